@@ -1,23 +1,35 @@
+import concurrent.futures
+import hashlib
 import logging
 import time
-import zlib
 
 from django.conf import settings
 from django.core.cache import cache
-from django.http.response import HttpResponse
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
+from django.db.models.signals import post_delete
+from django.http.response import HttpResponse, HttpResponseNotModified
+from django.urls import resolve
+from django.utils.cache import patch_vary_headers
 from edx_django_utils.cache import get_cache_key
+from edx_django_utils.monitoring import set_custom_attribute
+from rest_framework.decorators import action
 from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
 from rest_framework_extensions.cache.decorators import CacheResponse
 from rest_framework_extensions.key_constructor.bits import KeyBitBase, QueryParamsKeyBit
 from rest_framework_extensions.key_constructor.constructors import (
-    DefaultListKeyConstructor, DefaultObjectKeyConstructor
+    DefaultKeyConstructor, DefaultListKeyConstructor, DefaultObjectKeyConstructor
 )
 from waffle import get_waffle_flag_model  # lint-amnesty, pylint: disable=invalid-django-waffle-import
 
-from course_discovery.apps.api.utils import conditional_decorator
+from course_discovery.apps.api.compression import ZlibCodec, accepts_encoding, get_codec
+from course_discovery.apps.api.utils import conditional_decorator, get_excluded_restriction_types
+from course_discovery.apps.core.utils import get_search_index_generation
 
 logger = logging.getLogger(__name__)
 API_TIMESTAMP_KEY = 'api_timestamp'
+API_CACHE_TAG_KEY_PREFIX = 'api_cache_tag'
 
 
 class ApiTimestampKeyBit(KeyBitBase):
@@ -43,6 +55,55 @@ class TimestampedObjectKeyConstructor(DefaultObjectKeyConstructor):
     querystring = QueryParamsKeyBit()
 
 
+class StaleListKeyConstructor(TimestampedListKeyConstructor):
+    # Identifies a request independently of the api timestamp, so that the last response
+    # built for it can still be found after the timestamp rolls.
+    timestamp = None
+
+
+class StaleObjectKeyConstructor(TimestampedObjectKeyConstructor):
+    timestamp = None
+
+
+class SearchIndexGenerationKeyBit(KeyBitBase):
+    def get_data(self, **kwargs):  # pylint: disable=arguments-differ
+        return get_search_index_generation()
+
+
+class PartnerKeyBit(KeyBitBase):
+    def get_data(self, request, **kwargs):  # pylint: disable=arguments-differ
+        partner = getattr(getattr(request, 'site', None), 'partner', None)
+        return getattr(partner, 'id', None)
+
+
+class ExcludedRestrictionTypesKeyBit(KeyBitBase):
+    def get_data(self, request, **kwargs):  # pylint: disable=arguments-differ
+        return sorted(get_excluded_restriction_types(request))
+
+
+class NormalizedQueryParamsKeyBit(KeyBitBase):
+    """
+    Every value of every query param, including the body params merged into them by
+    update_query_params_with_body_data. Params are sorted by name, so that requests which only differ by the
+    order of their params share their cache key, but the values of each param keep their order, e.g. for ordering.
+    """
+    def get_data(self, request, **kwargs):  # pylint: disable=arguments-differ
+        return sorted(request.query_params.lists())
+
+
+class SearchKeyConstructor(DefaultKeyConstructor):
+    # Search responses are built from the search indexes rather than the database, so they are invalidated
+    # by the search index generation instead of the api timestamp.
+    generation = SearchIndexGenerationKeyBit()
+    partner = PartnerKeyBit()
+    excluded_restriction_types = ExcludedRestrictionTypesKeyBit()
+    querystring = NormalizedQueryParamsKeyBit()
+
+
+class StaleSearchKeyConstructor(SearchKeyConstructor):
+    generation = None
+
+
 def timestamped_list_key_constructor(*args, **kwargs):
     return TimestampedListKeyConstructor()(**kwargs)
 
@@ -51,17 +112,137 @@ def timestamped_object_key_constructor(*args, **kwargs):
     return TimestampedObjectKeyConstructor()(**kwargs)
 
 
+def stale_list_key_constructor(*args, **kwargs):
+    return f'stale.{StaleListKeyConstructor()(**kwargs)}'
+
+
+def stale_object_key_constructor(*args, **kwargs):
+    return f'stale.{StaleObjectKeyConstructor()(**kwargs)}'
+
+
+def search_key_constructor(*args, **kwargs):
+    return SearchKeyConstructor()(**kwargs)
+
+
+def stale_search_key_constructor(*args, **kwargs):
+    return f'stale.{StaleSearchKeyConstructor()(**kwargs)}'
+
+
 def set_api_timestamp():
     timestamp = time.time()
     cache.set(API_TIMESTAMP_KEY, timestamp, None)
 
 
-def api_change_receiver(sender, **kwargs):  # pylint: disable=unused-argument
+def get_cache_tag_key(tag):
+    return f'{API_CACHE_TAG_KEY_PREFIX}.{tag}'
+
+
+def get_cache_tag_versions(tags):
+    """
+    Return a dict mapping the cache key of each tag to its current version, initializing
+    the version of any tag that has not been seen (or has been evicted) yet.
+    """
+    keys = [get_cache_tag_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            versions[key] = cache.get_or_set(key, time.time, None)
+    return versions
+
+
+def invalidate_cache_tags(tags):
+    """
+    Invalidate every cached API response that was built from one of the given tags.
+    """
+    timestamp = time.time()
+    cache.set_many({get_cache_tag_key(tag): timestamp for tag in tags}, None)
+
+
+def _get_course_cache_tags(course):
+    """
+    Return the tags of every cached response that embeds the given course.
+
+    Course and course run responses are tagged per partner list and per object. Programs
+    (and the pathways that contain them) embed their courses, so they are only affected
+    when the course actually belongs to a program.
+    """
+    tags = {
+        f'course-list:{course.partner_id}',
+        f'course:{course.uuid}',
+        f'course:{course.key}',
+        f'course_run-list:{course.partner_id}',
+    }
+    tags.update(f'course_run:{key}' for key in course.course_runs.values_list('key', flat=True))
+
+    program_uuids = list(course.programs.values_list('uuid', flat=True))
+    if program_uuids:
+        tags.add(f'program-list:{course.partner_id}')
+        tags.update(f'program:{uuid}' for uuid in program_uuids)
+        tags.add('pathway')
+
+    return tags
+
+
+def _get_course_run_cache_tags(course_run):
+    return _get_course_cache_tags(course_run.course) | {f'course_run:{course_run.key}'}
+
+
+def _get_program_summary_cache_tags(summary):
+    # Summaries are refreshed after the changes they aggregate have been committed, so the program
+    # responses cached in between must be invalidated again.
+    program = summary.program
+    return {f'program:{program.uuid}', f'program-list:{program.partner_id}'}
+
+
+# Models that change frequently (publisher edits, data loaders) and whose changes can be
+# traced to a small set of cached responses. Changes to any other course_metadata model
+# fall back to invalidating the entire API cache.
+INSTANCE_CACHE_TAG_RESOLVERS = {
+    'course_metadata.course': _get_course_cache_tags,
+    'course_metadata.courseentitlement': lambda entitlement: _get_course_cache_tags(entitlement.course),
+    'course_metadata.courserun': _get_course_run_cache_tags,
+    'course_metadata.programsummary': _get_program_summary_cache_tags,
+    'course_metadata.seat': lambda seat: _get_course_run_cache_tags(seat.course_run),
+}
+
+
+def get_instance_cache_tags(instance, deleted=False):
+    """
+    Return the set of cache tags affected by a change to the given model instance, or None
+    if the affected responses can't be determined.
+    """
+    label = instance._meta.label_lower
+    # Deleting a course drops its program memberships before the signal is sent, so the
+    # programs embedding it can no longer be found.
+    if deleted and label == 'course_metadata.course':
+        return None
+
+    resolver = INSTANCE_CACHE_TAG_RESOLVERS.get(label)
+    if resolver is None:
+        return None
+
+    try:
+        return resolver(instance)
+    except ObjectDoesNotExist:
+        # The related objects may already be gone when a delete cascades.
+        return None
+
+
+def api_change_receiver(sender, instance=None, signal=None, **kwargs):  # pylint: disable=unused-argument
     """
     Receiver function for handling post_save and post_delete signals emitted by
     course_metadata models.
+
+    Only the cached responses built from the changed instance are invalidated when they
+    can be determined, otherwise the entire API cache is invalidated.
     """
-    set_api_timestamp()
+    tags = None
+    if instance is not None:
+        tags = get_instance_cache_tags(instance, deleted=signal is post_delete)
+    if tags is None:
+        set_api_timestamp()
+    else:
+        invalidate_cache_tags(tags)
 
 
 class CompressedCacheResponse(CacheResponse):
@@ -70,15 +251,40 @@ class CompressedCacheResponse(CacheResponse):
     See https://github.com/chibisov/drf-extensions/blob/master/rest_framework_extensions/cache/decorators.py#L52
     for a similar implementation of process_cache_response without compression
     """
+    def get_cache_tags(self, view_instance, view_method, request, kwargs):
+        """
+        Return the tags the cached response depends on. Views opt in to tagged invalidation
+        by declaring a cache_tag_prefix; responses of other views are only invalidated by
+        the global api timestamp.
+        """
+        prefix = getattr(view_instance, 'cache_tag_prefix', None)
+        if not prefix:
+            return []
+
+        tags = [prefix]
+        if view_method.__name__ == 'list':
+            partner = getattr(getattr(request, 'site', None), 'partner', None)
+            tags.append(f'{prefix}-list:{getattr(partner, "id", None)}')
+        else:
+            lookup_url_kwarg = getattr(view_instance, 'lookup_url_kwarg', None) or view_instance.lookup_field
+            tags.append(f'{prefix}:{kwargs.get(lookup_url_kwarg)}')
+        return tags
+
+    def __init__(self, *args, stale_key_func=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stale_key_func = stale_key_func
+
     def process_cache_response(self, view_instance, view_method, request, args, kwargs):
         flag_name = f'compressed_cache.{view_instance.__class__.__name__}.{view_method.__name__}'
         flag = get_waffle_flag_model().get(flag_name)
+        set_custom_attribute('compressed_cache_view', flag_name)
 
         # If the flag isn't stored in the database yet, then use the cache
         # If it is in the database, use the waffle rules for activity
         # This logic allows us to opt particular pages out of the cache without having
         # to define all of the flags ahead of time.
         use_page_cache = (not flag.pk) or flag.is_active(request)
+        stale_triple = None
 
         if use_page_cache:
             key = self.calculate_key(
@@ -89,11 +295,53 @@ class CompressedCacheResponse(CacheResponse):
                 kwargs=kwargs
             )
             response_triple = self.cache.get(key)
+            tags = self.get_cache_tags(view_instance, view_method, request, kwargs)
+
+            # Responses cached along with tag versions are only valid as long as none of
+            # those tags have been invalidated since.
+            if response_triple and len(response_triple) > 3 and response_triple[3]:
+                if cache.get_many(list(response_triple[3])) != response_triple[3]:
+                    stale_triple, response_triple = response_triple, None
         else:
             logger.info("Skipping page caching for %s", flag_name)
             response_triple = None
+            tags = []
+
+        if response_triple:
+            set_custom_attribute('compressed_cache_status', 'hit')
+            return self.build_cached_response(request, response_triple)
 
-        if not response_triple:
+        stale_key = None
+        lock_key = None
+        stale_timeout = settings.API_CACHE_STALE_WHILE_REVALIDATE_TIMEOUT
+        if use_page_cache and stale_timeout and self.stale_key_func:
+            stale_key = self.stale_key_func(
+                view_instance=view_instance,
+                view_method=view_method,
+                request=request,
+                args=args,
+                kwargs=kwargs
+            )
+            if stale_triple is None:
+                # The stale key points at the cache key of the last response built for this
+                # request, which is still in the cache after the api timestamp rolls.
+                previous_key = self.cache.get(stale_key)
+                stale_triple = self.cache.get(previous_key) if previous_key else None
+
+            # Only one worker rebuilds the response at a time. Everyone else keeps serving the
+            # previous response until it's done, or until the lock expires.
+            lock_key = f'{stale_key}.lock'
+            if not self.cache.add(lock_key, True, stale_timeout):
+                lock_key = None
+                if stale_triple:
+                    set_custom_attribute('compressed_cache_status', 'stale')
+                    return self.build_cached_response(request, stale_triple)
+
+        set_custom_attribute('compressed_cache_status', 'rebuild' if use_page_cache else 'skip')
+        try:
+            # Tag versions are read before the response is built so that a change made
+            # while rendering can't be masked by a newer version.
+            tag_versions = get_cache_tag_versions(tags) if tags else {}
             response = view_method(view_instance, request, *args, **kwargs)
             response = view_instance.finalize_response(request, response, *args, **kwargs)
             response.render()
@@ -104,42 +352,108 @@ class CompressedCacheResponse(CacheResponse):
                 # Put the response in the cache only if there are no cache errors, response errors,
                 # and the format is json. We avoid caching for the BrowsableAPIRenderer so that users don't see
                 # different usernames that are cached from the BrowsableAPIRenderer html
+                self.store_response(response, key, stale_key, tag_versions)
+        finally:
+            if lock_key:
+                self.cache.delete(lock_key)
 
-                # django 3.0 has not .items() method, django 3.2 has not ._headers
-                if hasattr(response, '_headers'):
-                    headers = response._headers.copy()  # pylint: disable=protected-access
-                else:
-                    headers = {k: (k, v) for k, v in response.items()}
-
-                response_triple = (
-                    zlib.compress(response.rendered_content),
-                    response.status_code,
-                    headers
-                )
-                self.cache.set(key, response_triple, self.timeout)
-        else:
-            # If we get data from the cache, we reassemble the data to build a response
-            # We reassemble the pieces from the cache because we can't actually set rendered_content
-            # which is the part of the response that we compress
-            compressed_content, status, headers = response_triple
+        if not hasattr(response, '_closable_objects'):
+            response._closable_objects = []  # pylint: disable=protected-access
 
-            try:
-                decompressed_content = zlib.decompress(compressed_content)
-            except (TypeError, zlib.error):
-                # If we get a type error or a zlib error, the response content was never compressed
-                decompressed_content = compressed_content
+        return response
 
-            response = HttpResponse(content=decompressed_content, status=status)
+    def store_response(self, response, key, stale_key, tag_versions):
+        """
+        Compress the rendered response into the cache under the given key, along with an ETag which is also
+        set on the response. The stale key, if given, is pointed at the key.
+        """
+        codec = get_codec()
+        content = response.rendered_content
+        etag = 'W/"{}"'.format(hashlib.md5(content, usedforsecurity=False).hexdigest())
+        response['ETag'] = etag
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        # django 3.0 has not .items() method, django 3.2 has not ._headers
+        if hasattr(response, '_headers'):
+            headers = response._headers.copy()  # pylint: disable=protected-access
+        else:
+            headers = {k: (k, v) for k, v in response.items()}
+
+        response_triple = (
+            codec.compress(content),
+            response.status_code,
+            headers,
+            tag_versions,
+            codec.name,
+            etag,
+        )
+        self.cache.set(key, response_triple, self.timeout)
+        if stale_key:
+            self.cache.set(stale_key, key, self.timeout)
+
+    def build_cached_response(self, request, response_triple):
+        """
+        Reassemble a response from the pieces stored in the cache. We reassemble the pieces
+        because we can't actually set rendered_content, which is the part of the response
+        that we compress.
+
+        The stored content is only decompressed when it has to be: clients that already have
+        the response get a 304, and clients accepting the stored content coding get the
+        compressed bytes as-is.
+        """
+        compressed_content, status, headers = response_triple[:3]
+        # Responses cached before codecs were configurable are always zlib compressed, and have no ETag
+        codec_name, etag = response_triple[4:6] if len(response_triple) > 5 else (ZlibCodec.name, None)
+        codec = get_codec(codec_name)
+
+        if etag and status == 200 and etag_matches(request, etag):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            patch_vary_headers(response, ('Accept-Encoding',))
+        else:
+            content_encoding = None
+            # Only responses cached with an ETag are known to be compressed
+            if etag and accepts_encoding(request, codec.content_encoding):
+                content = compressed_content
+                content_encoding = codec.content_encoding
+            else:
+                try:
+                    content = codec.decompress(compressed_content)
+                except codec.errors:
+                    # If we get a type error or a codec error, the response content was never compressed
+                    content = compressed_content
+
+            response = HttpResponse(content=content, status=status)
 
             for k, v in headers.values():
                 response[k] = v
 
+            if content_encoding:
+                response['Content-Encoding'] = content_encoding
+
         if not hasattr(response, '_closable_objects'):
             response._closable_objects = []  # pylint: disable=protected-access
 
         return response
 
 
+def etag_matches(request, etag):
+    """
+    Return whether the request's If-None-Match header matches the given ETag, using the weak
+    comparison function since the same ETag is served for every content coding.
+    """
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if not if_none_match:
+        return False
+
+    opaque_tag = etag.removeprefix('W/')
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == opaque_tag:
+            return True
+    return False
+
+
 # Decorator for mixin
 compressed_cache_response = CompressedCacheResponse
 
@@ -148,25 +462,101 @@ class CompressedCacheResponseMixin():
     """
     Acts like drf-extensions CacheResponseMixin, but with compression into the cache and decompression out of it
     """
+    # Prefix of the tags used to invalidate this view's cached responses, see get_instance_cache_tags
+    cache_tag_prefix = None
     object_cache_key_func = timestamped_object_key_constructor
     list_cache_key_func = timestamped_list_key_constructor
+    object_stale_key_func = stale_object_key_constructor
+    list_stale_key_func = stale_list_key_constructor
     object_cache_timeout = settings.REST_FRAMEWORK_EXTENSIONS['DEFAULT_CACHE_RESPONSE_TIMEOUT']
     list_cache_timeout = settings.REST_FRAMEWORK_EXTENSIONS['DEFAULT_CACHE_RESPONSE_TIMEOUT']
 
     @conditional_decorator(
         settings.USE_API_CACHING,
-        compressed_cache_response(key_func=list_cache_key_func, timeout=list_cache_timeout),
+        compressed_cache_response(
+            key_func=list_cache_key_func, timeout=list_cache_timeout, stale_key_func=list_stale_key_func
+        ),
     )
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
     @conditional_decorator(
         settings.USE_API_CACHING,
-        compressed_cache_response(key_func=object_cache_key_func, timeout=object_cache_timeout),
+        compressed_cache_response(
+            key_func=object_cache_key_func, timeout=object_cache_timeout, stale_key_func=object_stale_key_func
+        ),
     )
     def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
 
 
+search_cache_response = compressed_cache_response(
+    key_func=search_key_constructor,
+    timeout=settings.SEARCH_API_CACHE_TIMEOUT,
+    stale_key_func=stale_search_key_constructor,
+)
+
+
+class SearchCacheResponseMixin:
+    """
+    Caches the responses of the list, details and facets actions of Elasticsearch document viewsets, like
+    CompressedCacheResponseMixin, until the contents of the search indexes change.
+    """
+
+    @conditional_decorator(settings.USE_API_CACHING, search_cache_response)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @action(detail=False, methods=['get'])
+    @conditional_decorator(settings.USE_API_CACHING, search_cache_response)
+    def details(self, request):
+        return super().details(request)
+
+    @action(detail=False, methods=['get'], url_path='facets')
+    @conditional_decorator(settings.USE_API_CACHING, search_cache_response)
+    def facets(self, request):
+        return super().facets(request)
+
+
+def warm_api_cache(partner, user, paths, max_workers=1):
+    """
+    Replay the given API requests through the view stack, as the given user, so that their
+    responses are cached before real consumers ask for them.
+
+    Arguments:
+        partner (Partner): Partner whose site the requests are made against.
+        user (User): User making the requests.
+        paths (list): API paths, including their query strings, to request.
+        max_workers (int): Maximum number of requests made concurrently.
+
+    Returns:
+        dict: Mapping of each path to a (status code, duration in seconds) tuple. The status
+            code is None if the request raised an exception.
+    """
+    factory = APIRequestFactory()
+
+    def warm(path):
+        start = time.time()
+        status = None
+        try:
+            request = factory.get(path, HTTP_HOST=partner.site.domain, HTTP_ACCEPT='application/json')
+            request.site = partner.site
+            force_authenticate(request, user=user)
+            match = resolve(request.path_info)
+            status = match.func(request, *match.args, **match.kwargs).status_code
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Failed to warm the API cache for [%s].', path)
+        finally:
+            # Each worker thread has its own database connection, which must not outlive it.
+            connection.close()
+
+        duration = time.time() - start
+        logger.info('Warmed the API cache for [%s] in %.2f seconds with status [%s].', path, duration, status)
+        return path, status, duration
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return {path: (status, duration) for path, status, duration in executor.map(warm, paths)}
+
+
 def get_utm_source_request_cache_key(partner, user):
     return get_cache_key(partner=partner.id, user=user.id)
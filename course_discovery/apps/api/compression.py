@@ -0,0 +1,103 @@
+"""
+Codecs used to compress API responses stored in the cache.
+
+Each codec corresponds to an HTTP content coding, so that compressed payloads can be sent to
+clients that accept that coding without being decompressed first.
+"""
+import zlib
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None  # pylint: disable=invalid-name
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # pylint: disable=invalid-name
+
+
+class ZlibCodec:
+    name = 'zlib'
+    # zlib.compress produces the zlib format, which is what HTTP calls deflate
+    content_encoding = 'deflate'
+    errors = (TypeError, zlib.error)
+
+    def __init__(self, level=None):
+        self.level = -1 if level is None else level
+
+    def compress(self, data):
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data):
+        return zlib.decompress(data)
+
+
+class BrotliCodec:
+    name = 'brotli'
+    content_encoding = 'br'
+
+    def __init__(self, level=None):
+        if brotli is None:
+            raise ImproperlyConfigured('The brotli package is required to use the brotli API cache codec.')
+        self.level = level
+        self.errors = (TypeError, brotli.error)
+
+    def compress(self, data):
+        if self.level is None:
+            return brotli.compress(data)
+        return brotli.compress(data, quality=self.level)
+
+    def decompress(self, data):
+        return brotli.decompress(data)
+
+
+class ZstdCodec:
+    name = 'zstd'
+    content_encoding = 'zstd'
+
+    def __init__(self, level=None):
+        if zstandard is None:
+            raise ImproperlyConfigured('The zstandard package is required to use the zstd API cache codec.')
+        self.compressor = zstandard.ZstdCompressor() if level is None else zstandard.ZstdCompressor(level=level)
+        self.decompressor = zstandard.ZstdDecompressor()
+        self.errors = (TypeError, zstandard.ZstdError)
+
+    def compress(self, data):
+        return self.compressor.compress(data)
+
+    def decompress(self, data):
+        return self.decompressor.decompress(data)
+
+
+CODECS = {codec.name: codec for codec in (ZlibCodec, BrotliCodec, ZstdCodec)}
+_codec_instances = {}
+
+
+def get_codec(name=None):
+    """
+    Return the codec with the given name, or the one configured by the API_CACHE_COMPRESSION
+    and API_CACHE_COMPRESSION_LEVEL settings if no name is given.
+    """
+    level = settings.API_CACHE_COMPRESSION_LEVEL
+    name = name or settings.API_CACHE_COMPRESSION
+    if name not in CODECS:
+        raise ImproperlyConfigured(f'Unknown API cache codec [{name}].')
+
+    if (name, level) not in _codec_instances:
+        _codec_instances[(name, level)] = CODECS[name](level)
+    return _codec_instances[(name, level)]
+
+
+def accepts_encoding(request, content_encoding):
+    """
+    Return whether the request's Accept-Encoding header allows the given content coding.
+    """
+    for accepted in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        coding, _, params = accepted.partition(';')
+        if coding.strip().lower() in (content_encoding, '*'):
+            return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
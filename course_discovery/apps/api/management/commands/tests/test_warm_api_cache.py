@@ -0,0 +1,98 @@
+import functools
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from course_discovery.apps.api.cache import (
+    CompressedCacheResponseMixin, compressed_cache_response, stale_list_key_constructor,
+    timestamped_list_key_constructor, warm_api_cache
+)
+from course_discovery.apps.core.tests.factories import PartnerFactory, UserFactory
+from course_discovery.apps.course_metadata.tests.factories import ProgramFactory
+
+
+@override_settings(API_CACHE_WARMING_PATHS=['/api/v1/courses/', '/api/v1/programs/'])
+@mock.patch('course_discovery.apps.api.management.commands.warm_api_cache.warm_api_cache')
+class WarmApiCacheCommandTests(TestCase):
+    command_name = 'warm_api_cache'
+
+    def setUp(self):
+        super().setUp()
+        self.partner = PartnerFactory()
+        self.user = UserFactory()
+
+    def test_warm_configured_paths(self, mock_warm_api_cache):
+        mock_warm_api_cache.return_value = {'/api/v1/courses/': (200, 1.5), '/api/v1/programs/': (200, 2.5)}
+
+        call_command(self.command_name, '--username', self.user.username, '--max_workers', '2')
+
+        mock_warm_api_cache.assert_called_once_with(
+            self.partner, self.user, ['/api/v1/courses/', '/api/v1/programs/'], max_workers=2
+        )
+
+    def test_warm_given_paths(self, mock_warm_api_cache):
+        mock_warm_api_cache.return_value = {'/api/v1/courses/?page=2': (200, 1.5)}
+
+        call_command(
+            self.command_name, '--username', self.user.username, '--partner_code', self.partner.short_code,
+            '--path', '/api/v1/courses/?page=2',
+        )
+
+        assert mock_warm_api_cache.call_args[0][2] == ['/api/v1/courses/?page=2']
+
+    def test_failed_request(self, mock_warm_api_cache):
+        mock_warm_api_cache.return_value = {'/api/v1/courses/': (200, 1.5), '/api/v1/programs/': (None, 2.5)}
+
+        with pytest.raises(CommandError):
+            call_command(self.command_name, '--username', self.user.username)
+
+    def test_missing_user(self, mock_warm_api_cache):
+        with pytest.raises(CommandError):
+            call_command(self.command_name, '--username', 'nobody')
+
+        assert not mock_warm_api_cache.called
+
+
+class WarmApiCacheTests(TransactionTestCase):
+    """
+    The warming requests are made from worker threads, which use their own database connections,
+    so the data they read must be committed.
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.partner = PartnerFactory()
+        self.user = UserFactory(is_staff=True)
+        ProgramFactory(partner=self.partner)
+
+    def test_warm_api_cache(self):
+        """ Verify that warmed responses are cached, so that later requests don't reach the view. """
+        calls = []
+        list_view = CompressedCacheResponseMixin.list
+
+        @functools.wraps(list_view)
+        def counted_list(view, request, *args, **kwargs):
+            calls.append(request)
+            return list_view(view, request, *args, **kwargs)
+
+        cached_list = compressed_cache_response(
+            key_func=timestamped_list_key_constructor, stale_key_func=stale_list_key_constructor
+        )(counted_list)
+
+        # Caching is disabled by the test settings, enable it for the list views only
+        with mock.patch.object(CompressedCacheResponseMixin, 'list', cached_list):
+            results = warm_api_cache(
+                self.partner, self.user, ['/api/v1/programs/', '/api/v1/missing/'], max_workers=2
+            )
+            assert results['/api/v1/programs/'][0] == 200
+            # Paths which can't be resolved are reported as failed rather than aborting the warming
+            assert results['/api/v1/missing/'][0] is None
+            assert len(calls) == 1
+
+            results = warm_api_cache(self.partner, self.user, ['/api/v1/programs/'])
+            assert results['/api/v1/programs/'][0] == 200
+            assert len(calls) == 1
@@ -0,0 +1,73 @@
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand, CommandError
+
+from course_discovery.apps.api.cache import warm_api_cache
+from course_discovery.apps.core.models import Partner
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Warm the API cache by replaying popular API requests through the view stack.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--partner_code',
+            help='The short code for a specific partner whose cache should be warmed.'
+        )
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            help='API path, including its query string, to request. Can be repeated. '
+                 'Defaults to the API_CACHE_WARMING_PATHS setting.'
+        )
+        parser.add_argument(
+            '--username',
+            default=settings.API_CACHE_WARMING_USERNAME,
+            help='Username of the user making the requests.'
+        )
+        parser.add_argument(
+            '--max_workers',
+            type=int,
+            default=settings.API_CACHE_WARMING_MAX_WORKERS,
+            help='Maximum number of requests made concurrently.'
+        )
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or settings.API_CACHE_WARMING_PATHS
+        username = options['username']
+        if not username:
+            raise CommandError('A username is required to warm the API cache.')
+
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist as exc:
+            raise CommandError(f'User [{username}] does not exist.') from exc
+
+        partners = Partner.objects.all()
+        partner_code = options.get('partner_code')
+        if partner_code:
+            partners = partners.filter(short_code=partner_code)
+
+        if not partners:
+            raise CommandError('No partners available!')
+
+        failed = False
+        for partner in partners:
+            start = time.time()
+            results = warm_api_cache(partner, user, paths, max_workers=options['max_workers'])
+            for path, (status, duration) in results.items():
+                self.stdout.write(f'[{partner.short_code}] {path}: status {status} in {duration:.2f}s')
+                failed = failed or status is None or status >= 400
+            logger.info(
+                'Warmed the API cache for partner [%s] in %.2f seconds.', partner.short_code, time.time() - start
+            )
+
+        if failed:
+            raise CommandError('One or more API requests failed while warming the cache.')
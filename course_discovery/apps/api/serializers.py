@@ -2028,7 +2028,7 @@ class MinimalProgramSerializer(TaggitSerializer, FlexFieldsSerializerMixin, Base
     degree = DegreeSerializer()
     curricula = CurriculumSerializer(many=True)
     card_image_url = serializers.SerializerMethodField()
-    course_run_statuses = serializers.ReadOnlyField()
+    course_run_statuses = serializers.SerializerMethodField()
     organization_short_code_override = serializers.CharField(required=False, allow_blank=True)
     organization_logo_override_url = serializers.SerializerMethodField()
     primary_subject_override = SubjectSerializer()
@@ -2044,6 +2044,24 @@ class MinimalProgramSerializer(TaggitSerializer, FlexFieldsSerializerMixin, Base
             return logo_image_override.url
         return None
 
+    def get_program_summary(self, program):
+        """
+        Returns the summary of the program computed from the course runs prefetched for the view, if the view tells
+        which ones those are through the `program_summary_includes_restricted_runs` context.
+        """
+        includes_restricted_runs = self.context.get('program_summary_includes_restricted_runs')
+        if includes_restricted_runs is None:
+            return None
+        return program.get_summary(includes_restricted_runs)
+
+    def get_course_run_statuses(self, obj):
+        summary = self.get_program_summary(obj)
+        return summary.course_run_statuses if summary else obj.course_run_statuses
+
+    def get_price_ranges(self, obj):
+        summary = self.get_program_summary(obj)
+        return summary.price_ranges if summary else obj.price_ranges
+
     @classmethod
     def prefetch_queryset(cls, partner, queryset=None, course_runs=None):
         # Explicitly check if the queryset is None before selecting related
@@ -2054,6 +2072,7 @@ class MinimalProgramSerializer(TaggitSerializer, FlexFieldsSerializerMixin, Base
             'degree__additional_metadata'
         ).prefetch_related(
             'excluded_course_runs',
+            'summaries',
             # `type` is serialized by a third-party serializer. Providing this field name allows us to
             # prefetch `applicable_seat_types`, a m2m on `ProgramType`, through `type`, a foreign key to
             # `ProgramType` on `Program`.
@@ -2212,6 +2231,7 @@ class MinimalExtendedProgramSerializer(MinimalProgramSerializer):
     curricula = CurriculumSerializer(many=True)
     card_image_url = serializers.SerializerMethodField()
     expected_learning_items = serializers.SlugRelatedField(many=True, read_only=True, slug_field='value')
+    price_ranges = serializers.SerializerMethodField()
 
     @classmethod
     def prefetch_queryset(cls, partner, queryset=None, course_runs=None):
@@ -2235,8 +2255,7 @@ class ProgramSerializer(MinimalProgramSerializer):
     corporate_endorsements = CorporateEndorsementSerializer(many=True)
     job_outlook_items = serializers.SlugRelatedField(many=True, read_only=True, slug_field='value')
     individual_endorsements = EndorsementSerializer(many=True)
-    languages = serializers.SlugRelatedField(
-        many=True, read_only=True, slug_field='code',
+    languages = serializers.SerializerMethodField(
         help_text=_('Languages that course runs in this program are offered in.'),
     )
     transcript_languages = serializers.SlugRelatedField(
@@ -2245,6 +2264,9 @@ class ProgramSerializer(MinimalProgramSerializer):
     )
     subjects = SubjectSerializer(many=True)
     staff = MinimalPersonSerializer(many=True)
+    price_ranges = serializers.SerializerMethodField()
+    weeks_to_complete_min = serializers.SerializerMethodField()
+    weeks_to_complete_max = serializers.SerializerMethodField()
     instructor_ordering = MinimalPersonSerializer(many=True)
     applicable_seat_types = serializers.SerializerMethodField()
     topics = serializers.SerializerMethodField()
@@ -2283,6 +2305,7 @@ class ProgramSerializer(MinimalProgramSerializer):
             'degree__additional_metadata'
         ).prefetch_related(
             'excluded_course_runs',
+            'summaries',
             # `type` is serialized by a third-party serializer. Providing this field name allows us to
             # prefetch `applicable_seat_types`, a m2m on `ProgramType`, through `type`, a foreign key to
             # `ProgramType` on `Program`.
@@ -2314,6 +2337,18 @@ class ProgramSerializer(MinimalProgramSerializer):
     def get_applicable_seat_types(self, obj):
         return list(obj.type.applicable_seat_types.values_list('slug', flat=True))
 
+    def get_languages(self, obj):
+        summary = self.get_program_summary(obj)
+        return summary.language_codes if summary else [language.code for language in obj.languages]
+
+    def get_weeks_to_complete_min(self, obj):
+        summary = self.get_program_summary(obj)
+        return summary.weeks_to_complete_min if summary else obj.weeks_to_complete_min
+
+    def get_weeks_to_complete_max(self, obj):
+        summary = self.get_program_summary(obj)
+        return summary.weeks_to_complete_max if summary else obj.weeks_to_complete_max
+
     def get_topics(self, obj):
         return [topic.name for topic in obj.topics]
 
@@ -0,0 +1,470 @@
+"""
+In-process creation and update of courses and course runs.
+
+The course and course run endpoints and the CSV data loader share this service, so that the loader applies the
+same validation and side effects as the endpoints without calling them over HTTP.
+"""
+import logging
+
+from django.conf import settings
+from django.core import validators
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.utils.translation import gettext as _
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from taxonomy.signals.signals import UPDATE_COURSE_SKILLS
+
+from course_discovery.apps.api.serializers import (
+    CourseEntitlementSerializer, CourseRunWithProgramsSerializer, CourseWithProgramsSerializer
+)
+from course_discovery.apps.api.utils import StudioAPI, decode_image_data, reviewable_data_has_changed
+from course_discovery.apps.course_metadata.choices import CourseRunStatus
+from course_discovery.apps.course_metadata.models import (
+    Collaborator, Course, CourseEditor, CourseEntitlement, CourseRun, CourseType, CourseUrlSlug, Organization, Seat,
+    Source, Video
+)
+from course_discovery.apps.course_metadata.utils import (
+    call_external_service, ensure_draft_world, validate_course_number, validate_slug_format
+)
+
+logger = logging.getLogger(__name__)
+
+COURSE_FIELDS_FOR_SKILLS = ['title', 'short_description', 'full_description']
+
+
+class CourseService:
+    """
+    Creates and updates courses and course runs on behalf of a user.
+
+    Permissions aren't checked, callers are responsible for them. Each method runs in its own transaction, and
+    consumes the data it is given like the endpoints consume their request data.
+    """
+
+    def __init__(self, partner, user, context=None):
+        """
+        Arguments:
+            partner (Partner): Partner owning the created courses.
+            user (User): User acting on the courses, who becomes an editor of the created courses.
+            context (dict): Context of the serializers validating the data.
+        """
+        self.partner = partner
+        self.user = user
+        self.context = context or {}
+
+    def get_course_key(self, data):
+        return '{org}+{number}'.format(org=data['org'], number=data['number'])
+
+    @transaction.atomic
+    def create_course(self, data, organization=None, course_type=None, product_source=None):
+        """
+        Create a draft course with its entitlements.
+
+        Arguments:
+            data (dict): title, number, org, type and product_source of the course, and optionally its url_slug,
+                collaborators and prices.
+            organization (Organization): organization of the course, if the caller already looked it up.
+            course_type (CourseType): type of the course, if the caller already looked it up.
+            product_source (Source): product source of the course, if the caller already looked it up.
+
+        Returns:
+            Course: the draft course.
+        """
+        course_creation_fields = {
+            'title': data.get('title'),
+            'number': data.get('number'),
+            'org': data.get('org'),
+            'type': data.get('type'),
+            'product_source': data.get('product_source'),
+        }
+        url_slug = data.get('url_slug', '')
+
+        missing_values = [k for k, v in course_creation_fields.items() if v is None]
+        error_message = ''
+        if missing_values:
+            error_message += ''.join([_('Missing value for: [{name}]. ').format(name=name) for name in missing_values])
+        if organization is None:
+            organization = Organization.objects.filter(key=course_creation_fields['org']).first()
+            if organization is None:
+                error_message += _('Organization [{org}] does not exist. ').format(org=course_creation_fields['org'])
+        if course_type is None and not CourseType.objects.filter(uuid=course_creation_fields['type']).exists():
+            error_message += _('Course Type [{course_type}] does not exist. ').format(
+                course_type=course_creation_fields['type'])
+        if product_source is None and not Source.objects.filter(slug=course_creation_fields['product_source']).exists():
+            error_message += _('Product Source [{product_source}] does not exist. ').format(
+                product_source=course_creation_fields['product_source'])
+
+        if error_message:
+            raise ValidationError((_('Incorrect data sent. ') + error_message).strip())
+
+        course_creation_fields['partner'] = self.partner.id
+        course_creation_fields['key'] = self.get_course_key(course_creation_fields)
+
+        validate_course_number(course_creation_fields['number'])
+
+        serializer = CourseWithProgramsSerializer(data=course_creation_fields, context=self.context)
+        serializer.is_valid(raise_exception=True)
+
+        # Confirm that this course doesn't already exist in an official non-draft form
+        if Course.objects.filter(partner=self.partner, key=course_creation_fields['key']).exists():
+            raise Exception(  # pylint: disable=broad-exception-raised
+                _('A course with key [{key}] already exists.').format(key=course_creation_fields['key'])
+            )
+
+        # if a manually entered url_slug, ensure it's not already taken (auto-generated are guaranteed uniqueness)
+        if url_slug:
+            validators.validate_slug(url_slug)
+            if CourseUrlSlug.objects.filter(url_slug=url_slug, partner=self.partner).exists():
+                raise Exception(  # pylint: disable=broad-exception-raised
+                    _('Course creation was unsuccessful. The course URL slug ‘[{url_slug}]’ is already in '
+                      'use. Please update this field and try again.').format(url_slug=url_slug)
+                )
+
+        course = serializer.save(draft=True)
+        course.set_active_url_slug(url_slug)
+
+        course.authoring_organizations.add(organization)
+
+        collaborators_uuid = data.get('collaborators')
+        if collaborators_uuid:
+            collaborators = Collaborator.objects.filter(uuid__in=collaborators_uuid)
+            course.collaborators.add(*collaborators)
+
+        entitlement_types = course.type.entitlement_types.all()
+        prices = data.get('prices', {})
+        for entitlement_type in entitlement_types:
+            CourseEntitlement.objects.create(
+                course=course,
+                mode=entitlement_type,
+                partner=self.partner,
+                price=prices.get(entitlement_type.slug, 0),
+                draft=True,
+            )
+
+        CourseEditor.objects.create(
+            user=self.user,
+            course=course,
+        )
+        return course
+
+    def update_entitlement(self, course, entitlement_type, price, partial=False):
+        """
+        Finds and updates an existing entitlement from the incoming data, with verification.
+
+        Will create an entitlement if we're switching from Audit.
+        Returns a tuple of (CourseEntitlement, bool) where the second value is whether the entitlement changed.
+        """
+        entitlement = CourseEntitlement.everything.filter(course=course, draft=models.Value(1)).first()
+        existing_slug = entitlement.mode.slug if entitlement else Seat.AUDIT
+
+        # We want to allow upgrading an entitlement from Audit -> Verified, but allow no other
+        # entitlement type changes. We use the official version existing as an indicator for
+        # ecom products having already been created.
+        entitlement_type_switch_whitelist = {Seat.AUDIT: Seat.VERIFIED}
+        if (course.official_version and existing_slug != entitlement_type.slug and
+                entitlement_type_switch_whitelist.get(existing_slug) != entitlement_type.slug):
+            raise ValidationError(_('Switching entitlement types after being reviewed is not supported. Please reach '
+                                    'out to your project coordinator for additional help if necessary.'))
+
+        if entitlement:
+            data = {'mode': entitlement_type.slug, 'price': price}
+            serializer = CourseEntitlementSerializer(entitlement, data=data, partial=partial)
+            serializer.is_valid(raise_exception=True)
+            return serializer.save(), entitlement.price != float(price)
+        else:
+            return (CourseEntitlement.objects.create(
+                course=course,
+                mode=entitlement_type,
+                partner=course.partner,
+                price=price,
+                draft=True,
+            ), True)
+
+    def log_request_subjects_and_prices(self, data, course):  # pragma: no cover
+        req_subjects = ', '.join(data.get('subjects', []))
+        current_subjects = ', '.join(list(map(lambda s: s.slug, course.subjects.all())))
+        prices = data.get('prices', {})
+        logger.info(
+            'UPDATE to course uuid - {uuid}, req subjects - [{req_subjects}], request prices - {prices}, '  # lint-amnesty, pylint: disable=logging-format-interpolation
+            'current subjects - [{current_subjects}]'.format(uuid=data.get('uuid'), req_subjects=req_subjects,
+                                                             prices=prices, current_subjects=current_subjects)
+        )
+
+    @transaction.atomic
+    def update_course(self, course, data, partial=False):  # pylint: disable=too-many-statements
+        """
+        Updates an existing course from incoming data, working on its draft.
+
+        Returns:
+            Course: the updated draft course.
+        """
+        changed = False
+        # Sending draft=False means the course data is live and updates should be pushed out immediately
+        draft = data.pop('draft', True)
+        image_data = data.pop('image', None)
+        org_logo_override_image = data.pop('organization_logo_override', None)
+        video_data = data.pop('video', None)
+        url_slug = data.pop('url_slug', '')
+
+        # Get and validate object serializer
+        course = ensure_draft_world(course)  # always work on drafts
+        serializer = CourseWithProgramsSerializer(course, data=data, partial=partial, context=self.context)
+        serializer.is_valid(raise_exception=True)
+
+        # TEMPORARY - log incoming request (subject and prices) for all course updates, see Jira DISCO-1593
+        self.log_request_subjects_and_prices(data, course)
+
+        # First, update course entitlements
+        if data.get('type') or data.get('prices'):
+            entitlements = []
+            prices = data.get('prices', {})
+            course_type = CourseType.objects.get(uuid=data.get('type')) if data.get('type') else course.type
+            entitlement_types = course_type.entitlement_types.all()
+            for entitlement_type in entitlement_types:
+                price = prices.get(entitlement_type.slug)
+                if price is None:
+                    continue
+                entitlement, did_change = self.update_entitlement(course, entitlement_type, price, partial=partial)
+                entitlements.append(entitlement)
+                changed = changed or did_change
+            # Deleting entitlements here since they would be orphaned otherwise.
+            # One example of how this situation can happen is if a course team is switching between
+            # "Verified and Audit" and "Audit Only" before actually publishing their course run.
+            course.entitlements.exclude(mode__in=entitlement_types).delete()
+            course.entitlements.set(entitlements)
+
+            # If entitlement has changed, get updated course object from DB that has new value for
+            # data modified timestamp.
+            if changed:
+                course.refresh_from_db()
+
+        # Save video if a new video source is provided, also allow removing the video from course
+        if video_data:
+            video_url = video_data.get('src')
+            if not video_url and course.video:
+                course.video = None
+            elif video_url and (not course.video or video_url != course.video.src):
+                video, __ = Video.objects.get_or_create(src=video_data['src'])
+                course.video = video
+
+        # Save image and convert to the correct format
+        if image_data and isinstance(image_data, str) and image_data.startswith('data:image'):
+            # base64 encoded image - decode
+            img_name, img_data = decode_image_data(image_data)
+            course.image.save(img_name, img_data)
+
+        # Save organization logo override and convert to the correct format
+        if org_logo_override_image and isinstance(org_logo_override_image, str) \
+                and org_logo_override_image.startswith('data:image'):
+            img_name, img_data = decode_image_data(org_logo_override_image)
+            course.organization_logo_override.save(img_name, img_data)
+
+        # If price didn't change, check the other fields on the course
+        # (besides image and video, they are popped off above)
+        changed_fields = reviewable_data_has_changed(
+            course,
+            serializer.validated_data.items(),
+            Course.STATUS_CHANGE_EXEMPT_FIELDS
+        )
+        changed = changed or bool(changed_fields)
+
+        if url_slug:
+            validate_slug_format(url_slug, course)
+
+            all_course_historical_slugs_excluding_present = CourseUrlSlug.objects.filter(
+                url_slug=url_slug, partner=course.partner).exclude(course__uuid=course.uuid)
+            if all_course_historical_slugs_excluding_present.exists():
+                raise Exception(  # pylint: disable=broad-exception-raised
+                    _('Course edit was unsuccessful. The course URL slug ‘[{url_slug}]’ is already in use. '
+                      'Please update this field and try again.').format(url_slug=url_slug))
+
+        # Then the course itself
+        course = serializer.save()
+
+        if url_slug:
+            course.set_active_url_slug(url_slug)
+            if course.official_version and (not draft or self._is_course_run_reviewed(course)):
+                course.official_version.set_active_url_slug(url_slug)
+
+        if not draft:
+            for course_run in course.active_course_runs:
+                if course_run.status == CourseRunStatus.Published:
+                    # This will also update the course
+                    course_run.update_or_create_official_version()
+                    self.update_course_run_image_in_studio(course_run)
+
+                    if settings.FIRE_UPDATE_COURSE_SKILLS_SIGNAL:
+                        # If a skills relavant course field is updated than fire signal
+                        # so that a background task in taxonomy update the course skills
+                        if any(field in COURSE_FIELDS_FOR_SKILLS for field in changed_fields):
+                            logger.info('Signal fired to update course skills. Course: [%s]', course.uuid)
+                            UPDATE_COURSE_SKILLS.send(self.__class__, course_uuid=course.uuid)
+
+        # Revert any Reviewed course runs back to Unpublished
+        if changed:
+            for course_run in course.course_runs.filter(status=CourseRunStatus.Reviewed):
+                course_run.status = CourseRunStatus.Unpublished
+                course_run.save()
+                course_run.official_version.status = CourseRunStatus.Unpublished
+                course_run.official_version.save()
+
+        return course
+
+    def _is_course_run_reviewed(self, course):
+        """ Checks if any course run for a course is in reviewed state """
+        return course.course_runs.filter(status=CourseRunStatus.Reviewed).exists()
+
+    def push_to_studio(self, course_run, create=False, old_course_run_key=None):
+        if course_run.course.partner.studio_url:
+            api = StudioAPI(course_run.course.partner)
+            call_external_service(api.push_to_studio, course_run, create, old_course_run_key, user=self.user)
+        else:
+            logger.info('Not pushing course run info for %s to Studio as partner %s has no studio_url set.',
+                        course_run.key, course_run.course.partner.short_code)
+
+    def update_course_run_image_in_studio(self, course_run):
+        if course_run.course.partner.studio_url:
+            api = StudioAPI(course_run.course.partner)
+            call_external_service(api.update_course_run_image_in_studio, course_run)
+        else:
+            logger.info('Not updating course run image for %s to Studio as partner %s has no studio_url set.',
+                        course_run.key, course_run.course.partner.short_code)
+
+    @transaction.atomic
+    def create_course_run(self, data):
+        """
+        Create a draft course run with its seats, and push it to Studio.
+
+        Arguments:
+            data (dict): Fields of the course run, including the key of its course, and optionally its prices,
+                restriction_type and the key of the run it is a rerun of.
+
+        Returns:
+            CourseRun: the draft course run.
+        """
+        # Set a pacing default when creating (studio requires this to be set, even though discovery does not)
+        data.setdefault('pacing_type', 'instructor_paced')
+
+        # Guard against externally setting the draft state
+        data.pop('draft', None)
+
+        prices = data.pop('prices', {})
+        restriction_type = data.pop('restriction_type', None)
+        # Grab any existing course run for this course (we'll use it when talking to studio to form basis of rerun)
+        course_key = data.get('course', None)  # required field
+        if not course_key:
+            raise DRFValidationError({'course': ['This field is required.']})
+
+        # Before creating the serializer we need to ensure the course has draft rows as expected
+        # The serializer will attempt to retrieve the draft version of the Course
+        course = Course.objects.filter_drafts().get(key=course_key)
+        course = ensure_draft_world(course)
+        old_course_run_key = data.pop('rerun', None)
+
+        serializer = CourseRunWithProgramsSerializer(data=data, context=self.context)
+        serializer.is_valid(raise_exception=True)
+
+        # Save run to database
+        course_run = serializer.save(draft=True)
+
+        course_run.update_or_create_seats(course_run.type, prices)
+        course_run.update_or_create_restriction(restriction_type)
+
+        # Set canonical course run if needed (done this way to match historical behavior - but shouldn't this be
+        # updated *each* time we make a new run?)
+        if not course.canonical_course_run:
+            course.canonical_course_run = course_run
+            course.save()
+        elif not old_course_run_key:
+            # On a rerun, only set the old course run key to the canonical key if a rerun hasn't been provided
+            # This will prevent a breaking change if users of this endpoint don't choose to provide a key on rerun
+            old_course_run_key = course.canonical_course_run.key
+
+        if old_course_run_key:
+            old_course_run = CourseRun.objects.filter_drafts().get(key=old_course_run_key)
+            course_run.language = old_course_run.language
+            course_run.min_effort = old_course_run.min_effort
+            course_run.max_effort = old_course_run.max_effort
+            course_run.weeks_to_complete = old_course_run.weeks_to_complete
+            course_run.save()
+            course_run.staff.set(old_course_run.staff.all())
+            course_run.transcript_languages.set(old_course_run.transcript_languages.all())
+
+        # And finally, push run to studio
+        self.push_to_studio(course_run, create=True, old_course_run_key=old_course_run_key)
+        return course_run
+
+    def save_course_run(self, course_run, serializer, draft, prices, upgrade_deadline_override, restriction_type=None):
+        """
+        Save a validated update of a draft course run, moving it through the review process and pushing it to Studio.
+
+        Returns:
+            CourseRun: the updated draft course run.
+        """
+        changed = bool(reviewable_data_has_changed(
+            course_run,
+            serializer.validated_data.items(),
+            CourseRun.STATUS_CHANGE_EXEMPT_FIELDS
+        ))
+
+        save_kwargs = {}
+        # If changes are made after review and before publish, revert status to unpublished.
+        # Unless we're just switching the status
+        non_exempt_update = changed and course_run.status == CourseRunStatus.Reviewed
+        if non_exempt_update:
+            save_kwargs['status'] = CourseRunStatus.Unpublished
+            official_run = course_run.official_version
+            official_run.status = CourseRunStatus.Unpublished
+            official_run.save()
+        # When the course run is being updated and is coming from the Unpublished state, we always want to set
+        # it's status to in legal review.  If it is coming from the Reviewed state, we only want to put it
+        # back into legal review if a non exempt field was changed (expected_program_name and expected_program_type)
+        if not draft and (course_run.status == CourseRunStatus.Unpublished or non_exempt_update):
+            save_kwargs['status'] = CourseRunStatus.LegalReview
+
+        course_run = serializer.save(**save_kwargs)
+
+        if course_run in course_run.course.active_course_runs:
+            course_run.update_or_create_seats(course_run.type, prices, upgrade_deadline_override,)
+        course_run.update_or_create_restriction(restriction_type)
+        self.push_to_studio(course_run, create=False)
+
+        # Published course runs can be re-published directly or course runs that remain in the Reviewed
+        # state can update their official version. We want to do this even in the Reviewed case for
+        # when an exempt field is changed and we still want to update the official even though we don't
+        # want to completely unpublish it.
+        if ((not draft and course_run.status == CourseRunStatus.Published) or
+           course_run.status == CourseRunStatus.Reviewed):
+            course_run.update_or_create_official_version()
+
+        return course_run
+
+    @transaction.atomic
+    def update_course_run(self, course_run, data, partial=False):
+        """
+        Updates an existing course run from incoming data, working on its draft.
+
+        Unlike the course run endpoint, the upgrade_deadline_override of the data is applied whoever the user is,
+        and course runs in review can't be updated.
+
+        Returns:
+            CourseRun: the updated draft course run.
+        """
+        course_run = ensure_draft_world(course_run)  # always work on drafts
+        if course_run.in_review:
+            raise DRFValidationError(_('Course run is in review. Editing disabled.'))
+
+        # Sending draft=False triggers the review process for unpublished courses
+        draft = data.pop('draft', True)
+        prices = data.pop('prices', {})
+        restriction_type = data.pop('restriction_type', None)
+        upgrade_deadline_override = data.pop('upgrade_deadline_override', None)
+        data.pop('status', None)  # Status management is handled in the model
+
+        serializer = CourseRunWithProgramsSerializer(course_run, data=data, partial=partial, context=self.context)
+        serializer.is_valid(raise_exception=True)
+
+        course_run = self.save_course_run(
+            course_run, serializer, draft, prices, upgrade_deadline_override, restriction_type
+        )
+        self.update_course_run_image_in_studio(course_run)
+        return course_run
@@ -0,0 +1,43 @@
+"""
+Celery tasks for the API.
+"""
+import logging
+
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+from course_discovery.apps.api.cache import warm_api_cache
+from course_discovery.apps.core.models import Partner
+
+LOGGER = logging.getLogger(__name__)
+User = get_user_model()
+
+
+@shared_task()
+def warm_api_cache_task(partner_code=None):
+    """
+    Task to warm the API cache of every partner, or of the given partner, with the requests
+    listed in the API_CACHE_WARMING_PATHS setting.
+    Arguments:
+        partner_code (str): short code of the partner whose cache should be warmed
+    """
+    username = settings.API_CACHE_WARMING_USERNAME
+    if not username or not settings.API_CACHE_WARMING_PATHS:
+        LOGGER.info('API cache warming is not configured, skipping.')
+        return
+
+    try:
+        user = User.objects.get(username=username)
+    except User.DoesNotExist:
+        LOGGER.warning('API cache warming user [%s] does not exist, skipping.', username)
+        return
+
+    partners = Partner.objects.all()
+    if partner_code:
+        partners = partners.filter(short_code=partner_code)
+
+    for partner in partners:
+        warm_api_cache(
+            partner, user, settings.API_CACHE_WARMING_PATHS, max_workers=settings.API_CACHE_WARMING_MAX_WORKERS
+        )
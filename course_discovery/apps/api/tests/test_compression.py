@@ -0,0 +1,34 @@
+import ddt
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory, TestCase, override_settings
+
+from course_discovery.apps.api.compression import ZlibCodec, accepts_encoding, get_codec
+
+
+@ddt.ddt
+class CompressionTests(TestCase):
+    @override_settings(API_CACHE_COMPRESSION='zlib', API_CACHE_COMPRESSION_LEVEL=9)
+    def test_get_codec(self):
+        codec = get_codec()
+        assert isinstance(codec, ZlibCodec)
+        assert codec.level == 9
+        assert codec.decompress(codec.compress(b'content')) == b'content'
+
+    @override_settings(API_CACHE_COMPRESSION='lzma')
+    def test_get_unknown_codec(self):
+        with pytest.raises(ImproperlyConfigured):
+            get_codec()
+
+    @ddt.data(
+        ('gzip, deflate, br', True),
+        ('gzip;q=1.0, deflate;q=0.5', True),
+        ('*', True),
+        ('gzip, deflate;q=0', False),
+        ('gzip', False),
+        ('', False),
+    )
+    @ddt.unpack
+    def test_accepts_encoding(self, accept_encoding, expected):
+        request = RequestFactory().get('', HTTP_ACCEPT_ENCODING=accept_encoding)
+        assert accepts_encoding(request, 'deflate') == expected
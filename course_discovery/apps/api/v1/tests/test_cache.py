@@ -9,7 +9,8 @@ from rest_framework.response import Response
 from rest_framework_extensions.test import APIRequestFactory
 from waffle.testutils import override_flag
 
-from course_discovery.apps.api.cache import compressed_cache_response
+from course_discovery.apps.api.cache import compressed_cache_response, invalidate_cache_tags, search_key_constructor
+from course_discovery.apps.core.utils import bump_search_index_generation
 
 factory = APIRequestFactory()
 
@@ -169,3 +170,146 @@ class CompressedCacheResponseTest(TestCase):
         cache.set('cache_response_key', response_dict)
         response = view_instance.dispatch(request=self.request)
         self.assertEqual(response['test'], 'foo')
+
+    def test_should_invalidate_tagged_responses(self):
+        """ Verify that cached responses are rebuilt only when one of their tags is invalidated """
+        calls = []
+
+        def key_func(**kwargs):
+            return self.cache_response_key
+
+        class TestView(views.APIView):
+            permission_classes = [permissions.AllowAny]
+            renderer_classes = [JSONRenderer]
+            cache_tag_prefix = 'course'
+            lookup_field = 'key'
+
+            @compressed_cache_response(key_func=key_func)
+            def get(self, request, *_args, **_kwargs):
+                calls.append(request)
+                return Response('test response')
+
+        def dispatch():
+            view_instance = TestView()
+            view_instance.headers = {}  # pylint: disable=attribute-defined-outside-init
+            return view_instance.dispatch(request=self.request, key='course-v1:edX+DemoX')
+
+        assert dispatch().content.decode('utf-8') == '"test response"'
+        dispatch()
+        assert len(calls) == 1
+
+        invalidate_cache_tags(['program:unrelated'])
+        dispatch()
+        assert len(calls) == 1
+
+        invalidate_cache_tags(['course:course-v1:edX+DemoX'])
+        dispatch()
+        assert len(calls) == 2
+
+    @override_settings(API_CACHE_STALE_WHILE_REVALIDATE_TIMEOUT=60)
+    def test_should_serve_stale_response_while_rebuilding(self):
+        """ Verify that the previous response is served while another worker rebuilds it """
+        keys = ['first_key']
+        responses = ['first response']
+
+        def key_func(**kwargs):
+            return keys[0]
+
+        def stale_key_func(**kwargs):
+            return 'stale_key'
+
+        class TestView(views.APIView):
+            permission_classes = [permissions.AllowAny]
+            renderer_classes = [JSONRenderer]
+
+            @compressed_cache_response(key_func=key_func, stale_key_func=stale_key_func)
+            def get(self, request, *_args, **_kwargs):
+                return Response(responses[0])
+
+        def dispatch():
+            view_instance = TestView()
+            view_instance.headers = {}  # pylint: disable=attribute-defined-outside-init
+            return view_instance.dispatch(request=self.request).content.decode('utf-8')
+
+        assert dispatch() == '"first response"'
+
+        # Simulate the api timestamp rolling while another worker holds the rebuild lock
+        keys[0] = 'second_key'
+        responses[0] = 'second response'
+        cache.add('stale_key.lock', True)
+        assert dispatch() == '"first response"'
+        assert cache.get('second_key') is None
+
+        cache.delete('stale_key.lock')
+        assert dispatch() == '"second response"'
+        assert cache.get('stale_key') == 'second_key'
+        assert cache.get('stale_key.lock') is None
+
+    def test_should_answer_conditional_and_encoded_requests_from_cache(self):
+        """ Verify that cached responses are served as 304s or as-is compressed content when possible """
+        calls = []
+
+        def key_func(**kwargs):
+            return self.cache_response_key
+
+        class TestView(views.APIView):
+            permission_classes = [permissions.AllowAny]
+            renderer_classes = [JSONRenderer]
+
+            @compressed_cache_response(key_func=key_func)
+            def get(self, request, *_args, **_kwargs):
+                calls.append(request)
+                return Response('test response')
+
+        def dispatch(**headers):
+            view_instance = TestView()
+            view_instance.headers = {}  # pylint: disable=attribute-defined-outside-init
+            return view_instance.dispatch(request=factory.get('', **headers))
+
+        etag = dispatch()['ETag']
+        assert etag.startswith('W/"')
+
+        response = dispatch(HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+
+        response = dispatch(HTTP_ACCEPT_ENCODING='gzip, deflate')
+        assert response.status_code == 200
+        assert response['Content-Encoding'] == 'deflate'
+        assert zlib.decompress(response.content) == b'"test response"'
+
+        response = dispatch(HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH='W/"other"')
+        assert response.status_code == 200
+        assert not response.has_header('Content-Encoding')
+        assert response.content == b'"test response"'
+        assert len(calls) == 1
+
+    def test_should_cache_search_responses_until_the_indexes_change(self):
+        """ Verify that equivalent search requests share their cached response until the search indexes change """
+        calls = []
+
+        class TestView(views.APIView):
+            permission_classes = [permissions.AllowAny]
+            renderer_classes = [JSONRenderer]
+
+            @compressed_cache_response(key_func=search_key_constructor)
+            def get(self, request, *_args, **_kwargs):
+                calls.append(request)
+                return Response('test response')
+
+        def dispatch(path):
+            view_instance = TestView()
+            view_instance.headers = {}  # pylint: disable=attribute-defined-outside-init
+            return view_instance.dispatch(request=factory.get(path))
+
+        dispatch('/?q=python&content_type=course&content_type=program')
+        dispatch('/?content_type=course&content_type=program&q=python')
+        assert len(calls) == 1
+
+        dispatch('/?content_type=program&content_type=course&q=python')
+        dispatch('/?q=python&content_type=course&content_type=program&include_restricted=custom-b2c')
+        assert len(calls) == 3
+
+        bump_search_index_generation()
+        dispatch('/?q=python&content_type=course&content_type=program')
+        assert len(calls) == 4
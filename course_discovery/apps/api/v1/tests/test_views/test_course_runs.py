@@ -630,7 +630,7 @@ class CourseRunViewSetTests(SerializationMixin, ElasticsearchTestMixin, OAuth2Mi
 
         url = reverse('api:v1:course_run-detail', kwargs={'key': self.draft_course_run.key})
 
-        with mock.patch('course_discovery.apps.api.v1.views.course_runs.log.info') as mock_logger:
+        with mock.patch('course_discovery.apps.api.services.logger.info') as mock_logger:
             # Just pick any date that will be ahead of the ones in the Factory
             response = self.client.patch(url, {'start': '2019-01-01T00:00:00Z'}, format='json')
 
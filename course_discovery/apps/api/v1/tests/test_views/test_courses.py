@@ -1096,6 +1096,19 @@ class CourseViewSetTests(SerializationMixin, ElasticsearchTestMixin, OAuth2Mixin
         expected_error_message = 'Incorrect data sent. Course Type [' + data['type'] + '] does not exist.'
         assert response.data == expected_error_message
 
+    def test_create_fails_with_nonexistent_product_source(self):
+        data = {
+            'title': 'Test Course',
+            'number': 'test101',
+            'org': self.org.key,
+            'type': str(self.audit_type.uuid),
+            'product_source': 'fake-source',
+        }
+        response = self.create_course(data, update=False)
+        assert response.status_code == 400
+        expected_error_message = 'Incorrect data sent. Product Source [fake-source] does not exist.'
+        assert response.data == expected_error_message
+
     def test_create_fails_invalid_course_number(self):
         response = self.create_course({'number': 'a b c'})
         assert response.status_code == 400
@@ -1151,7 +1164,7 @@ class CourseViewSetTests(SerializationMixin, ElasticsearchTestMixin, OAuth2Mixin
         with mock.patch(
             # We are using get_course_key because it is called prior to trying to contact the
             # e-commerce service and still gives the effect of an api exception.
-            'course_discovery.apps.api.v1.views.courses.CourseViewSet.get_course_key',
+            'course_discovery.apps.api.services.CourseService.get_course_key',
             side_effect=IntegrityError('Error')
         ):
             with LogCapture(course_logger.name) as log_capture:
@@ -2428,7 +2441,7 @@ class CourseViewSetTests(SerializationMixin, ElasticsearchTestMixin, OAuth2Mixin
         }
 
         with mock.patch(
-            'course_discovery.apps.api.v1.views.courses.CourseViewSet.update_entitlement',
+            'course_discovery.apps.api.services.CourseService.update_entitlement',
             side_effect=IntegrityError('Nope')
         ):
             with LogCapture(course_logger.name) as log_capture:
@@ -1,21 +1,31 @@
 import datetime
+import functools
 import json
 import urllib.parse
 import uuid
+from unittest import mock
 
 import ddt
 import factory
 import pytz
+from django.core.cache import cache
 from django.core.management import call_command
+from django.db import connection
 from django.db.models import signals
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.renderers import JSONRenderer
+from waffle.testutils import override_switch
 
+from course_discovery.apps.api.cache import search_cache_response
 from course_discovery.apps.api.v1.tests.test_views import mixins
-from course_discovery.apps.api.v1.views.search import BrowsableAPIRendererWithoutForms, TypeaheadSearchView
+from course_discovery.apps.api.v1.views.search import (
+    BrowsableAPIRendererWithoutForms, CourseRunSearchViewSet, TypeaheadSearchView
+)
 from course_discovery.apps.core.tests.factories import USER_PASSWORD, PartnerFactory, UserFactory
 from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin
+from course_discovery.apps.core.utils import bump_search_index_generation
 from course_discovery.apps.course_metadata.choices import CourseRunStatus, ProgramStatus
 from course_discovery.apps.course_metadata.models import CourseRun
 from course_discovery.apps.course_metadata.search_indexes.serializers import (
@@ -30,6 +40,8 @@ from course_discovery.apps.learner_pathway.models import LearnerPathway
 from course_discovery.apps.learner_pathway.tests.factories import LearnerPathwayStepFactory
 from course_discovery.apps.publisher.tests import factories as publisher_factories
 
+INDEX_ONLY_SWITCH = 'course_metadata.enable_index_only_search_results'
+
 
 @ddt.ddt
 class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin, ElasticsearchTestMixin,
@@ -151,6 +163,29 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
         actual = response_data['fields']['pacing_type'][0]
         self.assertEqual(actual, actual | expected)  # pragma: no cover
 
+    def test_faceted_search_is_cached(self):
+        """ Verify that facets are served from the cache until the search indexes change. """
+        CourseRunFactory(course__partner=self.partner, status=CourseRunStatus.Published)
+        cache.clear()
+        calls = []
+        facets = CourseRunSearchViewSet.facets
+
+        @functools.wraps(facets)
+        def counted_facets(view, request):
+            calls.append(request)
+            return facets(view, request)
+
+        # Caching is disabled by the test settings, enable it for the facets of the viewset only
+        with mock.patch.object(CourseRunSearchViewSet, 'facets', search_cache_response(counted_facets)):
+            response = self.client.get(self.faceted_path)
+            assert response.status_code == 200
+            assert self.client.get(self.faceted_path).content == response.content
+            assert len(calls) == 1
+
+            bump_search_index_generation()
+            assert self.client.get(self.faceted_path).status_code == 200
+            assert len(calls) == 2
+
     def test_invalid_query_facet(self):
         """ Verify the endpoint returns HTTP 400 if an invalid facet is requested. """
         facet = 'not-a-facet'
@@ -633,6 +668,34 @@ class AggregateSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
         ]
         self.assertCountEqual(response_data['results'], expected)
 
+    @ddt.data(True, False)
+    def test_index_only_results(self, exclude_expired):
+        """ Verify that results rendered from the search indexes alone match the results loaded from the database. """
+        program = ProgramFactory(partner=self.partner, status=ProgramStatus.Active)
+        course_run = CourseRunFactory(course__partner=self.partner, status=CourseRunStatus.Published)
+        CourseRunFactory(
+            course=course_run.course, status=CourseRunStatus.Published,
+            end=datetime.datetime.now(pytz.UTC) - datetime.timedelta(days=10),
+        )
+        RestrictedCourseRunFactory(
+            course_run=CourseRunFactory(course=course_run.course, status=CourseRunStatus.Published),
+            restriction_type='custom-b2c',
+        )
+        self.reindex_courses(program)
+
+        query = {'partner': self.partner.short_code}
+        if exclude_expired:
+            query['exclude_expired_course_run'] = 'True'
+
+        with CaptureQueriesContext(connection) as hydrated_queries:
+            response = self.get_response(query, endpoint=self.list_path)
+        with override_switch(INDEX_ONLY_SWITCH, True), CaptureQueriesContext(connection) as index_only_queries:
+            index_only_response = self.get_response(query, endpoint=self.list_path)
+
+        assert index_only_response.status_code == 200
+        self.assertCountEqual(index_only_response.json()['results'], response.json()['results'])
+        assert len(index_only_queries) < len(hydrated_queries)
+
     @ddt.data("GET", "POST")
     def test_results_filtered_by_exclude_expired_course_run(self, request_method):
         """ Verify that there the result of combining exclud_expired_course_run and other parameters work fine. """
@@ -1,14 +1,15 @@
 import logging
 from uuid import UUID
 
-from elasticsearch_dsl.query import Q as ESDSLQ
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import DjangoModelPermissions, IsAuthenticated
 from rest_framework.response import Response
 
 from course_discovery.apps.api.mixins import ValidElasticSearchQueryRequiredMixin
+from course_discovery.apps.catalogs.utils import get_query_matches, matches_contain
 from course_discovery.apps.course_metadata.models import Course, CourseRun
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument, CourseRunDocument
 
 log = logging.getLogger(__name__)
 
@@ -41,19 +42,26 @@ class CatalogQueryContainsViewSet(ValidElasticSearchQueryRequiredMixin, GenericA
             if course_run_ids:
                 course_run_ids = course_run_ids.split(',')
                 specified_course_ids = course_run_ids
+                matches = get_query_matches(CourseRunDocument, query)
                 identified_course_ids.update(
-                    i.key
-                    for i in CourseRun.search(query)
-                    .filter(ESDSLQ('term', partner=partner.short_code) & ESDSLQ('terms', **{'key.raw': course_run_ids}))
-                    .source(['key'])
+                    key
+                    for key, pk in CourseRun.objects.filter(
+                        course__partner=partner, key__in=course_run_ids
+                    ).values_list('key', 'pk')
+                    if matches_contain(matches, pk)
                 )
             if course_uuids:
                 course_uuids = [UUID(course_uuid) for course_uuid in course_uuids.split(',')]
                 specified_course_ids += course_uuids
 
                 log.info(f"Specified course ids: {specified_course_ids}")
+                matches = get_query_matches(CourseDocument, query)
                 identified_course_ids.update(
-                    Course.search(query).filter(partner=partner, uuid__in=course_uuids).values_list('uuid', flat=True)
+                    uuid
+                    for uuid, pk in Course.objects.filter(
+                        partner=partner, uuid__in=course_uuids
+                    ).values_list('uuid', 'pk')
+                    if matches_contain(matches, pk)
                 )
             log.info(f"Identified {len(identified_course_ids)} course ids: {identified_course_ids}")
 
@@ -19,15 +19,14 @@ from course_discovery.apps.api.mixins import ValidElasticSearchQueryRequiredMixi
 from course_discovery.apps.api.pagination import ProxiedPagination
 from course_discovery.apps.api.permissions import IsCourseRunEditorOrDjangoOrReadOnly
 from course_discovery.apps.api.serializers import MetadataWithRelatedChoices
-from course_discovery.apps.api.utils import (
-    StudioAPI, get_excluded_restriction_types, get_query_param, reviewable_data_has_changed
-)
+from course_discovery.apps.api.services import CourseService
+from course_discovery.apps.api.utils import get_excluded_restriction_types, get_query_param
 from course_discovery.apps.api.v1.exceptions import EditableAndQUnsupported
 from course_discovery.apps.core.utils import SearchQuerySetWrapper
 from course_discovery.apps.course_metadata.choices import CourseRunStatus
 from course_discovery.apps.course_metadata.constants import COURSE_RUN_ID_REGEX
 from course_discovery.apps.course_metadata.exceptions import EcommerceSiteAPIClientException
-from course_discovery.apps.course_metadata.models import Course, CourseEditor, CourseRun
+from course_discovery.apps.course_metadata.models import CourseEditor, CourseRun
 from course_discovery.apps.course_metadata.utils import ensure_draft_world
 from course_discovery.apps.publisher.utils import is_publisher_user
 
@@ -63,6 +62,7 @@ class CourseRunViewSet(CompressedCacheResponseMixin, ValidElasticSearchQueryRequ
     queryset = CourseRun.objects.all().order_by(Lower('key'))
     serializer_class = serializers.CourseRunWithProgramsSerializer
     metadata_class = MetadataWithRelatedChoices
+    cache_tag_prefix = 'course_run'
     metadata_related_choices_whitelist = (
         'content_language', 'level_type', 'transcript_languages', 'expected_program_type', 'type'
     )
@@ -187,23 +187,8 @@ class CourseRunViewSet(CompressedCacheResponseMixin, ValidElasticSearchQueryRequ
         """
         return super().list(request, *args, **kwargs)
 
-    @classmethod
-    def push_to_studio(cls, request, course_run, create=False, old_course_run_key=None):
-        if course_run.course.partner.studio_url:
-            api = StudioAPI(course_run.course.partner)
-            api.push_to_studio(course_run, create, old_course_run_key, user=request.user)
-        else:
-            log.info('Not pushing course run info for %s to Studio as partner %s has no studio_url set.',
-                     course_run.key, course_run.course.partner.short_code)
-
-    @classmethod
-    def update_course_run_image_in_studio(cls, course_run):
-        if course_run.course.partner.studio_url:
-            api = StudioAPI(course_run.course.partner)
-            api.update_course_run_image_in_studio(course_run)
-        else:
-            log.info('Not updating course run image for %s to Studio as partner %s has no studio_url set.',
-                     course_run.key, course_run.course.partner.short_code)
+    def get_service(self):
+        return CourseService(self.request.site.partner, self.request.user, self.get_serializer_context())
 
     @writable_request_wrapper
     def create_run_helper(self, run_data, request=None):
@@ -216,57 +201,9 @@ class CourseRunViewSet(CompressedCacheResponseMixin, ValidElasticSearchQueryRequ
         if not hasattr(self, 'format_kwarg'):
             self.format_kwarg = None  # pylint: disable=attribute-defined-outside-init
 
-        # Set a pacing default when creating (studio requires this to be set, even though discovery does not)
-        run_data.setdefault('pacing_type', 'instructor_paced')
-
-        # Guard against externally setting the draft state
-        run_data.pop('draft', None)
-
-        prices = run_data.pop('prices', {})
-        restriction_type = run_data.pop('restriction_type', None)
-        # Grab any existing course run for this course (we'll use it when talking to studio to form basis of rerun)
-        course_key = run_data.get('course', None)  # required field
-        if not course_key:
-            raise ValidationError({'course': ['This field is required.']})
-
-        # Before creating the serializer we need to ensure the course has draft rows as expected
-        # The serializer will attempt to retrieve the draft version of the Course
-        course = Course.objects.filter_drafts().get(key=course_key)
-        course = ensure_draft_world(course)
-        old_course_run_key = run_data.pop('rerun', None)
-
-        serializer = self.get_serializer(data=run_data)
-        serializer.is_valid(raise_exception=True)
-
-        # Save run to database
-        course_run = serializer.save(draft=True)
-
-        course_run.update_or_create_seats(course_run.type, prices)
-        course_run.update_or_create_restriction(restriction_type)
-
-        # Set canonical course run if needed (done this way to match historical behavior - but shouldn't this be
-        # updated *each* time we make a new run?)
-        if not course.canonical_course_run:
-            course.canonical_course_run = course_run
-            course.save()
-        elif not old_course_run_key:
-            # On a rerun, only set the old course run key to the canonical key if a rerun hasn't been provided
-            # This will prevent a breaking change if users of this endpoint don't choose to provide a key on rerun
-            old_course_run_key = course.canonical_course_run.key
-
-        if old_course_run_key:
-            old_course_run = CourseRun.objects.filter_drafts().get(key=old_course_run_key)
-            course_run.language = old_course_run.language
-            course_run.min_effort = old_course_run.min_effort
-            course_run.max_effort = old_course_run.max_effort
-            course_run.weeks_to_complete = old_course_run.weeks_to_complete
-            course_run.save()
-            course_run.staff.set(old_course_run.staff.all())
-            course_run.transcript_languages.set(old_course_run.transcript_languages.all())
-
-        # And finally, push run to studio
-        self.push_to_studio(self.request, course_run, create=True, old_course_run_key=old_course_run_key)
+        course_run = self.get_service().create_course_run(run_data)
 
+        serializer = self.get_serializer(course_run)
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
@@ -276,42 +213,16 @@ class CourseRunViewSet(CompressedCacheResponseMixin, ValidElasticSearchQueryRequ
         if response.status_code == 201:
             run_key = response.data.get('key')
             course_run = CourseRun.everything.get(key=run_key, draft=models.Value(1))
-            self.update_course_run_image_in_studio(course_run)
+            self.get_service().update_course_run_image_in_studio(course_run)
 
         return response
 
     @writable_request_wrapper
-    def _update_course_run(self, course_run, draft, changed, serializer, request, prices, upgrade_deadline_override, restriction_type=None):  # pylint: disable=line-too-long
-        save_kwargs = {}
-        # If changes are made after review and before publish, revert status to unpublished.
-        # Unless we're just switching the status
-        non_exempt_update = changed and course_run.status == CourseRunStatus.Reviewed
-        if non_exempt_update:
-            save_kwargs['status'] = CourseRunStatus.Unpublished
-            official_run = course_run.official_version
-            official_run.status = CourseRunStatus.Unpublished
-            official_run.save()
-        # When the course run is being updated and is coming from the Unpublished state, we always want to set
-        # it's status to in legal review.  If it is coming from the Reviewed state, we only want to put it
-        # back into legal review if a non exempt field was changed (expected_program_name and expected_program_type)
-        if not draft and (course_run.status == CourseRunStatus.Unpublished or non_exempt_update):
-            save_kwargs['status'] = CourseRunStatus.LegalReview
-
-        course_run = serializer.save(**save_kwargs)
-
-        if course_run in course_run.course.active_course_runs:
-            course_run.update_or_create_seats(course_run.type, prices, upgrade_deadline_override,)
-        course_run.update_or_create_restriction(restriction_type)
-        self.push_to_studio(request, course_run, create=False)
-
-        # Published course runs can be re-published directly or course runs that remain in the Reviewed
-        # state can update their official version. We want to do this even in the Reviewed case for
-        # when an exempt field is changed and we still want to update the official even though we don't
-        # want to completely unpublish it.
-        if ((not draft and course_run.status == CourseRunStatus.Published) or
-           course_run.status == CourseRunStatus.Reviewed):
-            course_run.update_or_create_official_version()
-
+    def _update_course_run(self, course_run, draft, serializer, prices, upgrade_deadline_override,
+                           restriction_type=None):
+        self.get_service().save_course_run(
+            course_run, serializer, draft, prices, upgrade_deadline_override, restriction_type
+        )
         return Response(serializer.data)
 
     def handle_internal_review(self, request, serializer):
@@ -371,15 +282,10 @@ class CourseRunViewSet(CompressedCacheResponseMixin, ValidElasticSearchQueryRequ
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-        changed_fields = reviewable_data_has_changed(
-            course_run,
-            serializer.validated_data.items(),
-            CourseRun.STATUS_CHANGE_EXEMPT_FIELDS
-        )
-        response = self._update_course_run(course_run, draft, bool(changed_fields),
-                                           serializer, request, prices, upgrade_deadline_override, restriction_type)
+        response = self._update_course_run(course_run, draft, serializer, prices, upgrade_deadline_override,
+                                           restriction_type)
 
-        self.update_course_run_image_in_studio(course_run)
+        self.get_service().update_course_run_image_in_studio(course_run)
 
         return response
 
@@ -11,6 +11,7 @@ from course_discovery.apps.course_metadata.models import CourseRun
 class PathwayViewSet(CompressedCacheResponseMixin, viewsets.ReadOnlyModelViewSet):
     permission_classes = (ReadOnlyByPublisherUser,)
     serializer_class = serializers.PathwaySerializer
+    cache_tag_prefix = 'pathway'
 
     def get_queryset(self):
         excluded_restriction_types = get_excluded_restriction_types(self.request)
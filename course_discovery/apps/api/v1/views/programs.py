@@ -13,6 +13,7 @@ from course_discovery.apps.api import filters, serializers
 from course_discovery.apps.api.cache import CompressedCacheResponseMixin
 from course_discovery.apps.api.pagination import ProxiedPagination
 from course_discovery.apps.api.utils import get_excluded_restriction_types, get_query_param
+from course_discovery.apps.course_metadata.choices import CourseRunRestrictionType
 from course_discovery.apps.course_metadata.models import CourseRun, Program
 
 
@@ -23,6 +24,7 @@ class ProgramViewSet(CompressedCacheResponseMixin, viewsets.ReadOnlyModelViewSet
     permission_classes = (IsAuthenticated,)
     filter_backends = (DjangoFilterBackend, rest_framework_filters.OrderingFilter)
     filterset_class = filters.ProgramFilter
+    cache_tag_prefix = 'program'
 
     # Explicitly support PageNumberPagination and LimitOffsetPagination. Future
     # versions of this API should only support the system default, PageNumberPagination.
@@ -62,6 +64,13 @@ class ProgramViewSet(CompressedCacheResponseMixin, viewsets.ReadOnlyModelViewSet
         for query_param in query_params:
             context[query_param] = get_query_param(self.request, query_param)
 
+        # Program summaries are computed from either all course runs or the unrestricted ones, see get_queryset
+        excluded_restriction_types = set(get_excluded_restriction_types(self.request))
+        if not excluded_restriction_types:
+            context['program_summary_includes_restricted_runs'] = True
+        elif excluded_restriction_types == set(CourseRunRestrictionType.values):
+            context['program_summary_includes_restricted_runs'] = False
+
         return context
 
     def list(self, request, *args, **kwargs):
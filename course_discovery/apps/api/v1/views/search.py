@@ -16,6 +16,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from course_discovery.apps.api import serializers
+from course_discovery.apps.api.cache import SearchCacheResponseMixin
 from course_discovery.apps.api.utils import get_excluded_restriction_types, update_query_params_with_body_data
 from course_discovery.apps.course_metadata.choices import ProgramStatus
 from course_discovery.apps.course_metadata.models import Person
@@ -82,7 +83,7 @@ class CatalogDataViewSet(viewsets.GenericViewSet):
         return self.list(request)
 
 
-class CourseSearchViewSet(BaseElasticsearchDocumentViewSet):
+class CourseSearchViewSet(SearchCacheResponseMixin, BaseElasticsearchDocumentViewSet):
     """
     Course search viewset
     """
@@ -103,7 +104,7 @@ class CourseSearchViewSet(BaseElasticsearchDocumentViewSet):
     }
 
 
-class CourseRunSearchViewSet(FacetQueryFieldsMixin, BaseElasticsearchDocumentViewSet):
+class CourseRunSearchViewSet(SearchCacheResponseMixin, FacetQueryFieldsMixin, BaseElasticsearchDocumentViewSet):
     """
     CourseRun search viewset.
     """
@@ -139,7 +140,7 @@ class CourseRunSearchViewSet(FacetQueryFieldsMixin, BaseElasticsearchDocumentVie
         return queryset
 
 
-class ProgramSearchViewSet(BaseElasticsearchDocumentViewSet):
+class ProgramSearchViewSet(SearchCacheResponseMixin, BaseElasticsearchDocumentViewSet):
     """
     Program search viewset.
     """
@@ -273,7 +274,7 @@ class BaseAggregateSearchViewSet(FacetQueryFieldsMixin, BaseElasticsearchDocumen
     ordering_fields = {'start': 'start', 'aggregation_key': 'aggregation_key'}
 
 
-class AggregateSearchViewSet(BaseAggregateSearchViewSet):
+class AggregateSearchViewSet(SearchCacheResponseMixin, BaseAggregateSearchViewSet):
     """
     Search all elasticsearch documents.
     """
@@ -7,9 +7,11 @@ from elasticsearch.exceptions import RequestError
 from elasticsearch_dsl.query import Q as ESDSLQ
 from guardian.shortcuts import get_users_with_perms
 
+from course_discovery.apps.catalogs.utils import get_query_matches, matches_contain
 from course_discovery.apps.core.mixins import ModelPermissionsMixin
 from course_discovery.apps.course_metadata.models import Course, CourseRun, Program
-from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument, CourseRunDocument
+from course_discovery.apps.course_metadata.utils import clean_query
 
 
 class Catalog(ModelPermissionsMixin, TimeStampedModel):
@@ -43,7 +45,9 @@ class Catalog(ModelPermissionsMixin, TimeStampedModel):
         Returns:
             QuerySet
         """
-        return Course.search(self.query)
+        if clean_query(self.query) == '(*)':
+            return Course.objects.all()
+        return Course.objects.filter(pk__in=list(get_query_matches(CourseDocument, self.query)))
 
     def programs(self):
         """ Returns the list of Programs contained within this catalog.
@@ -72,9 +76,9 @@ class Catalog(ModelPermissionsMixin, TimeStampedModel):
                   contained in this catalog.
         """
         contains = {course_id: False for course_id in course_ids}
-        results = self._get_query_results().filter('terms', **{'key.raw': course_ids})
-        for result in results:
-            contains[result.key] = True
+        matches = get_query_matches(CourseDocument, self.query)
+        for key, pk in Course.objects.filter(key__in=course_ids).values_list('key', 'pk'):
+            contains[key] = matches_contain(matches, pk)
 
         return contains
 
@@ -90,12 +94,9 @@ class Catalog(ModelPermissionsMixin, TimeStampedModel):
                   contained in this catalog.
         """
         contains = {course_run_id: False for course_run_id in course_run_ids}
-        course_runs = CourseRun.search(self.query).filter('terms', **{'key.raw': course_run_ids}).source(['key'])
-        try:
-            course_runs_keys = [i.key for i in course_runs]
-        except RequestError:
-            course_runs_keys = []
-        contains.update({course_run_id: course_run_id in course_runs_keys for course_run_id in course_run_ids})
+        matches = get_query_matches(CourseRunDocument, self.query)
+        for key, pk in CourseRun.objects.filter(key__in=course_run_ids).values_list('key', 'pk'):
+            contains[key] = matches_contain(matches, pk)
 
         return contains
 
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import ddt
 import pytest
 from django.contrib.auth.models import ContentType, Permission
@@ -35,6 +37,14 @@ class CatalogTests(ElasticsearchTestMixin, TestCase):
         """ Verify the method returns a QuerySet of courses contained in the catalog. """
         assert list(self.catalog.courses()) == [self.course]
 
+    def test_courses_match_all(self):
+        """ Verify the method returns all the courses without searching if the query matches everything. """
+        other_course = CourseFactory(key='d/e/f', title='ABDEF')
+        catalog = factories.CatalogFactory(query='*')
+        with mock.patch('course_discovery.apps.catalogs.models.get_query_matches') as mock_get_query_matches:
+            assert set(catalog.courses()) == {self.course, other_course}
+        mock_get_query_matches.assert_not_called()
+
     def test_contains(self):
         """ Verify the method returns a mapping of course IDs to booleans. """
         uncontained_course = CourseFactory(key='d/e/f', title='ABDEF')
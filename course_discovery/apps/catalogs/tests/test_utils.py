@@ -0,0 +1,39 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from course_discovery.apps.catalogs import utils
+from course_discovery.apps.catalogs.utils import get_query_matches, matches_contain
+from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin
+from course_discovery.apps.core.utils import bump_search_index_generation
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument
+from course_discovery.apps.course_metadata.tests.factories import CourseFactory
+
+
+class QueryMatchesTests(ElasticsearchTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        utils._local_query_matches.clear()  # pylint: disable=protected-access
+        self.courses = CourseFactory.create_batch(3, title='ABCs of matching')
+        self.other_course = CourseFactory(title='Unrelated')
+        self.refresh_index()
+
+    def test_matches(self):
+        """ Verify that the matches contain exactly the courses matching the query. """
+        matches = get_query_matches(CourseDocument, 'title:abc*')
+        assert list(matches) == sorted(course.pk for course in self.courses)
+        assert all(matches_contain(matches, course.pk) for course in self.courses)
+        assert not matches_contain(matches, self.other_course.pk)
+
+    def test_matches_cached_per_generation(self):
+        """ Verify that matches are only searched for again once the search indexes change. """
+        with mock.patch.object(utils, 'iterate_pks', return_value=[3, 1, 2]) as mock_iterate_pks:
+            assert list(get_query_matches(CourseDocument, 'title:abc*')) == [1, 2, 3]
+            assert list(get_query_matches(CourseDocument, 'title:abc*')) == [1, 2, 3]
+            assert mock_iterate_pks.call_count == 1
+
+            bump_search_index_generation()
+            get_query_matches(CourseDocument, 'title:abc*')
+            assert mock_iterate_pks.call_count == 2
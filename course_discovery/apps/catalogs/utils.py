@@ -0,0 +1,77 @@
+"""
+Resolution of catalog queries to the courses and course runs they contain.
+
+Catalog queries rarely change while their contents are checked constantly, so the primary keys
+matching each query are cached as a sorted array for the current search index generation.
+"""
+import hashlib
+import logging
+from array import array
+from bisect import bisect_left
+
+from django.conf import settings
+from django.core.cache import cache
+from elasticsearch.exceptions import RequestError
+from elasticsearch_dsl.query import Q as ESDSLQ
+
+from course_discovery.apps.core.utils import get_search_index_generation
+from course_discovery.apps.course_metadata.utils import clean_query
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.search import iterate_pks
+
+logger = logging.getLogger(__name__)
+QUERY_MATCHES_CACHE_KEY_PREFIX = 'catalog_query_matches'
+
+# Per-process copy of the most recently used matches, to answer repeated checks without a cache round trip.
+_local_query_matches = {}
+
+
+def get_query_matches(document, query):
+    """
+    Returns the primary keys of the objects of the given document matching a catalog query.
+
+    Arguments:
+        document (Document): Document class whose index is searched.
+        query (str): Elasticsearch querystring (e.g. `title:intro*`)
+
+    Returns:
+        array: Sorted primary keys of the matching objects.
+    """
+    query = clean_query(query)
+    query_hash = hashlib.md5(query.encode('utf-8'), usedforsecurity=False).hexdigest()
+    key = '{prefix}.{document}.{generation}.{query_hash}'.format(
+        prefix=QUERY_MATCHES_CACHE_KEY_PREFIX,
+        document=document.__name__,
+        generation=get_search_index_generation(),
+        query_hash=query_hash,
+    )
+
+    matches = _local_query_matches.get(key)
+    if matches is None:
+        matches = cache.get(key)
+
+    if matches is None:
+        if query == '(*)':
+            # Wildcard searching is very expensive in elasticsearch, and matches everything anyway.
+            dsl_query = ESDSLQ('match_all')
+        else:
+            dsl_query = ESDSLQ('query_string', query=query, analyze_wildcard=True)
+        try:
+            matches = array('Q', sorted(iterate_pks(document, dsl_query)))
+        except RequestError as exp:
+            logger.warning('Elasticsearch request is failed. Got exception: %r', exp)
+            return array('Q')
+        cache.set(key, matches, settings.CATALOG_QUERY_MATCHES_CACHE_TIMEOUT)
+
+    if len(_local_query_matches) >= settings.CATALOG_QUERY_MATCHES_LOCAL_CACHE_SIZE:
+        _local_query_matches.clear()
+    _local_query_matches[key] = matches
+
+    return matches
+
+
+def matches_contain(matches, pk):
+    """
+    Returns whether the sorted primary keys returned by get_query_matches contain the given one.
+    """
+    index = bisect_left(matches, pk)
+    return index < len(matches) and matches[index] == pk
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class CoreAppConfig(AppConfig):
+    name = 'course_discovery.apps.core'
+    verbose_name = 'Core'
+
+    def ready(self):
+        super().ready()
+        # noinspection PyUnresolvedReferences
+        import course_discovery.apps.core.signals  # pylint: disable=import-outside-toplevel,unused-import
@@ -0,0 +1,37 @@
+""" Core signal receivers. """
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from course_discovery.apps.core.models import User, UserThrottleRate
+from course_discovery.apps.core.throttles import invalidate_user_throttle_rates
+
+
+@receiver(post_save, sender=UserThrottleRate)
+@receiver(post_delete, sender=UserThrottleRate)
+def user_throttle_rate_changed(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    invalidate_user_throttle_rates([instance.user_id])
+
+
+@receiver(post_save, sender=User)
+def user_created(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
+    # The id of a deleted user may be reused, don't let the new user inherit its throttle rate
+    if created:
+        invalidate_user_throttle_rates([instance.pk])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def user_groups_changed(sender, instance, action, reverse, pk_set, **kwargs):  # pylint: disable=unused-argument
+    """ Publisher users, i.e. members of any group, aren't throttled. """
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            invalidate_user_throttle_rates([instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        invalidate_user_throttle_rates(pk_set)
+    elif action == 'pre_clear':
+        invalidate_user_throttle_rates(instance.user_set.values_list('pk', flat=True))
+
+
+@receiver(pre_delete, sender=Group)
+def group_deleted(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    invalidate_user_throttle_rates(instance.user_set.values_list('pk', flat=True))
@@ -6,7 +6,9 @@ from rest_framework.test import APITestCase
 from course_discovery.apps.api.tests.mixins import SiteMixin
 from course_discovery.apps.core.models import UserThrottleRate
 from course_discovery.apps.core.tests.factories import USER_PASSWORD, UserFactory
-from course_discovery.apps.core.throttles import OverridableUserRateThrottle, throttling_cache
+from course_discovery.apps.core.throttles import (
+    OverridableUserRateThrottle, get_user_throttle_rate, invalidate_user_throttle_rates, throttling_cache
+)
 from course_discovery.apps.publisher.tests.factories import GroupFactory
 
 
@@ -84,3 +86,61 @@ class RateLimitingExceededTest(SiteMixin, APITestCase):
         self.user.save()
         UserThrottleRate.objects.create(user=self.user, rate='10/hour')
         self.assert_rate_limited(11)
+
+
+class UserThrottleRateCacheTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory()
+
+    def tearDown(self):
+        super().tearDown()
+        throttling_cache().clear()
+
+    def test_cached(self):
+        """ Verify that throttle rates are only looked up once, from the throttling cache or the current process. """
+        with self.assertNumQueries(2):
+            assert get_user_throttle_rate(self.user) == (None, False)
+        with self.assertNumQueries(0):
+            assert get_user_throttle_rate(self.user) == (None, False)
+
+        # Other processes find the rate in the throttling cache
+        with patch.dict('course_discovery.apps.core.throttles._local_user_throttle_rates', clear=True):
+            with self.assertNumQueries(0):
+                assert get_user_throttle_rate(self.user) == (None, False)
+
+    def test_invalidated_by_throttle_rate_changes(self):
+        """ Verify that creating, updating or deleting a UserThrottleRate invalidates the cached rate. """
+        get_user_throttle_rate(self.user)
+        user_throttle = UserThrottleRate.objects.create(user=self.user, rate='10/hour')
+        assert get_user_throttle_rate(self.user) == ('10/hour', False)
+
+        user_throttle.rate = '20/hour'
+        user_throttle.save()
+        assert get_user_throttle_rate(self.user) == ('20/hour', False)
+
+        user_throttle.delete()
+        assert get_user_throttle_rate(self.user) == (None, False)
+
+    def test_invalidated_by_group_changes(self):
+        """ Verify that group membership changes, from either side, invalidate the cached publisher status. """
+        group = GroupFactory()
+        get_user_throttle_rate(self.user)
+        self.user.groups.add(group)
+        assert get_user_throttle_rate(self.user) == (None, True)
+
+        group.user_set.remove(self.user)
+        assert get_user_throttle_rate(self.user) == (None, False)
+
+        group.user_set.add(self.user)
+        assert get_user_throttle_rate(self.user) == (None, True)
+
+        group.delete()
+        assert get_user_throttle_rate(self.user) == (None, False)
+
+    def test_invalidate_user_throttle_rates(self):
+        """ Verify that invalidated users are looked up again. """
+        get_user_throttle_rate(self.user)
+        invalidate_user_throttle_rates([self.user.pk])
+        with self.assertNumQueries(2):
+            get_user_throttle_rate(self.user)
@@ -1,10 +1,20 @@
 """Custom API throttles."""
+import time
+
+from django.conf import settings
 from django.core.cache import InvalidCacheBackendError, caches
 from rest_framework.throttling import UserRateThrottle
 
 from course_discovery.apps.core.models import UserThrottleRate
 from course_discovery.apps.publisher.utils import is_publisher_user
 
+USER_THROTTLE_RATE_KEY_PREFIX = 'user_throttle_rate'
+# Upper bound of the number of users whose throttle rates are remembered by each process
+USER_THROTTLE_RATE_LOCAL_CACHE_SIZE = 10000
+
+# Per-process copy of recently used throttle rates, mapping user ids to (expiry, rate, is_publisher).
+_local_user_throttle_rates = {}
+
 
 def throttling_cache():
     """
@@ -16,6 +26,50 @@ def throttling_cache():
         return caches['default']
 
 
+def get_user_throttle_rate_key(user_id):
+    return f'{USER_THROTTLE_RATE_KEY_PREFIX}.{user_id}'
+
+
+def get_user_throttle_rate(user):
+    """
+    Returns the user's overridden throttle rate, and whether they are a publisher user.
+
+    Both are cached in the throttling cache until the user's throttle rate or groups change, and
+    remembered by the current process for USER_THROTTLE_RATE_LOCAL_CACHE_TIMEOUT seconds.
+
+    Arguments:
+        user (User): Authenticated user making the request.
+
+    Returns:
+        tuple: (rate, is_publisher), where rate is None if the user's rate isn't overridden.
+    """
+    now = time.monotonic()
+    local = _local_user_throttle_rates.get(user.pk)
+    if local and local[0] > now:
+        return local[1:]
+
+    cache = throttling_cache()
+    key = get_user_throttle_rate_key(user.pk)
+    user_rate = cache.get(key)
+    if user_rate is None:
+        rate = UserThrottleRate.objects.filter(user=user).values_list('rate', flat=True).first()
+        user_rate = (rate, rate is None and is_publisher_user(user))
+        cache.set(key, user_rate, settings.USER_THROTTLE_RATE_CACHE_TIMEOUT)
+
+    if len(_local_user_throttle_rates) >= USER_THROTTLE_RATE_LOCAL_CACHE_SIZE:
+        _local_user_throttle_rates.clear()
+    _local_user_throttle_rates[user.pk] = (now + settings.USER_THROTTLE_RATE_LOCAL_CACHE_TIMEOUT, *user_rate)
+    return tuple(user_rate)
+
+
+def invalidate_user_throttle_rates(user_ids):
+    """ Forget the cached throttle rates of the given users. """
+    user_ids = list(user_ids)
+    throttling_cache().delete_many([get_user_throttle_rate_key(user_id) for user_id in user_ids])
+    for user_id in user_ids:
+        _local_user_throttle_rates.pop(user_id, None)
+
+
 class OverridableUserRateThrottle(UserRateThrottle):
     """Rate throttling of requests, overridable on a per-user basis."""
     cache = throttling_cache()
@@ -24,14 +78,13 @@ class OverridableUserRateThrottle(UserRateThrottle):
         user = request.user
 
         if user and user.is_authenticated:
-            try:
+            rate, is_publisher = get_user_throttle_rate(user)
+            if rate:
                 # Override this throttle's rate if applicable
-                user_throttle = UserThrottleRate.objects.get(user=user)
-                self.rate = user_throttle.rate
+                self.rate = rate
                 self.num_requests, self.duration = self.parse_rate(self.rate)
-            except UserThrottleRate.DoesNotExist:
+            elif user.is_superuser or user.is_staff or is_publisher:
                 # If we don't have a custom user override, skip throttling if they are a privileged user
-                if user.is_superuser or user.is_staff or is_publisher_user(user):
-                    return True
+                return True
 
         return super().allow_request(request, view)
@@ -1,14 +1,18 @@
 import datetime
 import logging
 import re
+import time
 from collections import namedtuple
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import prefetch_related_objects
 from django_elasticsearch_dsl import Index
+from django_elasticsearch_dsl.registries import registry
 
 IndexMeta = namedtuple("IndexMeta", "name alias")
 logger = logging.getLogger(__name__)
+SEARCH_INDEX_GENERATION_KEY = 'search_index_generation'
 
 INDEX_ALIAS_REGEX = re.compile(r'^(\w+)(?=[_]\d{8}[_]\d{6})')
 INDEX_ALIAS_SLICE = slice(0, -16)
@@ -21,6 +25,32 @@ INDEX_ALIAS_SLICE = slice(0, -16)
 # >>> 'course_run'
 
 
+def get_search_index_generation():
+    """
+    Returns the generation of the search indexes, which changes every time their contents may have changed.
+    Use it as part of the key of anything cached from search results.
+    """
+    return cache.get_or_set(SEARCH_INDEX_GENERATION_KEY, time.time, None)
+
+
+def bump_search_index_generation():
+    cache.set(SEARCH_INDEX_GENERATION_KEY, time.time(), None)
+
+
+def get_document_path(document):
+    """
+    Returns the dotted path of a document class, which identifies it across processes.
+    """
+    return f'{document.__module__}.{document.__name__}'
+
+
+def get_document(document_path):
+    """
+    Returns the registered document class with the given dotted path.
+    """
+    return next(document for document in registry.get_documents() if get_document_path(document) == document_path)
+
+
 def serialize_datetime(d):
     return d.strftime('%Y-%m-%dT%H:%M:%SZ') if d else None
 
@@ -70,12 +100,36 @@ class ElasticsearchUtils:
         }
 
         connection.indices.update_aliases(body)
+        bump_search_index_generation()
 
     @classmethod
     def update_max_result_window(cls, connection, max_result_window, index):
         if connection.indices.exists(index=index):
             connection.indices.put_settings(index=index, body={"index": {"max_result_window": max_result_window}})
 
+    @classmethod
+    def prepare_index_for_bulk_load(cls, connection, index):
+        """
+        Disables the refreshes and replicas of the index, which only slow down loading it in bulk.
+
+        Returns:
+            dict: the settings replaced, to be passed to `restore_index_settings` once the index is loaded.
+        """
+        index_settings = connection.indices.get_settings(index=index)[index]['settings']['index']
+        # Settings left to their default values are absent, and resetting them to None restores the default
+        previous_settings = {
+            'refresh_interval': index_settings.get('refresh_interval'),
+            'number_of_replicas': index_settings.get('number_of_replicas'),
+        }
+        connection.indices.put_settings(
+            index=index, body={'index': {'refresh_interval': '-1', 'number_of_replicas': 0}}
+        )
+        return previous_settings
+
+    @classmethod
+    def restore_index_settings(cls, connection, index, index_settings):
+        connection.indices.put_settings(index=index, body={'index': index_settings})
+
     @classmethod
     def create_index(cls, index, conn_name='default'):
         """
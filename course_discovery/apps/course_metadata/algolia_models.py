@@ -8,13 +8,12 @@ from django.utils.translation import gettext as _
 from django.utils.translation import override
 from sortedm2m.fields import SortedManyToManyField
 from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_serialized_skills
 
 from course_discovery.apps.course_metadata.choices import CourseRunStatus, ExternalProductStatus, ProgramStatus
 from course_discovery.apps.course_metadata.models import (
     AbstractLocationRestrictionModel, Course, CourseRun, CourseType, ProductValue, Program, ProgramType
 )
-from course_discovery.apps.course_metadata.utils import transform_skills_data
+from course_discovery.apps.course_metadata.utils import get_product_skills, transform_skills_data
 
 # Algolia can't filter on an empty list, provide a value we can still filter on
 ALGOLIA_EMPTY_LIST = ['null']
@@ -443,7 +442,7 @@ class AlgoliaProxyCourse(Course, AlgoliaBasicModelFieldsMixin):
 
     @property
     def skills(self):
-        skills_data = get_whitelisted_serialized_skills(self.key, ProductTypes.Course)
+        skills_data = get_product_skills(self.key, ProductTypes.Course)
         if not skills_data:
             return ALGOLIA_EMPTY_LIST
         return transform_skills_data(skills_data)
@@ -489,6 +488,7 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
     @classmethod
     def prefetch_queryset(cls):
         return cls.objects.all().prefetch_related(
+            'summaries',
             models.Prefetch(
                 'courses__course_runs', queryset=CourseRun.objects.filter(restricted_run__isnull=True)
             )
@@ -548,6 +548,11 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
     def subject_names(self):
         if self.primary_subject_override:
             return [self.primary_subject_override.name]
+
+        # Subjects don't depend on the course runs, so any summary will do
+        summary = self.get_summary()
+        if summary:
+            return summary.subject_names
         return [subject.name for subject in self.subjects]
 
     @property
@@ -688,7 +693,7 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
 
     @property
     def skills(self):
-        skills_data = get_whitelisted_serialized_skills(self.uuid, ProductTypes.Program)
+        skills_data = get_product_skills(self.uuid, ProductTypes.Program)
         if not skills_data:
             return ALGOLIA_EMPTY_LIST
         return transform_skills_data(skills_data)
@@ -18,7 +18,9 @@ class AbstractDataLoader(metaclass=abc.ABCMeta):
     LOADER_MAX_RETRY = 3
     PAGE_SIZE = 50
 
-    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, enable_api=True):
+    def __init__(
+        self, partner, api_url=None, max_workers=None, is_threadsafe=False, enable_api=True, incremental=False
+    ):
         """
         Arguments:
             partner (Partner): Partner which owns the APIs and data being loaded
@@ -27,6 +29,7 @@ class AbstractDataLoader(metaclass=abc.ABCMeta):
             is_threadsafe (bool): True if multiple threads can be used to write data.
             enable_api (bool): True if we want to use the api functionalities and clients with the dataloader.
                 This will most likely only be turned off for event bus use cases.
+            incremental (bool): True if upstream records which haven't changed since the last run should be skipped.
         """
         self.partner = partner
         self.enable_api = enable_api
@@ -37,6 +40,7 @@ class AbstractDataLoader(metaclass=abc.ABCMeta):
 
         self.max_workers = max_workers
         self.is_threadsafe = is_threadsafe
+        self.incremental = incremental
 
     @abc.abstractmethod
     def ingest(self):  # pragma: no cover
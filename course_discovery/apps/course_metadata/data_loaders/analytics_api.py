@@ -5,7 +5,7 @@ import pytz
 from analyticsclient.client import Client
 
 from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
-from course_discovery.apps.course_metadata.models import CourseRun
+from course_discovery.apps.course_metadata.models import Course, CourseRun, Program
 
 logger = logging.getLogger(__name__)
 
@@ -13,14 +13,15 @@ logger = logging.getLogger(__name__)
 class AnalyticsAPIDataLoader(AbstractDataLoader):
 
     API_TIMEOUT = 120  # time in seconds
+    BULK_UPDATE_BATCH_SIZE = 1000
 
-    def __init__(self, partner, api_url, max_workers=None, is_threadsafe=False):
-        super().__init__(partner, api_url, max_workers, is_threadsafe)
+    def __init__(self, partner, api_url, max_workers=None, is_threadsafe=False, **kwargs):
+        super().__init__(partner, api_url, max_workers, is_threadsafe, **kwargs)
 
-        # uuid: {course, count, recent_count}
-        self.course_dictionary = {}
-        # uuid: {program, count, recent_count}
-        self.program_dictionary = {}
+        # id: [count, recent_count]
+        self.course_run_counts = {}
+        self.course_counts = {}
+        self.program_counts = {}
 
         if not (self.partner.analytics_url and self.partner.analytics_token):
             msg = 'Analytics API credentials are not properly configured for Partner [{partner}]!'.format(
@@ -45,61 +46,54 @@ class AnalyticsAPIDataLoader(AbstractDataLoader):
                                                                                   'count',
                                                                                   'recent_count_change'])
 
+        # Course run keys are matched case insensitively, so resolve them all in memory with a single query
+        course_runs = {
+            key.lower(): (course_run_id, course_id)
+            for course_run_id, key, course_id in CourseRun.objects.values_list('id', 'key', 'course_id')
+        }
         for course_run_summary in course_run_summaries:
-            self._process_course_run_summary(course_run_summary=course_run_summary)
-
-        for course_dict in self.course_dictionary.values():
-            self._process_course_enrollment_count(course_dict['course'],
-                                                  course_dict['count'],
-                                                  course_dict['recent_count'])
-
-        for program_dict in self.program_dictionary.values():
-            # Update program count
-            program = program_dict['program']
-            program.enrollment_count = program_dict['count']
-            program.recent_enrollment_count = program_dict['recent_count']
-            program.save(suppress_publication=True)
-            logger.info('Updating program: %s', program.uuid)
-
-    def _process_course_run_summary(self, course_run_summary):
-        # Get course run object from course run key
+            self._process_course_run_summary(course_run_summary, course_runs)
+
+        program_courses = Program.courses.through.objects.filter(
+            course_id__in=self.course_counts
+        ).values_list('program_id', 'course_id')
+        for program_id, course_id in program_courses:
+            self._add_counts(self.program_counts, program_id, *self.course_counts[course_id])
+
+        # Only the counts are written, skipping history, signals and the status handling of save()
+        self._bulk_update_counts(CourseRun, self.course_run_counts)
+        self._bulk_update_counts(Course, self.course_counts)
+        self._bulk_update_counts(Program, self.program_counts)
+        logger.info(
+            'Updated enrollment counts of %d course runs, %d courses and %d programs.',
+            len(self.course_run_counts), len(self.course_counts), len(self.program_counts),
+        )
+
+    def _process_course_run_summary(self, course_run_summary, course_runs):
         course_run_key = course_run_summary['course_id']
         course_run_count = int(course_run_summary['count'])
         course_run_recent_count = int(course_run_summary['recent_count_change'])
         try:
-            course_run = CourseRun.objects.get(key__iexact=course_run_key)
-        except CourseRun.DoesNotExist:
+            course_run_id, course_id = course_runs[course_run_key.lower()]
+        except KeyError:
             logger.info('Course run: [%s] not found in DB.', course_run_key)
             return
 
-        course = course_run.course
-        # Update course run counts
-        course_run.enrollment_count = course_run_count
-        course_run.recent_enrollment_count = course_run_recent_count
-        course_run.save(suppress_publication=True)
-
-        # Add course run total to course total in dictionary
-        if course.uuid in self.course_dictionary:
-            self.course_dictionary[course.uuid]['count'] += course_run_count
-            self.course_dictionary[course.uuid]['recent_count'] += course_run_recent_count
-        else:
-            self.course_dictionary[course.uuid] = {'course': course,
-                                                   'count': course_run_count,
-                                                   'recent_count': course_run_recent_count}
-
-    def _process_course_enrollment_count(self, course, count, recent_count):
-        # update course count
-        course.enrollment_count = count
-        course.recent_enrollment_count = recent_count
-        course.save()
-
-        # Add course count to program dictionary for all programs
-        for program in course.programs.all():
-            # add course total to program total in dictionary
-            if program.uuid in self.program_dictionary:
-                self.program_dictionary[program.uuid]['count'] += count
-                self.program_dictionary[program.uuid]['recent_count'] += recent_count
-            else:
-                self.program_dictionary[program.uuid] = {'program': program,
-                                                         'count': count,
-                                                         'recent_count': recent_count}
+        self.course_run_counts[course_run_id] = [course_run_count, course_run_recent_count]
+        # Add course run total to course total
+        self._add_counts(self.course_counts, course_id, course_run_count, course_run_recent_count)
+
+    @staticmethod
+    def _add_counts(counts, pk, count, recent_count):
+        totals = counts.setdefault(pk, [0, 0])
+        totals[0] += count
+        totals[1] += recent_count
+
+    def _bulk_update_counts(self, model, counts):
+        instances = [
+            model(pk=pk, enrollment_count=count, recent_enrollment_count=recent_count)
+            for pk, (count, recent_count) in counts.items()
+        ]
+        model.objects.bulk_update(
+            instances, ['enrollment_count', 'recent_enrollment_count'], batch_size=self.BULK_UPDATE_BATCH_SIZE
+        )
@@ -1,16 +1,20 @@
 import concurrent.futures
+import hashlib
 import logging
 import math
+import queue
 import threading
 import time
 from decimal import Decimal
 from io import BytesIO
+from uuid import UUID
 
 import backoff
 import requests
 from django.conf import settings
 from django.core.files import File
 from django.core.management import CommandError
+from django.db import transaction
 from django.db.models import Q
 from opaque_keys.edx.keys import CourseKey
 
@@ -18,11 +22,15 @@ from course_discovery.apps.core.models import Currency
 from course_discovery.apps.course_metadata.choices import CourseRunPacing, CourseRunStatus
 from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
 from course_discovery.apps.course_metadata.data_loaders.course_type import calculate_course_type
+from course_discovery.apps.course_metadata.data_loaders.rate_limiter import TokenBucketRateLimiter, get_retry_after
+from course_discovery.apps.course_metadata.data_loaders.record_hashes import RecordHashes
 from course_discovery.apps.course_metadata.models import (
-    Course, CourseEntitlement, CourseRun, CourseRunType, CourseType, Organization, Program, ProgramType, Seat, SeatType,
-    Source, Video
+    Course, CourseEntitlement, CourseRun, CourseRunType, CourseType, Organization, OutboxMessage, Program, ProgramType,
+    Seat, SeatType, Source, Video
+)
+from course_discovery.apps.course_metadata.toggles import (
+    BYPASS_LMS_DATA_LOADER__END_DATE_UPDATED_CHECK, IS_SIDE_EFFECT_OUTBOX_ENABLED
 )
-from course_discovery.apps.course_metadata.toggles import BYPASS_LMS_DATA_LOADER__END_DATE_UPDATED_CHECK
 from course_discovery.apps.course_metadata.utils import push_to_ecommerce_for_course_run, subtract_deadline_delta
 
 logger = logging.getLogger(__name__)
@@ -45,9 +53,20 @@ class CoursesApiDataLoader(AbstractDataLoader):
     """ Loads course runs from the Courses API. """
 
     PAGE_SIZE = 50
-
-    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, enable_api=True):
-        super().__init__(partner, api_url, max_workers, is_threadsafe, enable_api)
+    # The courses endpoint has a 40 requests/minute rate limit.
+    RATE_LIMIT_REQUESTS = 40
+    RATE_LIMIT_PERIOD = 60
+    RATE_LIMIT_BURST = 5
+    MAX_REQUEST_ATTEMPTS = 4
+    # Maximum number of fetched pages waiting to be processed
+    PREFETCH_PAGES = 4
+
+    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, enable_api=True, **kwargs):
+        super().__init__(partner, api_url, max_workers, is_threadsafe, enable_api, **kwargs)
+        self.rate_limiter = TokenBucketRateLimiter(
+            self.RATE_LIMIT_REQUESTS, self.RATE_LIMIT_PERIOD, burst=self.RATE_LIMIT_BURST
+        )
+        self.record_hashes = RecordHashes(self.partner, self.__class__.__name__, self.incremental)
         self.default_product_source, __ = Source.objects.get_or_create(
             name=settings.DEFAULT_PRODUCT_SOURCE_NAME,
             slug=settings.DEFAULT_PRODUCT_SOURCE_SLUG
@@ -64,62 +83,114 @@ class CoursesApiDataLoader(AbstractDataLoader):
 
         pagerange = range(initial_page + 1, pages + 1)
         logger.info('Looping to request all %d pages...', pages)
+        try:
+            self._load_pages(pagerange)
+        finally:
+            self.record_hashes.save()
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:  # pragma: no cover
-            if self.is_threadsafe:
-                for page in pagerange:
-                    # This time.sleep is to make it very likely that this method does not encounter a 429 status
-                    # code by increasing the amount of time between each code. More details at LEARNER-5560
-                    # The current crude estimation is for ~3000 courses with a PAGE_SIZE=50 which means this method
-                    # will take ~30 minutes.
-                    # TODO Ticket to gracefully handle 429 https://openedx.atlassian.net/browse/LEARNER-5565
-                    time.sleep(30)
-                    executor.submit(self._load_data, page)
-            else:
-                for future in [executor.submit(self._make_request, page) for page in pagerange]:
-                    response = future.result()
+        logger.info('Retrieved %d course runs from %s.', count, self.partner.courses_api_url)
+
+    def _load_pages(self, pagerange):
+        """
+        Request and process the given pages in a producer/consumer pipeline.
+
+        Fetcher threads request pages as fast as the rate limiter allows, staying at most PREFETCH_PAGES
+        pages ahead of the writers, so that network and database work overlap. The calling thread is
+        always a writer; when the loader is threadsafe, additional writer threads process pages too.
+        """
+        fetched = queue.Queue(maxsize=self.PREFETCH_PAGES)
+        failures = []
+        writer_count = (self.max_workers or 1) if self.is_threadsafe else 1
+
+        def fetch(page):
+            try:
+                fetched.put(self._make_request(page))
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.exception('Failed to request course run page %d.', page)
+                failures.append(exc)
+
+        def write():
+            while (response := fetched.get()) is not None:
+                try:
                     self._process_response(response)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception('Failed to process a course run page.')
 
-        logger.info('Retrieved %d course runs from %s.', count, self.partner.courses_api_url)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(fetch, page) for page in pagerange]
 
-    def _load_data(self, page):  # pragma: no cover
-        """Make a request for the given page and process the response."""
-        response = self._make_request(page)
-        self._process_response(response)
+            def finish():
+                concurrent.futures.wait(futures)
+                for __ in range(writer_count):
+                    fetched.put(None)
+
+            threads = [threading.Thread(target=finish)]
+            threads += [threading.Thread(target=write) for __ in range(writer_count - 1)]
+            for thread in threads:
+                thread.start()
+            write()
+            for thread in threads:
+                thread.join()
+
+        if failures:
+            # Fail the loader as a whole, so that it can be retried
+            raise failures[0]
 
-    # The courses endpoint has 40 requests/minute rate limit.
-    # This will back off at a rate of 60/120/240 seconds (from the factor 60 and default value of base 2).
-    # This backoff code can still fail because of the concurrent requests all requesting at the same time.
-    # So even in the case of entering into the next minute, if we still exceed our limit for that min,
-    # any requests that failed in both limits are still approaching their max_tries limit.
-    @backoff.on_exception(
-        backoff.expo,
-        factor=60,
-        max_tries=4,
-        exception=requests.exceptions.RequestException,
-        giveup=_fatal_code,
-    )
     def _make_request(self, page):
-        logger.info('Requesting course run page %d...', page)
+        """
+        Request a page of course runs, without exceeding the rate limit of the courses endpoint.
+
+        Requests answered with a 429 are retried once the Retry-After delay has passed, which also holds
+        back every other request. Other transient errors are retried after a short backoff.
+        """
         params = {'page': page, 'page_size': self.PAGE_SIZE, 'username': self.username, 'active_only': True}
-        response = self.api_client.get(self.api_url + '/courses/', params=params)
-        response.raise_for_status()
-        return response.json()
+        for attempt in range(1, self.MAX_REQUEST_ATTEMPTS + 1):
+            self.rate_limiter.acquire()
+            logger.info('Requesting course run page %d...', page)
+            try:
+                response = self.api_client.get(self.api_url + '/courses/', params=params)
+                response.raise_for_status()
+                return response.json()
+            except requests.exceptions.RequestException as exc:
+                if attempt == self.MAX_REQUEST_ATTEMPTS or _fatal_code(exc):
+                    raise
+
+                if exc.response is not None and exc.response.status_code == 429:
+                    delay = get_retry_after(exc.response)
+                    delay = self.RATE_LIMIT_PERIOD if delay is None else delay
+                    logger.warning('Rate limited while requesting course run page %d, waiting %d seconds.', page, delay)
+                    self.rate_limiter.pause(delay)
+                else:
+                    logger.warning('Failed to request course run page %d, retrying: %r', page, exc)
+                    time.sleep(2 ** attempt)
+
+        return None  # pragma: no cover
 
     def _process_response(self, response):
         results = response['results']
         logger.info('Retrieved %d course runs...', len(results))
 
-        for body in results:
-            self.process_single_course_run(body)
+        bodies = [body for body in results if not self.record_hashes.is_unchanged(body['id'], body)]
+        course_runs = self.get_course_runs([body['id'] for body in bodies])
+        for body in bodies:
+            if self.process_single_course_run(body, course_runs=course_runs):
+                self.record_hashes.mark_applied(body['id'], body)
+
+    def process_single_course_run(self, body, course_runs=None):
+        """
+        Arguments:
+            body (dict): course run data from the Courses API
+            course_runs (dict): existing course runs resolved by get_course_runs, if any
 
-    def process_single_course_run(self, body):
+        Returns:
+            True if the course run was updated or created, False if an error occurred.
+        """
         course_run_id = body['id']
 
         logger.info(f"Starting course processing for id {course_run_id}")
         try:
             body = self.clean_strings(body)
-            official_run, draft_run = self.get_course_run(body)
+            official_run, draft_run = self.get_course_run(body, course_runs=course_runs)
             if official_run or draft_run:
                 self.update_course_run(official_run, draft_run, body)
                 if not self.partner.uses_publisher:
@@ -148,13 +219,49 @@ class CoursesApiDataLoader(AbstractDataLoader):
                 )
 
             logger.exception(msg)
+            return False
+
+        return True
+
+    def get_course_runs(self, course_run_keys):
+        """
+        Resolve the official and draft versions of many course runs at once, along with the courses
+        they are canonical for and their seats.
+
+        Returns:
+            dict mapping lowercased course run keys to tuples of (official, draft) versions of the run.
+        """
+        runs = list(
+            CourseRun.everything.filter(key__in=course_run_keys).select_related(
+                'canonical_for_course'
+            ).prefetch_related('seats').order_by('pk')
+        )
+        officials = {run.draft_version_id: run for run in runs if not run.draft and run.draft_version_id}
+
+        course_runs = {}
+        # Like filter_drafts().first(), which only considers drafts and official versions without a draft
+        for run in runs:
+            if run.draft:
+                course_runs.setdefault(run.key.lower(), (officials.get(run.id), run))
+            elif not run.draft_version_id:
+                course_runs.setdefault(run.key.lower(), (run, None))
+
+        return course_runs
 
-    def get_course_run(self, body):
+    def get_course_run(self, body, course_runs=None):
         """
+        Arguments:
+            body (dict): course run data from the Courses API
+            course_runs (dict): existing course runs resolved by get_course_runs, if any
+
         Returns:
             Tuple of (official, draft) versions of the run.
         """
         course_run_key = body['id']
+        if course_runs and course_run_key.lower() in course_runs:
+            return course_runs[course_run_key.lower()]
+
+        # Keys which differ in case from the stored ones, and new runs, are looked up one by one
         run = CourseRun.objects.filter_drafts(key__iexact=course_run_key).first()
         if not run:
             return None, None
@@ -173,9 +280,14 @@ class CoursesApiDataLoader(AbstractDataLoader):
         if BYPASS_LMS_DATA_LOADER__END_DATE_UPDATED_CHECK.is_enabled() or end_has_updated:
             self._update_verified_deadline_for_course_run(official_run)
             self._update_verified_deadline_for_course_run(draft_run)
-            has_upgrade_deadline_override = run.seats.filter(upgrade_deadline_override__isnull=False)
+            has_upgrade_deadline_override = any(
+                seat.upgrade_deadline_override is not None for seat in run.seats.all()
+            )
             if not has_upgrade_deadline_override and official_run:
-                push_to_ecommerce_for_course_run(official_run)
+                if IS_SIDE_EFFECT_OUTBOX_ENABLED.is_enabled():
+                    OutboxMessage.enqueue(OutboxMessage.ECOMMERCE, 'ecommerce_course_run', official_run)
+                else:
+                    push_to_ecommerce_for_course_run(official_run)
 
         logger.info(f'Processed course run with UUID [{run.uuid}] and key [{run.key}].')
 
@@ -239,7 +351,10 @@ class CoursesApiDataLoader(AbstractDataLoader):
         logger.info('Processed course with key [%s].', course.key)
 
     def _update_verified_deadline_for_course_run(self, course_run):
-        seats = course_run.seats.filter(type=Seat.VERIFIED) if course_run and course_run.end else []
+        # Filter in memory, so that seats prefetched by get_course_runs are reused
+        seats = [
+            seat for seat in course_run.seats.all() if seat.type_id == Seat.VERIFIED
+        ] if course_run and course_run.end else []
         for seat in seats:
             previous_upgrade_deadline = seat.upgrade_deadline
             seat.upgrade_deadline = subtract_deadline_delta(
@@ -343,10 +458,18 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self.course_run_count_lock = threading.Lock()
         self.entitlement_count_lock = threading.Lock()
         self.enrollment_code_lock = threading.Lock()
+        self.record_hashes = RecordHashes(self.partner, self.__class__.__name__, self.incremental)
+        # Courses whose products were loaded, and lookups shared by all products. These are reset by each run.
+        self.touched_course_ids = set()
+        self.seat_types = {}
+        self.currencies = {}
 
     def ingest(self):
         logger.info('Refreshing ecommerce data from %s...', self.partner.ecommerce_api_url)
-        self._load_ecommerce_data()
+        try:
+            self._load_ecommerce_data()
+        finally:
+            self.record_hashes.save()
 
         if self.processing_failure_occurred:  # pragma: no cover
             logger.warning(
@@ -357,71 +480,54 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self._delete_entitlements()
 
     def _load_ecommerce_data(self):
-        course_runs = self._request_course_runs(self.initial_page)
-        entitlements = self._request_entitlements(self.initial_page)
-        enrollment_codes = self._request_enrollment_codes(self.initial_page)
+        """
+        Request and write the seats, entitlements and enrollment codes of all course runs.
 
+        The pages of the three product feeds are requested concurrently, and written by the calling
+        thread as soon as they arrive. Enrollment codes are attached to seats, so they are only written
+        once all seats have been.
+        """
         self.entitlement_skus = []
         self.enrollment_skus = []
+        self.touched_course_ids = set()
+        self.seat_types = {seat_type.slug: seat_type for seat_type in SeatType.objects.all()}
+        self.currencies = {currency.code: currency for currency in Currency.objects.all()}
 
         self.processing_failure_occurred = False
         self.course_run_count = 0
         self.entitlement_count = 0
         self.enrollment_code_count = 0
-        self._process_course_runs(course_runs)
-        self._process_entitlements(entitlements)
-        self._process_enrollment_codes(enrollment_codes)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:  # pragma: no cover
-            # Create pageranges to iterate over all existing pages for each product type
-            pageranges = {
-                'course_runs': self._pagerange(course_runs['count']),
-                'entitlements': self._pagerange(entitlements['count']),
-                'enrollment_codes': self._pagerange(enrollment_codes['count'])
-            }
-
-            if self.is_threadsafe:
-                for page in pageranges['course_runs']:
-                    executor.submit(self._request_course_runs, page).add_done_callback(
-                        lambda future: self._check_future_and_process(future, self._process_course_runs)
-                    )
-                for page in pageranges['entitlements']:
-                    executor.submit(self._request_entitlements, page).add_done_callback(
-                        lambda future: self._check_future_and_process(future, self.process_entitlements)
-                    )
-                for page in pageranges['enrollment_codes']:
-                    executor.submit(self._request_enrollment_codes, page).add_done_callback(
-                        lambda future: self._check_future_and_process(future, self.process_enrollment_codes)
-                    )
-            else:
-                # Process in batches and wait for the result from the futures
-                pagerange = pageranges['course_runs']
-                for future in concurrent.futures.as_completed(
-                    executor.submit(self._request_course_runs, page) for page in pagerange
-                ):
-                    self._check_future_and_process(
-                        future, self._process_course_runs,
-                    )
-
-                pagerange = pageranges['entitlements']
-                for future in concurrent.futures.as_completed(
-                    executor.submit(self._request_entitlements, page) for page in pagerange
-                ):
-                    self._check_future_and_process(
-                        future, self._process_entitlements,
-                    )
 
-                pagerange = pageranges['enrollment_codes']
-                for future in concurrent.futures.as_completed(
-                    executor.submit(self._request_enrollment_codes, page) for page in pagerange
-                ):
-                    self._check_future_and_process(
-                        future, self._process_enrollment_codes,
-                    )
+        feeds = {
+            'course_runs': (self._request_course_runs, self._process_course_runs),
+            'entitlements': (self._request_entitlements, self._process_entitlements),
+            'enrollment_codes': (self._request_enrollment_codes, self._process_enrollment_codes),
+        }
+        expected_counts = {}
+        enrollment_code_pages = []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            first_pages = {feed: executor.submit(request, self.initial_page) for feed, (request, __) in feeds.items()}
+            futures = {}
+            for feed, first_page in first_pages.items():
+                # The first page of each feed tells how many pages remain to be requested
+                expected_counts[feed] = first_page.result()['count']
+                futures[first_page] = feed
+                for page in self._pagerange(expected_counts[feed]):
+                    futures[executor.submit(feeds[feed][0], page)] = feed
+
+            for future in concurrent.futures.as_completed(futures):
+                if futures[future] == 'enrollment_codes':
+                    enrollment_code_pages.append(future)
+                else:
+                    self._check_future_and_process(future, feeds[futures[future]][1])
+
+        for future in enrollment_code_pages:
+            self._check_future_and_process(future, self._process_enrollment_codes)
 
         logger.info('Expected %d course seats, %d course entitlements, and %d enrollment codes from %s.',
-                    course_runs['count'], entitlements['count'],
-                    enrollment_codes['count'], self.partner.ecommerce_api_url)
+                    expected_counts['course_runs'], expected_counts['entitlements'],
+                    expected_counts['enrollment_codes'], self.partner.ecommerce_api_url)
 
         logger.info('Actually Received %d course seats, %d course entitlements, and %d enrollment codes from %s.',
                     self.course_run_count,
@@ -429,19 +535,23 @@ class EcommerceApiDataLoader(AbstractDataLoader):
                     self.enrollment_code_count,
                     self.partner.ecommerce_api_url)
 
-        # Try to upgrade empty run types to real ones, now that we have seats from ecommerce
+        # Try to upgrade empty run types to real ones, now that we have seats from ecommerce. Only the courses
+        # whose products were loaded during this run, and their drafts, can have gained seats.
         empty_course_type = CourseType.objects.get(slug=CourseType.EMPTY)
         empty_course_run_type = CourseRunType.objects.get(slug=CourseRunType.EMPTY)
         has_empty_type = (Q(type=empty_course_type, course_runs__seats__isnull=False) |
                           Q(course_runs__type=empty_course_run_type, course_runs__seats__isnull=False))
-        for course in Course.everything.filter(has_empty_type, partner=self.partner).distinct().iterator():
+        touched_keys = Course.everything.filter(pk__in=self.touched_course_ids).values('key')
+        for course in Course.everything.filter(
+            has_empty_type, partner=self.partner, key__in=touched_keys
+        ).distinct().iterator():
             if not calculate_course_type(course, commit=True):
                 logger.warning('Calculating course type failure occurred for [%s].', course)
                 self.processing_failure_occurred = True
 
-        if (self.course_run_count != course_runs['count'] or
-                self.entitlement_count != entitlements['count'] or
-                self.enrollment_code_count != enrollment_codes['count']):  # pragma: no cover
+        if (self.course_run_count != expected_counts['course_runs'] or
+                self.entitlement_count != expected_counts['entitlements'] or
+                self.enrollment_code_count != expected_counts['enrollment_codes']):  # pragma: no cover
             # The count expected should match the count received
             logger.warning('There is a mismatch in the expected count of results and the actual results.')
             self.processing_failure_occurred = True
@@ -484,9 +594,11 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self.course_run_count_lock.acquire()  # lint-amnesty, pylint: disable=consider-using-with
         self.course_run_count += len(results)
         self.course_run_count_lock.release()
-        for body in results:
-            body = self.clean_strings(body)
-            self.update_seats(body)
+        bodies = [body for body in results if not self.record_hashes.is_unchanged(body['id'], body)]
+        course_runs = self.get_course_runs([body['id'] for body in bodies])
+        for body in bodies:
+            if self.update_seats(self.clean_strings(body), course_runs=course_runs):
+                self.record_hashes.mark_applied(body['id'], body)
 
     def _process_entitlements(self, response):
         results = response['results']
@@ -539,19 +651,62 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             # Protect against deletes if exceptions occurred
             self.processing_failure_occurred = True
 
-    def update_seats(self, body):
-        course_run_key = body['id']
-        try:
-            course_run = CourseRun.objects.get(key__iexact=course_run_key)
-        except CourseRun.DoesNotExist:
-            logger.warning('Could not find course run [%s]', course_run_key)
-            return
+    def get_course_runs(self, course_run_keys):
+        """
+        Resolve many course runs at once, along with their types and seats.
+
+        Returns:
+            dict mapping lowercased course run keys to course runs
+        """
+        course_runs = CourseRun.objects.filter(key__in=course_run_keys).select_related(
+            'type', 'draft_version'
+        ).prefetch_related('seats', 'type__tracks')
+        return {course_run.key.lower(): course_run for course_run in course_runs}
+
+    def _get_seat_type(self, slug):
+        if slug not in self.seat_types:
+            self.seat_types[slug] = SeatType.objects.filter(slug=slug).first()
+        return self.seat_types[slug]
+
+    def _get_currency(self, code):
+        if code not in self.currencies:
+            self.currencies[code] = Currency.objects.filter(code=code).first()
+        return self.currencies[code]
+
+    @staticmethod
+    def _get_seat_lookup(seat_type_slug, credit_provider, currency_code):
+        # Seats are matched case insensitively, like the database does under MySQL collations
+        return seat_type_slug, credit_provider.lower() if credit_provider else credit_provider, currency_code
+
+    def update_seats(self, body, course_runs=None):
+        """
+        Arguments:
+            body (dict): course run data, including its products, from ecommerce
+            course_runs (dict): course runs resolved by get_course_runs, if any
 
+        Returns:
+            True if all seats of the course run were updated, else False
+        """
+        course_run_key = body['id']
+        course_run = (course_runs or {}).get(course_run_key.lower())
+        if course_run is None:
+            try:
+                course_run = CourseRun.objects.get(key__iexact=course_run_key)
+            except CourseRun.DoesNotExist:
+                logger.warning('Could not find course run [%s]', course_run_key)
+                return False
+
+        self.touched_course_ids.add(course_run.course_id)
+        seats = {
+            self._get_seat_lookup(seat.type_id, seat.credit_provider, seat.currency_id): seat
+            for seat in course_run.seats.all()
+        }
+        updated = True
         for product_body in body['products']:
             if product_body['structure'] != 'child':
                 continue
             product_body = self.clean_strings(product_body)
-            self.update_seat(course_run, product_body)
+            updated = self.update_seat(course_run, product_body, seats=seats) and updated
 
         # Remove seats which no longer exist for that course run
         certificate_types = [self.get_certificate_type(product) for product in body['products']
@@ -570,7 +725,18 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             draft_seats_to_remove = course_run.draft_version.seats.exclude(type__slug__in=certificate_types)
             draft_seats_to_remove.delete()
 
-    def update_seat(self, course_run, product_body):
+        return updated
+
+    def update_seat(self, course_run, product_body, seats=None):
+        """
+        Arguments:
+            course_run (CourseRun): course run the seat belongs to
+            product_body (dict): seat product data from ecommerce
+            seats (dict): existing seats of the course run, by seat lookup. Created seats are added to it.
+
+        Returns:
+            False if the seat could not be loaded, else True
+        """
         stock_record = product_body['stockrecords'][0]
         currency_code = stock_record['price_currency']
         price = Decimal(stock_record['price_excl_tax'])
@@ -579,33 +745,33 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         # For more context see ADR docs/decisions/0025-dont-sync-mobile-skus-on-discovery.rst
         if "mobile" in sku:
             logger.warning("Skipping mobile seat with sku [%s]", sku)
-            return
+            return True
 
-        try:
-            currency = Currency.objects.get(code=currency_code)
-        except Currency.DoesNotExist:
+        currency = self._get_currency(currency_code)
+        if currency is None:
             logger.warning("Could not find currency [%s]", currency_code)
-            return
+            return False
 
         attributes = {attribute['name']: attribute['value'] for attribute in product_body['attribute_values']}
 
         certificate_type = attributes.get('certificate_type', Seat.AUDIT)
-        try:
-            seat_type = SeatType.objects.get(slug=certificate_type)
-        except SeatType.DoesNotExist:
+        seat_type = self._get_seat_type(certificate_type)
+        if seat_type is None:
             msg = ('Could not find seat type {seat_type} while loading seat with sku {sku} for course run with key '
                    '{key}'.format(seat_type=certificate_type, sku=sku, key=course_run.key))
             logger.warning(msg)
             self.processing_failure_occurred = True
-            return
-        if not course_run.type.empty and not course_run.type.tracks.filter(seat_type=seat_type).exists():
+            return False
+        if not course_run.type.empty and not any(
+            track.seat_type_id == seat_type.id for track in course_run.type.tracks.all()
+        ):
             logger.warning(
                 'Seat type {seat_type} is not compatible with course run type {run_type} for course run {key}'.format(  # lint-amnesty, pylint: disable=logging-format-interpolation
                     seat_type=seat_type.slug, run_type=course_run.type.slug, key=course_run.key,
                 )
             )
             self.processing_failure_occurred = True
-            return
+            return False
 
         credit_provider = attributes.get('credit_provider')
 
@@ -620,12 +786,26 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             'credit_hours': credit_hours,
         }
 
-        seat, created = course_run.seats.update_or_create(
-            type=seat_type,
-            credit_provider=credit_provider,
-            currency=currency,
-            defaults=defaults
-        )
+        if seats is None:
+            seats = {
+                self._get_seat_lookup(seat.type_id, seat.credit_provider, seat.currency_id): seat
+                for seat in course_run.seats.all()
+            }
+        lookup = self._get_seat_lookup(seat_type.slug, credit_provider, currency.code)
+        seat = seats.get(lookup)
+        created = seat is None
+        if created:
+            seat = seats[lookup] = course_run.seats.create(
+                type=seat_type, credit_provider=credit_provider, currency=currency, **defaults
+            )
+        elif any(
+            # upgrade_deadline returns the override if there is one, compare the deadline it sets instead
+            getattr(seat, '_upgrade_deadline' if field == 'upgrade_deadline' else field) != value
+            for field, value in defaults.items()
+        ):
+            for field, value in defaults.items():
+                setattr(seat, field, value)
+            seat.save()
 
         if course_run.draft_version:
             draft_seat, _ = course_run.draft_version.seats.update_or_create(
@@ -641,6 +821,8 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         if created:
             logger.info('Created seat for course with key [%s] and sku [%s].', course_run.key, sku)
 
+        return True
+
     def validate_stockrecord(self, stockrecords, title, product_class):
         """
         Argument:
@@ -770,6 +952,7 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             title=title, sku=sku, partner=self.partner
         )
         logger.info(msg)
+        self.touched_course_ids.add(course.id)
         entitlement, _ = course.entitlements.update_or_create(mode=mode, defaults=defaults)
         if course.draft_version:
             draft_entitlement, _ = course.draft_version.entitlements.update_or_create(
@@ -824,6 +1007,7 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         )
         logger.info(msg)
 
+        self.touched_course_ids.add(course_run.course_id)
         seat, _ = course_run.seats.update_or_create(type=seat_type, defaults=defaults)
         if course_run.draft_version:
             draft_seat, _ = course_run.draft_version.seats.update_or_create(
@@ -845,19 +1029,29 @@ class ProgramsApiDataLoader(AbstractDataLoader):
     """ Loads programs from the Programs API. """
     image_width = 1440
     image_height = 480
+    API_TIMEOUT = 120  # time in seconds
     XSERIES = None
 
-    def __init__(self, partner, api_url, max_workers=None, is_threadsafe=False):
-        super().__init__(partner, api_url, max_workers, is_threadsafe)
+    def __init__(self, partner, api_url, max_workers=None, is_threadsafe=False, **kwargs):
+        super().__init__(partner, api_url, max_workers, is_threadsafe, **kwargs)
         self.XSERIES = ProgramType.objects.get(translations__name_t='XSeries')
+        self.record_hashes = RecordHashes(self.partner, self.__class__.__name__, self.incremental)
 
     def ingest(self):
         api_url = self.partner.programs_api_url
+        logger.info('Refreshing programs from %s...', api_url)
+
+        try:
+            count = self._load_programs()
+        finally:
+            self.record_hashes.save()
+
+        logger.info('Retrieved %d programs from %s.', count, api_url)
+
+    def _load_programs(self):
         count = None
         page = 1
 
-        logger.info('Refreshing programs from %s...', api_url)
-
         while page:
             params = {'page': page, 'page_size': self.PAGE_SIZE}
             response = self.api_client.get(self.api_url + '/programs/', params=params)
@@ -872,39 +1066,90 @@ class ProgramsApiDataLoader(AbstractDataLoader):
             else:
                 page = None
 
-            for program in results:
-                program = self.clean_strings(program)
-                self.update_program(program)
+            loaded = []
+            for body in results:
+                if self.record_hashes.is_unchanged(self._get_uuid(body), body):
+                    continue
+                program = self.update_program(self.clean_strings(body))
+                if program:
+                    loaded.append((body, program))
 
-        logger.info('Retrieved %d programs from %s.', count, api_url)
+            failed = self._update_program_banner_images(loaded)
+            for body, program in loaded:
+                if program not in failed:
+                    self.record_hashes.mark_applied(self._get_uuid(body), body)
+
+        return count
 
     def _get_uuid(self, body):
         return body['uuid']
 
     def update_program(self, body):
+        """
+        Create or update a program, only writing the fields and relations which changed.
+
+        The banner image is loaded separately, see _update_program_banner_images.
+
+        Returns:
+            Program, or None if the program failed to load
+        """
         uuid = self._get_uuid(body)
 
         try:
             defaults = {
-                'uuid': uuid,
+                'uuid': UUID(uuid),
                 'title': body['name'],
                 'subtitle': body['subtitle'],
-                'type': self.XSERIES,
+                'type_id': self.XSERIES.id,
                 'status': body['status'],
                 'banner_image_url': self._get_banner_image_url(body),
             }
 
-            program, __ = Program.objects.update_or_create(
-                marketing_slug=body['marketing_slug'],
-                partner=self.partner,
-                defaults=defaults
-            )
-            self._update_program_organizations(body, program)
-            self._update_program_courses_and_runs(body, program)
-            self._update_program_banner_image(body, program)
-            program.save()
+            with transaction.atomic():
+                try:
+                    program = Program.objects.get(marketing_slug=body['marketing_slug'], partner=self.partner)
+                except Program.DoesNotExist:
+                    program = Program.objects.create(
+                        marketing_slug=body['marketing_slug'], partner=self.partner, **defaults
+                    )
+                    changed = True
+                else:
+                    changed = False
+                    for attr, value in defaults.items():
+                        if getattr(program, attr) != value:
+                            setattr(program, attr, value)
+                            changed = True
+
+                changed = self._update_program_organizations(body, program) or changed
+                changed = self._update_program_courses_and_runs(body, program) or changed
+                if changed:
+                    program.save()
         except Exception:  # pylint: disable=broad-except
             logger.exception('Failed to load program %s', uuid)
+            return None
+
+        return program
+
+    @staticmethod
+    def _sync_relation(manager, objects):
+        """
+        Make a many-to-many relation hold the given objects, only adding and removing the differences.
+
+        Returns:
+            bool: True if the relation changed
+        """
+        objects = {obj.pk: obj for obj in objects}
+        current = set(manager.values_list('pk', flat=True))
+        if current == objects.keys():
+            return False
+
+        removed = current - objects.keys()
+        if removed:
+            manager.remove(*removed)
+        added = [obj for pk, obj in objects.items() if pk not in current]
+        if added:
+            manager.add(*added)
+        return True
 
     def _update_program_courses_and_runs(self, body, program):
         course_run_keys = set()
@@ -913,45 +1158,77 @@ class ProgramsApiDataLoader(AbstractDataLoader):
 
         # The course_code key field is technically useless, so we must build the course list from the
         # associated course runs.
-        courses = Course.objects.filter(course_runs__key__in=course_run_keys).distinct()
-        program.courses.clear()
-        program.courses.add(*courses)
+        courses = list(Course.objects.filter(course_runs__key__in=course_run_keys).distinct())
+        changed = self._sync_relation(program.courses, courses)
 
         # Do a diff of all the course runs and the explicitly-associated course runs to determine
         # which course runs should be explicitly excluded.
         excluded_course_runs = CourseRun.objects.filter(course__in=courses).exclude(key__in=course_run_keys)
-        program.excluded_course_runs.clear()
-        program.excluded_course_runs.add(*excluded_course_runs)
+        return self._sync_relation(program.excluded_course_runs, excluded_course_runs) or changed
 
     def _update_program_organizations(self, body, program):
         uuid = self._get_uuid(body)
         org_keys = [org['key'] for org in body['organizations']]
-        organizations = Organization.objects.filter(key__in=org_keys, partner=self.partner)
+        organizations = list(Organization.objects.filter(key__in=org_keys, partner=self.partner))
 
-        if len(org_keys) != organizations.count():
+        if len(org_keys) != len(organizations):
             logger.error('Organizations for program [%s] are invalid!', uuid)
 
-        program.authoring_organizations.clear()
-        program.authoring_organizations.add(*organizations)
+        return self._sync_relation(program.authoring_organizations, organizations)
 
     def _get_banner_image_url(self, body):
         image_key = f'w{self.image_width}h{self.image_height}'
         image_url = body.get('banner_image_urls', {}).get(image_key)
         return image_url
 
-    def _update_program_banner_image(self, body, program):
-        image_url = self._get_banner_image_url(body)
-        if not image_url:
-            logger.warning('There are no banner image url for program %s', program.title)
+    def _update_program_banner_images(self, loaded):
+        """
+        Download the banner images of programs concurrently, and save the ones which changed.
+
+        Requests are conditional on the ETag of the banner image last downloaded for each program.
+
+        Arguments:
+            loaded (list): tuples of (body, program) of the loaded programs
+
+        Returns:
+            list: programs whose banner image failed to load
+        """
+        downloads = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for body, program in loaded:
+                image_url = self._get_banner_image_url(body)
+                if not image_url:
+                    logger.warning('There are no banner image url for program %s', program.title)
+                    continue
+
+                headers = {}
+                if program.banner_image and program.banner_image_etag:
+                    headers['If-None-Match'] = program.banner_image_etag
+                download = executor.submit(requests.get, image_url, headers=headers, timeout=self.API_TIMEOUT)
+                downloads[download] = (program, image_url)
+
+        failed = []
+        for future, (program, image_url) in downloads.items():
+            try:
+                self._update_program_banner_image(program, image_url, future.result())
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Loading the banner image %s for program %s failed', image_url, program.title)
+                failed.append(program)
+
+        return failed
+
+    def _update_program_banner_image(self, program, image_url, response):
+        if response.status_code == 304:
             return
 
-        r = requests.get(image_url)  # pylint: disable=missing-timeout
-        if r.status_code == 200:
-            banner_downloaded = File(BytesIO(r.content))
-            program.banner_image.save(
-                'banner.jpg',
-                banner_downloaded
-            )
-            program.save()
-        else:
-            logger.exception('Loading the banner image %s for program %s failed', image_url, program.title)
+        response.raise_for_status()
+        etag = response.headers.get('ETag')
+        if not etag:
+            etag = '"{}"'.format(hashlib.md5(response.content, usedforsecurity=False).hexdigest())
+        if program.banner_image and etag == program.banner_image_etag:
+            logger.info('Banner image %s for program %s is unchanged', image_url, program.title)
+            return
+
+        program.banner_image.save('banner.jpg', File(BytesIO(response.content)), save=False)
+        program.banner_image_etag = etag
+        program.save()
@@ -2,34 +2,37 @@
 Data loader responsible for creating course and course runs entries in discovery Database,
 creating and updating related objects in Studio, and ecommerce, provided a csv containing the required information.
 """
-import csv
+import concurrent.futures
+import json
 import logging
 
-import unicodecsv
 from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import Q
-from django.urls import reverse
+from rest_framework.exceptions import ValidationError as DRFValidationError
 
+from course_discovery.apps.api.services import CourseService
+from course_discovery.apps.core.models import User
 from course_discovery.apps.core.utils import serialize_datetime
 from course_discovery.apps.course_metadata.choices import (
     CourseRunRestrictionType, CourseRunStatus, ExternalCourseMarketingType, ExternalProductStatus
 )
-from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
 from course_discovery.apps.course_metadata.data_loaders.constants import (
     CSV_LOADER_ERROR_LOG_SEQUENCE, CSVIngestionErrorMessages, CSVIngestionErrors
 )
-from course_discovery.apps.course_metadata.gspread_client import GspreadClient
+from course_discovery.apps.course_metadata.data_loaders.streaming import StreamingCSVDataLoader
 from course_discovery.apps.course_metadata.models import (
     AdditionalMetadata, Collaborator, Course, CourseRun, CourseRunPacing, CourseRunType, CourseType, Organization,
     Person, ProgramType, Source, Subject
 )
-from course_discovery.apps.course_metadata.utils import download_and_save_course_image
+from course_discovery.apps.course_metadata.utils import download_course_image, save_course_image
 from course_discovery.apps.ietf_language_tags.models import LanguageTag
 
 logger = logging.getLogger(__name__)
 
 
-class CSVDataLoader(AbstractDataLoader):
+class CSVDataLoader(StreamingCSVDataLoader):
 
     PROGRAM_TYPES = [
         ProgramType.XSERIES,
@@ -60,7 +63,8 @@ class CSVDataLoader(AbstractDataLoader):
 
     def __init__(
         self, partner, api_url=None, max_workers=None, is_threadsafe=False,
-        csv_path=None, csv_file=None, use_gspread_client=None, product_type='audit', product_source='edx'
+        csv_path=None, csv_file=None, use_gspread_client=None, product_type='audit', product_source='edx',
+        incremental=False,
     ):
         """
         Arguments:
@@ -73,8 +77,21 @@ class CSVDataLoader(AbstractDataLoader):
             Google sheet link.
             * product_type: course type slug to identify the product type present in CSV
             * product_source: slug of the external source that actually owns the product.
-        """
-        super().__init__(partner, api_url, max_workers, is_threadsafe)
+            * incremental: Boolean flag to skip the rows which haven't changed since they were last ingested.
+        """
+        super().__init__(partner, api_url, max_workers, is_threadsafe, incremental=incremental)
+        # Courses are saved in-process, on behalf of the user of the partner's API client
+        user, __ = User.objects.get_or_create(username=self.username)
+        self.course_service = CourseService(partner, user)
+        self.organizations = {}
+        self.course_types = {}
+        self.course_run_types = {}
+        self.entitlement_type_slugs = {}
+        self.subject_slugs = {}
+        self.language_codes = {}
+        self.course_external_identifiers = set()  # store external course ids for each course present in sheet
+        self.created_course_keys = set()
+        self.images = {}  # images of the rows of the current chunk, by url
         self.error_logs = {}
         self.ingestion_summary = {
             'total_products_count': 0,
@@ -99,191 +116,248 @@ class CSVDataLoader(AbstractDataLoader):
             if use_gspread_client:
                 # TODO: add unit tests
                 product_type_config = settings.PRODUCT_METADATA_MAPPING[product_type][self.product_source.slug]
-                gspread_client = GspreadClient()
-                self.reader = gspread_client.read_data(product_type_config)
+                self.open_source(gspread_config=product_type_config)
             else:
                 # Read file from the path if given. Otherwise, read from the file
                 # received from CSVDataLoaderConfiguration.
-                self.reader = csv.DictReader(open(csv_path, 'r')) if csv_path \
-                    else list(unicodecsv.DictReader(csv_file))  # lint-amnesty, pylint: disable=consider-using-with
+                self.open_source(csv_path=csv_path, csv_file=csv_file)
         except FileNotFoundError:
             logger.exception("Error opening csv file at path {}".format(csv_path))  # lint-amnesty, pylint: disable=logging-format-interpolation
             raise  # re-raising exception to avoid moving the code flow
         except Exception:
             logger.exception("Error reading the input data source")
             raise  # re-raising exception to avoid moving the code flow
-        self.reader = list(self.reader)
-        self.ingestion_summary['total_products_count'] = len(self.reader)
 
-    def ingest(self):  # pylint: disable=too-many-statements
+    @property
+    def checkpoint_name(self):
+        return f'{self.__class__.__name__}:{self.product_type}:{self.product_source.slug}'
+
+    def ingest(self):
         logger.info("Initiating CSV data loader flow.")
-        course_external_identifiers = set()  # store external course ids for each course present in sheet
+        # Each service call of a row is a savepoint of the transaction of its chunk
+        self.ingest_rows()
+        self.ingestion_summary['total_products_count'] = self.rows_count
+
+        self._archive_stale_products(self.course_external_identifiers)
+        logger.info("CSV loader ingest pipeline has completed.")
 
-        for row in self.reader:
-            row = self.transform_dict_keys(row)
-            course_title = row['title']
-            org_key = row['organization']
+        self._render_error_logs()
+        self._render_course_uuids()
 
-            # store all external identifiers present in sheet, irrespective of ingestion status
-            if 'external_identifier' in row:
-                course_external_identifiers.add(row['external_identifier'])
+    def read_row(self, row):
+        row = self.transform_dict_keys(row)
+        # store all external identifiers present in sheet, irrespective of ingestion status
+        if 'external_identifier' in row:
+            self.course_external_identifiers.add(row['external_identifier'])
 
-            logger.info('Starting data import flow for {}'.format(course_title))  # lint-amnesty, pylint: disable=logging-format-interpolation
-            if not Organization.objects.filter(key=org_key).exists():
-                error_message = CSVIngestionErrorMessages.MISSING_ORGANIZATION.format(
-                    org_key=org_key,
-                    course_title=course_title,
+    def prepare_chunk(self, rows):
+        """
+        Load the organizations, course types and course run types referenced by the rows of a chunk at once, and
+        download the images of the rows concurrently.
+        """
+        rows = [self.transform_dict_keys(row) for row in rows]
+        self.organizations.update({
+            organization.key: organization
+            for organization in Organization.objects.filter(
+                key__in={row.get('organization') for row in rows} - set(self.organizations)
+            )
+        })
+        self.course_types.update({
+            course_type.name: course_type
+            for course_type in CourseType.objects.filter(
+                name__in={row.get('course_enrollment_track') for row in rows} - set(self.course_types)
+            )
+        })
+        self.course_run_types.update({
+            course_run_type.name: course_run_type
+            for course_run_type in CourseRunType.objects.filter(
+                name__in={row.get('course_run_enrollment_track') for row in rows} - set(self.course_run_types)
+            )
+        })
+
+        image_urls = {}
+        for row in rows:
+            course_key = self.get_course_key(row.get('organization'), row.get('number'))
+            for image_url in (row.get('image'), row.get('organization_logo_override')):
+                if image_url:
+                    image_urls[image_url] = course_key
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            downloads = {
+                image_url: executor.submit(
+                    download_course_image, course_key, image_url, headers=self.REQUEST_USER_AGENT_HEADERS
                 )
-                logger.error(error_message)
-                self._register_ingestion_error(CSVIngestionErrors.MISSING_ORGANIZATION, error_message)
-                continue
+                for image_url, course_key in image_urls.items()
+            }
+        self.images = {image_url: download.result() for image_url, download in downloads.items()}
+
+    def ingest_row(self, row):  # pylint: disable=too-many-statements
+        row = self.transform_dict_keys(row)
+        course_title = row['title']
+        org_key = row['organization']
+
+        logger.info('Starting data import flow for {}'.format(course_title))  # lint-amnesty, pylint: disable=logging-format-interpolation
+        organization = self.organizations.get(org_key)
+        if not organization:
+            error_message = CSVIngestionErrorMessages.MISSING_ORGANIZATION.format(
+                org_key=org_key,
+                course_title=course_title,
+            )
+            logger.error(error_message)
+            self._register_ingestion_error(CSVIngestionErrors.MISSING_ORGANIZATION, error_message)
+            return False
+
+        course_type = self.course_types.get(row['course_enrollment_track'])
+        if not course_type:
+            error_message = CSVIngestionErrorMessages.MISSING_COURSE_TYPE.format(
+                course_title=course_title, course_type=row['course_enrollment_track']
+            )
+            logger.error(error_message)
+            self._register_ingestion_error(CSVIngestionErrors.MISSING_COURSE_TYPE, error_message)
+            return False
+
+        course_run_type = self.course_run_types.get(row['course_run_enrollment_track'])
+        if not course_run_type:
+            error_message = CSVIngestionErrorMessages.MISSING_COURSE_RUN_TYPE.format(
+                course_title=course_title, course_run_type=row['course_run_enrollment_track']
+            )
+            logger.error(error_message)
+            self._register_ingestion_error(CSVIngestionErrors.MISSING_COURSE_RUN_TYPE, error_message)
+            return False
+
+        missing_fields = self.validate_course_data(course_type, row)
+        if missing_fields:
+            error_message = CSVIngestionErrorMessages.MISSING_REQUIRED_DATA.format(
+                course_title=course_title, missing_data=missing_fields
+            )
+            logger.error(error_message)
+            self._register_ingestion_error(CSVIngestionErrors.MISSING_REQUIRED_DATA, error_message)
+            return False
+
+        course_key = self.get_course_key(org_key, row['number'])
+        course = Course.objects.filter_drafts(key=course_key, partner=self.partner).first()
+        is_course_created = False
+        is_course_run_created = False
+        course_run_restriction = (
+            None
+            if row.get('restriction_type', None) == 'None'
+            else row.get('restriction_type', None)
+        )
 
+        if course:
             try:
-                course_type = CourseType.objects.get(name=row['course_enrollment_track'])
-                course_run_type = CourseRunType.objects.get(name=row['course_run_enrollment_track'])
-            except CourseType.DoesNotExist:
-                error_message = CSVIngestionErrorMessages.MISSING_COURSE_TYPE.format(
-                    course_title=course_title, course_type=row['course_enrollment_track']
+                logger.info("Course {} is located in the database.".format(course_key))  # lint-amnesty, pylint: disable=logging-format-interpolation
+                course_run, is_course_run_created = self._get_or_create_course_run(
+                    row, course, course_type, course_run_type.uuid
                 )
-                logger.exception(error_message)
-                self._register_ingestion_error(CSVIngestionErrors.MISSING_COURSE_TYPE, error_message)
-                continue
-            except CourseRunType.DoesNotExist:
-                error_message = CSVIngestionErrorMessages.MISSING_COURSE_RUN_TYPE.format(
-                    course_title=course_title, course_run_type=row['course_run_enrollment_track']
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.exception(exc)
+                return False
+        else:
+            logger.info("Course key {} could not be found in database, creating the course.".format(course_key))  # lint-amnesty, pylint: disable=logging-format-interpolation
+            try:
+                course, course_run = self._create_course(row, organization, course_type, course_run_type.uuid)
+            except Exception as exc:  # pylint: disable=broad-except
+                error_message = CSVIngestionErrorMessages.COURSE_CREATE_ERROR.format(
+                    course_title=course_title,
+                    exception_message=self.get_exception_message(exc)
                 )
                 logger.exception(error_message)
-                self._register_ingestion_error(CSVIngestionErrors.MISSING_COURSE_RUN_TYPE, error_message)
-                continue
+                self._register_ingestion_error(CSVIngestionErrors.COURSE_CREATE_ERROR, error_message)
+                return False
 
-            missing_fields = self.validate_course_data(course_type, row)
-            if missing_fields:
-                error_message = CSVIngestionErrorMessages.MISSING_REQUIRED_DATA.format(
-                    course_title=course_title, missing_data=missing_fields
-                )
-                logger.error(error_message)
-                self._register_ingestion_error(CSVIngestionErrors.MISSING_REQUIRED_DATA, error_message)
-                continue
-
-            course_key = self.get_course_key(org_key, row['number'])
-            course = Course.objects.filter_drafts(key=course_key, partner=self.partner).first()
-            is_course_created = False
-            is_course_run_created = False
-            course_run_restriction = (
-                None
-                if row.get('restriction_type', None) == 'None'
-                else row.get('restriction_type', None)
-            )
+            is_course_created = True
+            is_course_run_created = True
+            self.created_course_keys.add(course_key)
 
-            if course:
-                try:
-                    logger.info("Course {} is located in the database.".format(course_key))  # lint-amnesty, pylint: disable=logging-format-interpolation
-                    course_run, is_course_run_created = self._get_or_create_course_run(
-                        row, course, course_type, course_run_type.uuid
-                    )
-                except Exception as exc:  # pylint: disable=broad-except
-                    logger.exception(exc)
-                    continue
-            else:
-                logger.info("Course key {} could not be found in database, creating the course.".format(course_key))  # lint-amnesty, pylint: disable=logging-format-interpolation
-                try:
-                    _ = self._create_course(row, course_type, course_run_type.uuid)
-                except Exception as exc:  # pylint: disable=broad-except
-                    exception_message = exc
-                    if hasattr(exc, 'response'):
-                        exception_message = exc.response.content.decode('utf-8')
-                    error_message = CSVIngestionErrorMessages.COURSE_CREATE_ERROR.format(
-                        course_title=course_title,
-                        exception_message=exception_message
-                    )
-                    logger.exception(error_message)
-                    self._register_ingestion_error(CSVIngestionErrors.COURSE_CREATE_ERROR, error_message)
-                    continue
+        is_downloaded = save_course_image(course, row['image'], self.images.get(row['image']))
+        if not is_downloaded:
+            error_message = CSVIngestionErrorMessages.IMAGE_DOWNLOAD_FAILURE.format(course_title=course_title)
+            logger.error(error_message)
+            self._register_ingestion_error(CSVIngestionErrors.IMAGE_DOWNLOAD_FAILURE, error_message)
+            return False
+        if not is_course_created:
+            self.add_product_source(course)
 
-                course = Course.everything.get(key=course_key, partner=self.partner)
-                course_run = CourseRun.everything.filter(course=course).first()
-                is_course_created = True
-                is_course_run_created = True
+        is_draft = self.get_draft_flag(course=course)
+        logger.info(f"Draft flag is set to {is_draft} for the course {course_title}")
 
-            is_downloaded = download_and_save_course_image(
+        try:
+            self._update_course(row, course, is_draft)
+        except Exception as exc:  # pylint: disable=broad-except
+            error_message = CSVIngestionErrorMessages.COURSE_UPDATE_ERROR.format(
+                course_title=course_title,
+                exception_message=self.get_exception_message(exc)
+            )
+            logger.exception(error_message)
+            self._register_ingestion_error(CSVIngestionErrors.COURSE_UPDATE_ERROR, error_message)
+            return False
+
+        if row.get('organization_logo_override'):
+            course.refresh_from_db()
+            is_logo_downloaded = save_course_image(
                 course,
-                row['image'],
-                headers=self.REQUEST_USER_AGENT_HEADERS)
-            if not is_downloaded:
-                error_message = CSVIngestionErrorMessages.IMAGE_DOWNLOAD_FAILURE.format(course_title=course_title)
+                row['organization_logo_override'],
+                self.images.get(row['organization_logo_override']),
+                'organization_logo_override',
+            )
+            if not is_logo_downloaded:
+                error_message = CSVIngestionErrorMessages.LOGO_IMAGE_DOWNLOAD_FAILURE.format(
+                    course_title=course_title
+                )
                 logger.error(error_message)
-                self._register_ingestion_error(CSVIngestionErrors.IMAGE_DOWNLOAD_FAILURE, error_message)
-                continue
-            if not is_course_created:
-                self.add_product_source(course)
-
-            is_draft = self.get_draft_flag(course=course)
-            logger.info(f"Draft flag is set to {is_draft} for the course {course_title}")
+                self._register_ingestion_error(CSVIngestionErrors.LOGO_IMAGE_DOWNLOAD_FAILURE, error_message)
 
+        # The update of the run moves it out of the Unpublished status when the course isn't a draft
+        is_unpublished = course_run.status == CourseRunStatus.Unpublished
+        # No need to update the course run if the run is already in the review
+        if not course_run.in_review:
             try:
-                self._update_course(row, course, is_draft)
+                self._update_course_run(row, course_run, course_type, is_draft)
             except Exception as exc:  # pylint: disable=broad-except
-                exception_message = exc
-                if hasattr(exc, 'response'):
-                    exception_message = exc.response.content.decode('utf-8')
-                error_message = CSVIngestionErrorMessages.COURSE_UPDATE_ERROR.format(
+                error_message = CSVIngestionErrorMessages.COURSE_RUN_UPDATE_ERROR.format(
                     course_title=course_title,
-                    exception_message=exception_message
+                    exception_message=self.get_exception_message(exc)
                 )
                 logger.exception(error_message)
-                self._register_ingestion_error(CSVIngestionErrors.COURSE_UPDATE_ERROR, error_message)
-                continue
-
-            if row.get('organization_logo_override'):
-                course.refresh_from_db()
-                is_logo_downloaded = download_and_save_course_image(
-                    course,
-                    row['organization_logo_override'],
-                    'organization_logo_override',
-                    headers=self.REQUEST_USER_AGENT_HEADERS
-                )
-                if not is_logo_downloaded:
-                    error_message = CSVIngestionErrorMessages.LOGO_IMAGE_DOWNLOAD_FAILURE.format(
-                        course_title=course_title
-                    )
-                    logger.error(error_message)
-                    self._register_ingestion_error(CSVIngestionErrors.LOGO_IMAGE_DOWNLOAD_FAILURE, error_message)
-
-            # No need to update the course run if the run is already in the review
-            if not course_run.in_review:
-                try:
-                    self._update_course_run(row, course_run, course_type, is_draft)
-                except Exception as exc:  # pylint: disable=broad-except
-                    exception_message = exc
-                    if hasattr(exc, 'response'):
-                        exception_message = exc.response.content.decode('utf-8')
-                    error_message = CSVIngestionErrorMessages.COURSE_RUN_UPDATE_ERROR.format(
-                        course_title=course_title,
-                        exception_message=exception_message
-                    )
-                    logger.exception(error_message)
-                    self._register_ingestion_error(CSVIngestionErrors.COURSE_RUN_UPDATE_ERROR, error_message)
-                    continue
-
-            if course_run.status == CourseRunStatus.Unpublished:
-                course_run.refresh_from_db()
-                # Pushing the run into LegalReview is necessary to ensure that the
-                # url slug is correctly generated in subdirectory format
-                course_run.status = CourseRunStatus.LegalReview
-                course_run.save(update_fields=['status'], send_emails=False)
-                self._complete_run_review(row, course_run)
-
-            logger.info("Course and course run updated successfully for course key {}".format(course_key))  # lint-amnesty, pylint: disable=logging-format-interpolation
-            self.course_uuids[str(course.uuid)] = course_title
-            self._register_successful_ingestion(
-                str(course.uuid), str(course_run.variant_id), is_course_created, is_course_run_created,
-                course_run_restriction, course.active_url_slug, row.get('external_course_marketing_type', None))
-
-        self._archive_stale_products(course_external_identifiers)
-        logger.info("CSV loader ingest pipeline has completed.")
-
-        self._render_error_logs()
-        self._render_course_uuids()
+                self._register_ingestion_error(CSVIngestionErrors.COURSE_RUN_UPDATE_ERROR, error_message)
+                return False
+
+        if is_unpublished:
+            course_run.refresh_from_db()
+            # Pushing the run into LegalReview is necessary to ensure that the
+            # url slug is correctly generated in subdirectory format
+            course_run.status = CourseRunStatus.LegalReview
+            course_run.save(update_fields=['status'], send_emails=False)
+            self._complete_run_review(row, course_run)
+
+        logger.info("Course and course run updated successfully for course key {}".format(course_key))  # lint-amnesty, pylint: disable=logging-format-interpolation
+        self.course_uuids[str(course.uuid)] = course_title
+        self._register_successful_ingestion(
+            str(course.uuid), str(course_run.variant_id), is_course_created, is_course_run_created,
+            course_run_restriction, course.active_url_slug, row.get('external_course_marketing_type', None))
+        return True
+
+    def deferred_call_failed(self, row, exc):
+        """
+        Report the row as failed when pushing its course to Studio or its course run to ecommerce or the LMS
+        failed, as the ingestion did when the course was saved through the API.
+        """
+        row = self.transform_dict_keys(row)
+        course_title = row['title']
+        exception_message = self.get_exception_message(exc)
+        if self.get_course_key(row['organization'], row['number']) in self.created_course_keys:
+            error_key = CSVIngestionErrors.COURSE_CREATE_ERROR
+            error_message = CSVIngestionErrorMessages.COURSE_CREATE_ERROR.format(
+                course_title=course_title, exception_message=exception_message
+            )
+        else:
+            error_key = CSVIngestionErrors.COURSE_RUN_UPDATE_ERROR
+            error_message = CSVIngestionErrorMessages.COURSE_RUN_UPDATE_ERROR.format(
+                course_title=course_title, exception_message=exception_message
+            )
+        logger.error(error_message)
+        self.ingestion_summary['success_count'] -= 1
+        self._register_ingestion_error(error_key, error_message)
 
     def _get_or_create_course_run(self, data, course, course_type, course_run_type_uuid):
         """
@@ -325,12 +399,10 @@ class CSVDataLoader(AbstractDataLoader):
             )
             try:
                 last_run = course_runs.last()
-                _ = self._create_course_run(data, course, course_type, course_run_type_uuid, last_run.key)
+                course_run = self._create_course_run(data, course, course_type, course_run_type_uuid, last_run.key)
                 is_course_run_created = True
             except Exception as exc:
-                exception_message = exc
-                if hasattr(exc, 'response'):
-                    exception_message = exc.response.content.decode('utf-8')
+                exception_message = self.get_exception_message(exc)
                 error_message = CSVIngestionErrorMessages.COURSE_RUN_CREATE_ERROR.format(
                     course_title=course.title,
                     variant_id=variant_id,
@@ -338,8 +410,6 @@ class CSVDataLoader(AbstractDataLoader):
                 )
                 self._register_ingestion_error(CSVIngestionErrors.COURSE_RUN_CREATE_ERROR, exception_message)
                 raise Exception(error_message)  # pylint: disable=raise-missing-from
-        if not course_run and is_course_run_created:
-            course_run = CourseRun.objects.filter_drafts(course=course).order_by('created').last()
         return course_run, is_course_run_created
 
     def validate_course_data(self, course_type, data):
@@ -637,81 +707,68 @@ class CSVDataLoader(AbstractDataLoader):
         languages_list = language_str.split(',')
         for language in languages_list:
             language = language.strip()
-            language_obj = LanguageTag.objects.filter(
-                Q(name=language) | Q(code=language)
-            ).first()
-            if not language_obj:
+            if language not in self.language_codes:
+                language_obj = LanguageTag.objects.filter(
+                    Q(name=language) | Q(code=language)
+                ).first()
+                self.language_codes[language] = language_obj.code if language_obj else None
+            if not self.language_codes[language]:
                 raise Exception(  # pylint: disable=broad-exception-raised
                     'Language {} from provided string {} is either missing or an invalid ietf language'.format(
                         language, language_str
                     )
                 )
-            languages_codes_list.append(language_obj.code)
+            languages_codes_list.append(self.language_codes[language])
         return languages_codes_list
 
-    def _call_course_api(self, method, url, data):
+    def get_exception_message(self, exc):
         """
-        Helper method to make course and course run api calls.
+        Return the message of an exception raised while saving a course or a course run.
         """
-        response = self.api_client.request(
-            method,
-            url,
-            json=data,
-            headers={'content-type': 'application/json'}
-        )
-        if not response.ok:
-            logger.info("API request failed for url {} with response: {}".format(url, response.content.decode('utf-8')))  # lint-amnesty, pylint: disable=logging-format-interpolation
-        response.raise_for_status()
-        return response
+        if hasattr(exc, 'response'):
+            return exc.response.content.decode('utf-8')
+        if isinstance(exc, DRFValidationError):
+            return json.dumps(exc.detail)
+        if isinstance(exc, ValidationError):
+            return ' '.join(exc.messages)
+        return exc
 
-    def _create_course(self, data, course_type, course_run_type_uuid):
+    def _create_course(self, data, organization, course_type, course_run_type_uuid):
         """
-        Make a course entry through course api.
+        Create a draft course along with its first course run.
         """
-        course_api_url = reverse('api:v1:course-list')
-        url = f"{settings.DISCOVERY_BASE_URL}{course_api_url}"
-
         request_data = self._create_course_api_request_data(data, course_type, course_run_type_uuid)
-        response = self._call_course_api('POST', url, request_data)
-        if response.status_code not in (200, 201):
-            logger.info("Course creation response: {}".format(response.content))  # lint-amnesty, pylint: disable=logging-format-interpolation
-        return response.json()
+        course_run_data = request_data.pop('course_run')
+        with transaction.atomic():
+            course = self.course_service.create_course(
+                request_data, organization=organization, course_type=course_type, product_source=self.product_source
+            )
+            course_run_data.update({'course': course.key, 'prices': request_data['prices']})
+            course_run = self.course_service.create_course_run(course_run_data)
+        # The creation of the run sets the canonical course run of the course
+        course.refresh_from_db()
+        return course, course_run
 
     def _create_course_run(self, data, course, course_type, course_run_type_uuid, rerun=None):
         """
-        Make a course run entry through course run api.
+        Create a draft course run of the course.
         """
-        url = f"{settings.DISCOVERY_BASE_URL}{reverse('api:v1:course_run-list')}"
         request_data = self._create_course_run_api_request_data(data, course, course_type, course_run_type_uuid, rerun)
-        response = self._call_course_api('POST', url, request_data)
-        if response.status_code not in (200, 201):
-            logger.info("Course run creation response: {}".format(response.content))  # lint-amnesty, pylint: disable=logging-format-interpolation
-        return response.json()
+        return self.course_service.create_course_run(request_data)
 
     def _update_course(self, data, course, is_draft):
         """
         Update the course data.
         """
-        course_api_url = reverse('api:v1:course-detail', kwargs={'key': course.uuid})
-        url = f"{settings.DISCOVERY_BASE_URL}{course_api_url}?exclude_utm=1"
         request_data = self._update_course_api_request_data(data, course, is_draft)
-        response = self._call_course_api('PATCH', url, request_data)
-
-        if response.status_code not in (200, 201):
-            logger.info("Course update response: {}".format(response.content))  # lint-amnesty, pylint: disable=logging-format-interpolation
-        return response.json()
+        return self.course_service.update_course(course, request_data, partial=True)
 
     def _update_course_run(self, data, course_run, course_type, is_draft):
         """
         Update the course run data.
         """
-        course_run_api_url = reverse('api:v1:course_run-detail', kwargs={'key': course_run.key})
-        url = f"{settings.DISCOVERY_BASE_URL}{course_run_api_url}?exclude_utm=1"
         request_data = self._update_course_run_request_data(data, course_run, course_type, is_draft)
-        response = self._call_course_api('PATCH', url, request_data)
-        if response.status_code not in (200, 201):
-            logger.info("Course run update response: {}".format(response.content))  # lint-amnesty, pylint: disable=logging-format-interpolation
-        return response.json()
+        return self.course_service.update_course_run(course_run, request_data, partial=True)
 
     def _complete_run_review(self, data, course_run):
         """
@@ -749,11 +806,11 @@ class CSVDataLoader(AbstractDataLoader):
         """
         Return dict representation of prices for a given course type.
         """
-        prices = {}
-        entitlement_types = course_type.entitlement_types.all()
-        for entitlement_type in entitlement_types:
-            prices.update({entitlement_type.slug: price})
-        return prices
+        if course_type.pk not in self.entitlement_type_slugs:
+            self.entitlement_type_slugs[course_type.pk] = list(
+                course_type.entitlement_types.values_list('slug', flat=True)
+            )
+        return {slug: price for slug in self.entitlement_type_slugs[course_type.pk]}
 
     def get_subject_slugs(self, *subjects):
         """
@@ -764,8 +821,11 @@ class CSVDataLoader(AbstractDataLoader):
         subjects = [subject for subject in subjects if subject]
         for subject in subjects:
             try:
-                sub_obj = Subject.objects.get(translations__name=subject, translations__language_code='en')
-                subject_slugs.append(sub_obj.slug)
+                if subject not in self.subject_slugs:
+                    self.subject_slugs[subject] = Subject.objects.get(
+                        translations__name=subject, translations__language_code='en'
+                    ).slug
+                subject_slugs.append(self.subject_slugs[subject])
             except Subject.DoesNotExist:
                 logger.exception("Unable to locate subject {} in the database. Skipping subject association".format(  # lint-amnesty, pylint: disable=logging-format-interpolation
                     subject
@@ -1,18 +1,16 @@
 """
 Data loader responsible for creating degree entries in discovery Database,
 """
-import csv
 import logging
 
-import unicodecsv
 from django.conf import settings
+from django.db import transaction
 
-from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
 from course_discovery.apps.course_metadata.data_loaders.constants import (
     DEGREE_LOADER_ERROR_LOG_SEQUENCE, DegreeCSVIngestionErrorMessages, DegreeCSVIngestionErrors
 )
+from course_discovery.apps.course_metadata.data_loaders.streaming import StreamingCSVDataLoader
 from course_discovery.apps.course_metadata.data_loaders.utils import map_external_org_code_to_internal_org_code
-from course_discovery.apps.course_metadata.gspread_client import GspreadClient
 from course_discovery.apps.course_metadata.models import (
     Curriculum, Degree, DegreeAdditionalMetadata, LanguageTag, LevelType, Organization, Program, ProgramType, Source,
     Specialization, Subject
@@ -22,7 +20,7 @@ from course_discovery.apps.course_metadata.utils import download_and_save_progra
 logger = logging.getLogger(__name__)
 
 
-class DegreeCSVDataLoader(AbstractDataLoader):
+class DegreeCSVDataLoader(StreamingCSVDataLoader):
     """ Loads the degrees from the csv file """
 
     DEGREE_REQUIRED_FIELDS = [
@@ -57,9 +55,9 @@ class DegreeCSVDataLoader(AbstractDataLoader):
 
     def __init__(
         self, partner, api_url=None, max_workers=None, is_threadsafe=False,
-        csv_path=None, csv_file=None, args_from_env=None, product_type=None, product_source='edx'
+        csv_path=None, csv_file=None, args_from_env=None, product_type=None, product_source='edx', incremental=False
     ):
-        super().__init__(partner, api_url, max_workers, is_threadsafe)
+        super().__init__(partner, api_url, max_workers, is_threadsafe, incremental=incremental)
 
         self.error_logs = {}
         self.degree_uuids = {}  # to show the discovery degrees/program ids for each processed degree
@@ -84,108 +82,114 @@ class DegreeCSVDataLoader(AbstractDataLoader):
             if args_from_env:
                 # TODO: add unit tests
                 product_type_config = settings.PRODUCT_METADATA_MAPPING[product_type][self.product_source.slug]
-                gspread_client = GspreadClient()
-                self.reader = gspread_client.read_data(product_type_config)
+                self.open_source(gspread_config=product_type_config)
             else:
                 # Read file from the path if given. Otherwise,
                 # read from the file received from DegreeDataLoaderConfiguration.
-                self.reader = csv.DictReader(open(csv_path, 'r')) if csv_path \
-                    else list(unicodecsv.DictReader(csv_file))  # lint-amnesty, pylint: disable=consider-using-with
+                self.open_source(csv_path=csv_path, csv_file=csv_file)
         except FileNotFoundError:
             logger.exception("Error opening csv file at path {}".format(csv_path))    # lint-amnesty, pylint: disable=logging-format-interpolation
             raise  # re-raising exception to avoid moving the code flow
         except Exception:
             logger.exception("Error reading the input data source")
             raise  # re-raising exception to avoid moving the code flow
-        self.reader = list(self.reader)
-        self.ingestion_summary['total_products_count'] = len(self.reader)
+
+    @property
+    def checkpoint_name(self):
+        return f'{self.__class__.__name__}:{self.product_source.slug}'
 
     def ingest(self):
         logger.info("Initiating Degree CSV data loader flow.")
-        for row in self.reader:
-            row = self.transform_dict_keys(row)
+        self.ingest_rows()
+        self.ingestion_summary['total_products_count'] = self.rows_count
 
-            degree_slug = row['slug']
-            program_type = row['product_type'].replace('\'', '').lower()
+        logger.info("Degree CSV loader ingest pipeline has completed.")
 
-            missing_data = self.validate_degree_data(row)
-            if missing_data:
-                error_message = DegreeCSVIngestionErrorMessages.MISSING_REQUIRED_DATA.format(
-                    degree_slug=degree_slug,
-                    missing_data=missing_data
-                )
-                logger.error(error_message)
-                self._register_ingestion_error(DegreeCSVIngestionErrors.MISSING_REQUIRED_DATA, error_message)
-                continue
+        self._render_error_logs()
+        self._render_degree_uuids()
 
-            logger.info('Starting data import flow for {}'.format(degree_slug))    # lint-amnesty, pylint: disable=logging-format-interpolation
+    def ingest_row(self, row):
+        row = self.transform_dict_keys(row)
 
-            org_key = map_external_org_code_to_internal_org_code(row['organization_key'], self.product_source.slug)
-            org = self._get_object(Organization, "key", org_key, degree_slug)
-            program_type = self._get_object(ProgramType, "slug", program_type, degree_slug)
-            primary_subject_override = self._get_object(
-                Subject, "translations__name",
-                row['primary_subject'], degree_slug
-            )
-            level_type_override = self._get_object(
-                LevelType, "translations__name_t",
-                row['course_level'], degree_slug
-            )
-            language_override = self._get_object(
-                LanguageTag, "name",
-                row['content_language'], degree_slug
+        degree_slug = row['slug']
+        program_type = row['product_type'].replace('\'', '').lower()
+
+        missing_data = self.validate_degree_data(row)
+        if missing_data:
+            error_message = DegreeCSVIngestionErrorMessages.MISSING_REQUIRED_DATA.format(
+                degree_slug=degree_slug,
+                missing_data=missing_data
             )
+            logger.error(error_message)
+            self._register_ingestion_error(DegreeCSVIngestionErrors.MISSING_REQUIRED_DATA, error_message)
+            return False
+
+        logger.info('Starting data import flow for {}'.format(degree_slug))    # lint-amnesty, pylint: disable=logging-format-interpolation
 
-            if not (org and program_type and primary_subject_override and level_type_override and language_override):
-                continue
+        org_key = map_external_org_code_to_internal_org_code(row['organization_key'], self.product_source.slug)
+        org = self._get_object(Organization, "key", org_key, degree_slug)
+        program_type = self._get_object(ProgramType, "slug", program_type, degree_slug)
+        primary_subject_override = self._get_object(
+            Subject, "translations__name",
+            row['primary_subject'], degree_slug
+        )
+        level_type_override = self._get_object(
+            LevelType, "translations__name_t",
+            row['course_level'], degree_slug
+        )
+        language_override = self._get_object(
+            LanguageTag, "name",
+            row['content_language'], degree_slug
+        )
 
-            # get degree object from external_identifier and product source
-            degree = Degree.objects.filter(
-                partner=self.partner,
-                additional_metadata__external_identifier=row['identifier'],
-                product_source=self.product_source
-            ).first()
+        if not (org and program_type and primary_subject_override and level_type_override and language_override):
+            return False
 
-            logger.info("Degree with external identifier {} {} located in the database. {} degree.".format(   # lint-amnesty, pylint: disable=logging-format-interpolation
-                row['identifier'],
-                "is" if degree else "is not",
-                "Creating new" if not degree else "Updating existing"
-            ))
+        # get degree object from external_identifier and product source
+        degree = Degree.objects.filter(
+            partner=self.partner,
+            additional_metadata__external_identifier=row['identifier'],
+            product_source=self.product_source
+        ).first()
 
-            try:
+        logger.info("Degree with external identifier {} {} located in the database. {} degree.".format(   # lint-amnesty, pylint: disable=logging-format-interpolation
+            row['identifier'],
+            "is" if degree else "is not",
+            "Creating new" if not degree else "Updating existing"
+        ))
+
+        try:
+            # A savepoint, so that a failure leaves the transaction of the chunk usable
+            with transaction.atomic():
                 degree, is_degree_created = self._update_or_create_degree(
                     row, program_type, primary_subject_override,
                     level_type_override, language_override
                 )
-            # we can get the IntegrityError if the degree already exists in the database
-            # or any related error while updating or creating degree object
-            except Exception as exc:   # pylint: disable=broad-except
-                error_type = DegreeCSVIngestionErrors.DEGREE_UPDATE_ERROR if degree else \
-                    DegreeCSVIngestionErrors.DEGREE_CREATE_ERROR
-                error_message = DegreeCSVIngestionErrorMessages.DEGREE_UPDATE_ERROR if degree else \
-                    DegreeCSVIngestionErrorMessages.DEGREE_CREATE_ERROR
-                error_message = error_message.format(
-                    degree_slug=degree_slug,
-                    exception_message=exc
-                )
-                logger.exception(error_message)
-                self._register_ingestion_error(error_type, error_message)
-                continue
-
-            self._handle_organization_data(org, degree)
-            self._handle_additional_metadata(row, degree)
-            self._handle_image_fields(row, degree)
-            self._handle_specializations(row, degree)
-            self._handle_courses(row, degree)
-
-            logger.info("Degree updated successfully for degree key {}".format(degree.uuid))    # lint-amnesty, pylint: disable=logging-format-interpolation
-            self.degree_uuids[str(degree.uuid)] = degree.marketing_slug
-            self._register_successful_ingestion(str(degree.uuid), is_degree_created)
-
-        logger.info("Degree CSV loader ingest pipeline has completed.")
-
-        self._render_error_logs()
-        self._render_degree_uuids()
+        # we can get the IntegrityError if the degree already exists in the database
+        # or any related error while updating or creating degree object
+        except Exception as exc:   # pylint: disable=broad-except
+            error_type = DegreeCSVIngestionErrors.DEGREE_UPDATE_ERROR if degree else \
+                DegreeCSVIngestionErrors.DEGREE_CREATE_ERROR
+            error_message = DegreeCSVIngestionErrorMessages.DEGREE_UPDATE_ERROR if degree else \
+                DegreeCSVIngestionErrorMessages.DEGREE_CREATE_ERROR
+            error_message = error_message.format(
+                degree_slug=degree_slug,
+                exception_message=exc
+            )
+            logger.exception(error_message)
+            self._register_ingestion_error(error_type, error_message)
+            return False
+
+        self._handle_organization_data(org, degree)
+        self._handle_additional_metadata(row, degree)
+        self._handle_image_fields(row, degree)
+        self._handle_specializations(row, degree)
+        self._handle_courses(row, degree)
+
+        logger.info("Degree updated successfully for degree key {}".format(degree.uuid))    # lint-amnesty, pylint: disable=logging-format-interpolation
+        self.degree_uuids[str(degree.uuid)] = degree.marketing_slug
+        self._register_successful_ingestion(str(degree.uuid), is_degree_created)
+        return True
 
     def validate_degree_data(self, data):
         """
@@ -1,19 +1,16 @@
 """
 Data loader responsible for creating location restriction entries in discovery database,
 """
-import csv
 import logging
 import uuid
 
-import unicodecsv
-
-from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
+from course_discovery.apps.course_metadata.data_loaders.streaming import StreamingCSVDataLoader
 from course_discovery.apps.course_metadata.models import Course, GeoLocation, Program
 
 logger = logging.getLogger(__name__)
 
 
-class GeolocationCSVDataLoader(AbstractDataLoader):
+class GeolocationCSVDataLoader(StreamingCSVDataLoader):
     """ Loads the geolocation (lat/lng) data from the csv file """
     # Below are the minimum required fields needed for successful data upload
     # Additional column names (for info purposes only) may be Product Name, Partner, Notes
@@ -21,8 +18,11 @@ class GeolocationCSVDataLoader(AbstractDataLoader):
         'uuid', 'product_type', 'location_name', 'latitude', 'longitude',
     ]
 
-    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, csv_path=None, csv_file=None):
-        super().__init__(partner, api_url, max_workers, is_threadsafe)
+    def __init__(
+        self, partner, api_url=None, max_workers=None, is_threadsafe=False, csv_path=None, csv_file=None,
+        incremental=False,
+    ):
+        super().__init__(partner, api_url, max_workers, is_threadsafe, incremental=incremental)
         self.skipped_items = []
         self.processed_courses = []
         self.processed_programs = []
@@ -30,8 +30,7 @@ class GeolocationCSVDataLoader(AbstractDataLoader):
         try:
             # Read file from the path if given. Otherwise,
             # read from the file received from GeolocationDataLoaderConfiguration.
-            self.reader = csv.DictReader(open(csv_path, 'r')) if csv_path \
-                else list(unicodecsv.DictReader(csv_file))  # lint-amnesty, pylint: disable=consider-using-with
+            self.open_source(csv_path=csv_path, csv_file=csv_file)
         except FileNotFoundError:
             logger.exception("Error opening csv file at path {}".format(csv_path))    # lint-amnesty, pylint: disable=logging-format-interpolation
             raise  # re-raising exception to avoid moving the code flow
@@ -42,37 +41,7 @@ class GeolocationCSVDataLoader(AbstractDataLoader):
 
     def ingest(self):
         logger.info("Initiating Geolocation CSV data loader flow.")
-        processed_products = {
-            'course': self.processed_courses,
-            'program': self.processed_programs,
-        }
-
-        for row in self.reader:
-            row = self.transform_dict_keys(row)
-            row_uuid = row['uuid']
-            product_type = row['product_type']
-            model = Course if product_type == 'course' else Program
-
-            geolocation = {
-                'location_name': row['location_name'],
-                'lat': row['latitude'],
-                'lng': row['longitude'],
-            }
-
-            err_message = self.validate_geolocation_data(row)
-            if err_message:
-                logger.error(
-                    'Data validation issue for product with UUID: {}.'  # lint-amnesty, pylint: disable=logging-format-interpolation
-                    'Skipping ingestion for this item.'
-                    'Details: {}'
-                    .format(row_uuid, err_message)
-                )
-                self.skipped_items.append("Skipped {} with UUID {}. Errors: {}".format(product_type, row_uuid, err_message))  # pylint: disable=line-too-long
-                continue
-
-            logger.info('Starting data import flow for {}: {}'.format(product_type, row_uuid))  # lint-amnesty, pylint: disable=logging-format-interpolation
-
-            self.ingest_entry(model, row_uuid, geolocation, processed_products[product_type])
+        self.ingest_rows()
 
         self.check_for_potential_orphans_in_courses()
 
@@ -82,6 +51,38 @@ class GeolocationCSVDataLoader(AbstractDataLoader):
 
         self.log_processed_products()
 
+    def ingest_row(self, row):
+        row = self.transform_dict_keys(row)
+        row_uuid = row['uuid']
+        product_type = row['product_type']
+        model = Course if product_type == 'course' else Program
+
+        geolocation = {
+            'location_name': row['location_name'],
+            'lat': row['latitude'],
+            'lng': row['longitude'],
+        }
+
+        err_message = self.validate_geolocation_data(row)
+        if err_message:
+            logger.error(
+                'Data validation issue for product with UUID: {}.'  # lint-amnesty, pylint: disable=logging-format-interpolation
+                'Skipping ingestion for this item.'
+                'Details: {}'
+                .format(row_uuid, err_message)
+            )
+            self.skipped_items.append("Skipped {} with UUID {}. Errors: {}".format(product_type, row_uuid, err_message))  # pylint: disable=line-too-long
+            return False
+
+        logger.info('Starting data import flow for {}: {}'.format(product_type, row_uuid))  # lint-amnesty, pylint: disable=logging-format-interpolation
+
+        processed_products = {
+            'course': self.processed_courses,
+            'program': self.processed_programs,
+        }
+        self.ingest_entry(model, row_uuid, geolocation, processed_products[product_type])
+        return True
+
     def ingest_entry(self, model, row_uuid, geolocation, processed_products):
         products = model.everything.filter(uuid=row_uuid) if model is Course else model.objects.filter(uuid=row_uuid)
 
@@ -1,14 +1,12 @@
 """
 Data loader responsible for creating location restriction entries in discovery database,
 """
-import csv
 import logging
 import uuid
 
-import unicodecsv
 from django_countries import countries
 
-from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
+from course_discovery.apps.course_metadata.data_loaders.streaming import StreamingCSVDataLoader
 from course_discovery.apps.course_metadata.models import (
     AbstractLocationRestrictionModel, Course, CourseLocationRestriction, Program, ProgramLocationRestriction
 )
@@ -16,7 +14,7 @@ from course_discovery.apps.course_metadata.models import (
 logger = logging.getLogger(__name__)
 
 
-class GeotargetingCSVDataLoader(AbstractDataLoader):
+class GeotargetingCSVDataLoader(StreamingCSVDataLoader):
     """ Loads the geotargeting (location restriction) data from the csv file """
     # Below are the minimum required fields needed for successful data upload
     # Additional column names (for info purposes only) may be Product Name, Partner, Notes
@@ -26,8 +24,11 @@ class GeotargetingCSVDataLoader(AbstractDataLoader):
 
     VALID_COUNTRY_CODES = [code for code, country in list(countries)]
 
-    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, csv_path=None, csv_file=None):
-        super().__init__(partner, api_url, max_workers, is_threadsafe)
+    def __init__(
+        self, partner, api_url=None, max_workers=None, is_threadsafe=False, csv_path=None, csv_file=None,
+        incremental=False,
+    ):
+        super().__init__(partner, api_url, max_workers, is_threadsafe, incremental=incremental)
         self.skipped_items = []
         self.processed_courses = []
         self.processed_programs = []
@@ -35,8 +36,7 @@ class GeotargetingCSVDataLoader(AbstractDataLoader):
         try:
             # Read file from the path if given. Otherwise,
             # read from the file received from GeotargetingDataLoaderConfiguration.
-            self.reader = csv.DictReader(open(csv_path, 'r')) if csv_path \
-                else list(unicodecsv.DictReader(csv_file))  # lint-amnesty, pylint: disable=consider-using-with
+            self.open_source(csv_path=csv_path, csv_file=csv_file)
         except FileNotFoundError:
             logger.exception("Error opening csv file at path {}".format(csv_path))    # lint-amnesty, pylint: disable=logging-format-interpolation
             raise  # re-raising exception to avoid moving the code flow
@@ -45,77 +45,9 @@ class GeotargetingCSVDataLoader(AbstractDataLoader):
         logger.info(message)
         list_to_add.append(message)
 
-    def ingest(self):  # pylint: disable=too-many-statements
+    def ingest(self):
         logger.info("Initiating Geotargeting CSV data loader flow.")
-        for row in self.reader:
-            row = self.transform_dict_keys(row)
-            row_uuid = row['uuid']
-            product_type = row['product_type']
-
-            message = self.validate_geotargeting_data(row)
-            if message:
-                logger.error(
-                    'Data validation issue for product with UUID: {}.'  # lint-amnesty, pylint: disable=logging-format-interpolation
-                    'Skipping ingestion for this item.'
-                    'Details: {}'
-                    .format(row_uuid, message)
-                )
-                self.skipped_items.append("Skipped {} with UUID {}. Errors: {}".format(product_type, row_uuid, message))
-                continue
-
-            logger.info('Starting data import flow for {}: {}'.format(product_type, row_uuid))  # lint-amnesty, pylint: disable=logging-format-interpolation
-
-            restriction_type = None
-
-            if row['include_or_exclude'] == 'include':
-                restriction_type = AbstractLocationRestrictionModel.ALLOWLIST
-            else:
-                restriction_type = AbstractLocationRestrictionModel.BLOCKLIST
-
-            loc_res = {
-                'restriction_type': restriction_type,
-                'countries': row['countries'] if row['countries'] else None
-            }
-
-            if product_type == 'course':
-                # we need to find this course obj and then create or update related CourseLocationRestriction object
-                for course_obj in Course.everything.filter(uuid=row_uuid):
-                    action_taken = 'Created'
-                    existing_loc_restriction_id = course_obj.location_restriction.id if course_obj.location_restriction else None  # lint-amnesty, pylint: disable=line-too-long
-                    course_obj.location_restriction = CourseLocationRestriction.objects.create(**loc_res)
-                    course_obj.save()
-                    if existing_loc_restriction_id:
-                        self.updated_course_location_restrictions.append(existing_loc_restriction_id)
-                        action_taken = 'Updated'
-                    self.log_info(
-                        "{} geotargeting data for course with UUID: {}".format(action_taken, row_uuid),
-                        self.processed_courses
-                    )
-            else:
-                # we need to check if there already exists a ProgramLocationRestriction
-                # for this program and update it if yes or create a new one if needed
-                program_loc_restriction = ProgramLocationRestriction.objects.filter(program__uuid=row['uuid']).first()
-                if program_loc_restriction:
-                    # update existing
-                    program_loc_restriction.restriction_type = loc_res['restriction_type']
-                    program_loc_restriction.countries = loc_res['countries']
-                    program_loc_restriction.save()
-                    self.log_info(
-                        "Updated geotargeting data for program with UUID: {}".format(row_uuid),
-                        self.processed_programs
-                    )
-                else:
-                    # create new
-                    program_obj = Program.objects.filter(uuid=row['uuid']).first()
-                    ProgramLocationRestriction.objects.create(
-                        program=program_obj,
-                        restriction_type=loc_res['restriction_type'],
-                        countries=loc_res['countries']
-                    )
-                    self.log_info(
-                        "Created geotargeting data for program with UUID: {}".format(row_uuid),
-                        self.processed_programs
-                    )
+        self.ingest_rows()
 
         # Check for potential orphans
         for loc_res_id in self.updated_course_location_restrictions:
@@ -144,6 +76,77 @@ class GeotargetingCSVDataLoader(AbstractDataLoader):
             for msg in self.processed_programs:
                 logger.info(msg)
 
+    def ingest_row(self, row):
+        row = self.transform_dict_keys(row)
+        row_uuid = row['uuid']
+        product_type = row['product_type']
+
+        message = self.validate_geotargeting_data(row)
+        if message:
+            logger.error(
+                'Data validation issue for product with UUID: {}.'  # lint-amnesty, pylint: disable=logging-format-interpolation
+                'Skipping ingestion for this item.'
+                'Details: {}'
+                .format(row_uuid, message)
+            )
+            self.skipped_items.append("Skipped {} with UUID {}. Errors: {}".format(product_type, row_uuid, message))
+            return False
+
+        logger.info('Starting data import flow for {}: {}'.format(product_type, row_uuid))  # lint-amnesty, pylint: disable=logging-format-interpolation
+
+        restriction_type = None
+
+        if row['include_or_exclude'] == 'include':
+            restriction_type = AbstractLocationRestrictionModel.ALLOWLIST
+        else:
+            restriction_type = AbstractLocationRestrictionModel.BLOCKLIST
+
+        loc_res = {
+            'restriction_type': restriction_type,
+            'countries': row['countries'] if row['countries'] else None
+        }
+
+        if product_type == 'course':
+            # we need to find this course obj and then create or update related CourseLocationRestriction object
+            for course_obj in Course.everything.filter(uuid=row_uuid):
+                action_taken = 'Created'
+                existing_loc_restriction_id = course_obj.location_restriction.id if course_obj.location_restriction else None  # lint-amnesty, pylint: disable=line-too-long
+                course_obj.location_restriction = CourseLocationRestriction.objects.create(**loc_res)
+                course_obj.save()
+                if existing_loc_restriction_id:
+                    self.updated_course_location_restrictions.append(existing_loc_restriction_id)
+                    action_taken = 'Updated'
+                self.log_info(
+                    "{} geotargeting data for course with UUID: {}".format(action_taken, row_uuid),
+                    self.processed_courses
+                )
+        else:
+            # we need to check if there already exists a ProgramLocationRestriction
+            # for this program and update it if yes or create a new one if needed
+            program_loc_restriction = ProgramLocationRestriction.objects.filter(program__uuid=row['uuid']).first()
+            if program_loc_restriction:
+                # update existing
+                program_loc_restriction.restriction_type = loc_res['restriction_type']
+                program_loc_restriction.countries = loc_res['countries']
+                program_loc_restriction.save()
+                self.log_info(
+                    "Updated geotargeting data for program with UUID: {}".format(row_uuid),
+                    self.processed_programs
+                )
+            else:
+                # create new
+                program_obj = Program.objects.filter(uuid=row['uuid']).first()
+                ProgramLocationRestriction.objects.create(
+                    program=program_obj,
+                    restriction_type=loc_res['restriction_type'],
+                    countries=loc_res['countries']
+                )
+                self.log_info(
+                    "Created geotargeting data for program with UUID: {}".format(row_uuid),
+                    self.processed_programs
+                )
+        return True
+
     def transform_dict_keys(self, data):
         """
         Given a data dictionary, return a new dict that has its keys transformed to
@@ -1,19 +1,16 @@
 """
 Data loader responsible for creating product value entries in discovery database
 """
-import csv
 import logging
 import uuid
 
-import unicodecsv
-
-from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
+from course_discovery.apps.course_metadata.data_loaders.streaming import StreamingCSVDataLoader
 from course_discovery.apps.course_metadata.models import Course, ProductValue, Program
 
 logger = logging.getLogger(__name__)
 
 
-class ProductValueCSVDataLoader(AbstractDataLoader):
+class ProductValueCSVDataLoader(StreamingCSVDataLoader):
     """Loads product value data from a csv file"""
 
     PRODUCT_VALUE_REQUIRED_DATA_FIELDS = [
@@ -24,15 +21,17 @@ class ProductValueCSVDataLoader(AbstractDataLoader):
         'per_click_usa', 'per_click_international', 'per_lead_usa', 'per_lead_international'
     ]
 
-    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, csv_path=None, csv_file=None):
-        super().__init__(partner, api_url, max_workers, is_threadsafe)
+    def __init__(
+        self, partner, api_url=None, max_workers=None, is_threadsafe=False, csv_path=None, csv_file=None,
+        incremental=False,
+    ):
+        super().__init__(partner, api_url, max_workers, is_threadsafe, incremental=incremental)
         self.skipped_items = []
         self.processed_courses = []
         self.processed_programs = []
         self.updated_product_values = []
         try:
-            self.reader = csv.DictReader(open(csv_path, 'r')) if csv_path \
-                else list(unicodecsv.DictReader(csv_file))  # lint-amnesty, pylint: disable=consider-using-with
+            self.open_source(csv_path=csv_path, csv_file=csv_file)
 
         except FileNotFoundError:
             logger.exception(f"Error opening csv file at path {csv_path}")
@@ -191,26 +190,7 @@ class ProductValueCSVDataLoader(AbstractDataLoader):
 
     def ingest(self):
         logger.info("Initiating Product Value CSV data loader flow.")
-        for row in self.reader:
-            row = self.transform_dict_keys(row)
-            row_uuid = row['uuid']
-            product_type = row['product_type']
-
-            message = self.validate_product_value_data(row)
-            if message:
-                logger.error(
-                    f'Data validation issue for product with UUID: {row_uuid}.'
-                    f' Skipping ingestion for this item. Details: {message}'
-                )
-                self.skipped_items.append(f"Skipped {product_type} with UUID {row_uuid}. Errors: {message}")
-                continue
-
-            logger.info(f'Starting data import flow for {product_type}: {row_uuid}')
-
-            if product_type == 'course':
-                self.process_course(row)
-            else:
-                self.process_program(row)
+        self.ingest_rows()
 
         logger.info("Product Value CSV loader ingest pipeline has completed.")
 
@@ -234,3 +214,25 @@ class ProductValueCSVDataLoader(AbstractDataLoader):
                 logger.info(msg)
 
         logger.info("Product Value ingestion complete!")
+
+    def ingest_row(self, row):
+        row = self.transform_dict_keys(row)
+        row_uuid = row['uuid']
+        product_type = row['product_type']
+
+        message = self.validate_product_value_data(row)
+        if message:
+            logger.error(
+                f'Data validation issue for product with UUID: {row_uuid}.'
+                f' Skipping ingestion for this item. Details: {message}'
+            )
+            self.skipped_items.append(f"Skipped {product_type} with UUID {row_uuid}. Errors: {message}")
+            return False
+
+        logger.info(f'Starting data import flow for {product_type}: {row_uuid}')
+
+        if product_type == 'course':
+            self.process_course(row)
+        else:
+            self.process_program(row)
+        return True
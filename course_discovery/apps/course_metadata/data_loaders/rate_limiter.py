@@ -0,0 +1,85 @@
+"""
+Client-side rate limiting for data loaders requesting rate limited APIs.
+"""
+import datetime
+import email.utils
+import threading
+import time
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread safe token bucket limiting requests to an API.
+
+    Up to `burst` requests can be made back to back, after which requests are spread evenly
+    so that no more than `requests` are ever made in any `period` seconds window.
+    """
+
+    def __init__(self, requests, period, burst=1, clock=time.monotonic, sleep=time.sleep):
+        """
+        Arguments:
+            requests (int): Maximum number of requests allowed per period.
+            period (float): Length of the rate limiting window, in seconds.
+            burst (int): Number of requests which can be made back to back.
+            clock (callable): Returns the current time, in seconds.
+            sleep (callable): Sleeps for the given number of seconds.
+        """
+        self.capacity = burst
+        self.rate = max(requests - burst, 1) / period
+        self.tokens = burst
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self.paused_until = self.updated
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a request can be made.
+        """
+        while True:
+            with self.lock:
+                now = self.clock()
+                if now >= self.paused_until:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    wait = self.paused_until - now
+
+            self.sleep(wait)
+
+    def pause(self, seconds):
+        """
+        Prevents any request from being made for the given number of seconds, e.g. after the API
+        responded with a 429.
+        """
+        with self.lock:
+            now = self.clock()
+            self.paused_until = max(self.paused_until, now + seconds)
+            self.tokens = 0
+            self.updated = self.paused_until
+
+
+def get_retry_after(response):
+    """
+    Returns the number of seconds the Retry-After header of a response asks to wait for, or None
+    if the response has no valid Retry-After header.
+    """
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if not retry_after:
+        return None
+
+    try:
+        return max(float(retry_after), 0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0)
@@ -0,0 +1,107 @@
+"""
+Change detection for incremental data loader runs.
+"""
+import datetime
+import hashlib
+import json
+import logging
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from course_discovery.apps.course_metadata.models import DataLoaderRecordHash
+
+logger = logging.getLogger(__name__)
+
+
+class RecordHashes:
+    """
+    Thread safe record of the content hashes of upstream records applied by a data loader.
+
+    In incremental runs, records whose content hash matches the one stored by a previous run are
+    reported as unchanged, so that loaders can skip them before touching the database. Stored hashes
+    older than DATA_LOADER_FULL_RECONCILIATION_DAYS are ignored, so every record is applied again
+    periodically, which reconciles any drift between the upstream service and discovery.
+    Full runs apply every record and replace all stored hashes.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, partner, loader, incremental=False):
+        """
+        Arguments:
+            partner (Partner): Partner which owns the data being loaded
+            loader (str): Name of the data loader, the hashes of each loader are kept apart
+            incremental (bool): True if unchanged records should be skipped
+        """
+        self.partner = partner
+        self.loader = loader
+        self.incremental = incremental
+        self.known = {}
+        self.applied = {}
+        self.skipped = 0
+        self.lock = threading.Lock()
+
+        if incremental:
+            cutoff = timezone.now() - datetime.timedelta(days=settings.DATA_LOADER_FULL_RECONCILIATION_DAYS)
+            self.known = dict(
+                self._queryset().filter(modified__gte=cutoff).values_list('record_key', 'content_hash')
+            )
+
+    def _queryset(self):
+        return DataLoaderRecordHash.objects.filter(partner=self.partner, loader=self.loader)
+
+    @staticmethod
+    def get_hash(body):
+        content = json.dumps(body, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.md5(content, usedforsecurity=False).hexdigest()
+
+    def is_unchanged(self, record_key, body):
+        """ Returns True if the record was applied by a previous run and hasn't changed since. """
+        if not self.incremental or self.known.get(record_key) != self.get_hash(body):
+            return False
+
+        with self.lock:
+            self.skipped += 1
+        return True
+
+    def mark_applied(self, record_key, body):
+        """ Remember that the record was successfully applied. """
+        content_hash = self.get_hash(body)
+        with self.lock:
+            self.applied[record_key] = content_hash
+
+    def save(self):
+        """
+        Store the hashes of the records applied during this run.
+
+        Full runs replace every stored hash, which also forgets records that weren't applied,
+        e.g. because they are gone upstream or failed to load.
+        """
+        with self.lock:
+            changed = {key: value for key, value in self.applied.items() if self.known.get(key) != value}
+
+        with transaction.atomic():
+            if self.incremental:
+                keys = list(changed)
+                for start in range(0, len(keys), self.BATCH_SIZE):
+                    self._queryset().filter(record_key__in=keys[start:start + self.BATCH_SIZE]).delete()
+            else:
+                self._queryset().delete()
+
+            DataLoaderRecordHash.objects.bulk_create(
+                [
+                    DataLoaderRecordHash(
+                        partner=self.partner, loader=self.loader, record_key=key, content_hash=content_hash
+                    )
+                    for key, content_hash in changed.items()
+                ],
+                batch_size=self.BATCH_SIZE,
+            )
+
+        logger.info(
+            '%s stored the hashes of %d records and skipped %d unchanged records.',
+            self.loader, len(changed), self.skipped,
+        )
@@ -0,0 +1,221 @@
+"""
+Streaming ingestion of CSV rows with resumable checkpoints, shared by the CSV data loaders.
+"""
+import abc
+import csv
+import datetime
+import functools
+import hashlib
+import json
+import logging
+from itertools import islice
+
+import unicodecsv
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
+from course_discovery.apps.course_metadata.gspread_client import GspreadClient
+from course_discovery.apps.course_metadata.models import DataLoaderCheckpoint, DataLoaderRecordHash
+from course_discovery.apps.course_metadata.utils import defer_external_calls
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingCSVDataLoader(AbstractDataLoader):
+    """
+    Base class for data loaders ingesting the rows of a CSV file, an uploaded CSV file or a Google sheet.
+
+    Rows are read from the source as they are ingested rather than all at once, and ingested in chunks of
+    CSV_DATA_LOADER_CHUNK_SIZE rows. Each chunk is committed in a single transaction, along with a
+    DataLoaderCheckpoint recording the number of rows read so far and the hash of the last of them. If a run
+    stops partway through, the next run skips the rows committed by the previous one and resumes after them,
+    unless the source changed in the meantime.
+
+    The external service calls made while ingesting a row (Studio, ecommerce, the LMS) are made once the chunk
+    commits, so that its transaction doesn't wait for them. If one of them fails, the row is reported with
+    `deferred_call_failed` and ingested again by the next run.
+
+    The content hash of every successfully ingested row is stored as well. In incremental runs, rows identical
+    to a row successfully ingested by a previous run are skipped. Stored hashes older than
+    DATA_LOADER_FULL_RECONCILIATION_DAYS are ignored, so every row is ingested again periodically.
+    """
+
+    def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, incremental=False):
+        super().__init__(partner, api_url, max_workers, is_threadsafe, incremental=incremental)
+        self.csv_path = None
+        self.csv_file = None
+        self.gspread_config = None
+        self.reader = None
+        self.rows_count = 0
+        self.chunk_size = settings.CSV_DATA_LOADER_CHUNK_SIZE
+        self.failed_row_hashes = set()  # rows which failed in this run, including their deferred calls
+
+    @property
+    def checkpoint_name(self):
+        """
+        Name under which the checkpoint and the row hashes of the loader are stored. Loaders ingesting
+        different kinds of sheets must keep them apart.
+        """
+        return self.__class__.__name__
+
+    def open_source(self, csv_path=None, csv_file=None, gspread_config=None):
+        """
+        Open the rows of the CSV file at csv_path if given, otherwise of the sheet described by gspread_config
+        if given, otherwise of the uploaded csv_file. Errors opening the source are raised right away.
+        """
+        self.csv_path = csv_path
+        self.csv_file = csv_file
+        self.gspread_config = gspread_config
+        self.reader = self._read_rows()
+
+    def _read_rows(self):
+        if self.csv_path:
+            # Opened here rather than by the generator below, so that a missing file is reported right away
+            csv_file = open(self.csv_path, 'r')  # pylint: disable=consider-using-with
+            return self._read_file(csv_file)
+        if self.gspread_config:
+            return GspreadClient().iter_data(self.gspread_config)
+
+        self.csv_file.seek(0)
+        return iter(unicodecsv.DictReader(self.csv_file))
+
+    @staticmethod
+    def _read_file(csv_file):
+        with csv_file:
+            yield from csv.DictReader(csv_file)
+
+    @staticmethod
+    def get_row_hash(row):
+        content = json.dumps(row, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.md5(content, usedforsecurity=False).hexdigest()
+
+    def read_row(self, row):
+        """
+        Called with every row read from the source, including the rows which are skipped.
+        """
+
+    def prepare_chunk(self, rows):
+        """
+        Called with the rows of a chunk before they are ingested, e.g. to load the objects they reference at once.
+        It is called outside of the transaction of the chunk, which must not wait for external services.
+        """
+
+    @abc.abstractmethod
+    def ingest_row(self, row):
+        """
+        Ingest a row, returning True if it was ingested successfully.
+        """
+
+    def deferred_call_failed(self, row, exc):
+        """
+        Called when an external service call made while ingesting a row fails, once the row's chunk committed.
+        It is only called for rows which were otherwise ingested successfully, and at most once per row.
+        """
+
+    def ingest_rows(self):
+        """
+        Read all the rows of the source and ingest them chunk by chunk.
+        """
+        checkpoint, __ = DataLoaderCheckpoint.objects.get_or_create(partner=self.partner, loader=self.checkpoint_name)
+        if checkpoint.row_offset:
+            logger.info('Resuming %s after row %d.', self.checkpoint_name, checkpoint.row_offset)
+
+        if not self._ingest_rows(checkpoint):
+            logger.warning(
+                'The source of %s changed since its interrupted run, ingesting all the rows again.',
+                self.checkpoint_name,
+            )
+            checkpoint.row_offset = 0
+            self.reader = self._read_rows()
+            self._ingest_rows(checkpoint)
+
+        checkpoint.delete()
+        cutoff = timezone.now() - datetime.timedelta(days=settings.DATA_LOADER_FULL_RECONCILIATION_DAYS)
+        self._hashes().filter(modified__lt=cutoff).delete()
+
+    def _hashes(self):
+        return DataLoaderRecordHash.objects.filter(partner=self.partner, loader=self.checkpoint_name)
+
+    def _ingest_rows(self, checkpoint):
+        """
+        Ingest the rows after the checkpoint, returning False if the row at the checkpoint isn't the one which
+        was committed by the previous run, or if the source has fewer rows than the checkpoint.
+        """
+        resumed_offset = checkpoint.row_offset
+        known_hashes = set()
+        if self.incremental:
+            cutoff = timezone.now() - datetime.timedelta(days=settings.DATA_LOADER_FULL_RECONCILIATION_DAYS)
+            known_hashes = set(self._hashes().filter(modified__gte=cutoff).values_list('content_hash', flat=True))
+
+        self.rows_count = 0
+        ingested = skipped = 0
+        while True:
+            chunk = list(islice(self.reader, self.chunk_size))
+            if not chunk:
+                break
+
+            rows = []
+            for row in chunk:
+                self.rows_count += 1
+                self.read_row(row)
+                row_hash = self.get_row_hash(row)
+                if self.rows_count == resumed_offset and row_hash != checkpoint.row_hash:
+                    return False
+                if self.rows_count <= resumed_offset:
+                    continue
+                if row_hash in known_hashes:
+                    skipped += 1
+                else:
+                    rows.append((row, row_hash))
+
+            if self.rows_count <= resumed_offset:
+                continue
+
+            self.prepare_chunk([row for row, __ in rows])
+            with transaction.atomic():
+                ingested_hashes = {row_hash for row, row_hash in rows if self._ingest_row(row, row_hash)}
+                self._hashes().filter(content_hash__in=ingested_hashes).delete()
+                DataLoaderRecordHash.objects.bulk_create([
+                    DataLoaderRecordHash(
+                        partner=self.partner, loader=self.checkpoint_name, record_key=row_hash, content_hash=row_hash
+                    )
+                    for row_hash in ingested_hashes
+                ])
+                checkpoint.row_offset = self.rows_count
+                checkpoint.row_hash = self.get_row_hash(chunk[-1])
+                checkpoint.save()
+            ingested += len(rows)
+
+        if self.rows_count < resumed_offset:
+            return False
+
+        logger.info(
+            '%s read %d rows, ingested %d rows and skipped %d unchanged rows and %d rows committed by a previous run.',
+            self.checkpoint_name, self.rows_count, ingested, skipped, min(resumed_offset, self.rows_count),
+        )
+        return True
+
+    def _ingest_row(self, row, row_hash):
+        with defer_external_calls(functools.partial(self._defer_call, row, row_hash)):
+            ingested = self.ingest_row(row)
+        if not ingested:
+            self.failed_row_hashes.add(row_hash)
+        return ingested
+
+    def _defer_call(self, row, row_hash, call):
+        transaction.on_commit(functools.partial(self._make_deferred_call, row, row_hash, call))
+
+    def _make_deferred_call(self, row, row_hash, call):
+        try:
+            call()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception(
+                'An external service call of %s failed after its chunk was committed.', self.checkpoint_name
+            )
+            # Rows which already failed have been reported, and have no hash
+            if row_hash not in self.failed_row_hashes:
+                self.failed_row_hashes.add(row_hash)
+                self._hashes().filter(content_hash=row_hash).delete()
+                self.deferred_call_failed(row, exc)
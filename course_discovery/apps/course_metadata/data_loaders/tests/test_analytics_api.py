@@ -3,6 +3,7 @@ import json
 import responses
 from django.test import TestCase
 
+from course_discovery.apps.api.v1.tests.test_views.mixins import FuzzyInt
 from course_discovery.apps.course_metadata.data_loaders.analytics_api import AnalyticsAPIDataLoader
 from course_discovery.apps.course_metadata.data_loaders.tests import JSON, mock_data
 from course_discovery.apps.course_metadata.data_loaders.tests.mixins import DataLoaderTestMixin
@@ -92,3 +93,24 @@ class AnalyticsAPIDataLoaderTests(DataLoaderTestMixin, TestCase):
         programs = Program.objects.all()
         assert programs[0].enrollment_count == expected_program_enrollment_count
         assert programs[0].recent_enrollment_count == expected_program_recent_enrollment_count
+
+    @responses.activate
+    def test_ingest_query_count(self):
+        """ Verify that counts are written in a fixed number of queries, matching run keys case insensitively. """
+        self._define_course_metadata()
+        mocked_data = [dict(summary, course_id=summary['course_id'].upper()) for summary in self.mocked_data]
+        responses.add(
+            method=responses.GET,
+            url=f'{self.api_url}course_summaries/',
+            body=json.dumps(mocked_data),
+            match_querystring=False,
+            content_type=JSON
+        )
+
+        with self.assertNumQueries(FuzzyInt(11, 4)):
+            self.loader.ingest()
+
+        summary = self.mocked_data[0]
+        course_run = CourseRun.objects.get(key=summary['course_id'])
+        assert course_run.enrollment_count == int(summary['count'])
+        assert course_run.recent_enrollment_count == int(summary['recent_count_change'])
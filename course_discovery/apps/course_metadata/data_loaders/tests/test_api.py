@@ -9,6 +9,7 @@ import pytz
 import responses
 from django.conf import settings
 from django.core.management import CommandError
+from django.db.models.signals import m2m_changed
 from django.http.response import HttpResponse
 from django.test import TestCase
 from edx_django_utils.cache import TieredCache
@@ -21,10 +22,12 @@ from course_discovery.apps.course_metadata.choices import CourseRunPacing, Cours
 from course_discovery.apps.course_metadata.data_loaders.api import (
     AbstractDataLoader, CoursesApiDataLoader, EcommerceApiDataLoader, ProgramsApiDataLoader, _fatal_code
 )
+from course_discovery.apps.course_metadata.data_loaders.record_hashes import RecordHashes
 from course_discovery.apps.course_metadata.data_loaders.tests import JPEG, JSON, mock_data
 from course_discovery.apps.course_metadata.data_loaders.tests.mixins import DataLoaderTestMixin
 from course_discovery.apps.course_metadata.models import (
-    Course, CourseEntitlement, CourseRun, CourseRunType, CourseType, Organization, Program, ProgramType, Seat, SeatType
+    Course, CourseEntitlement, CourseRun, CourseRunType, CourseType, DataLoaderRecordHash, Organization, Program,
+    ProgramType, Seat, SeatType
 )
 from course_discovery.apps.course_metadata.tests.factories import (
     CourseEntitlementFactory, CourseFactory, CourseRunFactory, OrganizationFactory, SeatFactory, SeatTypeFactory,
@@ -189,6 +192,41 @@ class CoursesApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         # Verify multiple calls to ingest data do NOT result in data integrity errors.
         self.loader.ingest()
 
+    @responses.activate
+    def test_ingest_honors_retry_after(self):
+        """ Verify that requests answered with a 429 are retried once the Retry-After delay has passed. """
+        TieredCache.dangerous_clear_all_tiers()
+        responses.calls.reset()  # pylint: disable=no-member
+        responses.add(responses.GET, self.api_url + 'courses/', status=429, headers={'Retry-After': '0'})
+        api_data = self.mock_api()
+
+        with mock.patch.object(self.loader.rate_limiter, 'pause', wraps=self.loader.rate_limiter.pause) as mock_pause:
+            self.loader.ingest()
+
+        mock_pause.assert_called_once_with(0)
+        assert CourseRun.objects.count() == len(api_data)
+
+    @responses.activate
+    def test_ingest_incremental(self):
+        """ Verify that incremental runs only process the course runs which changed since the last run. """
+        TieredCache.dangerous_clear_all_tiers()
+        api_data = self.mock_api()
+        self.loader.ingest()
+
+        changed_body = dict(api_data[0], name='A new name')
+        responses.reset()
+        self.mock_api([changed_body] + api_data[1:])
+        self.loader.record_hashes = RecordHashes(self.partner, self.loader.__class__.__name__, incremental=True)
+
+        with mock.patch.object(
+            self.loader, 'process_single_course_run', wraps=self.loader.process_single_course_run
+        ) as mock_process:
+            self.loader.ingest()
+
+        mock_process.assert_called_once_with(changed_body)
+        assert CourseRun.objects.get(key=changed_body['id']).title_override == 'A new name'
+        assert DataLoaderRecordHash.objects.filter(partner=self.partner).count() == len(api_data)
+
     @responses.activate
     @mock.patch('course_discovery.apps.course_metadata.data_loaders.api.push_to_ecommerce_for_course_run')
     def test_ingest_verified_deadline(self, mock_push_to_ecomm):
@@ -507,6 +545,21 @@ class CoursesApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         self.assert_run_and_course_updated(datum, draft_run, draft_exists, True, partner_uses_publisher)
         self.assert_run_and_course_updated(datum, official_run, official_exists, False, partner_uses_publisher)
 
+    def test_get_course_runs(self):
+        """ Verify that official and draft versions of many course runs are resolved in a fixed number of queries. """
+        official_runs = CourseRunFactory.create_batch(3)
+        draft_run = ensure_draft_world(CourseRun.objects.get(pk=official_runs[0].pk))
+        keys = [run.key for run in official_runs] + ['course-v1:edX+Missing+Run']
+
+        with self.assertNumQueries(2):
+            course_runs = self.loader.get_course_runs(keys)
+
+        assert course_runs == {
+            official_runs[0].key.lower(): (official_runs[0], draft_run),
+            official_runs[1].key.lower(): (official_runs[1], None),
+            official_runs[2].key.lower(): (official_runs[2], None),
+        }
+
     @responses.activate
     def test_ingest_studio_made_run_with_existing_draft_course(self):
         """
@@ -1074,6 +1127,31 @@ class EcommerceApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         """ Verify the method returns the correct certificate type"""
         assert self.loader.get_certificate_type(product) == expected_certificate_type
 
+    def test_update_seat_with_upgrade_deadline_override(self):
+        """ Verify that an unchanged seat with an upgrade deadline override is not saved again. """
+        course_run = CourseRunFactory(type=CourseRunType.objects.get(slug=CourseRunType.VERIFIED_AUDIT))
+        seat = SeatFactory(
+            course_run=course_run,
+            type=SeatTypeFactory.verified(),
+            currency_id='USD',
+            price=Decimal('10.00'),
+            sku='sku132',
+            credit_hours=None,
+            upgrade_deadline=datetime.datetime(2030, 1, 1, tzinfo=UTC),
+            upgrade_deadline_override=datetime.datetime(2030, 2, 1, tzinfo=UTC),
+        )
+        product = {
+            'expires': '2030-01-01T00:00:00Z',
+            'attribute_values': [{'name': 'certificate_type', 'value': Seat.VERIFIED}],
+            'stockrecords': [{'price_currency': 'USD', 'price_excl_tax': '10.00', 'partner_sku': 'sku132'}],
+        }
+
+        with mock.patch.object(Seat, 'save') as mock_save:
+            assert self.loader.update_seat(course_run, product)
+        mock_save.assert_not_called()
+        seat.refresh_from_db()
+        assert seat.upgrade_deadline == datetime.datetime(2030, 2, 1, tzinfo=UTC)
+
     @responses.activate
     def test_upgrade_empty_types(self):
         """ Verify that we try to fill in any empty course or run types after loading seats. """
@@ -1122,6 +1200,22 @@ class EcommerceApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         assert audit_run.type.slug == CourseType.AUDIT
         assert audit_run.course.type.slug == CourseType.AUDIT
 
+    @responses.activate
+    def test_upgrade_empty_types_of_touched_courses_only(self):
+        """ Verify that only the types of courses whose products were loaded are recalculated. """
+        self.mock_courses_api()
+        self.mock_products_api()
+        empty_type = CourseType.objects.get(slug=CourseType.EMPTY)
+        untouched_run = CourseRunFactory(course__partner=self.partner, course__type=empty_type)
+        SeatFactory(course_run=untouched_run)
+
+        target = 'course_discovery.apps.course_metadata.data_loaders.api.calculate_course_type'
+        with mock.patch(target, return_value=True) as mock_calculate_course_type:
+            self.loader.ingest()
+
+        calculated = {call.args[0] for call in mock_calculate_course_type.call_args_list}
+        assert untouched_run.course not in calculated
+
 
 @ddt.ddt
 class ProgramsApiDataLoaderTests(DataLoaderTestMixin, TestCase):
@@ -1269,3 +1363,36 @@ class ProgramsApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         for program in programs:
             self.assert_program_loaded(program)
             self.assert_program_banner_image_loaded(program)
+
+    @responses.activate
+    def test_ingest_unchanged_programs(self):
+        """ Verify that ingesting unchanged programs again rewrites neither their relations nor their banner images. """
+        programs = self.mock_api()
+        for program_data in programs:
+            banner_image_url = program_data.get('banner_image_urls', {}).get('w1440h480')
+            if banner_image_url:
+                responses.add_callback(
+                    responses.GET,
+                    banner_image_url,
+                    callback=mock_jpeg_callback(),
+                    content_type=JPEG
+                )
+        self.loader.ingest()
+        banner_images = {program.pk: program.banner_image.name for program in Program.objects.all()}
+        assert any(Program.objects.values_list('banner_image_etag', flat=True))
+
+        m2m_receiver = mock.Mock()
+        for through in (Program.courses.through, Program.excluded_course_runs.through,
+                        Program.authoring_organizations.through):
+            m2m_changed.connect(m2m_receiver, sender=through, dispatch_uid='test_ingest_unchanged_programs')
+        try:
+            with mock.patch.object(Program, 'save') as mock_save:
+                self.loader.ingest()
+        finally:
+            for through in (Program.courses.through, Program.excluded_course_runs.through,
+                            Program.authoring_organizations.through):
+                m2m_changed.disconnect(sender=through, dispatch_uid='test_ingest_unchanged_programs')
+
+        assert not mock_save.called
+        assert not m2m_receiver.called
+        assert {program.pk: program.banner_image.name for program in Program.objects.all()} == banner_images
@@ -12,14 +12,15 @@ from edx_toggles.toggles.testutils import override_waffle_switch
 from pytz import UTC
 from testfixtures import LogCapture
 
+from course_discovery.apps.api.utils import StudioAPI
 from course_discovery.apps.api.v1.tests.test_views.mixins import APITestCase, OAuth2Mixin
-from course_discovery.apps.core.tests.factories import USER_PASSWORD, UserFactory
 from course_discovery.apps.course_metadata.choices import ExternalCourseMarketingType, ExternalProductStatus
+from course_discovery.apps.course_metadata.data_loaders.constants import CSVIngestionErrors
 from course_discovery.apps.course_metadata.data_loaders.csv_loader import CSVDataLoader
 from course_discovery.apps.course_metadata.data_loaders.tests import mock_data
 from course_discovery.apps.course_metadata.data_loaders.tests.mixins import CSVLoaderMixin
 from course_discovery.apps.course_metadata.models import (
-    AdditionalMetadata, Course, CourseEntitlement, CourseRun, CourseType, Seat, Source, TaxiForm
+    AdditionalMetadata, Course, CourseEntitlement, CourseRun, CourseType, DataLoaderRecordHash, Seat, Source, TaxiForm
 )
 from course_discovery.apps.course_metadata.tests.factories import (
     AdditionalMetadataFactory, CourseFactory, CourseRunFactory, CourseTypeFactory, OrganizationFactory, SourceFactory
@@ -28,6 +29,7 @@ from course_discovery.apps.course_metadata.toggles import (
     IS_COURSE_RUN_VARIANT_ID_EDITABLE, IS_SUBDIRECTORY_SLUG_FORMAT_ENABLED,
     IS_SUBDIRECTORY_SLUG_FORMAT_FOR_EXEC_ED_ENABLED
 )
+from course_discovery.apps.course_metadata.utils import download_course_image
 
 LOGGER_PATH = 'course_discovery.apps.course_metadata.data_loaders.csv_loader'
 
@@ -44,27 +46,6 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
     def setUp(self) -> None:
         super().setUp()
         self.mock_access_token()
-        self.user = UserFactory.create(username="test_user", password=USER_PASSWORD, is_staff=True)
-        self.client.login(username=self.user.username, password=USER_PASSWORD)
-
-    def mock_call_course_api(self, method, url, payload):
-        """
-        Helper method to make api calls using test client.
-        """
-        response = None
-        if method == 'POST':
-            response = self.client.post(
-                url,
-                data=payload,
-                format='json'
-            )
-        elif method == 'PATCH':
-            response = self.client.patch(
-                url,
-                data=payload,
-                format='json'
-            )
-        return response
 
     def _assert_default_logs(self, log_capture):
         """
@@ -169,34 +150,94 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
 
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        )
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
                     )
+                )
 
-                    # Creation call results in creating course and course run objects
-                    assert Course.everything.count() == 1
-                    assert CourseRun.everything.count() == 1
+                # Creation call results in creating course and course run objects
+                assert Course.everything.count() == 1
+                assert CourseRun.everything.count() == 1
 
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'ERROR',
-                            '[IMAGE_DOWNLOAD_FAILURE] The course image download failed for the course CSV Course.'
-                        )
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'ERROR',
+                        '[IMAGE_DOWNLOAD_FAILURE] The course image download failed for the course CSV Course.'
                     )
+                )
+
+    @responses.activate
+    def test_external_calls_outside_of_chunk_transaction(self, jwt_decode_patch):  # pylint: disable=unused-argument
+        """
+        Verify that the images of the rows are downloaded once before the chunk is ingested, and that the course
+        runs are pushed to Studio once the transaction of the chunk commits.
+        """
+        self._setup_prerequisites(self.partner)
+        self.mock_ecommerce_publication(self.partner)
+        self.mock_image_response()
+
+        with NamedTemporaryFile() as csv:
+            csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
+            loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+
+            with mock.patch(
+                f'{LOGGER_PATH}.download_course_image', wraps=download_course_image
+            ) as mock_download, mock.patch.object(StudioAPI, 'push_to_studio') as mock_push, mock.patch(
+                'course_discovery.apps.course_metadata.models.push_to_ecommerce_for_course_run'
+            ) as mock_ecommerce_push:
+                with self.captureOnCommitCallbacks() as callbacks:
+                    loader.ingest()
+
+                mock_download.assert_called_once_with(
+                    'edx+csv_123', 'https://example.com/image.jpg', headers=CSVDataLoader.REQUEST_USER_AGENT_HEADERS
+                )
+                assert not mock_push.called
+                assert not mock_ecommerce_push.called
+                for callback in callbacks:
+                    callback()
+                assert mock_push.called
+                assert mock_ecommerce_push.called
+
+        course = Course.everything.get(key='edx+csv_123', draft=True)
+        assert course.image
+        assert course.organization_logo_override
+
+    @responses.activate
+    def test_failed_deferred_studio_call(self, jwt_decode_patch):  # pylint: disable=unused-argument
+        """
+        Verify that a row whose course couldn't be pushed to Studio once its chunk committed is reported as failed,
+        and ingested again by the next incremental run.
+        """
+        self._setup_prerequisites(self.partner)
+        self.mock_ecommerce_publication(self.partner)
+        self.mock_image_response()
+
+        with NamedTemporaryFile() as csv:
+            csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
+            loader = CSVDataLoader(
+                self.partner, csv_path=csv.name, product_source=self.source.slug, incremental=True
+            )
+
+            with mock.patch.object(StudioAPI, 'push_to_studio', side_effect=Exception('Studio is down')):
+                with self.captureOnCommitCallbacks(execute=True):
+                    loader.ingest()
+
+        stats = loader.get_ingestion_stats()
+        assert stats['success_count'] == 0
+        assert stats['failure_count'] == 1
+        assert stats['errors'][CSVIngestionErrors.COURSE_CREATE_ERROR] == [
+            '[COURSE_CREATE_ERROR] Unable to create course CSV Course in the system. The ingestion failed with '
+            'the exception: Studio is down'
+        ]
+        assert not DataLoaderRecordHash.objects.filter(loader=loader.checkpoint_name).exists()
 
     @data(
         ('csv-course-custom-slug', 'executive-education/edx-csv-course'),
@@ -224,81 +265,78 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [csv_data])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(
-                        self.partner, csv_path=csv.name,
-                        product_type=self.course_type.slug,
-                        product_source=self.source.slug
-                    )
+                loader = CSVDataLoader(
+                    self.partner, csv_path=csv.name,
+                    product_type=self.course_type.slug,
+                    product_source=self.source.slug
+                )
 
-                    with mock.patch(
-                        'course_discovery.apps.course_metadata.emails.send_email_for_legal_review'
-                    ) as mocked_legal_email:
-                        with override_waffle_switch(IS_SUBDIRECTORY_SLUG_FORMAT_ENABLED, active=True):
-                            with override_waffle_switch(IS_SUBDIRECTORY_SLUG_FORMAT_FOR_EXEC_ED_ENABLED, active=True):
-                                loader.ingest()
-                    assert not mocked_legal_email.called
+                with mock.patch(
+                    'course_discovery.apps.course_metadata.emails.send_email_for_legal_review'
+                ) as mocked_legal_email:
+                    with override_waffle_switch(IS_SUBDIRECTORY_SLUG_FORMAT_ENABLED, active=True):
+                        with override_waffle_switch(IS_SUBDIRECTORY_SLUG_FORMAT_FOR_EXEC_ED_ENABLED, active=True):
+                            loader.ingest()
+                assert not mocked_legal_email.called
 
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        )
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
                     )
+                )
 
-                    for model in [Course, CourseRun, Seat, CourseEntitlement]:
-                        assert model.objects.count() == 1
-                        assert model.everything.count() == 2
+                for model in [Course, CourseRun, Seat, CourseEntitlement]:
+                    assert model.objects.count() == 1
+                    assert model.everything.count() == 2
 
-                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
-                    course_run = CourseRun.everything.get(course=course, draft=True)
+                course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
+                course_run = CourseRun.everything.get(course=course, draft=True)
 
-                    official_course = course.official_version
-                    official_course_run = course_run.official_version
+                official_course = course.official_version
+                official_course_run = course_run.official_version
 
-                    assert course.image.read() == image_content
-                    assert course.organization_logo_override.read() == image_content
-                    self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
-                    self._assert_course_run_data(course_run, self.BASE_EXPECTED_COURSE_RUN_DATA)
+                assert course.image.read() == image_content
+                assert course.organization_logo_override.read() == image_content
+                self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
+                self._assert_course_run_data(course_run, self.BASE_EXPECTED_COURSE_RUN_DATA)
 
-                    self._assert_course_data(
-                        official_course, {**self.BASE_EXPECTED_COURSE_DATA, 'draft': False}
-                    )
-                    self._assert_course_run_data(
-                        official_course_run, {**self.BASE_EXPECTED_COURSE_RUN_DATA, 'draft': False}
-                    )
-
-                    assert course.entitlements.get().official_version == official_course.entitlements.get()
-                    assert course_run.seats.get().official_version == official_course_run.seats.get()
-                    assert course.active_url_slug == expected_slug
-                    assert course.official_version.active_url_slug == expected_slug
-
-                    assert TaxiForm.objects.count() == 1
+                self._assert_course_data(
+                    official_course, {**self.BASE_EXPECTED_COURSE_DATA, 'draft': False}
+                )
+                self._assert_course_run_data(
+                    official_course_run, {**self.BASE_EXPECTED_COURSE_RUN_DATA, 'draft': False}
+                )
 
-                    assert loader.get_ingestion_stats() == {
-                        'total_products_count': 1,
-                        'success_count': 1,
-                        'failure_count': 0,
-                        'updated_products_count': 0,
-                        'created_products_count': 1,
-                        'created_products': [{
-                            'uuid': str(course.uuid),
-                            'external_course_marketing_type': 'short_course',
-                            'url_slug': expected_slug,
-                            'rerun': True,
-                            'course_run_variant_id': str(course.course_runs.last().variant_id),
-                            'restriction_type': None,
-                        }],
-                        'archived_products_count': 0,
-                        'archived_products': [],
-                        'errors': loader.error_logs
-                    }
+                assert course.entitlements.get().official_version == official_course.entitlements.get()
+                assert course_run.seats.get().official_version == official_course_run.seats.get()
+                assert course.active_url_slug == expected_slug
+                assert course.official_version.active_url_slug == expected_slug
+
+                assert TaxiForm.objects.count() == 1
+                # Courses are created in-process on behalf of the user of the partner's API client
+                assert course.editors.get().user.username == 'test_username'
+
+                assert loader.get_ingestion_stats() == {
+                    'total_products_count': 1,
+                    'success_count': 1,
+                    'failure_count': 0,
+                    'updated_products_count': 0,
+                    'created_products_count': 1,
+                    'created_products': [{
+                        'uuid': str(course.uuid),
+                        'external_course_marketing_type': 'short_course',
+                        'url_slug': expected_slug,
+                        'rerun': True,
+                        'course_run_variant_id': str(course.course_runs.last().variant_id),
+                        'restriction_type': None,
+                    }],
+                    'archived_products_count': 0,
+                    'archived_products': [],
+                    'errors': loader.error_logs
+                }
 
     @responses.activate
     def test_archived_flow_published_course(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -335,61 +373,56 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(
-                        self.partner,
-                        csv_path=csv.name,
-                        product_type=CourseType.EXECUTIVE_EDUCATION_2U,
-                        product_source=self.source.slug
-                    )
-                    loader.ingest()
-
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            f'Archived 2 products in CSV Ingestion for source {self.source.slug} and product type '
-                            f'{CourseType.EXECUTIVE_EDUCATION_2U}.'
-                        ),
-                    )
-
-                    # Verify the existence of both draft and non-draft versions
-                    assert Course.everything.count() == 5
-                    assert AdditionalMetadata.objects.count() == 4
-
-                    course = Course.everything.get(key=self.COURSE_KEY, draft=True)
-                    stats = loader.get_ingestion_stats()
-                    archived_products = stats.pop('archived_products')
-                    assert stats == {
-                        'total_products_count': 1,
-                        'success_count': 1,
-                        'failure_count': 0,
-                        'updated_products_count': 0,
-                        'created_products_count': 1,
-                        'created_products': [{
-                            'uuid': str(course.uuid),
-                            'external_course_marketing_type': 'short_course',
-                            'url_slug': 'csv-course',
-                            'rerun': True,
-                            'course_run_variant_id': str(course.course_runs.last().variant_id),
-                            'restriction_type': None,
-                        }],
-                        'archived_products_count': 2,
-                        'errors': loader.error_logs
-                    }
+                loader = CSVDataLoader(
+                    self.partner,
+                    csv_path=csv.name,
+                    product_type=CourseType.EXECUTIVE_EDUCATION_2U,
+                    product_source=self.source.slug
+                )
+                loader.ingest()
 
-                    # asserting separately due to random sort order
-                    assert set(archived_products) == {additional_metadata_one.external_identifier,
-                                                      additional_metadata_two.external_identifier}
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        f'Archived 2 products in CSV Ingestion for source {self.source.slug} and product type '
+                        f'{CourseType.EXECUTIVE_EDUCATION_2U}.'
+                    ),
+                )
 
-                    # Assert that a product status with different product source is not affected in Archive flow.
-                    additional_metadata__source_2.refresh_from_db()
-                    assert additional_metadata__source_2.product_status == ExternalProductStatus.Published
+                # Verify the existence of both draft and non-draft versions
+                assert Course.everything.count() == 5
+                assert AdditionalMetadata.objects.count() == 4
+
+                course = Course.everything.get(key=self.COURSE_KEY, draft=True)
+                stats = loader.get_ingestion_stats()
+                archived_products = stats.pop('archived_products')
+                assert stats == {
+                    'total_products_count': 1,
+                    'success_count': 1,
+                    'failure_count': 0,
+                    'updated_products_count': 0,
+                    'created_products_count': 1,
+                    'created_products': [{
+                        'uuid': str(course.uuid),
+                        'external_course_marketing_type': 'short_course',
+                        'url_slug': 'csv-course',
+                        'rerun': True,
+                        'course_run_variant_id': str(course.course_runs.last().variant_id),
+                        'restriction_type': None,
+                    }],
+                    'archived_products_count': 2,
+                    'errors': loader.error_logs
+                }
+
+                # asserting separately due to random sort order
+                assert set(archived_products) == {additional_metadata_one.external_identifier,
+                                                  additional_metadata_two.external_identifier}
+
+                # Assert that a product status with different product source is not affected in Archive flow.
+                additional_metadata__source_2.refresh_from_db()
+                assert additional_metadata__source_2.product_status == ExternalProductStatus.Published
 
     @responses.activate
     def test_ingest_flow_for_preexisting_published_course(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -424,52 +457,47 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
 
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course edx+csv_123 is located in the database.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to False for the course CSV Course'
-                        )
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course edx+csv_123 is located in the database.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to False for the course CSV Course'
                     )
+                )
 
-                    # Verify the existence of both draft and non-draft versions
-                    assert Course.everything.count() == 2
-                    assert CourseRun.everything.count() == 2
+                # Verify the existence of both draft and non-draft versions
+                assert Course.everything.count() == 2
+                assert CourseRun.everything.count() == 2
 
-                    course = Course.objects.get(key=self.COURSE_KEY, partner=self.partner)
-                    course_run = CourseRun.objects.get(course=course)
+                course = Course.objects.get(key=self.COURSE_KEY, partner=self.partner)
+                course_run = CourseRun.objects.get(course=course)
 
-                    self._assert_course_data(course, expected_course_data)
-                    self._assert_course_run_data(course_run, expected_course_run_data)
+                self._assert_course_data(course, expected_course_data)
+                self._assert_course_run_data(course_run, expected_course_run_data)
 
-                    assert course.product_source == self.source
-                    assert course.draft_version.product_source == self.source
+                assert course.product_source == self.source
+                assert course.draft_version.product_source == self.source
 
-                    assert loader.get_ingestion_stats() == {
-                        'total_products_count': 1,
-                        'success_count': 1,
-                        'failure_count': 0,
-                        'updated_products_count': 1,
-                        'created_products_count': 0,
-                        'created_products': [],
-                        'archived_products_count': 0,
-                        'archived_products': [],
-                        'errors': loader.error_logs
-                    }
+                assert loader.get_ingestion_stats() == {
+                    'total_products_count': 1,
+                    'success_count': 1,
+                    'failure_count': 0,
+                    'updated_products_count': 1,
+                    'created_products_count': 0,
+                    'created_products': [],
+                    'archived_products_count': 0,
+                    'archived_products': [],
+                    'errors': loader.error_logs
+                }
 
     @responses.activate
     def test_ingest_flow_for_preexisting_published_course_with_new_run_creation(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -517,83 +545,78 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
             with override_waffle_switch(IS_COURSE_RUN_VARIANT_ID_EDITABLE, active=True):
                 with LogCapture(LOGGER_PATH) as log_capture:
-                    with mock.patch.object(
-                            CSVDataLoader,
-                            '_call_course_api',
-                            self.mock_call_course_api
-                    ):
-                        loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                        loader.ingest()
-
-                        self._assert_default_logs(log_capture)
-                        log_capture.check_present(
-                            (
-                                LOGGER_PATH,
-                                'INFO',
-                                'Course edx+csv_123 is located in the database.'
-                            ),
-                            (
-                                LOGGER_PATH,
-                                'INFO',
-                                (
-                                    'Course Run with variant_id {variant_id} could not be found.' +
-                                    'Creating new course run for course {course_key} with variant_id {variant_id}'
-                                ).format(
-                                    variant_id='00000000-0000-0000-0000-000000000000',
-                                    course_key=self.COURSE_KEY,
-                                )
-                            ),
+                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                    loader.ingest()
+
+                    self._assert_default_logs(log_capture)
+                    log_capture.check_present(
+                        (
+                            LOGGER_PATH,
+                            'INFO',
+                            'Course edx+csv_123 is located in the database.'
+                        ),
+                        (
+                            LOGGER_PATH,
+                            'INFO',
                             (
-                                LOGGER_PATH,
-                                'INFO',
-                                'Draft flag is set to False for the course CSV Course'
-                            ),
-                        )
-
-                        # Verify the existence of both draft and non-draft versions
-                        assert Course.everything.count() == 2
-                        # Total course_runs count is 4 -> 2 for existing course runs (draft/non-draft)
-                        # and 2 for new course run (draft/non-draft)
-                        assert CourseRun.everything.count() == 4
-
-                        assert Seat.everything.count() == 2
-                        assert CourseEntitlement.everything.count() == 2
-
-                        course = Course.objects.filter_drafts(key=self.COURSE_KEY, partner=self.partner).first()
-                        course_run = CourseRun.everything.get(
-                            course=course,
-                            variant_id='00000000-0000-0000-0000-000000000000'
-                        )
-
-                        self._assert_course_data(course, expected_course_data)
-                        self._assert_course_data(course.official_version, {**expected_course_data, 'draft': False})
-                        self._assert_course_run_data(course_run, expected_course_run_data)
-                        self._assert_course_run_data(
-                            course_run.official_version, {**expected_course_run_data, 'draft': False}
-                        )
-
-                        assert course.product_source == self.source
-                        assert course.official_version.product_source == self.source
-
-                        assert loader.get_ingestion_stats() == {
-                            'total_products_count': 1,
-                            'success_count': 1,
-                            'failure_count': 0,
-                            'updated_products_count': 0,
-                            'created_products_count': 1,
-                            'created_products': [{
-                                'uuid': str(course.uuid),
-                                'external_course_marketing_type':
-                                    course.additional_metadata.external_course_marketing_type,
-                                'url_slug': course.active_url_slug,
-                                'rerun': True,
-                                'course_run_variant_id': str(course_run.variant_id),
-                                'restriction_type': None,
-                            }],
-                            'archived_products_count': 0,
-                            'archived_products': [],
-                            'errors': loader.error_logs
-                        }
+                                'Course Run with variant_id {variant_id} could not be found.' +
+                                'Creating new course run for course {course_key} with variant_id {variant_id}'
+                            ).format(
+                                variant_id='00000000-0000-0000-0000-000000000000',
+                                course_key=self.COURSE_KEY,
+                            )
+                        ),
+                        (
+                            LOGGER_PATH,
+                            'INFO',
+                            'Draft flag is set to False for the course CSV Course'
+                        ),
+                    )
+
+                    # Verify the existence of both draft and non-draft versions
+                    assert Course.everything.count() == 2
+                    # Total course_runs count is 4 -> 2 for existing course runs (draft/non-draft)
+                    # and 2 for new course run (draft/non-draft)
+                    assert CourseRun.everything.count() == 4
+
+                    assert Seat.everything.count() == 2
+                    assert CourseEntitlement.everything.count() == 2
+
+                    course = Course.objects.filter_drafts(key=self.COURSE_KEY, partner=self.partner).first()
+                    course_run = CourseRun.everything.get(
+                        course=course,
+                        variant_id='00000000-0000-0000-0000-000000000000'
+                    )
+
+                    self._assert_course_data(course, expected_course_data)
+                    self._assert_course_data(course.official_version, {**expected_course_data, 'draft': False})
+                    self._assert_course_run_data(course_run, expected_course_run_data)
+                    self._assert_course_run_data(
+                        course_run.official_version, {**expected_course_run_data, 'draft': False}
+                    )
+
+                    assert course.product_source == self.source
+                    assert course.official_version.product_source == self.source
+
+                    assert loader.get_ingestion_stats() == {
+                        'total_products_count': 1,
+                        'success_count': 1,
+                        'failure_count': 0,
+                        'updated_products_count': 0,
+                        'created_products_count': 1,
+                        'created_products': [{
+                            'uuid': str(course.uuid),
+                            'external_course_marketing_type':
+                                course.additional_metadata.external_course_marketing_type,
+                            'url_slug': course.active_url_slug,
+                            'rerun': True,
+                            'course_run_variant_id': str(course_run.variant_id),
+                            'restriction_type': None,
+                        }],
+                        'archived_products_count': 0,
+                        'archived_products': [],
+                        'errors': loader.error_logs
+                    }
 
     @responses.activate
     def test_invalid_language(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -609,47 +632,42 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [mock_data.INVALID_LANGUAGE])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
 
-                    self._assert_default_logs(log_capture)
+                self._assert_default_logs(log_capture)
 
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to True for the course CSV Course'
-                        )
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to True for the course CSV Course'
                     )
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'ERROR',
-                            '[COURSE_RUN_UPDATE_ERROR] Unable to update course run of the course CSV Course '
-                            'in the system. The update failed with the exception: '
-                            'Language gibberish-language from provided string gibberish-language'
-                            ' is either missing or an invalid ietf language'
-                        )
+                )
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'ERROR',
+                        '[COURSE_RUN_UPDATE_ERROR] Unable to update course run of the course CSV Course '
+                        'in the system. The update failed with the exception: '
+                        'Language gibberish-language from provided string gibberish-language'
+                        ' is either missing or an invalid ietf language'
                     )
+                )
 
-                    assert Course.everything.count() == 1
-                    assert CourseRun.everything.count() == 1
+                assert Course.everything.count() == 1
+                assert CourseRun.everything.count() == 1
 
-                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
+                course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
 
-                    assert course.image.read() == image_content
-                    assert course.organization_logo_override.read() == image_content
-                    self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
+                assert course.image.read() == image_content
+                assert course.organization_logo_override.read() == image_content
+                self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
 
     @responses.activate
     def test_ingest_flow_for_preexisting_unpublished_course(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -681,41 +699,36 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                 "taxi_form_id": ""
             }])
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
 
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
 
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course edx+csv_123 is located in the database.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to True for the course CSV Course'
-                        )
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course edx+csv_123 is located in the database.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to True for the course CSV Course'
                     )
+                )
 
-                    # Verify the existence of draft and non-draft
-                    assert Course.everything.count() == 2
-                    assert CourseRun.everything.count() == 2
-                    assert TaxiForm.objects.count() == 0
+                # Verify the existence of draft and non-draft
+                assert Course.everything.count() == 2
+                assert CourseRun.everything.count() == 2
+                assert TaxiForm.objects.count() == 0
 
-                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
-                    course_run = CourseRun.everything.get(course=course, draft=True)
+                course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
+                course_run = CourseRun.everything.get(course=course, draft=True)
 
-                    self._assert_course_data(course, {**self.BASE_EXPECTED_COURSE_DATA, 'taxi_form_is_none': True})
-                    self._assert_course_run_data(
-                        course_run,
-                        {**self.BASE_EXPECTED_COURSE_RUN_DATA, "fixed_price_usd": Decimal('111.11')}
-                    )
+                self._assert_course_data(course, {**self.BASE_EXPECTED_COURSE_DATA, 'taxi_form_is_none': True})
+                self._assert_course_run_data(
+                    course_run,
+                    {**self.BASE_EXPECTED_COURSE_RUN_DATA, "fixed_price_usd": Decimal('111.11')}
+                )
 
     @responses.activate
     def test_active_slug(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -736,50 +749,45 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                 ]
             )
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
 
-                    self._assert_default_logs(log_capture)
+                self._assert_default_logs(log_capture)
 
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to True for the course CSV Course'
-                        )
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to True for the course CSV Course'
                     )
+                )
 
-                    assert Course.everything.count() == 4
-                    assert CourseRun.everything.count() == 4
+                assert Course.everything.count() == 4
+                assert CourseRun.everything.count() == 4
 
-                    course1 = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
-                    course2 = Course.everything.get(key='testOrg+csv_123', partner=self.partner, draft=True)
+                course1 = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
+                course2 = Course.everything.get(key='testOrg+csv_123', partner=self.partner, draft=True)
 
-                    assert course1.active_url_slug == 'csv-course'
-                    assert course2.active_url_slug == 'csv-course-2'
+                assert course1.active_url_slug == 'csv-course'
+                assert course2.active_url_slug == 'csv-course-2'
 
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            '{}:CSV Course'.format(course1.uuid)
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            '{}:CSV Course'.format(course2.uuid)
-                        )
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        '{}:CSV Course'.format(course1.uuid)
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        '{}:CSV Course'.format(course2.uuid)
                     )
+                )
 
     @responses.activate
     def test_ingest_flow_for_minimal_course_data(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -796,45 +804,40 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             )
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
 
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to True for the course CSV Course'
-                        )
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to True for the course CSV Course'
                     )
+                )
 
-                    assert Course.everything.count() == 2
-                    assert CourseRun.everything.count() == 2
-
-                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
-                    course_run = CourseRun.everything.get(course=course, draft=True)
-
-                    # Asserting some required and optional values to verify the correctnesss
-                    assert course.title == 'CSV Course'
-                    assert course.short_description == '<p>Very short description</p>'
-                    assert course.full_description == (
-                        '<p>Organization,Title,Number,Course Enrollment track,Image,Short Description,Long Description,'
-                        'Organization,Title,Number,Course Enrollment track,Image,'
-                        'Short Description,Long Description,</p>'
-                    )
-                    assert course.syllabus_raw == '<p>Introduction to Algorithms</p>'
-                    assert course.subjects.first().slug == "computer-science"
-                    assert course_run.staff.exists() is False
+                assert Course.everything.count() == 2
+                assert CourseRun.everything.count() == 2
+
+                course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
+                course_run = CourseRun.everything.get(course=course, draft=True)
+
+                # Asserting some required and optional values to verify the correctnesss
+                assert course.title == 'CSV Course'
+                assert course.short_description == '<p>Very short description</p>'
+                assert course.full_description == (
+                    '<p>Organization,Title,Number,Course Enrollment track,Image,Short Description,Long Description,'
+                    'Organization,Title,Number,Course Enrollment track,Image,'
+                    'Short Description,Long Description,</p>'
+                )
+                assert course.syllabus_raw == '<p>Introduction to Algorithms</p>'
+                assert course.subjects.first().slug == "computer-science"
+                assert course_run.staff.exists() is False
 
     @data(True, False)
     @responses.activate
@@ -871,19 +874,14 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, csv_data, csv_key_order)
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
 
-                    self._assert_default_logs(log_capture)
-                    course = Course.objects.get(title='CSV Course')
-                    assert course.entitlements.count() == 1
-                    assert course.entitlements.first().price == 150
-                    assert course.short_description == '<p>ABC</p>'
+                self._assert_default_logs(log_capture)
+                course = Course.objects.get(title='CSV Course')
+                assert course.entitlements.count() == 1
+                assert course.entitlements.first().price == 150
+                assert course.short_description == '<p>ABC</p>'
 
     @responses.activate
     def test_ingest_product_metadata_flow_for_non_exec_ed(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -902,44 +900,39 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         with NamedTemporaryFile() as csv:
             csv = self._write_csv(csv, [csv_data], self.CSV_DATA_KEYS_ORDER)
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
 
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to True for the course CSV Course'
-                        )
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to True for the course CSV Course'
                     )
+                )
 
-                    assert Course.everything.count() == 2
-                    assert CourseRun.everything.count() == 2
+                assert Course.everything.count() == 2
+                assert CourseRun.everything.count() == 2
 
-                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
+                course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
 
-                    # Asserting some required and optional values to verify the correctness
-                    assert course.title == 'CSV Course'
-                    assert course.short_description == '<p>Very short description</p>'
-                    assert course.full_description == (
-                        '<p>Organization,Title,Number,Course Enrollment track,Image,Short Description,Long Description,'
-                        'Organization,Title,Number,Course Enrollment track,Image,'
-                        'Short Description,Long Description,</p>'
-                    )
-                    assert course.syllabus_raw == '<p>Introduction to Algorithms</p>'
-                    assert course.subjects.first().slug == "computer-science"
-                    assert course.additional_metadata.product_meta is None
+                # Asserting some required and optional values to verify the correctness
+                assert course.title == 'CSV Course'
+                assert course.short_description == '<p>Very short description</p>'
+                assert course.full_description == (
+                    '<p>Organization,Title,Number,Course Enrollment track,Image,Short Description,Long Description,'
+                    'Organization,Title,Number,Course Enrollment track,Image,'
+                    'Short Description,Long Description,</p>'
+                )
+                assert course.syllabus_raw == '<p>Introduction to Algorithms</p>'
+                assert course.subjects.first().slug == "computer-science"
+                assert course.additional_metadata.product_meta is None
 
     @data(
         (['certificate_header', 'certificate_text', 'stat1_text'],
@@ -0,0 +1,61 @@
+import datetime
+import email.utils
+
+import ddt
+from django.http import HttpResponse
+from django.test import TestCase
+
+from course_discovery.apps.course_metadata.data_loaders.rate_limiter import TokenBucketRateLimiter, get_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@ddt.ddt
+class TokenBucketRateLimiterTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+
+    def test_requests_never_exceed_limit(self):
+        """ Verify that no more than the allowed number of requests are made in any window. """
+        limiter = TokenBucketRateLimiter(40, 60, burst=5, clock=self.clock, sleep=self.clock.sleep)
+        timestamps = []
+        for __ in range(200):
+            limiter.acquire()
+            timestamps.append(self.clock.now)
+
+        assert timestamps[4] == 0
+        for index, timestamp in enumerate(timestamps):
+            in_window = [other for other in timestamps[index:] if other < timestamp + 60]
+            assert len(in_window) <= 40
+
+    def test_pause(self):
+        """ Verify that no request is made while the limiter is paused. """
+        limiter = TokenBucketRateLimiter(40, 60, burst=5, clock=self.clock, sleep=self.clock.sleep)
+        limiter.pause(30)
+        limiter.acquire()
+        assert self.clock.now >= 30
+
+    @ddt.data(
+        ({}, None),
+        ({'Retry-After': '120'}, 120),
+        ({'Retry-After': 'invalid'}, None),
+    )
+    @ddt.unpack
+    def test_get_retry_after(self, headers, expected):
+        response = HttpResponse(status=429, headers=headers)
+        assert get_retry_after(response) == expected
+
+    def test_get_retry_after_date(self):
+        retry_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=300)
+        response = HttpResponse(status=429, headers={'Retry-After': email.utils.format_datetime(retry_at)})
+        assert 250 < get_retry_after(response) <= 300
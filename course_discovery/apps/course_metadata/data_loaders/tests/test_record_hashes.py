@@ -0,0 +1,59 @@
+import datetime
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from course_discovery.apps.core.tests.factories import PartnerFactory
+from course_discovery.apps.course_metadata.data_loaders.record_hashes import RecordHashes
+from course_discovery.apps.course_metadata.models import DataLoaderRecordHash
+
+
+@override_settings(DATA_LOADER_FULL_RECONCILIATION_DAYS=7)
+class RecordHashesTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.partner = PartnerFactory()
+        self.body = {'id': 'course-v1:edX+DemoX+Demo', 'name': 'Demo'}
+
+    def load(self, incremental, bodies):
+        record_hashes = RecordHashes(self.partner, 'TestLoader', incremental=incremental)
+        skipped = []
+        for body in bodies:
+            if record_hashes.is_unchanged(body['id'], body):
+                skipped.append(body['id'])
+            else:
+                record_hashes.mark_applied(body['id'], body)
+        record_hashes.save()
+        return skipped
+
+    def test_incremental_run_skips_unchanged_records(self):
+        """ Verify that only records which changed since the last run are applied. """
+        other = {'id': 'course-v1:edX+Other+Run', 'name': 'Other'}
+        assert not self.load(True, [self.body, other])
+
+        changed = dict(other, name='Changed')
+        assert self.load(True, [self.body, changed]) == [self.body['id']]
+        assert self.load(True, [self.body, changed]) == [self.body['id'], other['id']]
+
+    def test_full_run_applies_all_records(self):
+        """ Verify that full runs apply every record and forget records which weren't applied. """
+        other = {'id': 'course-v1:edX+Other+Run', 'name': 'Other'}
+        self.load(False, [self.body, other])
+
+        assert not self.load(False, [self.body])
+        assert list(DataLoaderRecordHash.objects.values_list('record_key', flat=True)) == [self.body['id']]
+
+    def test_reconciliation(self):
+        """ Verify that records last applied before the reconciliation period are applied again. """
+        self.load(True, [self.body])
+        DataLoaderRecordHash.objects.update(modified=timezone.now() - datetime.timedelta(days=8))
+
+        assert not self.load(True, [self.body])
+        assert self.load(True, [self.body]) == [self.body['id']]
+
+    def test_partners_and_loaders_are_kept_apart(self):
+        """ Verify that hashes stored by another loader or for another partner are ignored. """
+        self.load(True, [self.body])
+        for partner, loader in ((PartnerFactory(), 'TestLoader'), (self.partner, 'OtherLoader')):
+            record_hashes = RecordHashes(partner, loader, incremental=True)
+            assert not record_hashes.is_unchanged(self.body['id'], self.body)
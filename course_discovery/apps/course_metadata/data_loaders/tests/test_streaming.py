@@ -0,0 +1,108 @@
+"""
+Unit tests for the streaming ingestion of the CSV data loaders.
+"""
+from tempfile import NamedTemporaryFile
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+
+from course_discovery.apps.api.v1.tests.test_views.mixins import APITestCase, OAuth2Mixin
+from course_discovery.apps.course_metadata.data_loaders.streaming import StreamingCSVDataLoader
+from course_discovery.apps.course_metadata.models import DataLoaderCheckpoint, DataLoaderRecordHash
+
+
+class RowsLoader(StreamingCSVDataLoader):
+    def __init__(self, partner, csv_path, incremental=False, failing_title=None, raising_title=None):
+        super().__init__(partner, incremental=incremental)
+        self.failing_title = failing_title
+        self.raising_title = raising_title
+        self.read_titles = []
+        self.ingested_titles = []
+        self.open_source(csv_path=csv_path)
+
+    def ingest(self):
+        self.ingest_rows()
+
+    def read_row(self, row):
+        self.read_titles.append(row['title'])
+
+    def ingest_row(self, row):
+        if row['title'] == self.raising_title:
+            raise ValueError(row['title'])
+        self.ingested_titles.append(row['title'])
+        return row['title'] != self.failing_title
+
+
+@override_settings(CSV_DATA_LOADER_CHUNK_SIZE=2, DATA_LOADER_FULL_RECONCILIATION_DAYS=7)
+@mock.patch(
+    'course_discovery.apps.course_metadata.data_loaders.configured_jwt_decode_handler',
+    return_value={'preferred_username': 'test_username'}
+)
+class StreamingCSVDataLoaderTests(OAuth2Mixin, APITestCase):
+    TITLES = ['a', 'b', 'c', 'd', 'e']
+
+    def setUp(self):
+        super().setUp()
+        self.mock_access_token()
+        self.csv = NamedTemporaryFile('w', suffix='.csv')  # pylint: disable=consider-using-with
+        self.addCleanup(self.csv.close)
+        self.write_csv(self.TITLES)
+
+    def write_csv(self, titles):
+        self.csv.seek(0)
+        self.csv.truncate()
+        self.csv.write('title,value\n' + ''.join(f'{title},{title.upper()}\n' for title in titles))
+        self.csv.flush()
+
+    def ingest(self, **kwargs):
+        loader = RowsLoader(self.partner, self.csv.name, **kwargs)
+        loader.ingest()
+        return loader
+
+    def test_ingest(self, _jwt_decode_patch):
+        loader = self.ingest(failing_title='b')
+
+        assert loader.read_titles == self.TITLES
+        assert loader.ingested_titles == self.TITLES
+        assert loader.rows_count == 5
+        assert not DataLoaderCheckpoint.objects.exists()
+        # Only the hashes of the rows which were ingested successfully are stored
+        assert DataLoaderRecordHash.objects.filter(partner=self.partner, loader='RowsLoader').count() == 4
+
+    def test_interrupted_run_is_resumed(self, _jwt_decode_patch):
+        """ Verify that a run resumes after the chunks committed by an interrupted run. """
+        with pytest.raises(ValueError):
+            self.ingest(raising_title='d')
+
+        checkpoint = DataLoaderCheckpoint.objects.get(partner=self.partner, loader='RowsLoader')
+        assert checkpoint.row_offset == 2
+        # The rows of the chunk which failed were rolled back
+        assert DataLoaderRecordHash.objects.count() == 2
+
+        loader = self.ingest()
+        assert loader.read_titles == self.TITLES
+        assert loader.ingested_titles == ['c', 'd', 'e']
+        assert not DataLoaderCheckpoint.objects.exists()
+
+    def test_changed_source_is_ingested_again(self, _jwt_decode_patch):
+        """ Verify that all the rows are ingested if the source changed since the interrupted run. """
+        DataLoaderCheckpoint.objects.create(partner=self.partner, loader='RowsLoader', row_offset=2, row_hash='0' * 32)
+
+        assert self.ingest().ingested_titles == self.TITLES
+        assert not DataLoaderCheckpoint.objects.exists()
+
+        # The source also changed if it has fewer rows than the checkpoint
+        DataLoaderCheckpoint.objects.create(partner=self.partner, loader='RowsLoader', row_offset=6)
+        assert self.ingest().ingested_titles == self.TITLES
+
+    def test_incremental_run_skips_unchanged_rows(self, _jwt_decode_patch):
+        """ Verify that incremental runs skip the rows which were ingested successfully by a previous run. """
+        self.ingest(failing_title='b')
+        self.write_csv(['a', 'b', 'f', 'd', 'e'])
+
+        loader = self.ingest(incremental=True)
+        assert loader.read_titles == ['a', 'b', 'f', 'd', 'e']
+        assert loader.ingested_titles == ['b', 'f']
+
+        assert self.ingest().ingested_titles == ['a', 'b', 'f', 'd', 'e']
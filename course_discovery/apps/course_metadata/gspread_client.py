@@ -3,6 +3,7 @@ from string import ascii_uppercase
 
 import gspread
 from django.conf import settings
+from gspread.utils import numericise_all
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +13,9 @@ class GspreadClient:
     API Client for GSpread to communicate with google spread sheets and drive images
     """
 
+    # Number of rows fetched at once by iter_data
+    READ_PAGE_SIZE = 500
+
     def __init__(self):
         try:
             self.client = gspread.service_account_from_dict(settings.GOOGLE_SERVICE_ACCOUNT_CREDENTIALS)
@@ -38,6 +42,29 @@ class GspreadClient:
             logger.exception('[Spread Sheet Read Error]: Exception occurred while reading sheet data')
         return None
 
+    def iter_data(self, config):
+        """
+        Return an iterator over the records of the input tab of a sheet, like the ones returned by read_data,
+        which fetches the rows of the tab page by page rather than all at once.
+        """
+        spread_sheet = self.get_spread_sheet_by_key(config['SHEET_ID'])
+        worksheet = self.get_worksheet_by_tab_id(spread_sheet, config['INPUT_TAB_ID']) if spread_sheet else None
+        if not worksheet:
+            raise ValueError(f'Unable to read the input tab {config["INPUT_TAB_ID"]} of sheet {config["SHEET_ID"]}')
+
+        headers = worksheet.row_values(1)
+
+        def records():
+            for start in range(2, worksheet.row_count + 1, self.READ_PAGE_SIZE):
+                rows = worksheet.get(f'{start}:{start + self.READ_PAGE_SIZE - 1}', pad_values=True)
+                if not rows:
+                    return
+                for row in rows:
+                    row = row + [''] * (len(headers) - len(row))
+                    yield dict(zip(headers, numericise_all(row)))
+
+        return records()
+
     def _get_or_create_worksheet(self, spread_sheet, tab_id, cols, rows):
         """
         Get or create a worksheet with the given tab_id in the given spread_sheet
@@ -131,14 +158,20 @@ class GspreadClient:
             logger.exception(f"[Spread Sheet Write Error]: Exception occurred while writing sheet data: {e}")
 
     @staticmethod
-    def get_worksheet_data_by_tab_id(spread_sheet, tab_id):
+    def get_worksheet_by_tab_id(spread_sheet, tab_id):
+        tab_id = int(tab_id)
+        worksheet_title = [ws.title for ws in spread_sheet.worksheets() if ws.id == tab_id]
+        if not worksheet_title:
+            logger.error(f'[Worksheet Not Found]: No worksheet found with id: {tab_id}')
+            return None
+        return spread_sheet.worksheet(worksheet_title[0])
+
+    @classmethod
+    def get_worksheet_data_by_tab_id(cls, spread_sheet, tab_id):
         try:
-            tab_id = int(tab_id)
-            worksheet_title = [ws.title for ws in spread_sheet.worksheets() if ws.id == tab_id]
-            if not worksheet_title:
-                logger.error(f'[Worksheet Not Found]: No worksheet found with id: {tab_id}')
+            ws = cls.get_worksheet_by_tab_id(spread_sheet, tab_id)
+            if not ws:
                 return None
-            ws = spread_sheet.worksheet(worksheet_title[0])
             logger.info('[Worksheet Found]: Getting data for worksheet tab')
             return ws.get_all_records()
         except Exception as ex:  # pylint: disable=broad-except
@@ -1,4 +1,5 @@
 from algoliasearch_django import AlgoliaIndex, register
+from taxonomy.choices import ProductTypes
 
 from course_discovery.apps.course_metadata.algolia_models import (
     AlgoliaProxyCourse, AlgoliaProxyProduct, AlgoliaProxyProgram, SearchDefaultResultsConfiguration
@@ -6,6 +7,7 @@ from course_discovery.apps.course_metadata.algolia_models import (
 from course_discovery.apps.course_metadata.contentful_utils import (
     fetch_and_transform_bootcamp_contentful_data, fetch_and_transform_degree_contentful_data
 )
+from course_discovery.apps.course_metadata.utils import preload_product_skills, product_skills_scope
 
 
 class BaseProductIndex(AlgoliaIndex):
@@ -21,13 +23,19 @@ class BaseProductIndex(AlgoliaIndex):
                 'Cannot update Algolia index \'{index_name}\'. No language set'.format(index_name=self.index_name)
             )
 
+        courses = list(AlgoliaProxyCourse.prefetch_queryset())
+        programs = list(AlgoliaProxyProgram.prefetch_queryset())
+        # Only kept while the products are serialized by reindex_all
+        preload_product_skills([course.key for course in courses], ProductTypes.Course)
+        preload_product_skills([program.uuid for program in programs], ProductTypes.Program)
+
         bootcamp_contentful_data = fetch_and_transform_bootcamp_contentful_data()
         qs1 = [AlgoliaProxyProduct(course, self.language, contentful_data=bootcamp_contentful_data)
-               for course in AlgoliaProxyCourse.prefetch_queryset()]
+               for course in courses]
 
         degree_contentful_data = fetch_and_transform_degree_contentful_data()
         qs2 = [AlgoliaProxyProduct(program, self.language, contentful_data=degree_contentful_data)
-               for program in AlgoliaProxyProgram.prefetch_queryset()]
+               for program in programs]
 
         return qs1 + qs2
 
@@ -67,7 +75,9 @@ class BaseProductIndex(AlgoliaIndex):
             if rule['objectID'] not in rules_to_create_ids
         ]
         final_rules = rules_to_create + existing_rules_to_keep
-        super().reindex_all(batch_size)
+        # Serializing the products reads their skills, load them all at once
+        with product_skills_scope():
+            super().reindex_all(batch_size)
         self._AlgoliaIndex__index.replace_all_rules(final_rules)
 
 
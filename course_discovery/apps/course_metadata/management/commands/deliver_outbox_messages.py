@@ -0,0 +1,29 @@
+import logging
+
+from django.core.management import BaseCommand
+
+from course_discovery.apps.course_metadata.models import OutboxMessage
+from course_discovery.apps.course_metadata.outbox import deliver_messages
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        'Delivers the due outbox messages, e.g. marketing site and Salesforce updates. Meant to be run periodically, '
+        'to deliver messages whose Celery tasks were lost, e.g. failed deliveries due for a retry after a restart.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target',
+            action='append',
+            choices=[target for target, __ in OutboxMessage.TARGET_CHOICES],
+            help='Only deliver the messages of this target. May be repeated.',
+        )
+
+    def handle(self, *args, **options):
+        targets = options['target'] or [target for target, __ in OutboxMessage.TARGET_CHOICES]
+        for target in targets:
+            logger.info('Delivering the due outbox messages of [%s].', target)
+            deliver_messages(target)
@@ -42,6 +42,12 @@ class Command(BaseCommand):
             help='Path to the CSV file',
             type=str,
         )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Skip the rows which have not changed since they were last ingested. Rows are ingested again '
+                 'regardless once their last ingestion is older than DATA_LOADER_FULL_RECONCILIATION_DAYS.'
+        )
         parser.add_argument(
             '--product_type',
             help='Product Type to ingest',
@@ -72,6 +78,7 @@ class Command(BaseCommand):
         product_type = options.get('product_type', None)
         product_source = options.get('product_source', None)
         use_gspread_client = options.get('use_gspread_client', None)
+        incremental = options.get('incremental', False)
 
         try:
             partner = Partner.objects.get(short_code=partner_short_code)
@@ -102,7 +109,8 @@ class Command(BaseCommand):
                 csv_file=csv_file,
                 use_gspread_client=use_gspread_client,
                 product_type=self.PRODUCT_TYPE_SLUG_MAP[product_type],
-                product_source=source.slug
+                product_source=source.slug,
+                incremental=incremental,
             )
             if csv_path:
                 with open(csv_path, mode='r', encoding='utf-8') as csv_file:
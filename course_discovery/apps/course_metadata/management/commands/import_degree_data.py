@@ -35,6 +35,12 @@ class Command(BaseCommand):
             help='Path to the CSV file',
             type=str,
         )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Skip the rows which have not changed since they were last ingested. Rows are ingested again '
+                 'regardless once their last ingestion is older than DATA_LOADER_FULL_RECONCILIATION_DAYS.'
+        )
         parser.add_argument(
             '--product_type',
             help='Product Type to ingest',
@@ -65,6 +71,7 @@ class Command(BaseCommand):
         product_type = options.get('product_type', None)
         args_from_env = options.get('args_from_env', None)
         product_source = options.get('product_source', None)
+        incremental = options.get('incremental', False)
 
         try:
             partner = Partner.objects.get(short_code=partner_short_code)
@@ -90,7 +97,8 @@ class Command(BaseCommand):
         try:
             loader = DegreeCSVDataLoader(
                 partner, csv_path=csv_path, csv_file=csv_file,
-                args_from_env=args_from_env, product_type=product_type, product_source=source.slug
+                args_from_env=args_from_env, product_type=product_type, product_source=source.slug,
+                incremental=incremental,
             )
             logger.info("Starting CSV loader import flow for partner {}".format(partner_short_code))  # lint-amnesty, pylint: disable=logging-format-interpolation
             ingestion_time = datetime.now()
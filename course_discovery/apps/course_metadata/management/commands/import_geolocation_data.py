@@ -28,6 +28,12 @@ class Command(BaseCommand):
             help='Path to the CSV file',
             type=str,
         )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Skip the rows which have not changed since they were last ingested. Rows are ingested again '
+                 'regardless once their last ingestion is older than DATA_LOADER_FULL_RECONCILIATION_DAYS.'
+        )
 
     def handle(self, *args, **options):
         """
@@ -37,6 +43,7 @@ class Command(BaseCommand):
         geolocation_loader_config = GeolocationDataLoaderConfiguration.current()
         csv_path = options.get('csv_path', None)
         csv_file = geolocation_loader_config.csv_file if geolocation_loader_config.is_enabled() else None
+        incremental = options.get('incremental', False)
 
         try:
             partner = Partner.objects.get(short_code=partner_short_code)
@@ -46,7 +53,9 @@ class Command(BaseCommand):
             )
 
         try:
-            loader = GeolocationCSVDataLoader(partner, csv_path=csv_path, csv_file=csv_file)
+            loader = GeolocationCSVDataLoader(
+                partner, csv_path=csv_path, csv_file=csv_file, incremental=incremental
+            )
             logger.info("Starting CSV loader import")
             loader.ingest()
         except Exception as exc:
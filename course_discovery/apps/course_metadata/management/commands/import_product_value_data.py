@@ -22,6 +22,12 @@ class Command(BaseCommand):
             help='Path to the CSV file',
             type=str,
         )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Skip the rows which have not changed since they were last ingested. Rows are ingested again '
+                 'regardless once their last ingestion is older than DATA_LOADER_FULL_RECONCILIATION_DAYS.'
+        )
 
     def handle(self, *args, **options):
         """
@@ -30,6 +36,7 @@ class Command(BaseCommand):
         product_value_loader_config = ProductValueDataLoaderConfiguration.current()
         csv_path = options.get('csv_path', None)
         csv_file = product_value_loader_config.csv_file if product_value_loader_config.is_enabled() else None
+        incremental = options.get('incremental', False)
 
         try:
             partner = Partner.objects.get(short_code='edx')
@@ -39,7 +46,9 @@ class Command(BaseCommand):
             )
 
         try:
-            loader = ProductValueCSVDataLoader(partner, csv_path=csv_path, csv_file=csv_file)
+            loader = ProductValueCSVDataLoader(
+                partner, csv_path=csv_path, csv_file=csv_file, incremental=incremental
+            )
             logger.info("Starting Product Value CSV loader import")
             loader.ingest()
         except Exception as exc:
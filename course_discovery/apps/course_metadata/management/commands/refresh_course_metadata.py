@@ -10,6 +10,7 @@ from django.db import connection
 from django.db.models.signals import post_delete, post_save
 
 from course_discovery.apps.api.cache import api_change_receiver, set_api_timestamp
+from course_discovery.apps.api.tasks import warm_api_cache_task
 from course_discovery.apps.core.models import Partner
 from course_discovery.apps.core.utils import delete_orphans
 from course_discovery.apps.course_metadata.data_loaders.analytics_api import AnalyticsAPIDataLoader
@@ -22,7 +23,7 @@ from course_discovery.apps.course_metadata.signals import connect_api_change_rec
 logger = logging.getLogger(__name__)
 
 
-def execute_loader(loader_class, *loader_args):
+def execute_loader(loader_class, *loader_args, **loader_kwargs):
     @backoff.on_exception(
         backoff.expo,
         Exception,
@@ -31,7 +32,7 @@ def execute_loader(loader_class, *loader_args):
         base=60,
     )
     def run_loader():
-        return loader_class(*loader_args).ingest()
+        return loader_class(*loader_args, **loader_kwargs).ingest()
 
     try:
         run_loader()
@@ -41,7 +42,7 @@ def execute_loader(loader_class, *loader_args):
         return False
 
 
-def execute_parallel_loader(loader_class, *loader_args):
+def execute_parallel_loader(loader_class, *loader_args, **loader_kwargs):
     """
     ProcessPoolExecutor uses the multiprocessing module. Multiprocessing forks processes,
     causing connection objects to be copied across processes. The key goal when running
@@ -57,7 +58,7 @@ def execute_parallel_loader(loader_class, *loader_args):
     """
     connection.close()
 
-    return execute_loader(loader_class, *loader_args)
+    return execute_loader(loader_class, *loader_args, **loader_kwargs)
 
 
 class Command(BaseCommand):
@@ -75,11 +76,20 @@ class Command(BaseCommand):
             help='The stage of pipeline to be run. If this argument is not provided it runs all pipeline stages.'
         )
 
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Skip upstream records which have not changed since they were last loaded. Records are loaded '
+                 'again regardless once their last load is older than DATA_LOADER_FULL_RECONCILIATION_DAYS, and '
+                 'runs without this argument reconcile all records.'
+        )
+
     def handle(self, *args, **options):
         # For each partner defined...
         partners = Partner.objects.all()
 
         data_loader_stage = options.get('data_loader_stage')
+        incremental = options.get('incremental', False)
         # If a specific partner was indicated, filter down the set
         partner_code = options.get('partner_code')
         if partner_code:
@@ -140,7 +150,7 @@ class Command(BaseCommand):
                     (CoursesApiDataLoader, partner.courses_api_url, 1),
                 ),
                 (
-                    (EcommerceApiDataLoader, partner.ecommerce_api_url, 1),
+                    (EcommerceApiDataLoader, partner.ecommerce_api_url, max_workers),
                     (ProgramsApiDataLoader, partner.programs_api_url, max_workers),
                 ),
                 (
@@ -168,6 +178,7 @@ class Command(BaseCommand):
                                     api_url,
                                     max_workers,
                                     is_threadsafe,
+                                    incremental=incremental,
                                 ))
 
                 success = success and all(f.result() for f in futures)
@@ -182,6 +193,7 @@ class Command(BaseCommand):
                             api_url,
                             max_workers,
                             is_threadsafe,
+                            incremental=incremental,
                         ) and success
 
             # TODO Cleanup CourseRun overrides equivalent to the Course values.
@@ -193,6 +205,7 @@ class Command(BaseCommand):
         delete_orphans(Video)
 
         set_api_timestamp()
+        warm_api_cache_task.delay(partner_code=options.get('partner_code'))
 
         # Re-connect back the api_change_receiver receiver to post_save and post_delete signals
         connect_api_change_receiver()
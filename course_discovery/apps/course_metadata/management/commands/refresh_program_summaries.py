@@ -0,0 +1,29 @@
+import logging
+
+from django.core.management import BaseCommand
+
+from course_discovery.apps.course_metadata.models import Program, ProgramSummary
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        'Recomputes the summaries of all programs. Meant to be run once after enabling program summaries, then '
+        'periodically, to refresh aggregates which depend on the current time, e.g. archived course run statuses.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Number of programs whose summaries are computed at once.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        program_ids = list(Program.objects.order_by('pk').values_list('pk', flat=True))
+        for start in range(0, len(program_ids), batch_size):
+            ProgramSummary.refresh(program_ids[start:start + batch_size])
+        logger.info('Refreshed the summaries of %d programs.', len(program_ids))
@@ -11,8 +11,6 @@ from slugify import slugify
 from testfixtures import LogCapture
 
 from course_discovery.apps.api.v1.tests.test_views.mixins import APITestCase, OAuth2Mixin
-from course_discovery.apps.core.tests.factories import USER_PASSWORD, UserFactory
-from course_discovery.apps.course_metadata.data_loaders.csv_loader import CSVDataLoader
 from course_discovery.apps.course_metadata.data_loaders.tests import mock_data
 from course_discovery.apps.course_metadata.data_loaders.tests.mixins import CSVLoaderMixin
 from course_discovery.apps.course_metadata.models import Course, CourseRun
@@ -35,8 +33,6 @@ class TestImportCourseMetadata(CSVLoaderMixin, OAuth2Mixin, APITestCase):
     def setUp(self) -> None:
         super().setUp()
         self.mock_access_token()
-        self.user = UserFactory.create(username="test_user", password=USER_PASSWORD, is_staff=True)
-        self.client.login(username=self.user.username, password=USER_PASSWORD)
         csv_file_content = ','.join(list(mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT)) + '\n'
         csv_file_content += ','.join(f'"{key}"' for key in list(
             mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT.values()))
@@ -46,25 +42,6 @@ class TestImportCourseMetadata(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             content_type='text/csv'
         )
 
-    def mock_call_course_api(self, method, url, data):
-        """
-        Helper method to make api calls using test client.
-        """
-        response = None
-        if method == 'POST':
-            response = self.client.post(
-                url,
-                data=data,
-                format='json'
-            )
-        elif method == 'PATCH':
-            response = self.client.patch(
-                url,
-                data=data,
-                format='json'
-            )
-        return response
-
     def test_no_csv_file(self, jwt_decode_patch):  # pylint: disable=unused-argument
         """
         Test that the command raises ValueError if no csv file is provided.
@@ -136,40 +113,35 @@ class TestImportCourseMetadata(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         with override_waffle_switch(IS_SUBDIRECTORY_SLUG_FORMAT_ENABLED, active=True):
             with override_waffle_switch(IS_SUBDIRECTORY_SLUG_FORMAT_FOR_EXEC_ED_ENABLED, active=True):
                 with LogCapture(LOGGER_PATH) as log_capture:
-                    with mock.patch.object(
-                            CSVDataLoader,
-                            '_call_course_api',
-                            self.mock_call_course_api
-                    ):
-                        call_command(
-                            'import_course_metadata',
-                            '--partner_code', self.partner.short_code,
-                            '--product_type', 'EXECUTIVE_EDUCATION',
-                            '--product_source', self.source.slug,
-                        )
-                        log_capture.check_present(
-                            (
-                                LOGGER_PATH,
-                                'INFO',
-                                'Starting CSV loader import flow for partner {}'.format(self.partner.short_code)
-                            )
-                        )
-                        log_capture.check_present(
-                            (LOGGER_PATH, 'INFO', 'CSV loader import flow completed.')
+                    call_command(
+                        'import_course_metadata',
+                        '--partner_code', self.partner.short_code,
+                        '--product_type', 'EXECUTIVE_EDUCATION',
+                        '--product_source', self.source.slug,
+                    )
+                    log_capture.check_present(
+                        (
+                            LOGGER_PATH,
+                            'INFO',
+                            'Starting CSV loader import flow for partner {}'.format(self.partner.short_code)
                         )
+                    )
+                    log_capture.check_present(
+                        (LOGGER_PATH, 'INFO', 'CSV loader import flow completed.')
+                    )
 
-                        assert Course.everything.count() == 2
-                        assert CourseRun.everything.count() == 2
+                    assert Course.everything.count() == 2
+                    assert CourseRun.everything.count() == 2
 
-                        course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
-                        course_run = CourseRun.everything.get(course=course, draft=True)
-                        slug_path = f'{slugify(course.authoring_organizations.first().name)}-{slugify(course.title)}'
+                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner, draft=True)
+                    course_run = CourseRun.everything.get(course=course, draft=True)
+                    slug_path = f'{slugify(course.authoring_organizations.first().name)}-{slugify(course.title)}'
 
-                        assert course.image.read() == image_content
-                        assert course.active_url_slug == f'executive-education/{slug_path}'
-                        self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
-                        self._assert_course_run_data(course_run, self.BASE_EXPECTED_COURSE_RUN_DATA)
-                        email_patch.assert_called_once()
+                    assert course.image.read() == image_content
+                    assert course.active_url_slug == f'executive-education/{slug_path}'
+                    self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
+                    self._assert_course_run_data(course_run, self.BASE_EXPECTED_COURSE_RUN_DATA)
+                    email_patch.assert_called_once()
 
     @responses.activate
     @mock.patch('course_discovery.apps.course_metadata.management.commands.import_course_metadata.send_ingestion_email')
@@ -187,27 +159,22 @@ class TestImportCourseMetadata(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         with override_waffle_switch(IS_SUBDIRECTORY_SLUG_FORMAT_ENABLED, active=True):
             with override_waffle_switch(IS_SUBDIRECTORY_SLUG_FORMAT_FOR_EXEC_ED_ENABLED, active=False):
                 with LogCapture(LOGGER_PATH) as log_capture:
-                    with mock.patch.object(
-                            CSVDataLoader,
-                            '_call_course_api',
-                            self.mock_call_course_api
-                    ):
-                        call_command(
-                            'import_course_metadata',
-                            '--partner_code', self.partner.short_code,
-                            '--product_type', 'EXECUTIVE_EDUCATION',
-                            '--product_source', self.source.slug,
-                        )
-                        log_capture.check_present(
-                            (
-                                LOGGER_PATH,
-                                'INFO',
-                                'Starting CSV loader import flow for partner {}'.format(self.partner.short_code)
-                            )
-                        )
-                        log_capture.check_present(
-                            (LOGGER_PATH, 'INFO', 'CSV loader import flow completed.')
+                    call_command(
+                        'import_course_metadata',
+                        '--partner_code', self.partner.short_code,
+                        '--product_type', 'EXECUTIVE_EDUCATION',
+                        '--product_source', self.source.slug,
+                    )
+                    log_capture.check_present(
+                        (
+                            LOGGER_PATH,
+                            'INFO',
+                            'Starting CSV loader import flow for partner {}'.format(self.partner.short_code)
                         )
+                    )
+                    log_capture.check_present(
+                        (LOGGER_PATH, 'INFO', 'CSV loader import flow completed.')
+                    )
 
-                        course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
-                        assert course.active_url_slug == slugify(course.title)
+                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
+                    assert course.active_url_slug == slugify(course.title)
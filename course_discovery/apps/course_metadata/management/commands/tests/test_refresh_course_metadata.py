@@ -31,7 +31,7 @@ class RefreshCourseMetadataCommandTests(OAuth2Mixin, TransactionTestCase):
         partner = self.partner
         self.pipeline = [
             (CoursesApiDataLoader, partner.courses_api_url, 1),
-            (EcommerceApiDataLoader, partner.ecommerce_api_url, 1),
+            (EcommerceApiDataLoader, partner.ecommerce_api_url, None),
             (ProgramsApiDataLoader, partner.programs_api_url, None),
             (AnalyticsAPIDataLoader, partner.analytics_url, 1),
         ]
@@ -115,7 +115,7 @@ class RefreshCourseMetadataCommandTests(OAuth2Mixin, TransactionTestCase):
             call_command('refresh_course_metadata')
 
             # Set up expected calls
-            expected_calls = [mock.call(loader_class, self.partner, api_url, max_workers or 7, False)
+            expected_calls = [mock.call(loader_class, self.partner, api_url, max_workers or 7, False, incremental=False)
                               for loader_class, api_url, max_workers in self.pipeline]
             mock_executor.assert_has_calls(expected_calls)
 
@@ -136,7 +136,7 @@ class RefreshCourseMetadataCommandTests(OAuth2Mixin, TransactionTestCase):
 
             # Set up expected calls
             expected_calls = [mock.call(execute_parallel_loader, loader_class,
-                                        self.partner, api_url, max_workers or 7, True)
+                                        self.partner, api_url, max_workers or 7, True, incremental=False)
                               for loader_class, api_url, max_workers in self.pipeline]
             mock_executor.assert_has_calls(expected_calls, any_order=True)
 
@@ -183,7 +183,21 @@ class RefreshCourseMetadataCommandTests(OAuth2Mixin, TransactionTestCase):
             call_command('refresh_course_metadata', *command_args)
 
             stage_1 = self.pipeline[0]
-            mock_executor.assert_has_calls([mock.call(stage_1[0], self.partner, stage_1[1], 1, False)])
+            mock_executor.assert_has_calls(
+                [mock.call(stage_1[0], self.partner, stage_1[1], 1, False, incremental=False)]
+            )
+
+    def test_refresh_course_metadata_incremental(self):
+        """ Verify that incremental runs are passed on to the data loaders. """
+        self.mock_apis()
+
+        with mock.patch('course_discovery.apps.course_metadata.management.commands.'
+                        'refresh_course_metadata.execute_loader', return_value=True) as mock_executor:
+            call_command('refresh_course_metadata', '--incremental')
+
+            expected_calls = [mock.call(loader_class, self.partner, api_url, max_workers or 7, False, incremental=True)
+                              for loader_class, api_url, max_workers in self.pipeline]
+            mock_executor.assert_has_calls(expected_calls)
 
     @mock.patch('course_discovery.apps.course_metadata.management.commands.refresh_course_metadata.delete_orphans')
     def test_deletes_orphans(self, mock_delete_orphans):
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.13 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_metadata', '0346_dataloaderrecordhash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalprogram',
+            name='banner_image_etag',
+            field=models.CharField(blank=True, default='', help_text='ETag, or content hash, of the banner image last downloaded from the banner image url.', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='program',
+            name='banner_image_etag',
+            field=models.CharField(blank=True, default='', help_text='ETag, or content hash, of the banner image last downloaded from the banner image url.', max_length=255),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.13 on 2026-10-18 14:05
+
+from django.db import migrations, models
+import django.utils.timezone
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_metadata', '0347_program_banner_image_etag'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('target', models.CharField(choices=[('marketing_site', 'Marketing site'), ('salesforce', 'Salesforce'), ('ecommerce', 'Ecommerce')], max_length=32)),
+                ('action', models.CharField(max_length=64)),
+                ('object_id', models.PositiveIntegerField()),
+                ('payload', models.JSONField(default=dict)),
+                ('version', models.PositiveIntegerField(default=1, help_text='Incremented every time the action is queued again before being delivered.')),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('available_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, help_text='When the message may next be delivered. Empty once delivery has been given up on.', null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+            ],
+            options={
+                'unique_together': {('action', 'object_id')},
+            },
+        ),
+    ]
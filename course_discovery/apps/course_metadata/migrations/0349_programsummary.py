@@ -0,0 +1,37 @@
+# Generated by Django 4.2.13 on 2026-10-18 16:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_metadata', '0348_outboxmessage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgramSummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('includes_restricted_runs', models.BooleanField()),
+                ('course_run_statuses', models.JSONField(default=list)),
+                ('language_codes', models.JSONField(default=list)),
+                ('seat_type_slugs', models.JSONField(default=list)),
+                ('subject_uuids', models.JSONField(default=list)),
+                ('staff_uuids', models.JSONField(default=list)),
+                ('serialized_price_ranges', models.JSONField(default=list)),
+                ('start', models.DateTimeField(null=True)),
+                ('weeks_to_complete_min', models.PositiveSmallIntegerField(null=True)),
+                ('weeks_to_complete_max', models.PositiveSmallIntegerField(null=True)),
+                ('program', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='summaries', to='course_metadata.program')),
+            ],
+            options={
+                'unique_together': {('program', 'includes_restricted_runs')},
+            },
+        ),
+    ]
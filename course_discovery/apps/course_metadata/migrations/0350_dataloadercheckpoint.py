@@ -0,0 +1,31 @@
+# Generated by Django 4.2.13 on 2026-10-18 18:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_alter_historicalpartner_options_and_more'),
+        ('course_metadata', '0349_programsummary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataLoaderCheckpoint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('loader', models.CharField(max_length=64)),
+                ('row_offset', models.PositiveIntegerField(default=0)),
+                ('row_hash', models.CharField(blank=True, max_length=32)),
+                ('partner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.partner')),
+            ],
+            options={
+                'unique_together': {('partner', 'loader')},
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.13 on 2026-10-18 20:30
+
+from django.db import migrations, models
+
+
+def delete_program_summaries(apps, schema_editor):
+    """
+    Delete the summaries computed without the new fields. Programs fall back to computing their aggregates until
+    the refresh_program_summaries command computes them again.
+    """
+    ProgramSummary = apps.get_model('course_metadata', 'ProgramSummary')
+    ProgramSummary.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_metadata', '0350_dataloadercheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='programsummary',
+            name='language_search_facets',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='programsummary',
+            name='subject_names',
+            field=models.JSONField(default=list),
+        ),
+        migrations.RunPython(delete_program_summaries, migrations.RunPython.noop),
+    ]
@@ -3,6 +3,7 @@ import itertools
 import logging
 import re
 from collections import Counter, defaultdict
+from decimal import Decimal
 from urllib.parse import urljoin
 from uuid import uuid4
 
@@ -17,6 +18,7 @@ from django.core.validators import FileExtensionValidator, MaxValueValidator, Mi
 from django.db import IntegrityError, models, transaction
 from django.db.models import F, Q, UniqueConstraint
 from django.db.models.query import Prefetch
+from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django_countries import countries as COUNTRIES
@@ -55,14 +57,15 @@ from course_discovery.apps.course_metadata.publishers import (
 )
 from course_discovery.apps.course_metadata.query import CourseQuerySet, CourseRunQuerySet, ProgramQuerySet
 from course_discovery.apps.course_metadata.toggles import (
-    IS_SUBDIRECTORY_SLUG_FORMAT_ENABLED, IS_SUBDIRECTORY_SLUG_FORMAT_FOR_BOOTCAMP_ENABLED,
-    IS_SUBDIRECTORY_SLUG_FORMAT_FOR_EXEC_ED_ENABLED
+    IS_PROGRAM_SUMMARY_ENABLED, IS_SIDE_EFFECT_OUTBOX_ENABLED, IS_SUBDIRECTORY_SLUG_FORMAT_ENABLED,
+    IS_SUBDIRECTORY_SLUG_FORMAT_FOR_BOOTCAMP_ENABLED, IS_SUBDIRECTORY_SLUG_FORMAT_FOR_EXEC_ED_ENABLED
 )
 from course_discovery.apps.course_metadata.utils import (
-    UploadToFieldNamePath, clean_query, clear_slug_request_cache_for_course, custom_render_variations,
-    get_course_run_statuses, get_slug_for_course, is_ocm_course, push_to_ecommerce_for_course_run,
-    push_tracks_to_lms_for_course_run, set_official_state, subtract_deadline_delta
+    UploadToFieldNamePath, call_external_service, clean_query, clear_slug_request_cache_for_course,
+    custom_render_variations, get_course_run_statuses, get_slug_for_course, is_ocm_course,
+    push_to_ecommerce_for_course_run, push_tracks_to_lms_for_course_run, set_official_state, subtract_deadline_delta
 )
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.search import iterate_pks
 from course_discovery.apps.ietf_language_tags.models import LanguageTag
 from course_discovery.apps.ietf_language_tags.utils import serialize_language
 from course_discovery.apps.publisher.utils import VALID_CHARS_IN_COURSE_NUM_AND_ORG_KEY
@@ -1138,15 +1141,12 @@ class PkSearchableMixin:
         es_document, *_ = registry.get_documents(models=(cls,))
         dsl_query = ESDSLQ('query_string', query=query, analyze_wildcard=True)
         try:
-            results = es_document.search().query(dsl_query).execute()
+            ids = set(iterate_pks(es_document, dsl_query))
         except RequestError as exp:
             logger.warning('Elasticsearch request is failed. Got exception: %r', exp)
-            results = []
-        ids = {result.pk for result in results}
+            ids = set()
         logger.info(f'{len(ids)} records extracted from Elasticsearch query "{query}"')
-        filtered_queryset = queryset.filter(pk__in=ids)
-        logger.info(f'Filtered queryset of length {len(filtered_queryset)} extracted against query "{query}"')
-        return filtered_queryset
+        return queryset.filter(pk__in=ids)
 
 
 class Collaborator(TimeStampedModel):
@@ -2768,8 +2768,8 @@ class CourseRun(ManageHistoryMixin, DraftModelMixin, CachedMixin, TimeStampedMod
 
         if notify_services:
             # Push any track changes to ecommerce and the LMS as well
-            push_to_ecommerce_for_course_run(official_version)
-            push_tracks_to_lms_for_course_run(official_version)
+            call_external_service(push_to_ecommerce_for_course_run, official_version)
+            call_external_service(push_tracks_to_lms_for_course_run, official_version)
         return official_version
 
     def handle_status_change(self, send_emails):
@@ -2825,11 +2825,19 @@ class CourseRun(ManageHistoryMixin, DraftModelMixin, CachedMixin, TimeStampedMod
             return False
         return True
 
-    # there have to be two saves because in order to check for if this is included in the
-    # subscription catalog, we need the id that is created on save to access the many-to-many fields
-    # and then need to update the boolean in the record based on conditional logic
+    def _is_loaded_row(self):
+        """
+        Returns True if this instance still represents the row it was loaded from, so that the field tracker
+        knows the values stored in that row. That is not the case of new instances, nor of instances whose pk
+        was changed, like drafts copied over their official version.
+        """
+        return not self._state.adding and not self.field_tracker.has_changed(self._meta.pk.attname)
+
     def save(self, *args, suppress_publication=False, send_emails=True, **kwargs):
         """
+        Saves the course run in a single write. Rows which already exist are only updated with the fields which
+        changed since they were loaded, unless update_fields is given.
+
         Arguments:
             suppress_publication (bool): if True, we won't push the run data to the marketing site
             send_emails (bool): whether to send email notifications for status changes from this save
@@ -2838,20 +2846,35 @@ class CourseRun(ManageHistoryMixin, DraftModelMixin, CachedMixin, TimeStampedMod
                              self.course.partner.has_marketing_site and
                              waffle.switch_is_active('publish_course_runs_to_marketing_site') and
                              self.could_be_marketable)
+        is_loaded_row = self._is_loaded_row() and not kwargs.get('force_insert')
+
+        # The inclusion only depends on the course and the pacing type, so unlike for courses and programs,
+        # it doesn't need the row to be saved first.
+        self.enterprise_subscription_inclusion = self._check_enterprise_subscription_inclusion()
+        if is_loaded_row and kwargs.get('update_fields') is None:
+            # AutoSlugField and the modification timestamp are only set while saving
+            kwargs['update_fields'] = {*self.field_tracker.changed(), 'slug', 'modified'}
 
         with transaction.atomic():
             if push_to_marketing:
-                previous_obj = CourseRun.objects.get(id=self.id) if self.id else None
+                if is_loaded_row:
+                    previous_obj = CourseRun(
+                        status=self.field_tracker.previous('status'), slug=self.field_tracker.previous('slug')
+                    )
+                else:
+                    previous_obj = CourseRun.objects.get(id=self.id) if self.id else None
 
-            super().save(*args, **kwargs)
-            self.enterprise_subscription_inclusion = self._check_enterprise_subscription_inclusion()
-            kwargs['force_insert'] = False
-            kwargs['force_update'] = True
             super().save(*args, **kwargs)
             self.handle_status_change(send_emails)
 
             if push_to_marketing:
-                self.push_to_marketing_site(previous_obj)
+                if IS_SIDE_EFFECT_OUTBOX_ENABLED.is_enabled():
+                    previous = {'status': previous_obj.status, 'slug': previous_obj.slug} if previous_obj else None
+                    OutboxMessage.enqueue(OutboxMessage.MARKETING_SITE, 'publish_course_run', self, {
+                        'previous': previous,
+                    })
+                else:
+                    self.push_to_marketing_site(previous_obj)
 
         if self.status == CourseRunStatus.Reviewed and not self.draft:
             retired_programs = self.programs.filter(status=ProgramStatus.Retired)
@@ -3255,6 +3278,10 @@ class Program(ManageHistoryMixin, PkSearchableMixin, TimeStampedModel):
         render_variations=custom_render_variations
     )
     banner_image_url = models.URLField(null=True, blank=True, help_text='DEPRECATED: Use the banner image field.')
+    banner_image_etag = models.CharField(
+        max_length=255, blank=True, default='',
+        help_text='ETag, or content hash, of the banner image last downloaded from the banner image url.',
+    )
     card_image = StdImageField(
         upload_to=UploadToFieldNamePath(populate_from='uuid', path='media/programs/card_images'),
         blank=True,
@@ -3797,7 +3824,6 @@ class Program(ManageHistoryMixin, PkSearchableMixin, TimeStampedModel):
             self.trigger_program_skills_update_flow()
 
         if is_publishable:
-            publisher = ProgramMarketingSitePublisher(self.partner)
             previous_obj = Program.objects.get(id=self.id) if self.id else None
 
             # there have to be two saves because in order to check for if this is included in the
@@ -3809,7 +3835,19 @@ class Program(ManageHistoryMixin, PkSearchableMixin, TimeStampedModel):
                 kwargs['force_insert'] = False
                 kwargs['force_update'] = True
                 super().save(*args, **kwargs)
-                publisher.publish_obj(self, previous_obj=previous_obj)
+                if IS_SIDE_EFFECT_OUTBOX_ENABLED.is_enabled():
+                    previous = None
+                    if previous_obj:
+                        previous = {
+                            field: getattr(previous_obj, field)
+                            for field in ('marketing_slug', 'status', 'title', 'type_id')
+                        }
+                    OutboxMessage.enqueue(OutboxMessage.MARKETING_SITE, 'publish_program', self, {
+                        'previous': previous,
+                    })
+                else:
+                    publisher = ProgramMarketingSitePublisher(self.partner)
+                    publisher.publish_obj(self, previous_obj=previous_obj)
         else:
             super().save(*args, **kwargs)
             self.enterprise_subscription_inclusion = self._check_enterprise_subscription_inclusion()
@@ -3840,6 +3878,155 @@ class Program(ManageHistoryMixin, PkSearchableMixin, TimeStampedModel):
         self.ofac_comment = f"Program type {self.type.slug} is OFAC restricted for {self.product_source.name}"
         self.save()
 
+    def get_summary(self, includes_restricted_runs=True):
+        """
+        Returns the ProgramSummary of the program computed with or without its restricted course runs, or None if
+        it hasn't been computed or program summaries are disabled.
+
+        Prefetch `summaries` when getting the summaries of several programs.
+        """
+        if not IS_PROGRAM_SUMMARY_ENABLED.is_enabled():
+            return None
+
+        for summary in self.summaries.all():
+            if summary.includes_restricted_runs == includes_restricted_runs:
+                return summary
+        return None
+
+
+class ProgramSummary(TimeStampedModel):
+    """
+    Aggregates of the courses, course runs, seats and entitlements of a program, stored so that serializers and
+    search indexes don't have to walk the program's courses to compute them.
+
+    Each program has one summary computed from all of its course runs, and one computed without the course runs
+    which the API hides unless restricted runs are requested. Summaries are refreshed whenever the program, its
+    courses, course runs, seats, entitlements or subjects change, see `refresh`. Aggregates which depend on the
+    current time, e.g. archived course run statuses and total prices, are only up to date as of the last refresh.
+    """
+    program = models.ForeignKey(Program, models.CASCADE, related_name='summaries')
+    includes_restricted_runs = models.BooleanField()
+    course_run_statuses = models.JSONField(default=list)
+    language_codes = models.JSONField(default=list)
+    language_search_facets = models.JSONField(default=list)
+    seat_type_slugs = models.JSONField(default=list)
+    subject_uuids = models.JSONField(default=list)
+    subject_names = models.JSONField(default=list)
+    staff_uuids = models.JSONField(default=list)
+    serialized_price_ranges = models.JSONField(default=list)
+    start = models.DateTimeField(null=True)
+    weeks_to_complete_min = models.PositiveSmallIntegerField(null=True)
+    weeks_to_complete_max = models.PositiveSmallIntegerField(null=True)
+
+    class Meta:
+        unique_together = ('program', 'includes_restricted_runs')
+
+    def __str__(self):
+        return f'{self.program}: {"all" if self.includes_restricted_runs else "unrestricted"} course runs'
+
+    @property
+    def price_ranges(self):
+        return [
+            {
+                'currency': price_range['currency'],
+                'min': Decimal(price_range['min']),
+                'max': Decimal(price_range['max']),
+                'total': Decimal(price_range['total']),
+            }
+            for price_range in self.serialized_price_ranges
+        ]
+
+    @staticmethod
+    def get_programs(program_ids, includes_restricted_runs):
+        """
+        Returns the programs with everything their aggregates are computed from prefetched.
+        """
+        course_runs = CourseRun.objects.select_related('language', 'type').prefetch_related(
+            'staff', 'seats__type', 'seats__currency'
+        )
+        if not includes_restricted_runs:
+            course_runs = course_runs.exclude(restricted_run__restriction_type__in=CourseRunRestrictionType.values)
+
+        return Program.objects.filter(pk__in=program_ids).select_related('type').prefetch_related(
+            'excluded_course_runs',
+            'type__applicable_seat_types',
+            Prefetch('courses', queryset=Course.objects.select_related('canonical_course_run').prefetch_related(
+                'subjects__translations',
+                'entitlements__mode',
+                'entitlements__currency',
+                'canonical_course_run__seats__type',
+                'canonical_course_run__seats__currency',
+                Prefetch('course_runs', queryset=course_runs),
+            )),
+        )
+
+    @classmethod
+    def compute(cls, program, includes_restricted_runs):
+        """
+        Returns an unsaved summary of the program, whose courses must have been prefetched with or without their
+        restricted course runs, see `get_programs`.
+        """
+        languages = sorted(program.languages, key=lambda language: language.code)
+        subjects = program.subjects
+        return cls(
+            program=program,
+            includes_restricted_runs=includes_restricted_runs,
+            course_run_statuses=program.course_run_statuses,
+            language_codes=[language.code for language in languages],
+            language_search_facets=[language.get_search_facet_display() for language in languages],
+            seat_type_slugs=sorted(seat_type.slug for seat_type in program.seat_types),
+            subject_uuids=[str(subject.uuid) for subject in subjects],
+            subject_names=[subject.name for subject in subjects],
+            staff_uuids=sorted({
+                str(staff.uuid) for course_run in program.course_runs for staff in course_run.staff.all()
+            }),
+            serialized_price_ranges=[
+                {
+                    'currency': price_range['currency'],
+                    'min': str(price_range['min']),
+                    'max': str(price_range['max']),
+                    'total': str(price_range['total']),
+                }
+                for price_range in program.price_ranges
+            ],
+            start=program.start,
+            weeks_to_complete_min=program.weeks_to_complete_min,
+            weeks_to_complete_max=program.weeks_to_complete_max,
+        )
+
+    @classmethod
+    def refresh(cls, program_ids):
+        """
+        Recompute the summaries of the given programs.
+        """
+        fields = [
+            field.name for field in cls._meta.concrete_fields
+            if field.name not in ('id', 'program', 'includes_restricted_runs', 'created', 'modified')
+        ]
+        for includes_restricted_runs in (True, False):
+            for program in cls.get_programs(program_ids, includes_restricted_runs):
+                summary = cls.compute(program, includes_restricted_runs)
+                cls.objects.update_or_create(
+                    program=program,
+                    includes_restricted_runs=includes_restricted_runs,
+                    defaults={field: getattr(summary, field) for field in fields},
+                )
+
+    @classmethod
+    def refresh_on_commit(cls, program_ids):
+        """
+        Refresh the summaries of the given programs in a Celery task, once the current transaction commits.
+        """
+        # pylint: disable=import-outside-toplevel
+        from course_discovery.apps.course_metadata.tasks import refresh_program_summaries
+
+        if not IS_PROGRAM_SUMMARY_ENABLED.is_enabled():
+            return
+
+        program_ids = sorted(set(program_ids))
+        if program_ids:
+            transaction.on_commit(lambda: refresh_program_summaries.delay(program_ids))
+
 
 class ProgramSubscription(PkSearchableMixin, TimeStampedModel):
     """Model for storing program subscription eligibility"""
@@ -4565,6 +4752,105 @@ class DataLoaderConfig(SingletonModel):
     max_workers = models.PositiveSmallIntegerField(default=7)
 
 
+class DataLoaderRecordHash(TimeStampedModel):
+    """
+    Content hash of an upstream record last applied by a data loader, used by incremental
+    refresh_course_metadata runs to skip records which haven't changed.
+    """
+    partner = models.ForeignKey(Partner, models.CASCADE)
+    loader = models.CharField(max_length=64)
+    record_key = models.CharField(max_length=255)
+    content_hash = models.CharField(max_length=32)
+
+    class Meta:
+        unique_together = ('partner', 'loader', 'record_key')
+
+    def __str__(self):
+        return f'{self.loader}: {self.record_key}'
+
+
+class DataLoaderCheckpoint(TimeStampedModel):
+    """
+    Progress of an unfinished run of a CSV data loader, used by the next run to resume after the rows committed
+    by the previous one. Checkpoints are deleted once a run has read all the rows of its source.
+    """
+    partner = models.ForeignKey(Partner, models.CASCADE)
+    loader = models.CharField(max_length=64)
+    row_offset = models.PositiveIntegerField(default=0)
+    row_hash = models.CharField(max_length=32, blank=True)
+
+    class Meta:
+        unique_together = ('partner', 'loader')
+
+    def __str__(self):
+        return f'{self.loader}: {self.row_offset}'
+
+
+class OutboxMessage(TimeStampedModel):
+    """
+    Side effect of a save, e.g. a marketing site or Salesforce update, waiting to be delivered by a Celery worker.
+
+    Messages are written in the same transaction as the save which triggered them, so they are delivered if and only
+    if that save commits. There is at most one message per action and object: queueing an action for an object which
+    already has an undelivered message coalesces both into a single delivery.
+    """
+    MARKETING_SITE = 'marketing_site'
+    SALESFORCE = 'salesforce'
+    ECOMMERCE = 'ecommerce'
+    TARGET_CHOICES = (
+        (MARKETING_SITE, _('Marketing site')),
+        (SALESFORCE, _('Salesforce')),
+        (ECOMMERCE, _('Ecommerce')),
+    )
+
+    target = models.CharField(max_length=32, choices=TARGET_CHOICES)
+    action = models.CharField(max_length=64)
+    object_id = models.PositiveIntegerField()
+    payload = models.JSONField(default=dict)
+    version = models.PositiveIntegerField(
+        default=1, help_text=_('Incremented every time the action is queued again before being delivered.')
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    available_at = models.DateTimeField(
+        null=True, db_index=True, default=timezone.now,
+        help_text=_('When the message may next be delivered. Empty once delivery has been given up on.'),
+    )
+    last_error = models.TextField(blank=True, default='')
+
+    class Meta:
+        unique_together = ('action', 'object_id')
+
+    def __str__(self):
+        return f'{self.action}: {self.object_id}'
+
+    @classmethod
+    def enqueue(cls, target, action, obj, payload=None):
+        """
+        Queue an action on the given object, to be delivered once the current transaction commits.
+
+        If the action is already queued for the object, the values of the existing payload are kept and only
+        missing keys are added, so the payload of the first of the coalesced messages wins.
+        """
+        # pylint: disable=import-outside-toplevel
+        from course_discovery.apps.course_metadata.tasks import deliver_outbox_messages
+
+        payload = payload or {}
+        with transaction.atomic():
+            message, created = cls.objects.select_for_update().get_or_create(
+                action=action, object_id=obj.pk, defaults={'target': target, 'payload': payload},
+            )
+            if not created:
+                cls.objects.filter(pk=message.pk).update(
+                    payload={**payload, **message.payload},
+                    version=F('version') + 1,
+                    attempts=0,
+                    available_at=timezone.now(),
+                    last_error='',
+                )
+
+        transaction.on_commit(lambda: deliver_outbox_messages.delay(target))
+
+
 class DeletePersonDupsConfig(SingletonModel):
     """
     Configuration for the delete_person_dups management command.
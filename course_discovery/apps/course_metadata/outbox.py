@@ -0,0 +1,195 @@
+"""
+Delivery of the marketing site, Salesforce and ecommerce side effects queued as OutboxMessages.
+
+Saves queue their side effects with OutboxMessage.enqueue, in the same transaction as the save itself, and Celery
+workers deliver them once that transaction commits. Failed deliveries are retried with an exponential backoff, and
+the number of workers delivering messages of the same target at once is limited by SIDE_EFFECT_OUTBOX_CONCURRENCY,
+so that a burst of saves doesn't flood the marketing site or Salesforce.
+"""
+import datetime
+import logging
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from course_discovery.apps.course_metadata.models import Course, CourseRun, Organization, OutboxMessage, Program
+from course_discovery.apps.course_metadata.publishers import ProgramMarketingSitePublisher
+from course_discovery.apps.course_metadata.salesforce import populate_official_with_existing_draft
+from course_discovery.apps.course_metadata.utils import get_salesforce_util, push_to_ecommerce_for_course_run
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_SLOT_KEY_PREFIX = 'outbox_delivery_slot'
+
+
+def publish_course_run_to_marketing_site(course_run, payload):
+    previous = payload.get('previous')
+    course_run.push_to_marketing_site(CourseRun(**previous) if previous else None)
+
+
+def publish_program_to_marketing_site(program, payload):
+    previous = payload.get('previous')
+    publisher = ProgramMarketingSitePublisher(program.partner)
+    publisher.publish_obj(program, previous_obj=Program(**previous) if previous else None)
+
+
+def update_salesforce_organization(organization, payload):
+    util = get_salesforce_util(organization.partner)
+    if util:
+        if not organization.salesforce_id:
+            util.create_publisher_organization(organization)
+        if payload.get('update'):
+            util.update_publisher_organization(organization)
+
+
+def update_salesforce_course(course, payload):
+    util = get_salesforce_util(course.partner)
+    if not util or not course.authoring_organizations.first():
+        return
+
+    if course.draft:
+        # Queued once the authoring organizations of a new draft have been set, the draft may have been linked since
+        if not course.salesforce_id:
+            util.create_course(course)
+        return
+
+    created_in_salesforce = False
+    if (not course.salesforce_id and
+            course.draft_version and
+            course.draft_version.authoring_organizations.first()):
+        created_in_salesforce = populate_official_with_existing_draft(course, util)
+    if not created_in_salesforce and payload.get('update'):
+        util.update_course(course)
+
+
+def update_salesforce_course_run(course_run, payload):
+    util = get_salesforce_util(course_run.course.partner)
+    if not util:
+        return
+
+    if course_run.draft:
+        util.create_course_run(course_run)
+        return
+
+    created_in_salesforce = False
+    if not course_run.salesforce_id and course_run.draft_version:
+        created_in_salesforce = populate_official_with_existing_draft(course_run, util)
+    if not created_in_salesforce and payload.get('update'):
+        util.update_course_run(course_run)
+
+
+def push_course_run_to_ecommerce(course_run, payload):  # pylint: disable=unused-argument
+    push_to_ecommerce_for_course_run(course_run)
+
+
+# Maps each action to the manager its objects are loaded with and the function delivering it
+OUTBOX_ACTIONS = {
+    'publish_course_run': (CourseRun.everything, publish_course_run_to_marketing_site),
+    'publish_program': (Program.objects, publish_program_to_marketing_site),
+    'salesforce_organization': (Organization.objects, update_salesforce_organization),
+    'salesforce_course': (Course.everything, update_salesforce_course),
+    'salesforce_course_run': (CourseRun.everything, update_salesforce_course_run),
+    'ecommerce_course_run': (CourseRun.everything, push_course_run_to_ecommerce),
+}
+
+
+@contextmanager
+def delivery_slot(target):
+    """
+    Acquire one of the delivery slots of the target, yielding its cache key, or None if all of them are taken.
+    """
+    timeout = settings.SIDE_EFFECT_OUTBOX_LEASE_SECONDS
+    for slot in range(settings.SIDE_EFFECT_OUTBOX_CONCURRENCY.get(target, 1)):
+        key = f'{OUTBOX_SLOT_KEY_PREFIX}.{target}.{slot}'
+        if cache.add(key, True, timeout):
+            try:
+                yield key
+            finally:
+                cache.delete(key)
+            return
+    yield None
+
+
+def claim_messages(target):
+    """
+    Claim a batch of due messages of the target, hiding them from other workers for the duration of the lease.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        messages = list(
+            OutboxMessage.objects.select_for_update(skip_locked=True).filter(
+                target=target, available_at__lte=now
+            ).order_by('available_at')[:settings.SIDE_EFFECT_OUTBOX_BATCH_SIZE]
+        )
+        OutboxMessage.objects.filter(pk__in=[message.pk for message in messages]).update(
+            available_at=now + datetime.timedelta(seconds=settings.SIDE_EFFECT_OUTBOX_LEASE_SECONDS)
+        )
+    return messages
+
+
+def deliver_message(message):
+    """
+    Deliver a claimed message.
+
+    Returns:
+        None if the message was delivered, else the number of seconds after which delivery will be retried,
+        or None as well if it has been given up on.
+    """
+    manager, deliver = OUTBOX_ACTIONS[message.action]
+    try:
+        obj = manager.filter(pk=message.object_id).first()
+        # Objects deleted since the message was queued have nothing left to deliver
+        if obj is not None:
+            deliver(obj, message.payload)
+    except Exception as exc:  # pylint: disable=broad-except
+        attempts = message.attempts + 1
+        retry_in = None
+        available_at = None
+        if attempts < settings.SIDE_EFFECT_OUTBOX_MAX_ATTEMPTS:
+            retry_in = settings.SIDE_EFFECT_OUTBOX_RETRY_DELAY_SECONDS * 2 ** (attempts - 1)
+            available_at = timezone.now() + datetime.timedelta(seconds=retry_in)
+            logger.warning('Failed to deliver outbox message [%s], retrying in %d seconds.', message, retry_in)
+        else:
+            logger.exception('Failed to deliver outbox message [%s] %d times, giving up.', message, attempts)
+
+        # Messages queued again during the delivery are already due, and get a fresh set of attempts
+        OutboxMessage.objects.filter(pk=message.pk, version=message.version).update(
+            attempts=attempts, available_at=available_at, last_error=str(exc)
+        )
+        return retry_in
+
+    # Messages queued again during the delivery must be delivered again, as the object may have changed since
+    OutboxMessage.objects.filter(pk=message.pk, version=message.version).delete()
+    return None
+
+
+def deliver_messages(target):
+    """
+    Deliver the due messages of the target, unless as many workers as allowed are already delivering them.
+
+    Returns:
+        The number of seconds after which the earliest failed delivery will be retried, or None.
+    """
+    retry_delays = []
+    while True:
+        with delivery_slot(target) as slot:
+            if not slot:
+                # The workers holding the slots will deliver the message which triggered this call
+                break
+
+            messages = claim_messages(target)
+            while messages:
+                for message in messages:
+                    retry_delays.append(deliver_message(message))
+                    cache.touch(slot, settings.SIDE_EFFECT_OUTBOX_LEASE_SECONDS)
+                messages = claim_messages(target)
+
+        # Messages queued after the last claim could have been turned away while the slot was held
+        if not OutboxMessage.objects.filter(target=target, available_at__lte=timezone.now()).exists():
+            break
+
+    retry_delays = [delay for delay in retry_delays if delay is not None]
+    return min(retry_delays) if retry_delays else None
@@ -1,7 +1,9 @@
+import itertools
 import json
 from fnmatch import fnmatch
 
 import waffle  # lint-amnesty, pylint: disable=invalid-django-waffle-import
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.template import loader
@@ -9,6 +11,7 @@ from django.template.exceptions import TemplateDoesNotExist
 from django_elasticsearch_dsl import Document as OriginDocument
 from django_elasticsearch_dsl import fields
 
+from course_discovery.apps.course_metadata.utils import preload_product_skills, product_skills_scope
 from course_discovery.apps.edx_elasticsearch_dsl_extensions.search import Search
 
 from .analyzers import case_insensitive_keyword, edge_ngram_completion, html_strip, synonym_text
@@ -23,6 +26,18 @@ def filter_visible_runs(course_runs):
     return course_runs.exclude(type__is_marketable=False)
 
 
+def get_visible_runs(course_runs):
+    """
+    In-memory equivalent of `filter_visible_runs`, which uses the prefetched course runs if there are any
+    rather than querying them again.
+    """
+    check_draft = waffle.switch_is_active('elasticsearch-course-draft-filter-visible-runs-check')
+    return [
+        course_run for course_run in course_runs.all()
+        if not (course_run.type and course_run.type.is_marketable is False) and not (check_draft and course_run.draft)
+    ]
+
+
 class OrganizationsMixin:
     """
     OrganizationsMixin to be able prepare a set specific fields for es index.
@@ -123,9 +138,34 @@ class BaseDocument(Document, metaclass=DocumentMeta):
     text = fields.TextField(analyzer=synonym_text)
     uuid = fields.KeywordField()
 
+    # Product type of the skills prepared for each object, see get_skills_product_identifier
+    skills_product_type = None
+
     def get_queryset(self):
         return self.django.model.objects.all()
 
+    def get_skills_product_identifier(self, obj):  # pylint: disable=unused-argument
+        """
+        Returns the identifier of the product whose skills are prepared for the object.
+        """
+        return None
+
+    def _get_actions(self, object_list, action):
+        if action == 'delete' or self.skills_product_type is None:
+            yield from super()._get_actions(object_list, action)
+            return
+
+        # Load the skills of each chunk of objects at once, rather than once per object and skills field
+        objects = iter(object_list)
+        chunk = list(itertools.islice(objects, settings.ELASTICSEARCH_DSL_BULK_CHUNK_SIZE))
+        while chunk:
+            with product_skills_scope():
+                preload_product_skills(
+                    [self.get_skills_product_identifier(obj) for obj in chunk], self.skills_product_type
+                )
+                yield from super()._get_actions(chunk, action)
+            chunk = list(itertools.islice(objects, settings.ELASTICSEARCH_DSL_BULK_CHUNK_SIZE))
+
     @classmethod
     def _matches(cls, hit):
         # pylint: disable=protected-access
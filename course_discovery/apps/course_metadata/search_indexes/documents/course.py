@@ -1,15 +1,17 @@
+import json
+
 from django.conf import settings
 from django.db.models import Prefetch
 from django_elasticsearch_dsl import Index, fields
 from opaque_keys.edx.keys import CourseKey
 from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_serialized_skills
 
 from course_discovery.apps.course_metadata.models import Course, CourseRun
-from course_discovery.apps.course_metadata.utils import get_product_skill_names
+from course_discovery.apps.course_metadata.utils import get_product_skill_names, get_product_skills
+from course_discovery.apps.ietf_language_tags.utils import serialize_language
 
 from .analyzers import case_insensitive_keyword
-from .common import BaseCourseDocument, filter_visible_runs
+from .common import BaseCourseDocument, get_visible_runs
 
 __all__ = ('CourseDocument',)
 
@@ -34,6 +36,7 @@ class CourseDocument(BaseCourseDocument):
     )
     card_image_url = fields.TextField()
     course_runs = fields.KeywordField(multi=True)
+    course_run_bodies = fields.TextField(multi=True, index=False)
     expected_learning_items = fields.KeywordField(multi=True)
     end = fields.DateField(multi=True)
     course_ends = fields.TextField(
@@ -59,14 +62,63 @@ class CourseDocument(BaseCourseDocument):
     external_course_marketing_type = fields.KeywordField(multi=True)
     product_source = fields.KeywordField(multi=True)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._visible_runs = None
+
+    def prepare(self, instance):
+        self._visible_runs = None
+        return super().prepare(instance)
+
+    def get_visible_runs(self, obj):
+        """
+        Returns the visible runs of the course, computed once per course from its prefetched runs and shared
+        by the prepare methods.
+        """
+        if self._visible_runs is None or self._visible_runs[0] is not obj:
+            self._visible_runs = (obj, get_visible_runs(obj.course_runs))
+        return self._visible_runs[1]
+
     def prepare_aggregation_key(self, obj):
         return 'course:{}'.format(obj.key)
 
     def prepare_availability(self, obj):
-        return [str(course_run.availability) for course_run in filter_visible_runs(obj.course_runs)]
+        return [str(course_run.availability) for course_run in self.get_visible_runs(obj)]
 
     def prepare_course_runs(self, obj):
-        return [course_run.key for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.key for course_run in self.get_visible_runs(obj)]
+
+    def format_course_run_body(self, course_run):
+        """
+        Returns the fields of the course run rendered by the course search serializer in index-only mode.
+        """
+        return json.dumps({
+            'key': course_run.key,
+            'start': course_run.start,
+            'end': course_run.end,
+            'enrollment_start': course_run.enrollment_start,
+            'enrollment_end': course_run.enrollment_end,
+            'go_live_date': course_run.go_live_date,
+            'modified': course_run.modified,
+            'status': course_run.status,
+            'pacing_type': course_run.pacing_type,
+            'type_legacy': course_run.type_legacy,
+            'min_effort': course_run.min_effort,
+            'max_effort': course_run.max_effort,
+            'weeks_to_complete': course_run.weeks_to_complete,
+            'first_enrollable_paid_seat_price': course_run.first_enrollable_paid_seat_price,
+            'fixed_price_usd': course_run.fixed_price_usd,
+            'is_marketable': course_run.is_marketable,
+            'language': serialize_language(course_run.language) if course_run.language else None,
+            'restriction_type': (
+                course_run.restricted_run.restriction_type if hasattr(course_run, 'restricted_run') else None
+            ),
+            'seat_types': [seat_type.slug for seat_type in course_run.seat_types],
+        }, default=str)
+
+    def prepare_course_run_bodies(self, obj):
+        # All the runs are indexed, unlike the visible runs of the other fields, as the hydrated results include them
+        return [self.format_course_run_body(course_run) for course_run in obj.course_runs.all()]
 
     def prepare_expected_learning_items(self, obj):
         return [item.value for item in obj.expected_learning_items.all()]
@@ -75,13 +127,13 @@ class CourseDocument(BaseCourseDocument):
         return list(
             {
                 self._prepare_language(course_run.language)
-                for course_run in filter_visible_runs(obj.course_runs)
+                for course_run in self.get_visible_runs(obj)
                 if course_run.language
             }
         )
 
     def prepare_end(self, obj):
-        return [course_run.end for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.end for course_run in self.get_visible_runs(obj)]
 
     def prepare_end_date(self, obj):
         return obj.end_date
@@ -90,32 +142,38 @@ class CourseDocument(BaseCourseDocument):
         return str(obj.course_ends)
 
     def prepare_enrollment_start(self, obj):
-        return [course_run.enrollment_start for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.enrollment_start for course_run in self.get_visible_runs(obj)]
 
     def prepare_enrollment_end(self, obj):
-        return [course_run.enrollment_end for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.enrollment_end for course_run in self.get_visible_runs(obj)]
 
     def prepare_org(self, obj):
-        course_run = filter_visible_runs(obj.course_runs).first()
-        if course_run:
+        course_runs = self.get_visible_runs(obj)
+        if course_runs:
+            course_run = min(course_runs, key=lambda run: run.pk)
             return CourseKey.from_string(course_run.key).org
         return None
 
     def prepare_seat_types(self, obj):
-        seat_types = [seat.slug for run in filter_visible_runs(obj.course_runs) for seat in run.seat_types]
+        seat_types = [seat.slug for run in self.get_visible_runs(obj) for seat in run.seat_types]
         return list(set(seat_types))
 
+    skills_product_type = ProductTypes.Course
+
+    def get_skills_product_identifier(self, obj):
+        return obj.key
+
     def prepare_skill_names(self, obj):
         return get_product_skill_names(obj.key, ProductTypes.Course)
 
     def prepare_skills(self, obj):
-        return get_whitelisted_serialized_skills(obj.key, product_type=ProductTypes.Course)
+        return get_product_skills(obj.key, ProductTypes.Course)
 
     def prepare_status(self, obj):
-        return [course_run.status for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.status for course_run in self.get_visible_runs(obj)]
 
     def prepare_start(self, obj):
-        return [course_run.start for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.start for course_run in self.get_visible_runs(obj)]
 
     def prepare_partner(self, obj):
         return obj.partner.short_code
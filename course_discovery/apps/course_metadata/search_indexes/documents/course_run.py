@@ -2,11 +2,10 @@ from django.conf import settings
 from django_elasticsearch_dsl import Index, fields
 from opaque_keys.edx.keys import CourseKey
 from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_serialized_skills
 
 from course_discovery.apps.course_metadata.choices import CourseRunStatus
 from course_discovery.apps.course_metadata.models import CourseRun
-from course_discovery.apps.course_metadata.utils import get_product_skill_names
+from course_discovery.apps.course_metadata.utils import get_product_skill_names, get_product_skills
 
 from .analyzers import case_insensitive_keyword, html_strip
 from .common import BaseCourseDocument, filter_visible_runs
@@ -124,6 +123,11 @@ class CourseRunDocument(BaseCourseDocument):
     def prepare_seat_types(self, obj):
         return [seat_type.slug for seat_type in obj.seat_types]
 
+    skills_product_type = ProductTypes.Course
+
+    def get_skills_product_identifier(self, obj):
+        return obj.course.key
+
     def prepare_skill_names(self, obj):
         return get_product_skill_names(obj.course.key, ProductTypes.Course)
 
@@ -133,7 +137,7 @@ class CourseRunDocument(BaseCourseDocument):
         return None
 
     def prepare_skills(self, obj):
-        return get_whitelisted_serialized_skills(obj.course.key, product_type=ProductTypes.Course)
+        return get_product_skills(obj.course.key, ProductTypes.Course)
 
     def prepare_staff_uuids(self, obj):
         return [str(staff.uuid) for staff in obj.staff.all()]
@@ -2,11 +2,10 @@ from django.conf import settings
 from django.db.models import Prefetch
 from django_elasticsearch_dsl import Index, fields
 from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_serialized_skills
 
 from course_discovery.apps.course_metadata.choices import ProgramStatus
 from course_discovery.apps.course_metadata.models import Course, CourseRun, Degree, Program
-from course_discovery.apps.course_metadata.utils import get_product_skill_names
+from course_discovery.apps.course_metadata.utils import get_product_skill_names, get_product_skills
 
 from .analyzers import case_insensitive_keyword, edge_ngram_completion, html_strip, synonym_text
 from .common import BaseDocument, OrganizationsMixin
@@ -84,7 +83,14 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
     def prepare_credit_backing_organizations(self, obj):
         return self._prepare_organizations(obj.credit_backing_organizations.all())
 
+    def prepare_course_run_statuses(self, obj):
+        summary = obj.get_summary()
+        return summary.course_run_statuses if summary else obj.course_run_statuses
+
     def prepare_language(self, obj):
+        summary = obj.get_summary()
+        if summary:
+            return summary.language_search_facets
         return [self._prepare_language(language) for language in obj.languages]
 
     def prepare_organizations(self, obj):
@@ -97,13 +103,21 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
         return obj.status == ProgramStatus.Active
 
     def prepare_seat_types(self, obj):
+        summary = obj.get_summary()
+        if summary:
+            return summary.seat_type_slugs
         return [seat_type.slug for seat_type in obj.seat_types]
 
+    skills_product_type = ProductTypes.Program
+
+    def get_skills_product_identifier(self, obj):
+        return obj.uuid
+
     def prepare_skill_names(self, obj):
         return get_product_skill_names(obj.uuid, ProductTypes.Program)
 
     def prepare_skills(self, obj):
-        return get_whitelisted_serialized_skills(obj.uuid, product_type=ProductTypes.Program)
+        return get_product_skills(obj.uuid, ProductTypes.Program)
 
     def prepare_search_card_display(self, obj):
         try:
@@ -113,20 +127,39 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
             return []
         return [degree.search_card_ranking, degree.search_card_cost, degree.search_card_courses]
 
+    def prepare_start(self, obj):
+        summary = obj.get_summary()
+        return summary.start if summary else obj.start
+
     def prepare_subject_uuids(self, obj):
+        summary = obj.get_summary()
+        if summary:
+            return summary.subject_uuids
         return [str(subject.uuid) for subject in obj.subjects]
 
     def prepare_staff_uuids(self, obj):
+        summary = obj.get_summary()
+        if summary:
+            return summary.staff_uuids
         return list({str(staff.uuid) for course_run in obj.course_runs for staff in course_run.staff.all()})
 
     def prepare_type(self, obj):
         return obj.type.name_t
 
+    def prepare_weeks_to_complete_min(self, obj):
+        summary = obj.get_summary()
+        return summary.weeks_to_complete_min if summary else obj.weeks_to_complete_min
+
+    def prepare_weeks_to_complete_max(self, obj):
+        summary = obj.get_summary()
+        return summary.weeks_to_complete_max if summary else obj.weeks_to_complete_max
+
     def get_queryset(self, excluded_restriction_types=None):
         if excluded_restriction_types is None:
             excluded_restriction_types = []
 
         return super().get_queryset().select_related('type').select_related('partner').prefetch_related(
+            'summaries',
             Prefetch('courses', queryset=Course.objects.all().prefetch_related(
                 Prefetch('course_runs', queryset=CourseRun.objects.exclude(
                     restricted_run__restriction_type__in=excluded_restriction_types
@@ -2,14 +2,36 @@ import logging
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
 from django_elasticsearch_dsl.registries import registry
 
 from course_discovery.apps.api.utils import get_excluded_restriction_types
 from course_discovery.apps.core.utils import ElasticsearchUtils, serialize_datetime
+from course_discovery.apps.course_metadata.toggles import IS_INDEX_ONLY_SEARCH_ENABLED
 
 log = logging.getLogger(__name__)
 
 
+def is_index_only_search(request):
+    """
+    Returns True if search results should be rendered from the fields stored in the search index alone, rather than
+    from their objects loaded from the database.
+
+    Results requested with detail_fields include fields which aren't indexed, e.g. the staff of course runs.
+    """
+    detail_fields = request.GET.get('detail_fields')
+    if request.method == 'POST':
+        detail_fields = request.POST.get('detail_fields') or detail_fields
+    return IS_INDEX_ONLY_SEARCH_ENABLED.is_enabled() and not detail_fields
+
+
+def get_indexed_skills(result):
+    """
+    Returns the skills stored in the search index for the result, serialized like taxonomy's whitelisted skills.
+    """
+    return [skill.to_dict() for skill in result.skills]
+
+
 class DateTimeSerializerMixin:
     @staticmethod
     def handle_datetime_field(value):
@@ -18,6 +40,16 @@ class DateTimeSerializerMixin:
         return serialize_datetime(value)
 
 
+class IndexOnlySearchSerializerMixin:
+    """
+    Search document serializer mixin telling whether results are rendered in index-only mode, see is_index_only_search.
+    """
+
+    @cached_property
+    def index_only(self):
+        return is_index_only_search(self.context['request'])
+
+
 class ModelObjectDocumentSerializerMixin:
     """
     Model object document serializer mixin.
@@ -1,8 +1,11 @@
 # pylint: disable=W0223
 import datetime
+import json
+from types import SimpleNamespace
 
 import pytz
 from django.db import models
+from django.utils.dateparse import parse_datetime
 from django_elasticsearch_dsl_drf.serializers import DocumentSerializer
 from rest_framework import serializers
 from rest_framework.serializers import ListSerializer
@@ -11,16 +14,64 @@ from taxonomy.utils import get_whitelisted_serialized_skills
 
 from course_discovery.apps.api import serializers as cd_serializers
 from course_discovery.apps.api.serializers import ContentTypeSerializer, CourseWithProgramsSerializer
+from course_discovery.apps.api.utils import get_excluded_restriction_types
+from course_discovery.apps.course_metadata.models import CourseRun
 from course_discovery.apps.course_metadata.utils import get_course_run_estimated_hours, get_product_skill_names
 from course_discovery.apps.edx_elasticsearch_dsl_extensions.serializers import BaseDjangoESDSLFacetSerializer
 
 from ..constants import BASE_SEARCH_INDEX_FIELDS, COMMON_IGNORED_FIELDS
 from ..documents import CourseDocument
-from .common import DateTimeSerializerMixin, DocumentDSLSerializerMixin, ModelObjectDocumentSerializerMixin
+from .common import (
+    DateTimeSerializerMixin, DocumentDSLSerializerMixin, IndexOnlySearchSerializerMixin,
+    ModelObjectDocumentSerializerMixin, get_indexed_skills
+)
 
 __all__ = ('CourseSearchDocumentSerializer',)
 
 
+class IndexedCourseRun:
+    """
+    Course run loaded from the body indexed with its course, see CourseDocument.format_course_run_body.
+
+    It stands in for the CourseRun model when course search results are rendered in index-only mode, and shares
+    the properties of the model which only depend on the indexed fields, so that they are evaluated at request time.
+    """
+
+    DATETIME_FIELDS = ('start', 'end', 'enrollment_start', 'enrollment_end', 'go_live_date', 'modified')
+
+    availability = CourseRun.availability
+    has_ended = CourseRun.has_ended
+    is_active = CourseRun.is_active
+    is_enrollable = CourseRun.is_enrollable
+
+    def __init__(self, body):
+        body = json.loads(body)
+        for field in self.DATETIME_FIELDS:
+            body[field] = parse_datetime(body[field]) if body[field] else None
+
+        self.key = body['key']
+        self.start = body['start']
+        self.end = body['end']
+        self.enrollment_start = body['enrollment_start']
+        self.enrollment_end = body['enrollment_end']
+        self.go_live_date = body['go_live_date']
+        self.modified = body['modified']
+        self.status = body['status']
+        self.pacing_type = body['pacing_type']
+        self.type_legacy = body['type_legacy']
+        self.min_effort = body['min_effort']
+        self.max_effort = body['max_effort']
+        self.weeks_to_complete = body['weeks_to_complete']
+        self.first_enrollable_paid_seat_price = body['first_enrollable_paid_seat_price']
+        self.fixed_price_usd = body['fixed_price_usd']
+        self.is_marketable = body['is_marketable']
+        self.serialized_language = body['language']
+        # Only the attributes of the seat types and restricted run read by the serializer are indexed
+        self.seat_types = [SimpleNamespace(slug=slug) for slug in body['seat_types']]
+        if body['restriction_type']:
+            self.restricted_run = SimpleNamespace(restriction_type=body['restriction_type'])
+
+
 class CourseSearchDocumentListSerializer(ModelObjectDocumentSerializerMixin, ListSerializer):
     """
     Custom List Serializer for CourseSearchDocument to fetch all instances at once.
@@ -31,6 +82,9 @@ class CourseSearchDocumentListSerializer(ModelObjectDocumentSerializerMixin, Lis
         Custom list representation to fetch all the course instances at once.
         """
         iterable = data.all() if isinstance(data, models.Manager) else data
+        if self.child.index_only:
+            return super().to_representation(iterable)
+
         _objects = list(self.get_model_object_by_instances(iterable))
 
         object_dict = {obj.pk: obj for obj in _objects}
@@ -39,7 +93,9 @@ class CourseSearchDocumentListSerializer(ModelObjectDocumentSerializerMixin, Lis
         return super().to_representation(result_tuples)
 
 
-class CourseSearchDocumentSerializer(ModelObjectDocumentSerializerMixin, DateTimeSerializerMixin, DocumentSerializer):
+class CourseSearchDocumentSerializer(
+    IndexOnlySearchSerializerMixin, ModelObjectDocumentSerializerMixin, DateTimeSerializerMixin, DocumentSerializer
+):
     """
     Serializer for course elasticsearch document.
     """
@@ -87,9 +143,27 @@ class CourseSearchDocumentSerializer(ModelObjectDocumentSerializerMixin, DateTim
             )
         return course_run_detail
 
+    def get_result_course_runs(self, result):
+        """
+        Returns the course runs of the result, loaded from the search index in index-only mode and from the
+        database otherwise.
+        """
+        if not self.index_only:
+            return result.object.course_runs.all()
+
+        if self._indexed_course_runs is None or self._indexed_course_runs[0] is not result:
+            excluded_restriction_types = get_excluded_restriction_types(self.context['request'])
+            course_runs = [IndexedCourseRun(body) for body in result.course_run_bodies]
+            self._indexed_course_runs = (result, [
+                course_run for course_run in course_runs
+                if not (hasattr(course_run, 'restricted_run') and
+                        course_run.restricted_run.restriction_type in excluded_restriction_types)
+            ])
+        return self._indexed_course_runs[1]
+
     def get_course_runs(self, result):
         request = self.context['request']
-        course_runs = result.object.course_runs.all()
+        course_runs = self.get_result_course_runs(result)
         now = datetime.datetime.now(pytz.UTC)
         exclude_expired = request.GET.get('exclude_expired_course_run')
         detail_fields = request.GET.get('detail_fields')
@@ -125,7 +199,13 @@ class CourseSearchDocumentSerializer(ModelObjectDocumentSerializerMixin, DateTim
         if request.method == 'POST':
             exclude_non_active_languages = request.POST.get('exclude_expired_course_run', exclude_non_active_languages)
 
-        return result.object.languages(exclude_non_active_languages)
+        if not self.index_only:
+            return result.object.languages(exclude_non_active_languages)
+
+        return list({
+            course_run.serialized_language for course_run in self.get_result_course_runs(result)
+            if course_run.serialized_language and (not exclude_non_active_languages or course_run.is_active)
+        })
 
     def get_seat_types(self, result):
         now = datetime.datetime.now(pytz.UTC)
@@ -136,17 +216,23 @@ class CourseSearchDocumentSerializer(ModelObjectDocumentSerializerMixin, DateTim
         if exclude_expired:
             # if course_run is active then add course_run.seat_types to seat_types
             seat_types = [
-                seat.slug for course_run in result.object.course_runs.all()
+                seat.slug for course_run in self.get_result_course_runs(result)
                 if course_run.end is None or course_run.end > now for seat in course_run.seat_types
             ]
         else:
-            seat_types = [seat.slug for course_run in result.object.course_runs.all() for seat in course_run.seat_types]
+            seat_types = [
+                seat.slug for course_run in self.get_result_course_runs(result) for seat in course_run.seat_types
+            ]
         return list(set(seat_types))
 
     def get_skill_names(self, result):
+        if self.index_only:
+            return list(result.skill_names)
         return get_product_skill_names(result.key, ProductTypes.Course)
 
     def get_skills(self, result):
+        if self.index_only:
+            return get_indexed_skills(result)
         return get_whitelisted_serialized_skills(result.key, product_type=ProductTypes.Course)
 
     def get_end_date(self, result):
@@ -164,6 +250,7 @@ class CourseSearchDocumentSerializer(ModelObjectDocumentSerializerMixin, DateTim
             self.fields.pop('level_type', None)
             self.fields.pop('modified', None)
             self.fields.pop('outcome', None)
+        self._indexed_course_runs = None
 
     def to_representation(self, instance):
         """
@@ -171,11 +258,13 @@ class CourseSearchDocumentSerializer(ModelObjectDocumentSerializerMixin, DateTim
         The instance needs to be handled differently and can be either of the two:
 
         1. A tuple consistent of an ES Hit object and a model object to be assigned to the hit object.
-        2. A single ES Hit object
+        2. A single ES Hit object, whose model object is loaded unless results are rendered in index-only mode.
         """
         if isinstance(instance, tuple):
             setattr(instance[0], 'object', instance[1])  # pylint: disable=literal-used-as-attribute
             prepared_instance = instance[0]
+        elif self.index_only:
+            prepared_instance = instance
         else:
             _object = self.get_model_object_by_instances(instance).get()
             setattr(instance, 'object', _object)  # pylint: disable=literal-used-as-attribute
@@ -9,12 +9,16 @@ from course_discovery.apps.edx_elasticsearch_dsl_extensions.serializers import B
 
 from ..constants import BASE_SEARCH_INDEX_FIELDS, COMMON_IGNORED_FIELDS
 from ..documents import CourseRunDocument
-from .common import DateTimeSerializerMixin, DocumentDSLSerializerMixin
+from .common import (
+    DateTimeSerializerMixin, DocumentDSLSerializerMixin, IndexOnlySearchSerializerMixin, get_indexed_skills
+)
 
 __all__ = ('CourseRunSearchDocumentSerializer',)
 
 
-class CourseRunSearchDocumentSerializer(DateTimeSerializerMixin, DocumentSerializer):
+class CourseRunSearchDocumentSerializer(
+    IndexOnlySearchSerializerMixin, DateTimeSerializerMixin, DocumentSerializer
+):
     """
     Serializer for course run elasticsearch document.
     """
@@ -39,9 +43,13 @@ class CourseRunSearchDocumentSerializer(DateTimeSerializerMixin, DocumentSeriali
         return self.handle_datetime_field(obj.enrollment_end)
 
     def get_skill_names(self, result):
+        if self.index_only:
+            return list(result.skill_names)
         return get_product_skill_names(result.course_key, ProductTypes.Course)
 
     def get_skills(self, result):
+        if self.index_only:
+            return get_indexed_skills(result)
         return get_whitelisted_serialized_skills(result.course_key, product_type=ProductTypes.Course)
 
     class Meta:
@@ -11,12 +11,12 @@ from course_discovery.apps.edx_elasticsearch_dsl_extensions.serializers import B
 
 from ..constants import BASE_PROGRAM_FIELDS, BASE_SEARCH_INDEX_FIELDS, COMMON_IGNORED_FIELDS
 from ..documents import ProgramDocument
-from .common import DocumentDSLSerializerMixin
+from .common import DocumentDSLSerializerMixin, IndexOnlySearchSerializerMixin, get_indexed_skills
 
 __all__ = ('ProgramSearchDocumentSerializer',)
 
 
-class ProgramSearchDocumentSerializer(DocumentSerializer):
+class ProgramSearchDocumentSerializer(IndexOnlySearchSerializerMixin, DocumentSerializer):
     """
     Serializer for program elasticsearch document.
     """
@@ -30,9 +30,13 @@ class ProgramSearchDocumentSerializer(DocumentSerializer):
         return [json.loads(organization) for organization in organizations] if organizations else []
 
     def get_skill_names(self, program):
+        if self.index_only:
+            return list(program.skill_names)
         return get_product_skill_names(program.uuid, ProductTypes.Program)
 
     def get_skills(self, program):
+        if self.index_only:
+            return get_indexed_skills(program)
         return get_whitelisted_serialized_skills(program.uuid, product_type=ProductTypes.Program)
 
     class Meta:
@@ -1,8 +1,24 @@
+import atexit
+import logging
+import threading
 from abc import ABC, abstractmethod, abstractproperty
+from collections import defaultdict
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+from django_elasticsearch_dsl.apps import DEDConfig
 from django_elasticsearch_dsl.registries import registry
 from django_elasticsearch_dsl.signals import RealTimeSignalProcessor as OriginRealTimeSignalProcessor
 
+from course_discovery.apps.core.utils import bump_search_index_generation, get_document, get_document_path
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_UPDATES_IN_FLIGHT_KEY = 'search_document_updates_in_flight'
+# Bounds how long the batches of crashed workers keep counting as in flight
+DOCUMENT_UPDATES_IN_FLIGHT_TIMEOUT = 5 * 60
+
 
 class IndexForbiddenException(Exception):
     """
@@ -27,6 +43,14 @@ class RegistryUpdateHandler(ABC):
 
     __next_handler = None
 
+    def __init__(self, update_index=None):
+        """
+        Arguments:
+            update_index (callable): updates the indexes once the instance passed every handler,
+                defaults to updating them immediately
+        """
+        self.update_index = update_index or update_registry
+
     def set_next(self, handler):
         self.__next_handler = handler
         return handler
@@ -36,8 +60,12 @@ class RegistryUpdateHandler(ABC):
     def handle(self, sender, instance, **kwargs):
         if self.__next_handler:
             return self.__next_handler.handle(sender, instance, **kwargs)
-        registry.update(instance)
-        registry.update_related(instance)
+        self.update_index(instance)
+
+
+def update_registry(instance):
+    registry.update(instance)
+    registry.update_related(instance)
 
 
 class MarketableHandler(RegistryUpdateHandler):
@@ -91,20 +119,194 @@ class RealTimeSignalProcessor(OriginRealTimeSignalProcessor):
             index_updater.handle(sender, instance, **kwargs)
         except IndexForbiddenException:
             pass
+        else:
+            self.bump_search_index_generation(instance)
+
+    def handle_delete(self, sender, instance, **kwargs):
+        super().handle_delete(sender, instance, **kwargs)
+        self.bump_search_index_generation(instance)
+
+    @staticmethod
+    def bump_search_index_generation(instance):
+        """
+        Bump the search index generation if the instance is indexed, or is related to an indexed model.
+        """
+        model = instance.__class__
+        if model in registry._models or model in registry._related_models:  # pylint: disable=protected-access
+            bump_search_index_generation()
 
     @staticmethod
-    def build_index_updater():
+    def build_index_updater(update_index=None):
         """
         Build a chain of handlers.
 
         Each handler must either prevent a index from being updated, or
         pass it to another handler.
-        The last handler in the chain is updating the index.
+        The last handler in the chain is updating the index, with update_index if given.
 
         Implements pattern 'Chain of responsibilities.'
         """
-        market_handler = MarketableHandler()
-        draft_handler = DraftHandler()
+        market_handler = MarketableHandler(update_index)
+        draft_handler = DraftHandler(update_index)
         market_handler.set_next(draft_handler)
 
         return market_handler
+
+
+def get_document_updates(instance):
+    """
+    Returns the (document path, pk) pairs of the documents which registry.update and registry.update_related
+    would update after the instance was saved.
+    """
+    if not DEDConfig.autosync_enabled():
+        return set()
+
+    updates = set()
+    for document in registry.get_documents([instance.__class__]):
+        if not document.django.ignore_signals:
+            updates.add((get_document_path(document), instance.pk))
+
+    # pylint: disable=protected-access
+    for model in registry._related_models.get(instance.__class__, ()):
+        for document in registry.get_documents([model]):
+            if document.django.ignore_signals:
+                continue
+            related = document().get_instances_from_related(instance)
+            if related is None:
+                continue
+            if isinstance(related, models.Model):
+                related = [related]
+            updates.update((get_document_path(document), obj.pk) for obj in related)
+
+    return updates
+
+
+def update_documents(document_path, pks):
+    """
+    Prepare the documents of the objects with the given pks and index them with bulk requests.
+    """
+    document = get_document(document_path)()
+    # The document's queryset prefetches what preparing the documents needs, but the objects it leaves out
+    # must still be updated, as they were when indexes were updated on save
+    objects = list(document.get_queryset().filter(pk__in=pks))
+    missing = set(pks) - {obj.pk for obj in objects}
+    if missing:
+        manager = document.django.model._default_manager  # pylint: disable=protected-access
+        objects += list(manager.filter(pk__in=missing))
+
+    if objects:
+        document.update(objects)
+        bump_search_index_generation()
+
+
+class PendingDocumentUpdates:
+    """
+    Process wide buffer of the document updates deferred by DeferredSignalProcessor.
+
+    Updates are deduplicated and handed to update_search_documents tasks in batches of up to
+    ELASTICSEARCH_DSL_DEFERRED_BATCH_SIZE documents, as soon as that many are buffered or at the latest
+    ELASTICSEARCH_DSL_DEFERRED_FLUSH_INTERVAL seconds after the first of them was buffered. While
+    ELASTICSEARCH_DSL_DEFERRED_MAX_IN_FLIGHT batches are still being indexed, updates keep being buffered,
+    which coalesces repeated updates of the same documents rather than piling up more work for the cluster.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pks = defaultdict(set)
+        self.timer = None
+
+    def __len__(self):
+        return sum(len(pks) for pks in self.pks.values())
+
+    def add(self, updates):
+        with self.lock:
+            for document_path, pk in updates:
+                self.pks[document_path].add(pk)
+            full = len(self) >= settings.ELASTICSEARCH_DSL_DEFERRED_BATCH_SIZE
+            if not full:
+                self._start_timer()
+
+        if full:
+            self.flush()
+
+    def _start_timer(self):
+        if self.timer is None:
+            self.timer = threading.Timer(settings.ELASTICSEARCH_DSL_DEFERRED_FLUSH_INTERVAL, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush(self, force=False):
+        """
+        Hand the buffered updates to update_search_documents tasks.
+
+        Arguments:
+            force (bool): True to hand them over even if too many batches are in flight, e.g. at exit
+        """
+        # NOTE: Deferred to prevent a circular import:
+        # course_discovery.apps.course_metadata.tasks -> course_discovery.apps.course_metadata.search_indexes
+        # pylint: disable=import-outside-toplevel
+        from course_discovery.apps.course_metadata.tasks import update_search_documents
+
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.pks:
+                return
+            if not force and get_document_updates_in_flight() >= settings.ELASTICSEARCH_DSL_DEFERRED_MAX_IN_FLIGHT:
+                logger.info('Postponing %d search document updates until earlier batches are indexed.', len(self))
+                self._start_timer()
+                return
+            pending, self.pks = self.pks, defaultdict(set)
+
+        batch_size = settings.ELASTICSEARCH_DSL_DEFERRED_BATCH_SIZE
+        for document_path, pks in pending.items():
+            pks = sorted(pks)
+            for start in range(0, len(pks), batch_size):
+                cache.add(DOCUMENT_UPDATES_IN_FLIGHT_KEY, 0, DOCUMENT_UPDATES_IN_FLIGHT_TIMEOUT)
+                cache.incr(DOCUMENT_UPDATES_IN_FLIGHT_KEY)
+                update_search_documents.delay(document_path, pks[start:start + batch_size])
+
+
+def get_document_updates_in_flight():
+    return cache.get(DOCUMENT_UPDATES_IN_FLIGHT_KEY, 0)
+
+
+def finish_document_updates():
+    """
+    Record that a batch of document updates has been indexed.
+    """
+    try:
+        cache.decr(DOCUMENT_UPDATES_IN_FLIGHT_KEY)
+    except ValueError:
+        # The counter timed out while the batch was being indexed
+        pass
+
+
+pending_document_updates = PendingDocumentUpdates()
+# Processes such as management commands must not exit with updates left in the buffer
+atexit.register(pending_document_updates.flush, force=True)
+
+
+class DeferredSignalProcessor(RealTimeSignalProcessor):
+    """
+    Custom signal processor which keeps es indexes fresh asynchronously.
+
+    Rather than updating the documents of a saved object and of its related objects on the spot, it applies the same
+    business logic as RealTimeSignalProcessor, then buffers the updates once the transaction commits, so that they
+    are deduplicated and indexed in batches by Celery workers, see PendingDocumentUpdates. Deletions are still
+    applied immediately.
+    """
+
+    def handle_save(self, sender, instance, **kwargs):
+        index_updater = self.build_index_updater(update_index=self.defer_update)
+        try:
+            index_updater.handle(sender, instance, **kwargs)
+        except IndexForbiddenException:
+            pass
+
+    @staticmethod
+    def defer_update(instance):
+        updates = get_document_updates(instance)
+        if updates:
+            transaction.on_commit(lambda: pending_document_updates.add(updates))
@@ -0,0 +1,48 @@
+import ddt
+from django.test import TestCase
+from waffle.testutils import override_switch
+
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument
+from course_discovery.apps.course_metadata.search_indexes.documents.common import filter_visible_runs
+from course_discovery.apps.course_metadata.tests.factories import (
+    CourseFactory, CourseRunFactory, CourseRunTypeFactory, SeatFactory
+)
+
+VISIBLE_RUNS_PREPARE_METHODS = (
+    'prepare_availability', 'prepare_course_runs', 'prepare_end', 'prepare_enrollment_end',
+    'prepare_enrollment_start', 'prepare_languages', 'prepare_org', 'prepare_seat_types', 'prepare_start',
+    'prepare_status',
+)
+
+
+@ddt.ddt
+class CourseDocumentTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.courses = CourseFactory.create_batch(3)
+        for course in self.courses:
+            for __ in range(2):
+                SeatFactory(course_run=CourseRunFactory(course=course))
+            CourseRunFactory(course=course, type=CourseRunTypeFactory(is_marketable=False))
+
+    @ddt.data(True, False)
+    def test_visible_runs(self, check_draft):
+        """ Verify that the visible runs computed in memory match those of filter_visible_runs. """
+        with override_switch('elasticsearch-course-draft-filter-visible-runs-check', check_draft):
+            for course in CourseDocument().get_queryset():
+                expected = list(filter_visible_runs(course.course_runs).order_by('pk'))
+                assert sorted(CourseDocument().get_visible_runs(course), key=lambda run: run.pk) == expected
+                assert len(expected) == 2
+
+    def test_prepare_query_count(self):
+        """ Verify that the course run fields of prefetched courses are prepared without querying the database. """
+        document = CourseDocument()
+        courses = list(document.get_queryset())
+        # Warm up the waffle switch cache
+        document.prepare_course_runs(courses[0])
+
+        document = CourseDocument()
+        with self.assertNumQueries(0):
+            for course in courses:
+                for method in VISIBLE_RUNS_PREPARE_METHODS:
+                    getattr(document, method)(course)
@@ -0,0 +1,95 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from course_discovery.apps.core.utils import get_document_path
+from course_discovery.apps.course_metadata.models import DataLoaderRecordHash
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseRunDocument
+from course_discovery.apps.course_metadata.search_indexes.signals import (
+    DOCUMENT_UPDATES_IN_FLIGHT_KEY, DeferredSignalProcessor, PendingDocumentUpdates, RealTimeSignalProcessor,
+    get_document_updates
+)
+from course_discovery.apps.course_metadata.tests.factories import CourseRunFactory
+
+COURSE_RUN_DOCUMENT = get_document_path(CourseRunDocument)
+
+
+@override_settings(
+    ELASTICSEARCH_DSL_DEFERRED_BATCH_SIZE=3,
+    ELASTICSEARCH_DSL_DEFERRED_FLUSH_INTERVAL=60,
+    ELASTICSEARCH_DSL_DEFERRED_MAX_IN_FLIGHT=1,
+)
+class PendingDocumentUpdatesTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.pending = PendingDocumentUpdates()
+        patch = mock.patch('course_discovery.apps.course_metadata.tasks.update_search_documents')
+        self.mock_task = patch.start()
+        self.addCleanup(patch.stop)
+        self.addCleanup(self.pending.flush, force=True)
+
+    def test_updates_are_deduplicated(self):
+        """ Verify that buffered updates of the same document are handed over once, when the buffer is flushed. """
+        self.pending.add({(COURSE_RUN_DOCUMENT, 1)})
+        self.pending.add({(COURSE_RUN_DOCUMENT, 1), (COURSE_RUN_DOCUMENT, 2)})
+        self.mock_task.delay.assert_not_called()
+        assert self.pending.timer is not None
+
+        self.pending.flush()
+        self.mock_task.delay.assert_called_once_with(COURSE_RUN_DOCUMENT, [1, 2])
+        assert self.pending.timer is None
+
+    def test_full_buffer_is_flushed(self):
+        self.pending.add({(COURSE_RUN_DOCUMENT, pk) for pk in range(3)})
+        self.mock_task.delay.assert_called_once_with(COURSE_RUN_DOCUMENT, [0, 1, 2])
+
+    def test_backpressure(self):
+        """ Verify that updates keep being buffered while too many batches are being indexed. """
+        cache.set(DOCUMENT_UPDATES_IN_FLIGHT_KEY, 1)
+        self.pending.add({(COURSE_RUN_DOCUMENT, pk) for pk in range(3)})
+        self.pending.add({(COURSE_RUN_DOCUMENT, 3)})
+        self.mock_task.delay.assert_not_called()
+        assert len(self.pending) == 4
+
+        cache.set(DOCUMENT_UPDATES_IN_FLIGHT_KEY, 0)
+        self.pending.flush()
+        assert self.mock_task.delay.call_args_list == [
+            mock.call(COURSE_RUN_DOCUMENT, [0, 1, 2]), mock.call(COURSE_RUN_DOCUMENT, [3]),
+        ]
+        assert cache.get(DOCUMENT_UPDATES_IN_FLIGHT_KEY) == 2
+
+
+class DeferredSignalProcessorTests(TestCase):
+    def test_updates_are_deferred_until_commit(self):
+        """ Verify that saves only buffer the updates of their documents, once their transaction commits. """
+        course_run = CourseRunFactory(draft=False)
+        # Skip connecting the processor to the model signals
+        processor = DeferredSignalProcessor.__new__(DeferredSignalProcessor)
+
+        with mock.patch(
+            'course_discovery.apps.course_metadata.search_indexes.signals.pending_document_updates'
+        ) as mock_pending, mock.patch(
+            'course_discovery.apps.course_metadata.search_indexes.signals.registry.update'
+        ) as mock_update:
+            with self.captureOnCommitCallbacks(execute=True):
+                processor.handle_save(course_run.__class__, course_run)
+                mock_pending.add.assert_not_called()
+
+            mock_update.assert_not_called()
+            mock_pending.add.assert_called_once_with(get_document_updates(course_run))
+        assert (COURSE_RUN_DOCUMENT, course_run.pk) in get_document_updates(course_run)
+
+
+class RealTimeSignalProcessorTests(TestCase):
+    def test_search_index_generation_is_bumped_for_indexed_models(self):
+        """ Verify that only changes of the indexed models and of their related models bump the generation. """
+        with mock.patch(
+            'course_discovery.apps.course_metadata.search_indexes.signals.bump_search_index_generation'
+        ) as mock_bump:
+            RealTimeSignalProcessor.bump_search_index_generation(DataLoaderRecordHash())
+            mock_bump.assert_not_called()
+
+            RealTimeSignalProcessor.bump_search_index_generation(CourseRunFactory.build())
+            mock_bump.assert_called_once_with()
@@ -20,14 +20,16 @@ from course_discovery.apps.course_metadata.constants import MASTERS_PROGRAM_TYPE
 from course_discovery.apps.course_metadata.data_loaders.api import CoursesApiDataLoader
 from course_discovery.apps.course_metadata.models import (
     AdditionalMetadata, CertificateInfo, Course, CourseEditor, CourseEntitlement, CourseLocationRestriction, CourseRun,
-    Curriculum, CurriculumCourseMembership, CurriculumProgramMembership, Fact, GeoLocation, Organization, ProductMeta,
-    ProductValue, Program, Seat, TaxiForm
+    Curriculum, CurriculumCourseMembership, CurriculumProgramMembership, DataLoaderCheckpoint, DataLoaderRecordHash,
+    Fact, GeoLocation, Organization, OutboxMessage, ProductMeta, ProductValue, Program, ProgramSummary,
+    RestrictedCourseRun, Seat, SubjectTranslation, TaxiForm
 )
 from course_discovery.apps.course_metadata.publishers import ProgramMarketingSitePublisher
 from course_discovery.apps.course_metadata.salesforce import (
     populate_official_with_existing_draft, requires_salesforce_update
 )
 from course_discovery.apps.course_metadata.tasks import update_org_program_and_courses_ent_sub_inclusion
+from course_discovery.apps.course_metadata.toggles import IS_PROGRAM_SUMMARY_ENABLED, IS_SIDE_EFFECT_OUTBOX_ENABLED
 from course_discovery.apps.course_metadata.utils import data_modified_timestamp_update, get_salesforce_util
 
 logger = logging.getLogger(__name__)
@@ -102,6 +104,10 @@ def _find_in_programs(existing_programs, target_curriculum=None, target_program=
     return _find_in_programs(child_programs, target_curriculum=target_curriculum, target_program=target_program)
 
 
+# Bookkeeping models which aren't exposed by the API, and are written too often to invalidate its cache
+API_CACHE_IGNORED_MODELS = (DataLoaderCheckpoint, DataLoaderRecordHash, OutboxMessage)
+
+
 def connect_api_change_receiver():
     """
     Invalidate API cache when any model in the course_metadata app is saved or
@@ -110,6 +116,8 @@ def connect_api_change_receiver():
     of the API while providing closer-to-optimal cache TTLs.
     """
     for model in apps.get_app_config('course_metadata').get_models():
+        if model in API_CACHE_IGNORED_MODELS:
+            continue
         for signal in (post_save, post_delete):
             signal.connect(api_change_receiver, sender=model)
 
@@ -184,6 +192,14 @@ def ensure_external_key_uniqueness__curriculum(sender, instance, **kwargs):  # p
 @receiver(post_save, sender=Organization)
 def update_or_create_salesforce_organization(instance, created, **kwargs):
     partner = instance.partner
+    if IS_SIDE_EFFECT_OUTBOX_ENABLED.is_enabled():
+        if hasattr(partner, 'salesforce'):
+            update = not created and requires_salesforce_update('organization', instance)
+            OutboxMessage.enqueue(
+                OutboxMessage.SALESFORCE, 'salesforce_organization', instance, {'update': True} if update else None
+            )
+        return
+
     util = get_salesforce_util(partner)
     if util:
         if not instance.salesforce_id:
@@ -203,6 +219,14 @@ def update_enterprise_inclusion_for_courses_and_programs(instance, created, **kw
 @receiver(post_save, sender=Course)
 def update_or_create_salesforce_course(instance, created, **kwargs):
     partner = instance.partner
+    if IS_SIDE_EFFECT_OUTBOX_ENABLED.is_enabled():
+        if hasattr(partner, 'salesforce') and not created and not instance.draft:
+            update = requires_salesforce_update('course', instance)
+            OutboxMessage.enqueue(
+                OutboxMessage.SALESFORCE, 'salesforce_course', instance, {'update': True} if update else None
+            )
+        return
+
     util = get_salesforce_util(partner)
     # Only bother to create the course if there's a util, and the auth orgs are already set up
     if util and instance.authoring_organizations.first():
@@ -222,6 +246,11 @@ def authoring_organizations_changed(sender, instance, action, **kwargs):  # pyli
     # Only do this after an auth org has been added, the salesforce_id isn't set and it's a draft (new)
     if action == 'post_add' and not instance.salesforce_id and instance.draft:
         partner = instance.partner
+        if IS_SIDE_EFFECT_OUTBOX_ENABLED.is_enabled():
+            if hasattr(partner, 'salesforce'):
+                OutboxMessage.enqueue(OutboxMessage.SALESFORCE, 'salesforce_course', instance)
+            return
+
         util = get_salesforce_util(partner)
         if util:
             util.create_course(instance)
@@ -234,6 +263,14 @@ def update_or_create_salesforce_course_run(instance, created, **kwargs):
     except (Course.DoesNotExist, Partner.DoesNotExist):
         # exit early in the unusual event that we can't look up the appropriate partner
         return
+    if IS_SIDE_EFFECT_OUTBOX_ENABLED.is_enabled():
+        if hasattr(partner, 'salesforce') and (instance.draft or not created):
+            update = not instance.draft and requires_salesforce_update('course_run', instance)
+            OutboxMessage.enqueue(
+                OutboxMessage.SALESFORCE, 'salesforce_course_run', instance, {'update': True} if update else None
+            )
+        return
+
     util = get_salesforce_util(partner)
     if util:
         if instance.draft:
@@ -601,4 +638,85 @@ def handle_organization_group_removal(sender, instance, action, pk_set, reverse,
             )
 
 
+# A deleted course's program memberships are gone by post_delete, the refresh is scheduled before they are deleted
+@receiver([post_save, pre_delete], sender=Course)
+@receiver([post_save, post_delete], sender=CourseRun)
+@receiver([post_save, post_delete], sender=CourseEntitlement)
+@receiver([post_save, post_delete], sender=Seat)
+@receiver([post_save, post_delete], sender=RestrictedCourseRun)
+def refresh_program_summaries_of_course(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Refresh the summaries of the programs including the course of the changed object.
+    """
+    # Programs only include official courses
+    if not IS_PROGRAM_SUMMARY_ENABLED.is_enabled() or instance.draft:
+        return
+
+    if isinstance(instance, Course):
+        programs = Program.objects.filter(courses=instance.pk)
+    elif isinstance(instance, (CourseRun, CourseEntitlement)):
+        programs = Program.objects.filter(courses=instance.course_id)
+    else:
+        programs = Program.objects.filter(courses__course_runs=instance.course_run_id)
+    ProgramSummary.refresh_on_commit(programs.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=Program)
+def refresh_program_summary(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    ProgramSummary.refresh_on_commit([instance.pk])
+
+
+@receiver(post_save, sender=SubjectTranslation)
+def refresh_program_summaries_of_subject(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Refresh the summaries of the programs including a course of the renamed subject.
+    """
+    if not IS_PROGRAM_SUMMARY_ENABLED.is_enabled():
+        return
+
+    programs = Program.objects.filter(courses__subjects=instance.master_id)
+    ProgramSummary.refresh_on_commit(programs.values_list('pk', flat=True))
+
+
+# Lookups of the programs affected by reverse changes to the relations summaries depend on: the first one finds
+# the programs related to the changed instance, the second one the programs related to the objects in pk_set.
+PROGRAM_SUMMARY_REVERSE_LOOKUPS = {
+    Program.courses.through: ('courses', 'pk'),
+    Program.excluded_course_runs.through: ('excluded_course_runs', 'pk'),
+    Course.subjects.through: ('courses__subjects', 'courses'),
+    CourseRun.staff.through: ('courses__course_runs__staff', 'courses__course_runs'),
+}
+
+
+@receiver(m2m_changed, sender=Program.courses.through)
+@receiver(m2m_changed, sender=Program.excluded_course_runs.through)
+@receiver(m2m_changed, sender=Course.subjects.through)
+@receiver(m2m_changed, sender=CourseRun.staff.through)
+def program_summary_relations_changed(sender, instance, action, pk_set, reverse, **kwargs):  # pylint: disable=unused-argument
+    """
+    Refresh the summaries of the programs whose relations changed, either directly or through their courses
+    and course runs.
+    """
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            if isinstance(instance, Program):
+                refresh_program_summary(sender, instance)
+            else:
+                refresh_program_summaries_of_course(sender, instance)
+        return
+
+    if not IS_PROGRAM_SUMMARY_ENABLED.is_enabled():
+        return
+
+    instance_lookup, pk_set_lookup = PROGRAM_SUMMARY_REVERSE_LOOKUPS[sender]
+    if action == 'pre_clear':
+        # pk_set isn't sent when clearing, the cleared relations must be looked up before they are deleted
+        programs = Program.objects.filter(**{instance_lookup: instance.pk})
+    elif action in ('post_add', 'post_remove'):
+        programs = Program.objects.filter(**{f'{pk_set_lookup}__in': pk_set})
+    else:
+        return
+    ProgramSummary.refresh_on_commit(programs.values_list('pk', flat=True))
+
+
 connect_course_data_modified_timestamp_related_models()
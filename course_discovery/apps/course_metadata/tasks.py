@@ -5,7 +5,9 @@ import logging
 
 from celery import shared_task
 
-from course_discovery.apps.course_metadata.models import Course, CourseType, Program, ProgramType
+from course_discovery.apps.course_metadata.models import Course, CourseType, Program, ProgramSummary, ProgramType
+from course_discovery.apps.course_metadata.outbox import deliver_messages
+from course_discovery.apps.course_metadata.search_indexes.signals import finish_document_updates, update_documents
 
 LOGGER = logging.getLogger(__name__)
 
@@ -50,3 +52,40 @@ def update_org_program_and_courses_ent_sub_inclusion(org_pk, org_sub_inclusion):
     LOGGER.info(sub_tag_log, org_pk, len(programs), 'programs')
     for program in programs:
         program.save()
+
+
+@shared_task()
+def deliver_outbox_messages(target):
+    """
+    Task to deliver the due outbox messages of a target, e.g. the marketing site. Schedules itself again
+    if some deliveries failed and are due to be retried.
+    Arguments:
+        target (str): target of the messages to deliver, one of OutboxMessage.TARGET_CHOICES
+    """
+    retry_in = deliver_messages(target)
+    if retry_in is not None:
+        deliver_outbox_messages.apply_async((target,), countdown=retry_in)
+
+
+@shared_task()
+def update_search_documents(document_path, pks):
+    """
+    Task to index a batch of search documents, whose updates were deferred by DeferredSignalProcessor.
+    Arguments:
+        document_path (str): dotted path of the document class
+        pks (list): primary keys of the objects whose documents are updated
+    """
+    try:
+        update_documents(document_path, pks)
+    finally:
+        finish_document_updates()
+
+
+@shared_task()
+def refresh_program_summaries(program_ids):
+    """
+    Task to recompute the summaries of programs whose courses, course runs, seats or entitlements changed.
+    Arguments:
+        program_ids (list): primary keys of the programs
+    """
+    ProgramSummary.refresh(program_ids)
@@ -754,6 +754,14 @@ class ProgramFactory(ProgramBaseFactory):
     status = ProgramStatus.Active
 
 
+class ProgramSummaryFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = ProgramSummary
+
+    program = factory.SubFactory(ProgramFactory)
+    includes_restricted_runs = True
+
+
 class ProgramSubscriptionFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = ProgramSubscription
@@ -50,6 +50,32 @@ class GspreadClientTests(TestCase):
         mock_get_worksheet_data_by_tab_id.assert_called_once_with(mock_spreadsheet, 'input_tab_id')
         self.assertEqual(result, mock_worksheet_data)
 
+    @mock.patch('course_discovery.apps.course_metadata.gspread_client.GspreadClient.get_spread_sheet_by_key')
+    @mock.patch('course_discovery.apps.course_metadata.gspread_client.GspreadClient.get_worksheet_by_tab_id')
+    @mock.patch('course_discovery.apps.course_metadata.gspread_client.gspread.service_account_from_dict')
+    def test_iter_data(self, _mock_gspread_connection, mock_get_worksheet_by_tab_id, _mock_get_spread_sheet_by_key):
+        """
+        Test that iter_data fetches the records of the input tab page by page
+        """
+        worksheet = mock_get_worksheet_by_tab_id.return_value
+        worksheet.row_count = 1000
+        worksheet.row_values.return_value = ['Title', 'Price']
+        worksheet.get.side_effect = [[['Course 1', '100'], ['Course 2']], [['Course 3', '300']], []]
+
+        client = GspreadClient()
+        client.READ_PAGE_SIZE = 2
+        records = client.iter_data({'SHEET_ID': 'sheet_id', 'INPUT_TAB_ID': 'input_tab_id'})
+        worksheet.get.assert_not_called()
+
+        self.assertEqual(list(records), [
+            {'Title': 'Course 1', 'Price': 100},
+            {'Title': 'Course 2', 'Price': ''},
+            {'Title': 'Course 3', 'Price': 300},
+        ])
+        self.assertEqual(worksheet.get.call_args_list, [
+            mock.call('2:3', pad_values=True), mock.call('4:5', pad_values=True), mock.call('6:7', pad_values=True),
+        ])
+
     @mock.patch(
         "course_discovery.apps.course_metadata.gspread_client.ascii_uppercase",
         new=list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"),
@@ -16,8 +16,9 @@ from dateutil.relativedelta import relativedelta
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.management import call_command
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connection, transaction
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from edx_django_utils.cache import RequestCache
 from edx_toggles.toggles.testutils import override_waffle_switch
 from freezegun import freeze_time
@@ -39,7 +40,8 @@ from course_discovery.apps.course_metadata.models import (
     FAQ, AbstractHeadingBlurbModel, AbstractMediaModel, AbstractNamedModel, AbstractTitleDescriptionModel,
     AbstractValueModel, CorporateEndorsement, Course, CourseEditor, CourseRun, CourseRunType, CourseType, Curriculum,
     CurriculumCourseMembership, CurriculumCourseRunExclusion, CurriculumProgramMembership, DegreeCost, DegreeDeadline,
-    Endorsement, Organization, OrganizationMapping, Program, ProgramType, Ranking, Seat, SeatType, Subject, Topic
+    Endorsement, Organization, OrganizationMapping, Program, ProgramSummary, ProgramType, Ranking, Seat, SeatType,
+    Subject, Topic
 )
 from course_discovery.apps.course_metadata.publishers import (
     CourseRunMarketingSitePublisher, ProgramMarketingSitePublisher
@@ -50,7 +52,8 @@ from course_discovery.apps.course_metadata.signals import (
 from course_discovery.apps.course_metadata.tests import factories
 from course_discovery.apps.course_metadata.tests.factories import (
     AdditionalMetadataFactory, CourseFactory, CourseRunFactory, CourseTypeFactory, CourseUrlSlugFactory, ImageFactory,
-    OrganizationFactory, PartnerFactory, ProgramFactory, SeatFactory, SeatTypeFactory, SourceFactory, SubjectFactory
+    OrganizationFactory, PartnerFactory, ProgramFactory, ProgramTypeFactory, RestrictedCourseRunFactory, SeatFactory,
+    SeatTypeFactory, SourceFactory, SubjectFactory
 )
 from course_discovery.apps.course_metadata.tests.mixins import MarketingSitePublisherTestMixin
 from course_discovery.apps.course_metadata.toggles import (
@@ -93,6 +96,13 @@ class TestCourse(TestCase):
         expected = set(factories.CourseFactory.create_batch(3))
         assert set(Course.search('*')) == expected
 
+    @override_settings(ELASTICSEARCH_DSL_PK_CHUNK_SIZE=2)
+    def test_search_pages_through_matches(self):
+        """ Verify that search resolves every match, regardless of how many fit in a single request. """
+        title = 'Some paged title'
+        expected = set(factories.CourseFactory.create_batch(5, title=title))
+        assert set(Course.search('title:' + title)) == expected
+
     def test_image_url(self):
         course = factories.CourseFactory()
         assert course.image_url == course.image.small.url
@@ -1226,6 +1236,25 @@ class CourseRunTests(OAuth2Mixin, TestCase):
         course_run3.save()
         assert course_run3.enterprise_subscription_inclusion is False
 
+    def test_save_updates_changed_fields_only(self):
+        """ Verify that saving an existing course run writes its row once, with the fields which changed only. """
+        course_run = CourseRun.everything.get(pk=self.course_run.pk)
+        CourseRun.everything.filter(pk=course_run.pk).update(title_override='Changed elsewhere')
+        course_run.max_effort = 42
+
+        with CaptureQueriesContext(connection) as queries:
+            course_run.save()
+
+        updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+        updates = [sql for sql in updates if 'course_metadata_courserun"' in sql.split(' SET ')[0]]
+        assert len(updates) == 1
+        assert '"max_effort"' in updates[0]
+        assert '"title_override"' not in updates[0]
+
+        course_run.refresh_from_db()
+        assert course_run.max_effort == 42
+        assert course_run.title_override == 'Changed elsewhere'
+
     @ddt.data(
         # Case 1: Return False when there are no paid Seats.
         ([('audit', 0)], False),
@@ -3645,6 +3674,98 @@ class ProgramTests(TestCase):
         self.assertEqual(program.active_languages, expected_languages)
 
 
+@override_switch('course_metadata.enable_program_summaries', True)
+class ProgramSummaryTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        currency = Currency.objects.get(code='USD')
+        verified_seat_type = SeatTypeFactory.verified()
+        self.course_run = CourseRunFactory(weeks_to_complete=3, language=LanguageTag.objects.get(code='en'))
+        course = self.course_run.course
+        course.canonical_course_run = self.course_run
+        course.save()
+        SeatFactory(type=verified_seat_type, currency=currency, course_run=self.course_run, price=100)
+
+        restricted_run = CourseRunFactory(course=course, language=LanguageTag.objects.get(code='es'))
+        SeatFactory(type=verified_seat_type, currency=currency, course_run=restricted_run, price=150)
+        RestrictedCourseRunFactory(course_run=restricted_run)
+
+        program_type = ProgramTypeFactory(applicable_seat_types=[verified_seat_type])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.program = ProgramFactory(type=program_type, courses=[course])
+
+    def assert_summary_matches(self, includes_restricted_runs):
+        summary = Program.objects.get(pk=self.program.pk).get_summary(includes_restricted_runs)
+        program = ProgramSummary.get_programs([self.program.pk], includes_restricted_runs).get()
+
+        assert summary.course_run_statuses == program.course_run_statuses
+        languages = sorted(program.languages, key=lambda language: language.code)
+        assert summary.language_codes == [language.code for language in languages]
+        assert summary.language_search_facets == [language.get_search_facet_display() for language in languages]
+        assert summary.seat_type_slugs == sorted(seat_type.slug for seat_type in program.seat_types)
+        assert summary.subject_uuids == [str(subject.uuid) for subject in program.subjects]
+        assert summary.subject_names == [subject.name for subject in program.subjects]
+        assert summary.price_ranges == program.price_ranges
+        assert summary.start == program.start
+        assert summary.weeks_to_complete_min == program.weeks_to_complete_min == 3
+        return summary
+
+    def test_summaries(self):
+        """ Verify that programs are summarized with and without their restricted course runs. """
+        assert self.assert_summary_matches(True).language_codes == ['en', 'es']
+        assert self.assert_summary_matches(False).language_codes == ['en']
+
+    def test_summaries_are_refreshed(self):
+        """ Verify that summaries are refreshed when the seats of the program's course runs change. """
+        seat = self.course_run.seats.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            seat.price = 200
+            seat.save()
+
+        assert self.assert_summary_matches(False).price_ranges[0]['max'] == Decimal('200.00')
+
+    def test_summaries_are_refreshed_on_subject_change(self):
+        """ Verify that summaries are refreshed when a subject of the program's courses is renamed. """
+        subject = SubjectFactory(name='Physics')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course_run.course.subjects.add(subject)
+        assert self.assert_summary_matches(True).subject_names == ['Physics']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            subject.name = 'Astrophysics'
+            subject.save()
+        assert self.assert_summary_matches(True).subject_names == ['Astrophysics']
+
+    def test_summaries_are_refreshed_on_reverse_relation_change(self):
+        """ Verify that summaries are refreshed when their relations are changed from the related side. """
+        subject = SubjectFactory(name='Physics')
+        with self.captureOnCommitCallbacks(execute=True):
+            subject.course_set.add(self.course_run.course)
+        assert self.assert_summary_matches(True).subject_names == ['Physics']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            subject.course_set.clear()
+        assert self.assert_summary_matches(True).subject_names == []
+
+        course = self.course_run.course
+        with self.captureOnCommitCallbacks(execute=True):
+            course.programs.remove(self.program)
+        assert Program.objects.get(pk=self.program.pk).get_summary().language_codes == []
+
+        with self.captureOnCommitCallbacks(execute=True):
+            course.programs.add(self.program)
+        assert self.assert_summary_matches(True).language_codes == ['en', 'es']
+
+    def test_summaries_are_refreshed_on_course_deletion(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course_run.course.delete()
+        assert Program.objects.get(pk=self.program.pk).get_summary().language_codes == []
+
+    def test_disabled(self):
+        with override_switch('course_metadata.enable_program_summaries', False):
+            assert self.program.get_summary() is None
+
+
 class ProgramSubscriptionTests(TestCase):
 
     def test_str(self):
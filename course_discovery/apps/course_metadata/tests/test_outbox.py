@@ -0,0 +1,148 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from waffle.testutils import override_switch
+
+from course_discovery.apps.core.tests.factories import SalesforceConfigurationFactory
+from course_discovery.apps.course_metadata.choices import CourseRunStatus
+from course_discovery.apps.course_metadata.models import CourseRun, OutboxMessage
+from course_discovery.apps.course_metadata.outbox import OUTBOX_ACTIONS, OUTBOX_SLOT_KEY_PREFIX, deliver_messages
+from course_discovery.apps.course_metadata.publishers import CourseRunMarketingSitePublisher
+from course_discovery.apps.course_metadata.tests.factories import CourseFactory, CourseRunFactory, OrganizationFactory
+
+OUTBOX_SWITCH = 'course_metadata.enable_side_effect_outbox'
+
+
+@override_settings(
+    SIDE_EFFECT_OUTBOX_MAX_ATTEMPTS=2,
+    SIDE_EFFECT_OUTBOX_RETRY_DELAY_SECONDS=30,
+)
+class OutboxTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.course_run = CourseRunFactory(draft=False)
+
+    def mock_delivery(self, **kwargs):
+        deliver = mock.Mock(**kwargs)
+        return deliver, mock.patch.dict(
+            OUTBOX_ACTIONS, {'publish_course_run': (CourseRun.everything, deliver)}
+        )
+
+    def test_enqueue_coalesces_messages(self):
+        """ Verify that queueing an action which is already queued for the same object keeps a single message. """
+        OutboxMessage.enqueue(OutboxMessage.MARKETING_SITE, 'publish_course_run', self.course_run, {'previous': None})
+        OutboxMessage.enqueue(OutboxMessage.MARKETING_SITE, 'publish_course_run', self.course_run, {
+            'previous': {'status': CourseRunStatus.Published}, 'update': True,
+        })
+
+        message = OutboxMessage.objects.get()
+        assert message.version == 2
+        assert message.payload == {'previous': None, 'update': True}
+
+    def test_messages_are_delivered_on_commit(self):
+        deliver, patch = self.mock_delivery()
+        with patch, self.captureOnCommitCallbacks(execute=True):
+            OutboxMessage.enqueue(OutboxMessage.MARKETING_SITE, 'publish_course_run', self.course_run)
+            deliver.assert_not_called()
+
+        deliver.assert_called_once_with(self.course_run, {})
+        assert not OutboxMessage.objects.exists()
+
+    def test_failed_deliveries_are_retried(self):
+        __, patch = self.mock_delivery(side_effect=Exception('Marketing site is down'))
+        OutboxMessage.enqueue(OutboxMessage.MARKETING_SITE, 'publish_course_run', self.course_run)
+
+        with patch:
+            assert deliver_messages(OutboxMessage.MARKETING_SITE) == 30
+
+            message = OutboxMessage.objects.get()
+            assert message.attempts == 1
+            assert message.available_at > timezone.now()
+            assert message.last_error == 'Marketing site is down'
+
+            OutboxMessage.objects.update(available_at=timezone.now())
+            assert deliver_messages(OutboxMessage.MARKETING_SITE) is None
+
+        message = OutboxMessage.objects.get()
+        assert message.attempts == 2
+        assert message.available_at is None
+
+    def test_messages_queued_during_delivery_are_delivered_again(self):
+        def enqueue_again(obj, payload):  # pylint: disable=unused-argument
+            if deliver.call_count == 1:
+                OutboxMessage.enqueue(OutboxMessage.MARKETING_SITE, 'publish_course_run', obj)
+
+        deliver, patch = self.mock_delivery()
+        deliver.side_effect = enqueue_again
+        OutboxMessage.enqueue(OutboxMessage.MARKETING_SITE, 'publish_course_run', self.course_run)
+
+        with patch:
+            deliver_messages(OutboxMessage.MARKETING_SITE)
+
+        assert deliver.call_count == 2
+        assert not OutboxMessage.objects.exists()
+
+    @override_settings(SIDE_EFFECT_OUTBOX_CONCURRENCY={OutboxMessage.MARKETING_SITE: 1})
+    def test_concurrency_limit(self):
+        """ Verify that messages aren't delivered while every delivery slot of their target is taken. """
+        deliver, patch = self.mock_delivery()
+        OutboxMessage.enqueue(OutboxMessage.MARKETING_SITE, 'publish_course_run', self.course_run)
+        cache.set(f'{OUTBOX_SLOT_KEY_PREFIX}.{OutboxMessage.MARKETING_SITE}.0', True)
+
+        with patch:
+            deliver_messages(OutboxMessage.MARKETING_SITE)
+            deliver.assert_not_called()
+
+            cache.clear()
+            deliver_messages(OutboxMessage.MARKETING_SITE)
+            deliver.assert_called_once()
+
+    @override_switch(OUTBOX_SWITCH, True)
+    @override_switch('publish_course_runs_to_marketing_site', True)
+    def test_course_run_marketing_site_publication(self):
+        """ Verify that course runs are published to the marketing site once the save commits. """
+        previous_status = self.course_run.status
+        with mock.patch.object(CourseRunMarketingSitePublisher, 'publish_obj') as mock_publish_obj:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.course_run.status = CourseRunStatus.Unpublished
+                self.course_run.save()
+                mock_publish_obj.assert_not_called()
+
+            assert mock_publish_obj.call_count == 1
+            assert mock_publish_obj.call_args[1]['previous_obj'].status == previous_status
+
+    @override_switch(OUTBOX_SWITCH, True)
+    def test_salesforce_organization(self):
+        salesforce_config = SalesforceConfigurationFactory()
+        with mock.patch('course_discovery.apps.course_metadata.utils.SalesforceUtil') as mock_salesforce_util:
+            with self.captureOnCommitCallbacks(execute=True):
+                organization = OrganizationFactory(partner=salesforce_config.partner)
+                mock_salesforce_util().create_publisher_organization.assert_not_called()
+
+            mock_salesforce_util().create_publisher_organization.assert_called_once_with(organization)
+            mock_salesforce_util().update_publisher_organization.assert_not_called()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                organization.name = 'changed'
+                organization.save()
+
+            mock_salesforce_util().update_publisher_organization.assert_called_once_with(organization)
+
+    def test_salesforce_draft_course_linked_before_delivery(self):
+        """ Verify that a draft course isn't created in Salesforce again if it was linked after being queued. """
+        salesforce_config = SalesforceConfigurationFactory()
+        with mock.patch('course_discovery.apps.course_metadata.utils.SalesforceUtil') as mock_salesforce_util:
+            course = CourseFactory(draft=True, partner=salesforce_config.partner)
+            course.authoring_organizations.add(OrganizationFactory(partner=salesforce_config.partner))
+            mock_salesforce_util.reset_mock()
+
+            OutboxMessage.enqueue(OutboxMessage.SALESFORCE, 'salesforce_course', course)
+            course.salesforce_id = 'SomeSalesforceId'
+            course.save()
+            deliver_messages(OutboxMessage.SALESFORCE)
+
+            mock_salesforce_util().create_course.assert_not_called()
+            assert not OutboxMessage.objects.exists()
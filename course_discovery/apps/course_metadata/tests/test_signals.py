@@ -26,10 +26,11 @@ from course_discovery.apps.course_metadata.choices import CourseRunStatus
 from course_discovery.apps.course_metadata.models import (
     AdditionalMetadata, BackfillCourseRunSlugsConfig, BackpopulateCourseTypeConfig, BulkModifyProgramHookConfig,
     BulkUpdateImagesConfig, BulkUploadTagsConfig, Course, CourseEditor, CourseRun, CSVDataLoaderConfiguration,
-    Curriculum, CurriculumProgramMembership, DataLoaderConfig, DeduplicateHistoryConfig, DeletePersonDupsConfig,
-    DrupalPublishUuidConfig, LevelTypeTranslation, MigrateCourseSlugConfiguration,
-    MigratePublisherToCourseMetadataConfig, ProductMeta, ProfileImageDownloadConfig, Program, ProgramTypeTranslation,
-    RemoveRedirectsConfig, SubjectTranslation, TagCourseUuidsConfig, TopicTranslation
+    Curriculum, CurriculumProgramMembership, DataLoaderCheckpoint, DataLoaderConfig, DataLoaderRecordHash,
+    DeduplicateHistoryConfig, DeletePersonDupsConfig, DrupalPublishUuidConfig, LevelTypeTranslation,
+    MigrateCourseSlugConfiguration, MigratePublisherToCourseMetadataConfig, OutboxMessage, ProductMeta,
+    ProfileImageDownloadConfig, Program, ProgramTypeTranslation, RemoveRedirectsConfig, SubjectTranslation,
+    TagCourseUuidsConfig, TopicTranslation
 )
 from course_discovery.apps.course_metadata.signals import (
     _duplicate_external_key_message, additional_metadata_facts_changed,
@@ -47,9 +48,10 @@ LOGGER_NAME = 'course_discovery.apps.course_metadata.signals'
 
 
 @pytest.mark.django_db
+@mock.patch('course_discovery.apps.api.cache.invalidate_cache_tags')
 @mock.patch('course_discovery.apps.api.cache.set_api_timestamp')
 class TestCacheInvalidation:
-    def test_model_change(self, mock_set_api_timestamp):
+    def test_model_change(self, mock_set_api_timestamp, mock_invalidate_cache_tags):
         """
         Verify that the API cache is invalidated after course_metadata models
         are saved or deleted.
@@ -66,8 +68,9 @@ class TestCacheInvalidation:
         # connecting to. We want to test each of them.
         for model in apps.get_app_config('course_metadata').get_models():
             # Ignore models that aren't exposed by the API or are only used for testing.
-            if model in [BackpopulateCourseTypeConfig, DataLoaderConfig, DeletePersonDupsConfig,
-                         DrupalPublishUuidConfig, MigratePublisherToCourseMetadataConfig, SubjectTranslation,
+            if model in [BackpopulateCourseTypeConfig, DataLoaderCheckpoint, DataLoaderConfig, DataLoaderRecordHash,
+                         DeletePersonDupsConfig, DrupalPublishUuidConfig, MigratePublisherToCourseMetadataConfig,
+                         OutboxMessage, SubjectTranslation,
                          TopicTranslation, ProfileImageDownloadConfig, TagCourseUuidsConfig, RemoveRedirectsConfig,
                          BulkModifyProgramHookConfig, BackfillCourseRunSlugsConfig, AlgoliaProxyCourse,
                          AlgoliaProxyProgram, AlgoliaProxyProduct, ProgramTypeTranslation,
@@ -85,13 +88,77 @@ class TestCacheInvalidation:
             # Verify that model creation and deletion invalidates the API cache.
             instance = factory()
 
-            assert mock_set_api_timestamp.called
+            assert mock_set_api_timestamp.called or mock_invalidate_cache_tags.called
             mock_set_api_timestamp.reset_mock()
+            mock_invalidate_cache_tags.reset_mock()
 
             instance.delete()
 
-            assert mock_set_api_timestamp.called
+            assert mock_set_api_timestamp.called or mock_invalidate_cache_tags.called
             mock_set_api_timestamp.reset_mock()
+            mock_invalidate_cache_tags.reset_mock()
+
+    def test_ignored_model_change(self, mock_set_api_timestamp, mock_invalidate_cache_tags):
+        """
+        Verify that the bookkeeping models don't invalidate the API cache.
+        """
+        partner = PartnerFactory()
+        instances = [
+            DataLoaderCheckpoint.objects.create(partner=partner, loader='loader'),
+            DataLoaderRecordHash.objects.create(
+                partner=partner, loader='loader', record_key='key', content_hash='hash'
+            ),
+            OutboxMessage.objects.create(target=OutboxMessage.MARKETING_SITE, action='action', object_id=1),
+        ]
+        for instance in instances:
+            instance.delete()
+
+        assert not mock_set_api_timestamp.called
+        assert not mock_invalidate_cache_tags.called
+
+    def test_targeted_invalidation(self, mock_set_api_timestamp, mock_invalidate_cache_tags):
+        """
+        Verify that seat changes only invalidate the cached responses of the affected course
+        and course run, and don't touch the global API timestamp.
+        """
+        seat = factories.SeatFactory()
+        mock_set_api_timestamp.reset_mock()
+        mock_invalidate_cache_tags.reset_mock()
+
+        seat.price = 10
+        seat.save()
+
+        course_run = seat.course_run
+        course = course_run.course
+        assert not mock_set_api_timestamp.called
+        tags = mock_invalidate_cache_tags.call_args[0][0]
+        assert f'course:{course.uuid}' in tags
+        assert f'course-list:{course.partner_id}' in tags
+        assert f'course_run:{course_run.key}' in tags
+        assert not any(tag.startswith('program') for tag in tags)
+
+        program = factories.ProgramFactory(courses=[course], partner=course.partner)
+        mock_invalidate_cache_tags.reset_mock()
+
+        seat.save()
+
+        tags = mock_invalidate_cache_tags.call_args[0][0]
+        assert f'program:{program.uuid}' in tags
+        assert f'program-list:{course.partner_id}' in tags
+
+    def test_program_summary_invalidation(self, mock_set_api_timestamp, mock_invalidate_cache_tags):
+        """
+        Verify that refreshed program summaries invalidate the cached responses of their program.
+        """
+        program = factories.ProgramFactory()
+        mock_set_api_timestamp.reset_mock()
+        mock_invalidate_cache_tags.reset_mock()
+
+        factories.ProgramSummaryFactory(program=program)
+
+        assert not mock_set_api_timestamp.called
+        tags = mock_invalidate_cache_tags.call_args[0][0]
+        assert tags == {f'program:{program.uuid}', f'program-list:{program.partner_id}'}
 
 
 @ddt.ddt
@@ -15,6 +15,8 @@ from django.test import TestCase
 from edx_django_utils.cache import RequestCache
 from edx_toggles.toggles.testutils import override_waffle_switch
 from slugify import slugify
+from taxonomy.choices import ProductTypes
+from taxonomy.utils import get_whitelisted_serialized_skills
 
 from course_discovery.apps.api.tests.mixins import SiteMixin
 from course_discovery.apps.api.v1.tests.test_views.mixins import OAuth2Mixin
@@ -32,9 +34,9 @@ from course_discovery.apps.course_metadata.models import (
 )
 from course_discovery.apps.course_metadata.tests.constants import MOCK_PRODUCTS_DATA
 from course_discovery.apps.course_metadata.tests.factories import (
-    CourseEditorFactory, CourseEntitlementFactory, CourseFactory, CourseRunFactory, CourseTypeFactory, ModeFactory,
-    OrganizationFactory, OrganizationMappingFactory, PartnerFactory, ProgramFactory, RestrictedCourseRunFactory,
-    SeatFactory, SeatTypeFactory, SourceFactory, SubjectFactory
+    CourseEditorFactory, CourseEntitlementFactory, CourseFactory, CourseRunFactory, CourseSkillsFactory,
+    CourseTypeFactory, ModeFactory, OrganizationFactory, OrganizationMappingFactory, PartnerFactory, ProgramFactory,
+    ProgramSkillFactory, RestrictedCourseRunFactory, SeatFactory, SeatTypeFactory, SourceFactory, SubjectFactory
 )
 from course_discovery.apps.course_metadata.tests.mixins import MarketingSiteAPIClientTestMixin
 from course_discovery.apps.course_metadata.toggles import (
@@ -43,8 +45,9 @@ from course_discovery.apps.course_metadata.toggles import (
 from course_discovery.apps.course_metadata.utils import (
     calculated_seat_upgrade_deadline, clean_html, convert_svg_to_png_from_url, create_missing_entitlement,
     download_and_save_course_image, download_and_save_program_image, ensure_draft_world, fetch_getsmarter_products,
-    is_google_drive_url, serialize_entitlement_for_ecommerce_api, serialize_seat_for_ecommerce_api,
-    transform_skills_data, validate_slug_format
+    get_product_skills, is_google_drive_url, preload_product_skills, product_skills_scope,
+    serialize_entitlement_for_ecommerce_api, serialize_seat_for_ecommerce_api, transform_skills_data,
+    validate_slug_format
 )
 
 
@@ -913,6 +916,48 @@ class UtilsTests(TestCase):
         assert key == org.key
 
 
+class ProductSkillsTests(TestCase):
+    @staticmethod
+    def sort_skills(skills):
+        return sorted(skills, key=lambda skill: skill['name'])
+
+    def test_preloaded_course_skills(self):
+        """ Verify that preloaded skills are loaded with a single query and match taxonomy's serialized skills. """
+        course_skills = CourseSkillsFactory.create_batch(2, course_key='edX+DemoX')
+        CourseSkillsFactory(course_key=course_skills[0].course_key, is_blacklisted=True)
+        CourseSkillsFactory(course_key='edX+OtherX')
+        keys = ['edX+DemoX', 'edX+OtherX', 'edX+NoSkillsX']
+        expected = {key: get_whitelisted_serialized_skills(key, product_type=ProductTypes.Course) for key in keys}
+
+        with product_skills_scope():
+            with self.assertNumQueries(1):
+                preload_product_skills(keys, ProductTypes.Course)
+            with self.assertNumQueries(0):
+                for key in keys:
+                    assert self.sort_skills(get_product_skills(key, ProductTypes.Course)) == \
+                        self.sort_skills(expected[key])
+
+    def test_preloaded_program_skills(self):
+        program_skill = ProgramSkillFactory()
+        expected = get_whitelisted_serialized_skills(program_skill.program_uuid, product_type=ProductTypes.Program)
+
+        with product_skills_scope():
+            preload_product_skills([program_skill.program_uuid], ProductTypes.Program)
+            with self.assertNumQueries(0):
+                assert get_product_skills(program_skill.program_uuid, ProductTypes.Program) == expected
+
+    def test_preload_outside_of_scope(self):
+        """ Verify that skills aren't kept outside of a product skills scope. """
+        course_skill = CourseSkillsFactory()
+        with product_skills_scope():
+            preload_product_skills([course_skill.course_key], ProductTypes.Course)
+
+        with mock.patch('course_discovery.apps.course_metadata.utils.get_whitelisted_serialized_skills') as mock_skills:
+            preload_product_skills([course_skill.course_key], ProductTypes.Course)
+            get_product_skills(course_skill.course_key, ProductTypes.Course)
+            mock_skills.assert_called_once_with(course_skill.course_key, product_type=ProductTypes.Course)
+
+
 class TestConvertSvgToPngFromUrl(TestCase):
     """Test Convert SVG to PNG"""
     @mock.patch('course_discovery.apps.course_metadata.utils.svg2png')
@@ -78,3 +78,43 @@ IS_COURSE_RUN_VARIANT_ID_EDITABLE = WaffleSwitch(
 IS_COURSE_RUN_VARIANT_ID_ECOMMERCE_CONSUMABLE = WaffleSwitch(
     'course_metadata.is_course_run_variant_id_ecommerce_consumable', __name__
 )
+# .. toggle_name: course_metadata.enable_side_effect_outbox
+# .. toggle_implementation: WaffleSwitch
+# .. toggle_default: False
+# .. toggle_description: Enable to queue the marketing site, Salesforce and ecommerce updates triggered by course,
+#     course run, program and organization saves in the outbox, to be delivered by Celery workers once the saving
+#     transaction commits, instead of calling those services while saving.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-18
+# .. toggle_target_removal_date: None
+# .. toggle_tickets: None
+IS_SIDE_EFFECT_OUTBOX_ENABLED = WaffleSwitch(
+    'course_metadata.enable_side_effect_outbox', __name__
+)
+# .. toggle_name: course_metadata.enable_program_summaries
+# .. toggle_implementation: WaffleSwitch
+# .. toggle_default: False
+# .. toggle_description: Enable to keep the ProgramSummary aggregates of programs up to date as their courses, course
+#     runs, seats and entitlements change, and to read those aggregates in the program serializers and search indexes
+#     instead of computing them from the program's courses. Run refresh_program_summaries after enabling it.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-18
+# .. toggle_target_removal_date: None
+# .. toggle_tickets: None
+IS_PROGRAM_SUMMARY_ENABLED = WaffleSwitch(
+    'course_metadata.enable_program_summaries', __name__
+)
+# .. toggle_name: course_metadata.enable_index_only_search_results
+# .. toggle_implementation: WaffleSwitch
+# .. toggle_default: False
+# .. toggle_description: Enable to render the results of the course, course run, program and aggregated search list
+#     endpoints from the fields stored in the search indexes alone, instead of loading the objects of each page of
+#     results from the database. Results requested with detail_fields and detail views still load their objects.
+#     Rebuild the course index before enabling it.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-18
+# .. toggle_target_removal_date: None
+# .. toggle_tickets: None
+IS_INDEX_ONLY_SEARCH_ENABLED = WaffleSwitch(
+    'course_metadata.enable_index_only_search_results', __name__
+)
@@ -1,9 +1,12 @@
 import datetime
+import functools
 import logging
 import random
 import re
 import string
+import threading
 import uuid
+from contextlib import contextmanager
 from tempfile import NamedTemporaryFile
 from urllib.parse import urljoin, urlparse
 
@@ -24,6 +27,8 @@ from edx_django_utils.cache import RequestCache, get_cache_key
 from getsmarter_api_clients.geag import GetSmarterEnterpriseApiClient
 from slugify import slugify
 from stdimage.models import StdImageFieldFile
+from taxonomy.choices import ProductTypes
+from taxonomy.models import CourseSkills, ProgramSkill
 from taxonomy.utils import get_whitelisted_serialized_skills
 
 from course_discovery.apps.core.models import SalesforceConfiguration
@@ -45,6 +50,12 @@ from course_discovery.apps.publisher.utils import VALID_CHARS_IN_COURSE_NUM_AND_
 
 logger = logging.getLogger(__name__)
 
+# Whitelisted skills loaded by preload_product_skills, while a product_skills_scope is active
+_product_skills = threading.local()
+# Callable the calls made with call_external_service are passed to, while a defer_external_calls block is active
+_external_calls = threading.local()
+PRODUCT_SKILLS_BATCH_SIZE = 1000
+
 RESERVED_ELASTICSEARCH_QUERY_OPERATORS = ('AND', 'OR', 'NOT', 'TO',)
 
 
@@ -814,28 +825,39 @@ def get_file_from_drive_link(image_url):
     return content_type, content
 
 
-def download_and_save_course_image(course, image_url, data_field='image', headers=None):
+def download_course_image(course_key, image_url, headers=None):
     """
-    Helper method to download an image from a provided image url and save it
-    in the data field mentioned, defaulting to course card image.
+    Helper method to download the image of a course from a provided image url.
+
+    Returns:
+        tuple: content type and content of the image, or None if the download failed.
     """
     try:
         if is_google_drive_url(image_url):
-            content_type, content = get_file_from_drive_link(image_url)
-            extension = IMAGE_TYPES.get(content_type)
-        else:
-            response = requests.get(image_url, headers=headers)  # pylint: disable=missing-timeout
+            return get_file_from_drive_link(image_url)
 
-            if response.status_code == requests.codes.ok:  # pylint: disable=no-member
-                content_type = response.headers['Content-Type'].lower()
-                extension = IMAGE_TYPES.get(content_type)
-                content = response.content
+        response = requests.get(image_url, headers=headers)  # pylint: disable=missing-timeout
+        if response.status_code == requests.codes.ok:  # pylint: disable=no-member
+            return response.headers['Content-Type'].lower(), response.content
 
-            else:
-                msg = 'Failed to download image for course [%s] from [%s]! Response was [%d]:\n%s'
-                logger.error(msg, course.key, image_url, response.status_code, response.content)
-                return False
+        msg = 'Failed to download image for course [%s] from [%s]! Response was [%d]:\n%s'
+        logger.error(msg, course_key, image_url, response.status_code, response.content)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception('An unknown exception occurred while downloading image for course [%s]', course_key)
+    return None
 
+
+def save_course_image(course, image_url, image, data_field='image'):
+    """
+    Helper method to save an image downloaded by download_course_image from the provided image url
+    in the data field mentioned, defaulting to course card image.
+    """
+    if image is None:
+        return False
+
+    content_type, content = image
+    extension = IMAGE_TYPES.get(content_type)
+    try:
         if extension:
             filename = '{uuid}.{extension}'.format(uuid=str(course.uuid), extension=extension)
             # TODO: Get field from _meta.get_field. Tried that approach initially but was getting
@@ -846,7 +868,7 @@ def download_and_save_course_image(course, image_url, data_field='image', header
                 image_file = ContentFile(content)
                 if extension == 'svg':
                     filename = '{uuid}.png'.format(uuid=str(course.uuid))
-                    image_file = convert_svg_to_png_from_url(image_url)
+                    image_file = convert_svg_to_png_from_url(image_url, content)
                 if image_file:
                     course.organization_logo_override.save(filename, image_file)
                 else:
@@ -863,14 +885,27 @@ def download_and_save_course_image(course, image_url, data_field='image', header
     return False
 
 
-def convert_svg_to_png_from_url(image_url):
+def download_and_save_course_image(course, image_url, data_field='image', headers=None):
+    """
+    Helper method to download an image from a provided image url and save it
+    in the data field mentioned, defaulting to course card image.
+    """
+    image = download_course_image(course.key, image_url, headers=headers)
+    return save_course_image(course, image_url, image, data_field)
+
+
+def convert_svg_to_png_from_url(image_url, content=None):
     """
     Given an image file url of svg, it will convert that svg image to png
-    and save in temporary file
+    and save in temporary file. The content of the svg image is converted
+    rather than downloaded again if it is given.
     """
     try:
         temp_file = NamedTemporaryFile()  # lint-amnesty, pylint: disable=consider-using-with
-        svg2png(url=image_url, write_to=temp_file.name)
+        if content:
+            svg2png(bytestring=content, url=image_url, write_to=temp_file.name)
+        else:
+            svg2png(url=image_url, write_to=temp_file.name)
         temp_file.seek(0)
         return temp_file
     except Exception:  # pylint: disable=broad-except
@@ -1243,11 +1278,117 @@ def clear_slug_request_cache_for_course(course_uuid):
     active_url_cache.delete(get_cache_key(course_uuid=course_uuid, draft=False))
 
 
+def serialize_skill(skill):
+    """
+    Serialize a skill the way taxonomy's get_whitelisted_serialized_skills does.
+    """
+    category = skill.category
+    subcategory = skill.subcategory
+    return {
+        'name': skill.name,
+        'description': skill.description,
+        'category': {'name': category.name} if category else None,
+        'subcategory': {
+            'name': subcategory.name,
+            'category': {'name': subcategory.category.name},
+        } if subcategory else None,
+    }
+
+
+@contextmanager
+def product_skills_scope():
+    """
+    Keep the skills loaded by `preload_product_skills` in memory for the duration of the block, e.g. an index build,
+    so that every field built from the skills of a product reads them from there rather than looking them up again.
+    """
+    previous = getattr(_product_skills, 'cache', None)
+    _product_skills.cache = {} if previous is None else previous
+    try:
+        yield
+    finally:
+        _product_skills.cache = previous
+
+
+@contextmanager
+def defer_external_calls(defer):
+    """
+    Pass the external service calls made with `call_external_service` in the block to `defer` rather than making
+    them right away, e.g. to make them once the current transaction commits. `defer` is called with each call,
+    as a callable taking no arguments.
+    """
+    previous = getattr(_external_calls, 'defer', None)
+    _external_calls.defer = defer
+    try:
+        yield
+    finally:
+        _external_calls.defer = previous
+
+
+def call_external_service(func, *args, **kwargs):
+    """
+    Call func, which calls an external service such as Studio, ecommerce or the LMS, unless calls are deferred by
+    an active `defer_external_calls` block.
+    """
+    defer = getattr(_external_calls, 'defer', None)
+    if defer is None:
+        return func(*args, **kwargs)
+
+    defer(functools.partial(func, *args, **kwargs))
+    return None
+
+
+def preload_product_skills(product_identifiers, product_type):
+    """
+    Load the whitelisted skills of several products (courses or programs) with one query per
+    PRODUCT_SKILLS_BATCH_SIZE products.
+
+    The skills are kept in the active `product_skills_scope`, there is nothing to load outside of one.
+    """
+    cache = getattr(_product_skills, 'cache', None)
+    if cache is None:
+        return
+
+    identifiers = {str(identifier) for identifier in product_identifiers} - {
+        identifier for cached_type, identifier in cache if cached_type == product_type
+    }
+    if not identifiers:
+        return
+
+    if product_type == ProductTypes.Program:
+        model, identifier_field = ProgramSkill, 'program_uuid'
+    else:
+        model, identifier_field = CourseSkills, 'course_key'
+
+    skills = {identifier: [] for identifier in identifiers}
+    identifiers = sorted(identifiers)
+    for start in range(0, len(identifiers), PRODUCT_SKILLS_BATCH_SIZE):
+        product_skills = model.objects.filter(
+            is_blacklisted=False,
+            **{f'{identifier_field}__in': identifiers[start:start + PRODUCT_SKILLS_BATCH_SIZE]}
+        ).select_related('skill__category', 'skill__subcategory__category').order_by('id')
+        for product_skill in product_skills:
+            skills[str(getattr(product_skill, identifier_field))].append(serialize_skill(product_skill.skill))
+
+    cache.update({(product_type, identifier): value for identifier, value in skills.items()})
+
+
+def get_product_skills(product_identifier, product_type):
+    """
+    Get the serialized whitelisted skills of a product (course/program), from the active `product_skills_scope`
+    if they have been preloaded.
+    """
+    cache = getattr(_product_skills, 'cache', None) or {}
+    product_skills = cache.get((product_type, str(product_identifier)))
+    if product_skills is None:
+        product_skills = get_whitelisted_serialized_skills(product_identifier, product_type=product_type)
+    return product_skills
+
+
 def get_product_skill_names(product_identifier, product_type):
     """
     Util method to get list of skill names associated with a product (course/program).
     """
-    product_skills = get_whitelisted_serialized_skills(product_identifier, product_type=product_type)
+    product_skills = get_product_skills(product_identifier, product_type)
     return list({product_skill['name'] for product_skill in product_skills})
 
 
@@ -153,7 +153,11 @@ class DistinctCountsElasticsearchQueryWrapper:
     # The default size for field facet aggregations.
     DEFAULT_FIELD_FACET_SIZE = 100
 
-    def __init__(self, search_instance, aggregation_key):
+    # The name of the filters aggregation computing all the query facets when they are collapsed.
+    QUERY_FACETS_AGGREGATION_NAME = 'distinct_counts_query_facets'
+
+    def __init__(self, search_instance, aggregation_key, hit_precision=None, facet_precision=None,
+                 collapse_query_facets=None):
         """
         Initialize a new instance of the DistinctCountsElasticsearchQueryWrapper.
 
@@ -163,10 +167,23 @@ class DistinctCountsElasticsearchQueryWrapper:
                 It should be a field that is NOT analyzed by the index (like one of the faceted _exact fields).
                 Using a field that is analyzed will result in inaccurate counts, as analyzed fields are broken down by
                 the search instance and will result in records being grouped by substrings of the aggregation_key field.
+            hit_precision (int): Precision threshold of the distinct hit count, defaults to
+                DISTINCT_COUNTS_HIT_PRECISION.
+            facet_precision (int): Precision threshold of the distinct facet counts, defaults to
+                DISTINCT_COUNTS_FACET_PRECISION.
+            collapse_query_facets (bool): Whether all the query facets are computed by a single filters aggregation,
+                defaults to DISTINCT_COUNTS_COLLAPSE_QUERY_FACETS.
         """
         self.search_instance = search_instance
         self.aggregation_key = aggregation_key
         self.aggregation_name = 'distinct_{}'.format(aggregation_key)
+        self.hit_precision = settings.DISTINCT_COUNTS_HIT_PRECISION if hit_precision is None else hit_precision
+        self.facet_precision = settings.DISTINCT_COUNTS_FACET_PRECISION if facet_precision is None else facet_precision
+        self.collapse_query_facets = (
+            settings.DISTINCT_COUNTS_COLLAPSE_QUERY_FACETS if collapse_query_facets is None else collapse_query_facets
+        )
+        # Maps each collapsed query facet to the bucket of the filters aggregation computing it
+        self.query_facet_buckets = {}
 
     def search(self, search_query):
         """
@@ -187,23 +204,23 @@ class DistinctCountsElasticsearchQueryWrapper:
         """
         Build and return the arguments for the elasticsearch query.
         """
-        aggregations = self._build_cardinality_aggregation(precision=settings.DISTINCT_COUNTS_HIT_PRECISION)
+        aggregations = self._build_cardinality_aggregation(precision=self.hit_precision)
         facets = kwargs.get('aggs', {})
         field_facets = {key: value for key, value in facets.items() if key.startswith('_filter')}
         query_facets = {key: value for key, value in facets.items() if key.startswith('_query')}
         unhandled_facets = set(facets.keys()) - set(field_facets.keys()) - set(query_facets.keys())
         if field_facets:
             aggregations.update(
-                self._build_field_facet_aggregations(
-                    facet_dict=field_facets, precision=settings.DISTINCT_COUNTS_FACET_PRECISION
-                )
+                self._build_field_facet_aggregations(facet_dict=field_facets, precision=self.facet_precision)
             )
 
-        if query_facets:
+        if query_facets and self.collapse_query_facets:
+            aggregations.update(
+                self._build_collapsed_query_facet_aggregations(facet_dict=query_facets, precision=self.facet_precision)
+            )
+        elif query_facets:
             aggregations.update(
-                self._build_query_facet_aggregations(
-                    facet_dict=query_facets, precision=settings.DISTINCT_COUNTS_FACET_PRECISION
-                )
+                self._build_query_facet_aggregations(facet_dict=query_facets, precision=self.facet_precision)
             )
 
         if unhandled_facets:
@@ -255,10 +272,39 @@ class DistinctCountsElasticsearchQueryWrapper:
             }
         return aggregations
 
+    def _build_collapsed_query_facet_aggregations(self, facet_dict, precision=None):
+        """
+        Build and return a single filters aggregation computing all the query facets, rather than one filter
+        aggregation per query facet, so that Elasticsearch collects the matching documents in a single pass.
+        Query facets sharing the same filter are computed by the same bucket.
+        """
+        filters = {}
+        self.query_facet_buckets = {}
+        for facet_field_name, value in facet_dict.items():
+            facet_filter = value.get('filter')
+            bucket = next(
+                (name for name, bucket_filter in filters.items() if bucket_filter == facet_filter), facet_field_name
+            )
+            filters.setdefault(bucket, facet_filter)
+            self.query_facet_buckets[facet_field_name] = bucket
+
+        return {
+            self.QUERY_FACETS_AGGREGATION_NAME: {
+                'filters': {'filters': filters},
+                'aggs': self._build_cardinality_aggregation(precision=precision),
+            }
+        }
+
     def _process_results(self, raw_results, **kwargs):
         """
         Process the query results into a form that is more easily consumable by the client.
         """
+        collapsed_query_facets = raw_results['aggregations'].pop(self.QUERY_FACETS_AGGREGATION_NAME, None)
+        if collapsed_query_facets:
+            # Expand the buckets of the filters aggregation into the results of the query facets they computed
+            for facet_field_name, bucket in self.query_facet_buckets.items():
+                raw_results['aggregations'][facet_field_name] = collapsed_query_facets['buckets'][bucket]
+
         raw_results['aggregations']['aggregation_name'] = self.aggregation_name
         results = DistinctDSLResponse(self.search_instance, raw_results)
         aggregations = raw_results['aggregations']
@@ -429,3 +429,34 @@ class TestDistinctCountsElasticsearchQueryWrapper:
 
         assert 'facets' not in search_kwargs
         assert 'aggs' in search_kwargs
+
+    def test_search_with_collapsed_query_facets(self):
+        """ Verify that collapsing the query facets into a single filters aggregation doesn't change their counts. """
+        course = CourseFactory()
+        CourseRunFactory(title='foo', pacing_type='self_paced', hidden=True, course=course)
+        CourseRunFactory(title='foo', pacing_type='self_paced', hidden=True, course=course)
+        CourseRunFactory(title='foo', pacing_type='instructor_paced', hidden=False)
+
+        queryset = DistinctCountsSearchQuerySet(index=CourseRunDocument._index._name).filter('term', title='foo')
+        for name, filter_query in (
+                ('hidden', ESDSLQ('term', hidden=True)),
+                ('also_hidden', ESDSLQ('term', hidden=True)),
+                ('self_paced', ESDSLQ('term', pacing_type='self_paced')),
+                ('instructor_paced', ESDSLQ('term', pacing_type='instructor_paced')),
+        ):
+            queryset.aggs.bucket('_query_' + name, 'filter', filter=ESDSLQ('bool', filter=filter_query))
+        querystring = queryset.to_dict()
+
+        backend = DistinctCountsElasticsearchQueryWrapper(queryset, 'aggregation_key', collapse_query_facets=True)
+        search_kwargs = backend._build_search_kwargs(**querystring)
+        collapsed_filters = search_kwargs['aggs'][backend.QUERY_FACETS_AGGREGATION_NAME]['filters']['filters']
+        assert set(collapsed_filters) == {'_query_hidden', '_query_self_paced', '_query_instructor_paced'}
+        assert backend.query_facet_buckets['_query_also_hidden'] == '_query_hidden'
+
+        collapsed_facets = backend.search(querystring).facets['queries']
+        separate_facets = DistinctCountsElasticsearchQueryWrapper(
+            queryset, 'aggregation_key', collapse_query_facets=False
+        ).search(querystring).facets['queries']
+        assert collapsed_facets == separate_facets
+        assert collapsed_facets['hidden'] == collapsed_facets['also_hidden'] == (2, 1)
+        assert collapsed_facets['instructor_paced'] == (1, 1)
@@ -0,0 +1,213 @@
+import datetime
+import random
+import statistics
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from elasticsearch.helpers import bulk
+from elasticsearch_dsl.connections import get_connection
+from elasticsearch_dsl.query import Q as ESDSLQ
+
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.distinct_counts.query import (
+    DistinctCountsElasticsearchQueryWrapper, DistinctCountsSearchQuerySet
+)
+
+AGGREGATION_KEY = 'aggregation_key'
+# Faceted keyword fields of the synthetic documents, and the number of distinct values of each
+FIELD_FACETS = {
+    'organizations': 200,
+    'language': 30,
+    'seat_types': 6,
+    'level_type': 3,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Index synthetic documents in a temporary Elasticsearch index, then report the latency and the error of the '
+        'distinct hit and facet counts computed by DistinctCountsSearchQuerySet at different precision thresholds, '
+        'with and without collapsing the query facets into a single filters aggregation.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--documents', type=int, default=20000,
+            help='Number of synthetic documents to index.',
+        )
+        parser.add_argument(
+            '--keys', type=int, default=None,
+            help='Number of distinct aggregation keys of the documents, defaults to a quarter of the documents.',
+        )
+        parser.add_argument(
+            '--precisions', type=int, nargs='+', default=[100, 250, 1500, 3000, 40000],
+            help='Precision thresholds of the cardinality aggregations to benchmark.',
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=5,
+            help='Number of timed runs of each query.',
+        )
+        parser.add_argument(
+            '--shards', type=int, default=1,
+            help='Number of shards of the temporary index.',
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='Seed of the generated documents, so that runs can be compared.',
+        )
+        parser.add_argument(
+            '--using', default='default',
+            help='Name of the Elasticsearch connection to benchmark.',
+        )
+        parser.add_argument(
+            '--keep-index', action='store_true',
+            help='Keep the temporary index once the benchmark is done.',
+        )
+
+    def handle(self, *args, **options):
+        documents = options['documents']
+        keys = options['keys'] or max(documents // 4, 1)
+        if documents < 1 or options['repeat'] < 1:
+            raise CommandError('--documents and --repeat must be positive.')
+
+        connection = get_connection(options['using'])
+        now = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        index_name = 'distinct_counts_benchmark_{}'.format(now.strftime('%Y%m%d_%H%M%S'))
+        query_facets = self.get_query_facets(now)
+
+        connection.indices.create(index=index_name, body={
+            'settings': {'number_of_shards': options['shards'], 'number_of_replicas': 0},
+            'mappings': {
+                'properties': dict(
+                    {field: {'type': 'keyword'} for field in (AGGREGATION_KEY, *FIELD_FACETS)},
+                    start={'type': 'date'},
+                    end={'type': 'date'},
+                ),
+            },
+        })
+        try:
+            start = time.time()
+            expected = self.index_documents(connection, index_name, documents, keys, now, options['seed'])
+            self.stdout.write(
+                'Indexed {documents} documents with {keys} distinct keys in {duration:.1f} seconds.'.format(
+                    documents=documents, keys=len(expected['hits']), duration=time.time() - start
+                )
+            )
+
+            self.stdout.write('{:>10} {:>10} {:>12} {:>12} {:>11} {:>10}'.format(
+                'precision', 'plan', 'latency ms', 'took ms', 'mean error', 'max error'
+            ))
+            for precision in options['precisions']:
+                for collapse_query_facets in (False, True):
+                    self.benchmark(
+                        connection, index_name, query_facets, expected, precision, collapse_query_facets,
+                        options['repeat'],
+                    )
+        finally:
+            if not options['keep_index']:
+                connection.indices.delete(index=index_name)
+
+    @staticmethod
+    def get_query_facets(now):
+        """
+        Returns the availability query facets of the search viewsets, for a fixed point in time rather than `now`
+        so that their exact counts can be computed while generating the documents.
+        """
+        soon = now + datetime.timedelta(days=60)
+        return {
+            'availability_current': (
+                ESDSLQ('bool', filter=[ESDSLQ('range', start={'lte': now}), ESDSLQ('range', end={'gte': now})]),
+                lambda doc: doc['start'] <= now <= doc['end'],
+            ),
+            'availability_starting_soon': (
+                ESDSLQ('bool', filter=[ESDSLQ('range', start={'lte': soon, 'gte': now})]),
+                lambda doc: now <= doc['start'] <= soon,
+            ),
+            'availability_upcoming': (
+                ESDSLQ('bool', filter=[ESDSLQ('range', start={'gte': soon})]),
+                lambda doc: doc['start'] >= soon,
+            ),
+            'availability_archived': (
+                ESDSLQ('bool', filter=[ESDSLQ('range', end={'lte': now})]),
+                lambda doc: doc['end'] <= now,
+            ),
+        }
+
+    def index_documents(self, connection, index_name, documents, keys, now, seed):
+        """
+        Index the synthetic documents, returning the exact distinct counts of the benchmarked query.
+        """
+        rng = random.Random(seed)
+        query_facets = self.get_query_facets(now)
+        expected = {'hits': set(), 'fields': defaultdict(set), 'queries': defaultdict(set)}
+
+        def generate():
+            for pk in range(documents):
+                start = now + datetime.timedelta(days=rng.randint(-720, 360))
+                doc = {
+                    AGGREGATION_KEY: 'course:key-{}'.format(rng.randrange(keys)),
+                    'start': start,
+                    'end': start + datetime.timedelta(weeks=rng.randint(1, 52)),
+                }
+                for field, values in FIELD_FACETS.items():
+                    doc[field] = '{}-{}'.format(field, rng.randrange(values))
+                    expected['fields'][(field, doc[field])].add(doc[AGGREGATION_KEY])
+                for name, (__, matches) in query_facets.items():
+                    if matches(doc):
+                        expected['queries'][name].add(doc[AGGREGATION_KEY])
+                expected['hits'].add(doc[AGGREGATION_KEY])
+                yield {'_index': index_name, '_id': pk, '_source': doc}
+
+        bulk(connection, generate(), chunk_size=1000)
+        connection.indices.refresh(index=index_name)
+        return expected
+
+    def benchmark(self, connection, index_name, query_facets, expected, precision, collapse_query_facets, repeat):
+        queryset = DistinctCountsSearchQuerySet(using=connection, index=index_name)[:0]
+        for field, values in FIELD_FACETS.items():
+            queryset.aggs.bucket('_filter_' + field, 'filter', filter=ESDSLQ('match_all')).bucket(
+                field, 'terms', field=field, size=values
+            )
+        for name, (query, __) in query_facets.items():
+            queryset.aggs.bucket('_query_' + name, 'filter', filter=query)
+        queryset = queryset.with_distinct_counts(AGGREGATION_KEY)
+
+        latencies = []
+        took = []
+        response = None
+        # The first run warms up the caches of Elasticsearch and isn't timed
+        for run in range(repeat + 1):
+            wrapper = DistinctCountsElasticsearchQueryWrapper(
+                queryset, AGGREGATION_KEY, hit_precision=precision, facet_precision=precision,
+                collapse_query_facets=collapse_query_facets,
+            )
+            start = time.time()
+            response = wrapper.search(queryset.to_dict())
+            if run:
+                latencies.append((time.time() - start) * 1000)
+                took.append(response.took)
+
+        errors = [self.get_error(response.distinct_hits, len(expected['hits']))]
+        for field, buckets in response.facets['fields'].items():
+            errors += [
+                self.get_error(distinct_count, len(expected['fields'][(field, value)]))
+                for value, __, distinct_count in buckets
+            ]
+        errors += [
+            self.get_error(distinct_count, len(expected['queries'][name]))
+            for name, (__, distinct_count) in response.facets['queries'].items()
+        ]
+
+        self.stdout.write('{:>10} {:>10} {:>12.1f} {:>12.1f} {:>11.2%} {:>10.2%}'.format(
+            precision, 'collapsed' if collapse_query_facets else 'separate', statistics.median(latencies),
+            statistics.median(took), statistics.mean(errors), max(errors),
+        ))
+
+    @staticmethod
+    def get_error(count, expected_count):
+        """
+        Returns the relative error of a distinct count.
+        """
+        if not expected_count:
+            return float(bool(count))
+        return abs(count - expected_count) / expected_count
@@ -1,16 +1,20 @@
+import concurrent.futures
 import datetime
 import logging
+import multiprocessing
 import time
 from collections import namedtuple
 
 from django.conf import settings
 from django.core.management import CommandError
+from django.db import connections as db_connections
 from django_elasticsearch_dsl.management.commands.search_index import Command as DjangoESDSLCommand
 from django_elasticsearch_dsl.registries import registry
+from elasticsearch.helpers import streaming_bulk
 from elasticsearch_dsl import Mapping
-from elasticsearch_dsl.connections import get_connection
+from elasticsearch_dsl.connections import connections, get_connection
 
-from course_discovery.apps.core.utils import ElasticsearchUtils
+from course_discovery.apps.core.utils import ElasticsearchUtils, get_document, get_document_path
 
 OLD_AND_NEW_INDEX_NAMES = slice(2, 4)
 
@@ -19,6 +23,48 @@ AliasMapper = namedtuple('AliasMapper',
 logger = logging.getLogger(__name__)
 
 
+def get_pk_ranges(queryset, partition_size):
+    """
+    Split the queryset into ranges of consecutive primary keys, each containing up to partition_size objects.
+
+    Returns:
+        list: (first pk, last pk) tuples
+    """
+    pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+    return [
+        (pks[start], pks[min(start + partition_size, len(pks)) - 1])
+        for start in range(0, len(pks), partition_size)
+    ]
+
+
+def init_worker_process():
+    """
+    Give each forked worker process its own Elasticsearch clients, rather than sharing the sockets of its parent.
+    Database connections are closed before forking, so workers open their own on first use.
+    """
+    for alias, connection_settings in settings.ELASTICSEARCH_DSL.items():
+        connections.create_connection(alias, **connection_settings)
+
+
+def index_pk_range(document_path, index_name, first_pk, last_pk, chunk_size):
+    """
+    Prepare the documents of the objects in the pk range and stream them to the index with bulk requests.
+
+    Returns:
+        int: number of documents indexed
+    """
+    document = get_document(document_path)()
+    queryset = document.get_queryset().filter(pk__gte=first_pk, pk__lte=last_pk).order_by('pk')
+    objects = queryset.iterator(chunk_size=settings.ELASTICSEARCH_DSL_QUERYSET_PAGINATION)
+
+    indexed = 0
+    # pylint: disable=protected-access
+    actions = (dict(action, _index=index_name) for action in document._get_actions(objects, 'index'))
+    for ok, __ in streaming_bulk(document._get_connection(), actions, chunk_size=chunk_size):
+        indexed += ok
+    return indexed
+
+
 class Command(DjangoESDSLCommand):
     help = 'Manage elasticsearch index.'
     backends = []
@@ -44,6 +90,27 @@ class Command(DjangoESDSLCommand):
             help='Run populate/rebuild update single threaded'
         )
         parser.set_defaults(parallel=getattr(settings, 'ELASTICSEARCH_DSL_PARALLEL', False))
+        parser.add_argument(
+            '--chunked',
+            action='store_true',
+            dest='chunked',
+            help='Rebuild the indices by splitting their querysets into pk ranges, which are prepared and '
+                 'streamed to Elasticsearch by several processes, with refreshes and replicas disabled meanwhile'
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=None,
+            help='Number of processes of chunked rebuilds, ELASTICSEARCH_DSL_REBUILD_PROCESSES by default'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            dest='chunk_size',
+            help='Number of documents per bulk request of chunked rebuilds, '
+                 'ELASTICSEARCH_DSL_BULK_CHUNK_SIZE by default'
+        )
         parser.add_argument(
             '--refresh',
             action='store_true',
@@ -107,7 +174,10 @@ class Command(DjangoESDSLCommand):
         conn = get_connection()
         while indexes_pending and run_attempts < 1:  # Only try once, as retries gave buggy results. See VAN-391
             run_attempts += 1
-            self._populate(models, options)
+            if options.get('chunked'):
+                self._populate_chunked(alias_mappings, options)
+            else:
+                self._populate(models, options)
             for doc, __, new_index_name, alias, record_count in alias_mappings:
                 # Run a sanity check to ensure we aren't drastically changing the
                 # index, which could be indicative of a bug.
@@ -134,6 +204,56 @@ class Command(DjangoESDSLCommand):
 
         return True
 
+    def _populate_chunked(self, alias_mappings, options):
+        """
+        Populate the new indices from pk ranges of their querysets, spread across worker processes.
+
+        Refreshes and replicas are disabled while loading, and restored before the aliases are pointed
+        to the new indices.
+        """
+        conn = get_connection()
+        processes = options.get('processes') or settings.ELASTICSEARCH_DSL_REBUILD_PROCESSES
+        chunk_size = options.get('chunk_size') or settings.ELASTICSEARCH_DSL_BULK_CHUNK_SIZE
+
+        tasks = []
+        for mapping in alias_mappings:
+            pk_ranges = get_pk_ranges(
+                mapping.document().get_queryset(), settings.ELASTICSEARCH_DSL_REBUILD_PARTITION_SIZE
+            )
+            self.stdout.write("Indexing '{}' objects in {} chunks".format(
+                mapping.document.django.model.__name__, len(pk_ranges)
+            ))
+            tasks.extend(
+                (get_document_path(mapping.document), mapping.new_index_name, first_pk, last_pk, chunk_size)
+                for first_pk, last_pk in pk_ranges
+            )
+
+        previous_settings = {}
+        try:
+            for mapping in alias_mappings:
+                previous_settings[mapping.new_index_name] = ElasticsearchUtils.prepare_index_for_bulk_load(
+                    conn, mapping.new_index_name
+                )
+
+            if processes > 1:
+                # Forked processes must not share the database connections of their parent
+                db_connections.close_all()
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=processes,
+                    mp_context=multiprocessing.get_context('fork'),
+                    initializer=init_worker_process,
+                ) as executor:
+                    futures = [executor.submit(index_pk_range, *task) for task in tasks]
+                    indexed = sum(future.result() for future in concurrent.futures.as_completed(futures))
+            else:
+                indexed = sum(index_pk_range(*task) for task in tasks)
+        finally:
+            for index_name, index_settings in previous_settings.items():
+                ElasticsearchUtils.restore_index_settings(conn, index_name, index_settings)
+                conn.indices.refresh(index=index_name)
+
+        logger.info('Indexed %d documents into %d indices.', indexed, len(alias_mappings))
+
     @staticmethod
     def percentage_change(current, previous):
         if current == previous:
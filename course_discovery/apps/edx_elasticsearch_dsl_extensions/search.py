@@ -9,6 +9,7 @@ from course_discovery.apps.edx_elasticsearch_dsl_extensions.elasticsearch_boost_
 from course_discovery.apps.edx_elasticsearch_dsl_extensions.response import DSLResponse
 
 DEFAULT_SIZE = 10
+DEFAULT_PK_CHUNK_SIZE = 10000
 
 
 class Search(OriginSearch):
@@ -84,3 +85,38 @@ class FacetedSearch(OriginSearch):
             clone.aggs._params = {'aggs': self.aggs._params['aggs'].copy()}
 
         return clone
+
+
+def iterate_pks(document, query, chunk_size=None):
+    """
+    Yield the primary key of every document matching the query.
+
+    Only the `pk` doc value of each hit is requested, and results are paged through with
+    `search_after` on `pk`, so there is no cap on the number of matches and no `_source`
+    is downloaded. The query runs in filter context, since hits don't need to be scored.
+
+    Arguments:
+        document (Document): Document class whose index is searched.
+        query (elasticsearch_dsl.query.Query): Query the documents must match.
+        chunk_size (int): Number of primary keys fetched per request.
+    """
+    chunk_size = chunk_size or getattr(settings, 'ELASTICSEARCH_DSL_PK_CHUNK_SIZE', DEFAULT_PK_CHUNK_SIZE)
+    # pylint: disable=protected-access
+    search = (
+        OriginSearch(using=document._get_using(), index=document._default_index())
+        .filter(query)
+        .source(False)
+        .sort('pk')
+        .extra(size=chunk_size, docvalue_fields=['pk'], track_total_hits=False)
+    )
+
+    search_after = None
+    while True:
+        page = search if search_after is None else search.extra(search_after=search_after)
+        hits = page.execute().to_dict()['hits']['hits']
+        for hit in hits:
+            yield hit['fields']['pk'][0]
+
+        if len(hits) < chunk_size:
+            return
+        search_after = hits[-1]['sort']
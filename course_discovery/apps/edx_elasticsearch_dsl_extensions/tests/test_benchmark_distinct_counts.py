@@ -0,0 +1,24 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.usefixtures('elasticsearch_dsl_default_connection')
+class TestBenchmarkDistinctCounts:
+    def test_handle(self, elasticsearch_dsl_default_connection):
+        """ Verify the command reports both query plans for each precision, and removes its temporary index. """
+        indexes = set(elasticsearch_dsl_default_connection.indices.get_alias(index='*'))
+        out = StringIO()
+        call_command(
+            'benchmark_distinct_counts', documents=200, precisions=[100, 3000], repeat=1, stdout=out
+        )
+
+        lines = out.getvalue().splitlines()
+        assert lines[0].startswith('Indexed 200 documents')
+        assert [line.split()[:2] for line in lines[2:]] == [
+            ['100', 'separate'], ['100', 'collapsed'], ['3000', 'separate'], ['3000', 'collapsed'],
+        ]
+        # Counts below the precision threshold are expected to be close to exact
+        assert all(line.split()[-1] == '0.00%' for line in lines[4:])
+        assert set(elasticsearch_dsl_default_connection.indices.get_alias(index='*')) == indexes
@@ -65,3 +65,20 @@ class UpdateIndexTests(ElasticsearchTestMixin, SearchIndexTestMixin, TestCase):
                         'update_index.Command.sanity_check_new_index') as mock_sanity_check_new_index:
             call_command('update_index', disable_change_limit=True)
             assert not mock_sanity_check_new_index.called
+
+    @freeze_time('2016-06-21')
+    @override_settings(ELASTICSEARCH_DSL_REBUILD_PARTITION_SIZE=2)
+    def test_handle_chunked(self):
+        """ Verify chunked rebuilds index every object and restore the settings of the new indices. """
+        CourseRunFactory.create_batch(5)
+
+        call_command('update_index', chunked=True, processes=1, chunk_size=2, disable_change_limit=True)
+
+        for alias in settings.ELASTICSEARCH_INDEX_NAMES.values():
+            index = f'{alias}_20160621_000000'
+            assert list(self.conn.indices.get_alias(name=alias)) == [index]
+            index_settings = self.conn.indices.get_settings(index=index)[index]['settings']['index']
+            assert index_settings.get('refresh_interval') != '-1'
+            assert index_settings['number_of_replicas'] == '1'
+
+        assert self.conn.count(index='course_run')['count'] == 5
@@ -174,6 +174,31 @@ PARLER_ENABLE_CACHING = False
 # Determines whether the caching mixin in course_discovery/apps/api/cache.py is used
 USE_API_CACHING = True
 
+# Number of seconds for which the previous cached API response keeps being served while a single
+# worker rebuilds it after it has been invalidated. Set to 0 to have every request rebuild on a miss.
+API_CACHE_STALE_WHILE_REVALIDATE_TIMEOUT = 0
+
+# Number of seconds for which search API responses are cached. Cached responses are invalidated whenever the
+# search indexes change, but they must also expire because availability filters and facets are relative to now.
+SEARCH_API_CACHE_TIMEOUT = 60 * 15
+
+# Codec (zlib, brotli or zstd) and compression level used for API responses stored in the cache. brotli and zstd
+# require the brotli and zstandard packages respectively. A level of None uses the codec's default level.
+API_CACHE_COMPRESSION = 'zlib'
+API_CACHE_COMPRESSION_LEVEL = None
+
+# API requests replayed by the warm_api_cache task after the api timestamp is bumped at the end of
+# refresh_course_metadata, so that the first consumers don't pay the full render cost. Only the responses of
+# cached views are worth replaying: the catalog courses and contains views, and the catalog query contains view,
+# aren't cached.
+API_CACHE_WARMING_PATHS = [
+    '/api/v1/courses/',
+    '/api/v1/programs/',
+]
+# Existing user the warming requests are made as. Warming is skipped if it isn't set.
+API_CACHE_WARMING_USERNAME = None
+API_CACHE_WARMING_MAX_WORKERS = 4
+
 TIME_ZONE = 'UTC'
 
 USE_I18N = True
@@ -422,6 +447,11 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.coreapi.AutoSchema'
 }
 
+# Throttle rate overrides and publisher status of users are cached until they change. Each process also
+# remembers them for a short while, so that throttling a request only costs a hit on its request counter.
+USER_THROTTLE_RATE_CACHE_TIMEOUT = 60 * 60
+USER_THROTTLE_RATE_LOCAL_CACHE_TIMEOUT = 60
+
 # http://chibisov.github.io/drf-extensions/docs/
 REST_FRAMEWORK_EXTENSIONS = {
     'DEFAULT_CACHE_ERRORS': False,
@@ -467,6 +497,21 @@ ELASTICSEARCH_DSL_QUERYSET_PAGINATION = 10000
 # whose parameters 'size' and 'from' are not explicitly set.
 ELASTICSEARCH_DSL_LOAD_PER_QUERY = 10000
 
+# Number of primary keys fetched per request when resolving a search query to model objects.
+ELASTICSEARCH_DSL_PK_CHUNK_SIZE = 10000
+
+# Chunked update_index rebuilds split each index's queryset into ranges of this many primary keys, which are
+# prepared and sent to Elasticsearch by this many processes, with bulk requests of this many documents.
+ELASTICSEARCH_DSL_REBUILD_PARTITION_SIZE = 2000
+ELASTICSEARCH_DSL_REBUILD_PROCESSES = 4
+# Documents are also prepared in chunks of ELASTICSEARCH_DSL_BULK_CHUNK_SIZE objects, whose skills are loaded at once.
+ELASTICSEARCH_DSL_BULK_CHUNK_SIZE = 500
+
+# Catalog query matches are invalidated whenever the search indexes change. The timeout only bounds how long
+# matches of rarely used queries are kept around.
+CATALOG_QUERY_MATCHES_CACHE_TIMEOUT = 60 * 60
+CATALOG_QUERY_MATCHES_LOCAL_CACHE_SIZE = 100
+
 MAX_RESULT_WINDOW = 15000
 
 ELASTICSEARCH_DSL = {
@@ -485,9 +530,17 @@ ELASTICSEARCH_DSL_INDEX_SETTINGS = {'number_of_shards': 1, 'number_of_replicas':
 # Elasticsearch instance when running the refresh_course_metadata command
 # If you still want to use please use customized RealTimeSignalProcessor
 # course_discovery.apps.course_metadata.search_indexes.signals.RealTimeSignalProcessor
+# or course_discovery.apps.course_metadata.search_indexes.signals.DeferredSignalProcessor, which indexes the updates
+# in batches with Celery tasks
 ELASTICSEARCH_DSL_SIGNAL_PROCESSOR = 'django_elasticsearch_dsl.signals.BaseSignalProcessor'
 ELASTICSEARCH_DSL_INDEX_RETENTION_LIMIT = 3
 
+# DeferredSignalProcessor hands batches of up to this many updated documents to Celery, at least every this many
+# seconds, and keeps buffering updates while this many batches are still being indexed.
+ELASTICSEARCH_DSL_DEFERRED_BATCH_SIZE = 500
+ELASTICSEARCH_DSL_DEFERRED_FLUSH_INTERVAL = 5
+ELASTICSEARCH_DSL_DEFERRED_MAX_IN_FLIGHT = 4
+
 # Update Index Settings
 # Make sure the size of the new index does not change by more than this percentage
 INDEX_SIZE_CHANGE_THRESHOLD = .1  # 10%
@@ -510,6 +563,9 @@ SEARCH_FACET_LIMIT = 10000
 #       precision, since the hit count only requires a single aggregation.
 DISTINCT_COUNTS_HIT_PRECISION = 1500
 DISTINCT_COUNTS_FACET_PRECISION = 250
+# Whether the query facets of distinct count searches are computed by a single filters aggregation rather than by
+# one filter aggregation each. Use the benchmark_distinct_counts command to compare both query plans.
+DISTINCT_COUNTS_COLLAPSE_QUERY_FACETS = False
 
 DEFAULT_PARTNER_ID = None
 
@@ -740,6 +796,28 @@ SUBSCRIPTION_METADATA_MAPPING = {
     'INPUT_TAB_ID': '',
 }
 
+# Incremental refresh_course_metadata runs skip upstream records which haven't changed since they were
+# last loaded. Records last loaded more than this many days ago are loaded again regardless.
+DATA_LOADER_FULL_RECONCILIATION_DAYS = 7
+
+# Number of rows of a CSV data loader committed in a single transaction, along with the checkpoint
+# from which an interrupted run is resumed.
+CSV_DATA_LOADER_CHUNK_SIZE = 20
+
+# Delivery of marketing site, Salesforce and ecommerce side effects queued in the outbox, see
+# course_metadata.outbox. The number of workers delivering messages at once is limited per target.
+SIDE_EFFECT_OUTBOX_CONCURRENCY = {
+    'marketing_site': 2,
+    'salesforce': 2,
+    'ecommerce': 4,
+}
+SIDE_EFFECT_OUTBOX_BATCH_SIZE = 50
+# Seconds a worker may spend delivering a message before other workers consider it abandoned.
+SIDE_EFFECT_OUTBOX_LEASE_SECONDS = 300
+# Failed deliveries are retried with an exponential backoff, starting at this many seconds.
+SIDE_EFFECT_OUTBOX_RETRY_DELAY_SECONDS = 30
+SIDE_EFFECT_OUTBOX_MAX_ATTEMPTS = 10
+
 DEFAULT_PRODUCT_SOURCE_NAME = 'edX'
 DEFAULT_PRODUCT_SOURCE_SLUG = 'edx'
 EXTERNAL_PRODUCT_SOURCE_SLUG = ''